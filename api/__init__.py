@@ -1,4 +1,9 @@
 """API 계층 패키지"""
 from .routes import register_routes
+from .admin_routes import register_admin_routes
+from .analytics_routes import register_analytics_routes
+from .asset_routes import register_asset_routes
+from .recurrence_routes import register_recurrence_routes
 
-__all__ = ['register_routes']
+__all__ = ['register_routes', 'register_admin_routes', 'register_analytics_routes', 'register_asset_routes',
+           'register_recurrence_routes']
@@ -0,0 +1,154 @@
+"""관리자 전용 라우트 정의"""
+from functools import wraps
+from typing import Optional
+from flask import current_app, jsonify, request, Response
+from utils import ProfileStore, AdmissionController, MemoryDiagnostics
+from utils.admin import ADMIN_TOKEN_HEADER, is_valid_admin_token
+
+
+def require_admin(view):
+    """관리자 토큰이 있는 요청만 허용하는 데코레이터"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        expected = current_app.config.get('ADMIN_TOKEN')
+        if not is_valid_admin_token(expected, request.headers.get(ADMIN_TOKEN_HEADER)):
+            return jsonify({'error': '관리자 권한이 필요합니다'}), 403
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def register_admin_routes(app, profile_store: ProfileStore, admission: Optional[AdmissionController] = None,
+                          memory: Optional[MemoryDiagnostics] = None):
+    """
+    Flask 앱에 관리자 라우트 등록
+
+    Args:
+        app: Flask 애플리케이션
+        profile_store: 요청 프로파일 저장소
+        admission: 진입 제어기 (지표 조회용)
+        memory: 메모리 진단 (스냅샷/구조별 크기 조회용)
+    """
+
+    # ==================== 프로파일 라우트 ====================
+    @app.route('/api/admin/profiles', methods=['GET'])
+    @require_admin
+    def list_profiles():
+        """최근 프로파일 목록"""
+        return jsonify([record.to_summary() for record in profile_store.list()]), 200
+
+    @app.route('/api/admin/profiles/<profile_id>', methods=['GET'])
+    @require_admin
+    def download_profile(profile_id):
+        """프로파일 다운로드 (기본: pstats, ?format=text: 텍스트 리포트)"""
+        record = profile_store.get(profile_id)
+        if not record:
+            return jsonify({'error': '프로파일을 찾을 수 없습니다'}), 404
+
+        if request.args.get('format') == 'text':
+            sort_by = request.args.get('sort', 'cumulative')
+            try:
+                text = record.to_text(sort_by=sort_by)
+            except KeyError:
+                return jsonify({'error': '유효하지 않은 정렬 기준'}), 400
+            return Response(text, mimetype='text/plain; charset=utf-8')
+
+        return Response(
+            record.to_pstats_bytes(),
+            mimetype='application/octet-stream',
+            headers={'Content-Disposition': f'attachment; filename={profile_id}.pstats'}
+        )
+
+    @app.route('/api/admin/profiles', methods=['DELETE'])
+    @require_admin
+    def clear_profiles():
+        """저장된 프로파일 삭제"""
+        profile_store.clear()
+        return jsonify({'message': '프로파일이 삭제되었습니다'}), 200
+
+    # ==================== 진입 제어 라우트 ====================
+    if admission is not None:
+        @app.route('/api/admin/admission', methods=['GET'])
+        @require_admin
+        def admission_metrics():
+            """분류별 허용/거절 횟수와 대기열 대기 시간"""
+            return jsonify(admission.metrics()), 200
+
+    # ==================== 메모리 진단 라우트 ====================
+    if memory is not None:
+        @app.route('/api/admin/memory', methods=['GET'])
+        @require_admin
+        def memory_overview():
+            """tracemalloc 상태, GC 통계, 구조별 크기 (?structures=0 이면 구조별 크기 생략)"""
+            result = {'tracemalloc': memory.tracing(), 'gc': memory.gc_stats()}
+            if request.args.get('structures', '1').lower() not in ('0', 'false'):
+                result['structures'] = memory.structures()
+            return jsonify(result), 200
+
+        @app.route('/api/admin/memory/gc', methods=['POST'])
+        @require_admin
+        def collect_garbage():
+            """전체 GC 실행"""
+            return jsonify({'collected': memory.collect(), 'gc': memory.gc_stats()}), 200
+
+        @app.route('/api/admin/memory/tracing', methods=['POST'])
+        @require_admin
+        def start_tracing():
+            """tracemalloc 추적 시작 ({"frames": n}, 기본 TRACEMALLOC_FRAMES 또는 1)"""
+            data = request.get_json(silent=True) or {}
+            try:
+                memory.start(int(data.get('frames') or app.config.get('TRACEMALLOC_FRAMES') or 1))
+            except (TypeError, ValueError) as e:
+                return jsonify({'error': f'입력 오류: {str(e)}'}), 400
+            return jsonify(memory.tracing()), 200
+
+        @app.route('/api/admin/memory/tracing', methods=['DELETE'])
+        @require_admin
+        def stop_tracing():
+            """tracemalloc 추적 중지"""
+            memory.stop()
+            return jsonify(memory.tracing()), 200
+
+        @app.route('/api/admin/memory/snapshots', methods=['POST'])
+        @require_admin
+        def take_memory_snapshot():
+            """스냅샷 찍기 (추적 중이 아니면 409)"""
+            try:
+                record = memory.take_snapshot()
+            except RuntimeError as e:
+                return jsonify({'error': str(e)}), 409
+            return jsonify(record.to_summary()), 201
+
+        @app.route('/api/admin/memory/snapshots', methods=['GET'])
+        @require_admin
+        def list_memory_snapshots():
+            """보관한 스냅샷 목록 (최신순)"""
+            return jsonify([record.to_summary() for record in memory.list()]), 200
+
+        @app.route('/api/admin/memory/snapshots/<snapshot_id>', methods=['GET'])
+        @require_admin
+        def memory_snapshot_stats(snapshot_id):
+            """
+            스냅샷의 상위 할당 위치 (?group_by=lineno|filename|traceback &limit=)
+
+            ?base=<스냅샷 ID> 를 지정하면 그 스냅샷 이후의 변화량 순으로 반환한다.
+            """
+            record = memory.get(snapshot_id)
+            base_id = request.args.get('base')
+            base = None if base_id is None else memory.get(base_id)
+            if record is None or (base_id is not None and base is None):
+                return jsonify({'error': '스냅샷을 찾을 수 없습니다'}), 404
+            try:
+                group_by = request.args.get('group_by', 'lineno')
+                limit = int(request.args.get('limit', 20))
+                if base is None:
+                    return jsonify(memory.top(record, group_by, limit)), 200
+                return jsonify(memory.diff(record, base, group_by, limit)), 200
+            except ValueError as e:
+                return jsonify({'error': f'입력 오류: {str(e)}'}), 400
+
+        @app.route('/api/admin/memory/snapshots', methods=['DELETE'])
+        @require_admin
+        def clear_memory_snapshots():
+            """보관한 스냅샷 삭제"""
+            memory.clear()
+            return jsonify({'message': '스냅샷이 삭제되었습니다'}), 200
@@ -0,0 +1,56 @@
+"""통계/리포트 라우트 정의"""
+from flask import jsonify, request
+from services.analytics_service import AnalyticsService
+
+
+def register_analytics_routes(app, analytics_service: AnalyticsService):
+    """
+    Flask 앱에 통계/리포트 라우트 등록
+
+    Args:
+        app: Flask 애플리케이션
+        analytics_service: AnalyticsService 인스턴스
+    """
+
+    # ==================== 리포트 라우트 ====================
+    @app.route('/api/stats/completion-rate', methods=['GET'])
+    def get_completion_rate():
+        """기간별 누적 완료율 (?period=day|week)"""
+        try:
+            report = analytics_service.completion_rate(request.args.get('period', 'day'))
+            return jsonify(report), 200
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
+    @app.route('/api/stats/overdue', methods=['GET'])
+    def get_overdue():
+        """주별 기한 초과 미완료 TODO 개수"""
+        try:
+            return jsonify(analytics_service.overdue_by_week()), 200
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
+    @app.route('/api/stats/completion-time', methods=['GET'])
+    def get_completion_time():
+        """생성~완료 소요 시간 분포"""
+        try:
+            return jsonify(analytics_service.completion_time()), 200
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
+    @app.route('/api/stats/history', methods=['GET'])
+    def get_stats_history():
+        """상태별 개수 시계열 (?resolution=minute|hour|day &limit=최근 버킷 수)"""
+        try:
+            limit = request.args.get('limit')
+            history = analytics_service.stats_history(
+                request.args.get('resolution', 'hour'),
+                None if limit is None else int(limit)
+            )
+            return jsonify(history), 200
+        except ValueError as e:
+            return jsonify({'error': f'입력 오류: {str(e)}'}), 400
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
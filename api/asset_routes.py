@@ -0,0 +1,41 @@
+"""해시 이름 정적 파일 라우트 정의"""
+from flask import Response, jsonify, request, url_for
+from utils.assets import AssetManifest
+
+
+def register_asset_routes(app, manifest: AssetManifest):
+    """
+    Flask 앱에 해시 이름 정적 파일 라우트와 템플릿 함수 asset_url 등록
+
+    Args:
+        app: Flask 애플리케이션
+        manifest: AssetManifest 인스턴스
+    """
+
+    @app.template_global()
+    def asset_url(filename: str) -> str:
+        """정적 파일의 해시 이름 URL (목록에 없으면 기본 static URL)"""
+        hashed_name = manifest.hashed_name(filename)
+        if hashed_name is None:
+            return url_for('static', filename=filename)
+        return url_for('get_asset', name=hashed_name)
+
+    # ==================== 정적 파일 라우트 ====================
+    @app.route('/assets/<path:name>', methods=['GET'])
+    def get_asset(name):
+        """해시 이름 정적 파일 (내용이 바뀌면 이름이 바뀌므로 만료 없이 캐시)"""
+        asset = manifest.get(name)
+        if asset is None:
+            return jsonify({'error': '파일을 찾을 수 없습니다'}), 404
+
+        if request.if_none_match.contains(asset.etag):
+            response = Response(status=304)
+        else:
+            encoding, body = asset.choose(request.headers.get('Accept-Encoding'))
+            response = Response(body, mimetype=asset.mimetype)
+            if encoding != 'identity':
+                response.headers['Content-Encoding'] = encoding
+        response.set_etag(asset.etag)
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = f"public, max-age={app.config['ASSET_MAX_AGE']}, immutable"
+        return response
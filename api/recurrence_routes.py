@@ -0,0 +1,65 @@
+"""반복 TODO 규칙 라우트 정의"""
+from datetime import datetime
+from flask import jsonify, request
+from services import TodoService
+from utils import TodoNotFoundError, InvalidTodoError
+
+
+def register_recurrence_routes(app, service: TodoService):
+    """
+    Flask 앱에 반복 TODO 규칙 라우트 등록
+
+    회차 조회/수정/삭제는 일반 TODO 라우트에서 회차 ID로 처리한다.
+
+    Args:
+        app: Flask 애플리케이션
+        service: TodoService 인스턴스
+    """
+
+    # ==================== 반복 규칙 라우트 ====================
+    @app.route('/api/recurrences', methods=['GET'])
+    def get_recurrences():
+        """반복 TODO 규칙 목록"""
+        try:
+            return jsonify(service.get_recurrences()), 200
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
+    @app.route('/api/recurrences', methods=['POST'])
+    def create_recurrence():
+        """반복 TODO 규칙 생성"""
+        try:
+            data = request.get_json(silent=True)
+
+            # 필수 필드 검증
+            if not data or 'content' not in data or 'start' not in data or 'frequency' not in data:
+                return jsonify({'error': '필수 필드가 없습니다'}), 400
+
+            until = data.get('until')
+            rule = service.create_recurrence(
+                data['content'],
+                datetime.fromisoformat(data['start']),
+                data['frequency'],
+                interval=data.get('interval', 1),
+                weekdays=data.get('weekdays'),
+                until=None if until is None else datetime.fromisoformat(until),
+                count=data.get('count')
+            )
+            return jsonify(rule), 201
+        except InvalidTodoError as e:
+            return jsonify({'error': str(e)}), 400
+        except (TypeError, ValueError) as e:
+            return jsonify({'error': f'입력 오류: {str(e)}'}), 400
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
+    @app.route('/api/recurrences/<rule_id>', methods=['DELETE'])
+    def delete_recurrence(rule_id):
+        """반복 TODO 규칙 삭제 (이미 저장된 회차는 남음)"""
+        try:
+            service.delete_recurrence(rule_id)
+            return jsonify({'message': '반복 TODO가 삭제되었습니다'}), 200
+        except TodoNotFoundError as e:
+            return jsonify({'error': str(e)}), 404
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
@@ -1,9 +1,14 @@
 """Flask 라우트 정의"""
-from flask import render_template, request, jsonify
+from flask import Response, render_template, request, jsonify
+from pydantic import ValidationError
 from datetime import datetime
-from models import TodoStatus
+from models import TodoStatus, TodoQuery, to_local_naive
 from services import TodoService
-from utils import TodoSerializer, TodoNotFoundError, InvalidTodoError
+from utils import (
+    TodoSerializer, TodoNotFoundError, InvalidTodoError, CreateTodoRequest, UpdateTodoRequest, ReorderRequest,
+    MoveTodoRequest
+)
+from utils.dtos import CREATE_TODO_BATCH, describe_validation_error
 
 
 def register_routes(app, service: TodoService, serializer: TodoSerializer):
@@ -16,61 +21,176 @@ def register_routes(app, service: TodoService, serializer: TodoSerializer):
         serializer: TodoSerializer 인스턴스
     """
 
+    def list_response(todos):
+        """?fields= / ?compact= 쿼리에 따라 목록 응답 생성"""
+        fields = serializer.parse_fields(request.args.get('fields'))
+        compact = request.args.get('compact', '').lower() in ('1', 'true')
+        if fields is None and not compact:
+            # 기본 형식은 딕셔너리를 거치지 않고 바로 바이트로 인코딩
+            return app.json.raw_response(serializer.encode_list(todos))
+        return jsonify(serializer.to_sparse_list(todos, fields=fields, compact=compact))
+
+    def date_range():
+        """?start=&end= 쿼리의 날짜 구간 (둘 다 없으면 None)"""
+        start, end = request.args.get('start'), request.args.get('end')
+        if start is None and end is None:
+            return None
+        if start is None or end is None:
+            raise InvalidTodoError('start와 end를 함께 지정해야 합니다')
+        return to_local_naive(datetime.fromisoformat(start)), to_local_naive(datetime.fromisoformat(end))
+
+    def bootstrap_payload():
+        """첫 화면용 목록 첫 페이지와 통계 (BOOTSTRAP_LIMIT개)"""
+        bootstrap = service.get_bootstrap(app.config['BOOTSTRAP_LIMIT'])
+        bootstrap['todos'] = serializer.to_list(bootstrap['todos'])
+        return bootstrap
+
     # ==================== 페이지 라우트 ====================
     @app.route('/')
     def index():
-        """메인 페이지"""
-        return render_template('index.html')
+        """메인 페이지 (첫 화면 데이터를 함께 내려보내 추가 요청 없이 렌더링)"""
+        return render_template('index.html', bootstrap=bootstrap_payload())
 
     # ==================== API 라우트 ====================
     @app.route('/api/todos', methods=['GET'])
     def get_todos():
-        """모든 TODO 항목 조회"""
+        """모든 TODO 항목 조회 (?offset=&limit= 로 일부만, ?sort=date 로 날짜순 조회)"""
         try:
-            todos = service.get_all_todos()
-            return jsonify(serializer.to_list(todos)), 200
+            sort = request.args.get('sort')
+            if 'offset' not in request.args and 'limit' not in request.args:
+                if sort is None:
+                    return list_response(service.get_all_todos()), 200
+                if sort == 'date':
+                    return list_response(service.get_todos_by_date()), 200
+
+            limit = request.args.get('limit')
+            todos, total, version = service.get_todos_page(
+                int(request.args.get('offset', 0)),
+                None if limit is None else int(limit),
+                sort
+            )
+            response = list_response(todos)
+            response.headers['X-Total-Count'] = str(total)
+            response.headers['X-Snapshot-Version'] = str(version)
+            return response, 200
+        except InvalidTodoError as e:
+            return jsonify({'error': str(e)}), 400
+        except ValueError as e:
+            return jsonify({'error': f'입력 오류: {str(e)}'}), 400
         except Exception as e:
             return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
 
-    @app.route('/api/todos/<status_filter>', methods=['GET'])
+    @app.route('/api/todos/query', methods=['GET'])
+    def query_todos():
+        """
+        조건을 조합한 TODO 조회
+
+        ?status=예정,진행중 &start=&end= (한쪽만 지정 가능) &q=검색어 &sort=-date
+        &offset=&limit= 를 AND로 결합하며, ?explain=1 이면 항목 대신 실행 계획을 반환한다.
+        """
+        try:
+            args = request.args
+            status = args.get('status')
+            start, end = args.get('start'), args.get('end')
+            query = TodoQuery(
+                statuses=None if status in (None, 'all') else status.split(','),
+                start=None if start is None else datetime.fromisoformat(start),
+                end=None if end is None else datetime.fromisoformat(end),
+                text=args.get('q'),
+                sort=args.get('sort', 'order'),
+                offset=int(args.get('offset', 0)),
+                limit=None if args.get('limit') is None else int(args['limit']),
+            )
+            todos, total, plan = service.query_todos(query)
+            if args.get('explain', '').lower() in ('1', 'true'):
+                return jsonify({'plan': plan.to_dict(), 'total': total}), 200
+            response = list_response(todos)
+            response.headers['X-Total-Count'] = str(total)
+            response.headers['X-Query-Index'] = plan.index
+            return response, 200
+        except ValueError as e:
+            return jsonify({'error': f'입력 오류: {str(e)}'}), 400
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
+    @app.route('/api/todos/overdue', methods=['GET'])
+    def get_overdue_todos():
+        """목표 날짜가 지난 미완료 TODO 조회"""
+        try:
+            return list_response(service.get_overdue_todos()), 200
+        except ValueError as e:
+            return jsonify({'error': f'입력 오류: {str(e)}'}), 400
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
+    # 상태 이름만 받으므로 그 밖의 값은 GET /api/todos/<todo_id>(ID 조회)로 감
+    @app.route('/api/todos/<any(all, 예정, 진행중, 완료):status_filter>', methods=['GET'])
     def get_todos_by_status(status_filter):
-        """상태별 TODO 항목 조회"""
+        """
+        상태별 TODO 항목 조회 (?sort=date 로 날짜순 조회)
+
+        ?start=&end= 를 지정하면 목표 날짜가 그 구간인 항목을 반복 TODO 회차와
+        함께 날짜순으로 조회한다.
+        """
         try:
-            if status_filter == 'all':
+            status = None if status_filter == 'all' else TodoStatus(status_filter)
+
+            sort = request.args.get('sort')
+            window = date_range()
+            if sort not in (None, 'date'):
+                return jsonify({'error': f'지원하지 않는 정렬 기준: {sort}'}), 400
+            elif window is not None:
+                todos = service.get_todos_in_range(*window, status)  # 구간 조회는 항상 날짜순
+            elif sort == 'date':
+                todos = service.get_todos_by_date(status)
+            elif status is None:
                 todos = service.get_all_todos()
-            elif status_filter == '예정':
-                todos = service.get_todos_by_status(TodoStatus.SCHEDULED)
-            elif status_filter == '진행중':
-                todos = service.get_todos_by_status(TodoStatus.IN_PROGRESS)
-            elif status_filter == '완료':
-                todos = service.get_todos_by_status(TodoStatus.COMPLETED)
             else:
-                return jsonify({'error': '유효하지 않은 상태'}), 400
+                todos = service.get_todos_by_status(status)
 
-            return jsonify(serializer.to_list(todos)), 200
+            response = list_response(todos)
+            if status == TodoStatus.COMPLETED and window is None:
+                # 보관한 완료 항목은 /api/archive에서 나눠 받음
+                response.headers['X-Archived-Count'] = str(service.get_archived_count())
+            return response, 200
+        except InvalidTodoError as e:
+            return jsonify({'error': str(e)}), 400
+        except ValueError as e:
+            return jsonify({'error': f'입력 오류: {str(e)}'}), 400
         except Exception as e:
             return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
 
     @app.route('/api/todos', methods=['POST'])
     def create_todo():
-        """새로운 TODO 생성"""
+        """새로운 TODO 생성 (본문은 CreateTodoRequest로 한 번만 검증)"""
         try:
-            data = request.get_json()
+            body = CreateTodoRequest.model_validate_json(request.get_data())
+            todo, = service.create_todos([body])
 
-            # 필수 필드 검증
-            if not data or 'content' not in data or 'target_date' not in data:
-                return jsonify({'error': '필수 필드가 없습니다'}), 400
+            return jsonify(serializer.to_dict(todo)), 201
+        except ValidationError as e:
+            return jsonify({'error': f'입력 오류: {describe_validation_error(e)}'}), 400
+        except InvalidTodoError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
 
-            target_date = datetime.fromisoformat(data['target_date'])
-            status = data.get('status', TodoStatus.SCHEDULED)
+    @app.route('/api/todos/batch', methods=['POST'])
+    def create_todos_batch():
+        """
+        여러 TODO를 한 번에 생성 (본문: CreateTodoRequest 객체의 JSON 배열)
 
-            todo = service.create_todo(data['content'], target_date, status)
+        배열 전체를 한 번에 검증하고, 하나라도 잘못되면 아무것도 만들지 않는다.
+        """
+        try:
+            bodies = CREATE_TODO_BATCH.validate_json(request.get_data())
+            todos = service.create_todos(bodies)
 
-            return jsonify(serializer.to_dict(todo)), 201
+            return app.json.raw_response(serializer.encode_list(todos)), 201
+        except ValidationError as e:
+            return jsonify({'error': f'입력 오류: {describe_validation_error(e)}'}), 400
         except InvalidTodoError as e:
             return jsonify({'error': str(e)}), 400
-        except ValueError as e:
-            return jsonify({'error': f'입력 오류: {str(e)}'}), 400
         except Exception as e:
             return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
 
@@ -87,20 +207,15 @@ def register_routes(app, service: TodoService, serializer: TodoSerializer):
 
     @app.route('/api/todos/<todo_id>', methods=['PUT'])
     def update_todo(todo_id):
-        """TODO 항목 수정"""
+        """TODO 항목 수정 (반복 TODO 회차는 새 ID의 TODO로 저장)"""
         try:
-            data = request.get_json()
-
-            target_date = None
-            if 'target_date' in data:
-                target_date = datetime.fromisoformat(data['target_date'])
+            body = UpdateTodoRequest.model_validate_json(request.get_data())
 
-            status = data.get('status')
-            content = data.get('content')
-
-            todo = service.update_todo(todo_id, content=content, target_date=target_date, status=status)
+            todo = service.apply_update(todo_id, body)
 
             return jsonify(serializer.to_dict(todo)), 200
+        except ValidationError as e:
+            return jsonify({'error': f'입력 오류: {describe_validation_error(e)}'}), 400
         except TodoNotFoundError as e:
             return jsonify({'error': str(e)}), 404
         except InvalidTodoError as e:
@@ -121,35 +236,105 @@ def register_routes(app, service: TodoService, serializer: TodoSerializer):
         except Exception as e:
             return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
 
+    @app.route('/api/todos/<todo_id>/restore', methods=['POST'])
+    def restore_todo(todo_id):
+        """삭제한 TODO 항목 복구"""
+        try:
+            todo = service.restore_todo(todo_id)
+            return jsonify(serializer.to_dict(todo)), 200
+        except TodoNotFoundError as e:
+            return jsonify({'error': str(e)}), 404
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
     @app.route('/api/todos/reorder', methods=['PUT'])
     def reorder_todos():
-        """TODO 항목의 순서 변경"""
+        """TODO 항목의 순서 변경 (본문은 ReorderRequest로 검증)"""
         try:
-            data = request.get_json()
+            body = ReorderRequest.model_validate_json(request.get_data())
 
-            if not data or 'order' not in data:
-                return jsonify({'error': '순서 정보가 없습니다'}), 400
-
-            service.reorder_todos(data['order'])
+            service.reorder_todos(body.order)
             return jsonify({'message': '순서가 업데이트되었습니다'}), 200
+        except ValidationError as e:
+            return jsonify({'error': f'입력 오류: {describe_validation_error(e)}'}), 400
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
+    @app.route('/api/todos/<todo_id>/move', methods=['POST'])
+    def move_todo(todo_id):
+        """TODO 하나를 다른 항목 앞/뒤 또는 특정 위치로 이동 (본문은 MoveTodoRequest로 검증)"""
+        try:
+            body = MoveTodoRequest.model_validate_json(request.get_data())
+
+            index = service.move_todo(todo_id, before=body.before, after=body.after, position=body.position)
+            return jsonify({'id': todo_id, 'index': index}), 200
+        except ValidationError as e:
+            return jsonify({'error': f'입력 오류: {describe_validation_error(e)}'}), 400
+        except TodoNotFoundError as e:
+            return jsonify({'error': str(e)}), 404
+        except InvalidTodoError as e:
+            return jsonify({'error': str(e)}), 400
         except Exception as e:
             return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
 
     @app.route('/api/todos/sort/date', methods=['PUT'])
     def sort_todos_by_date():
-        """TODO 항목을 날짜순으로 정렬"""
+        """날짜순 보기를 사용자 순서로 저장 (보기만 필요하면 GET ?sort=date)"""
         try:
+            serializer.parse_fields(request.args.get('fields'))  # 정렬 전에 쿼리 검증
             todos = service.sort_by_date()
-            return jsonify(serializer.to_list(todos)), 200
+            return list_response(todos), 200
+        except ValueError as e:
+            return jsonify({'error': f'입력 오류: {str(e)}'}), 400
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
+    @app.route('/api/archive', methods=['GET'])
+    def get_archived_todos():
+        """보관한 완료 항목을 보관 순서로 조회 (?offset=&limit=)"""
+        try:
+            limit = request.args.get('limit')
+            todos, total = service.get_archived_page(
+                int(request.args.get('offset', 0)),
+                None if limit is None else int(limit)
+            )
+            response = list_response(todos)
+            response.headers['X-Total-Count'] = str(total)
+            return response, 200
+        except InvalidTodoError as e:
+            return jsonify({'error': str(e)}), 400
+        except ValueError as e:
+            return jsonify({'error': f'입력 오류: {str(e)}'}), 400
+        except Exception as e:
+            return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
+
+    @app.route('/api/export', methods=['GET'])
+    def export_todos():
+        """보관한 항목을 포함한 모든 TODO를 한 줄에 하나씩 JSON으로 스트리밍 (NDJSON)"""
+        lines = (serializer.to_json(todo) + '\n' for todo in service.export_todos())
+        response = Response(lines, mimetype='application/x-ndjson')
+        response.headers['Content-Disposition'] = 'attachment; filename="todos.ndjson"'
+        return response
+
+    @app.route('/api/bootstrap', methods=['GET'])
+    def get_bootstrap():
+        """첫 화면용 목록 첫 페이지와 통계를 한 번에 조회"""
+        try:
+            return jsonify(bootstrap_payload()), 200
         except Exception as e:
             return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
 
     @app.route('/api/stats', methods=['GET'])
     def get_stats():
-        """TODO 통계"""
+        """TODO 통계 (?start=&end= 를 지정하면 그 구간의 TODO와 반복 TODO 회차만 집계)"""
         try:
-            stats = service.get_statistics()
+            window = date_range()
+            stats = service.get_statistics() if window is None else service.get_statistics(*window)
             return jsonify(stats), 200
+        except InvalidTodoError as e:
+            return jsonify({'error': str(e)}), 400
+        except ValueError as e:
+            return jsonify({'error': f'입력 오류: {str(e)}'}), 400
         except Exception as e:
             return jsonify({'error': '서버 오류 발생', 'details': str(e)}), 500
 
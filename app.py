@@ -1,17 +1,46 @@
-"""TODO 애플리케이션 엔트리 포인트"""
+"""TODO 애플리케이션 엔트리 포인트
+
+    python app.py                                              # 단독 실행
+    python app.py --role primary                               # 주 서버 (7001번 포트로 변경 로그 전송)
+    python app.py --role follower --port 5001                  # 읽기 전용 팔로워
+    python app.py --archive-dir data/archive                   # 오래된 완료 항목을 디스크로 보관
+"""
+import argparse
 from app import TodoApp
 
 
 def main():
     """애플리케이션 실행"""
+    parser = argparse.ArgumentParser(description='TODO 애플리케이션')
+    parser.add_argument('--host', default='0.0.0.0', help='HTTP 바인드 호스트')
+    parser.add_argument('--port', type=int, default=5000, help='HTTP 포트')
+    parser.add_argument('--role', choices=['primary', 'follower'], help='읽기 복제 역할')
+    parser.add_argument('--replication-host', default='127.0.0.1', help='주 서버 로그 전송 호스트')
+    parser.add_argument('--replication-port', type=int, default=7001, help='주 서버 로그 전송 포트')
+    parser.add_argument('--max-staleness', type=float, help='팔로워가 응답할 최대 복제 지연(초)')
+    parser.add_argument('--archive-dir', help='오래된 완료 항목을 보관할 디렉터리')
+    parser.add_argument('--archive-after-days', type=float, default=30, help='완료 후 보관까지 기다릴 일수')
+    parser.add_argument('--trace-memory', type=int, default=0, metavar='FRAMES',
+                        help='시작할 때부터 tracemalloc 추적 (저장할 호출 프레임 수)')
+    args = parser.parse_args()
+
     # TODO 앱 생성
-    todo_app = TodoApp()
-    
-    # 샘플 데이터 초기화
-    todo_app.initialize_sample_data()
-    
-    # 애플리케이션 실행
-    todo_app.run(debug=True, host='0.0.0.0', port=5000)
+    todo_app = TodoApp(config={
+        'REPLICATION_ROLE': args.role,
+        'REPLICATION_HOST': args.replication_host,
+        'REPLICATION_PORT': args.replication_port,
+        'REPLICA_MAX_STALENESS': args.max_staleness,
+        'ARCHIVE_DIR': args.archive_dir,
+        'ARCHIVE_AFTER': args.archive_after_days * 24 * 3600,
+        'TRACEMALLOC_FRAMES': args.trace_memory,
+    })
+
+    # 샘플 데이터 초기화 (팔로워는 주 서버에서 받음)
+    if args.role != 'follower':
+        todo_app.initialize_sample_data()
+
+    # 애플리케이션 실행 (복제 중에는 자동 재시작이 로그 전송 포트를 두 번 열지 않도록 디버그 모드 끔)
+    todo_app.run(debug=args.role is None, host=args.host, port=args.port)
 
 
 if __name__ == '__main__':
@@ -1,4 +1,19 @@
-"""애플리케이션 패키지"""
-from .app_factory import TodoApp
+"""애플리케이션 패키지
+
+TodoApp은 Flask와 라우트 전체를 불러오므로 처음 사용할 때 불러온다.
+"""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .app_factory import TodoApp
 
 __all__ = ['TodoApp']
+
+
+def __getattr__(name):
+    """TodoApp을 처음 접근할 때 app_factory 모듈을 불러옴"""
+    if name == 'TodoApp':
+        from .app_factory import TodoApp
+        globals()['TodoApp'] = TodoApp
+        return TodoApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
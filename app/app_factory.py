@@ -1,23 +1,46 @@
 """Flask 애플리케이션 설정 및 초기화"""
+import math
 import os
-from flask import Flask
+from flask import Flask, Response, g, jsonify, request
 from datetime import datetime
+from typing import Optional
 from models import TodoStatus
-from repositories import TodoRepository
-from services import TodoService
-from utils import TodoSerializer
-from api import register_routes
+from repositories import (
+    BaseTodoRepository, TodoRepository, TombstoneCompactor, RecurrenceStore, ColumnarMirror, QueryIndex,
+    ReplicationLog, ReplicaRepository, LogShipper, LogFollower, ColdStore, Archiver, StatsHistory
+)
+from services import TodoService, DeadlineScheduler, AnalyticsService
+from utils import (
+    TodoSerializer, ProfileStore, ProfilingMiddleware, ResponseCompressor, TodoJSONProvider, IdempotencyCache,
+    AdmissionController, AssetManifest, MemoryDiagnostics
+)
+from utils.idempotency import IDEMPOTENCY_HEADER, REPLAYED_HEADER, MAX_KEY_LENGTH, request_fingerprint
+from api import (
+    register_routes, register_admin_routes, register_analytics_routes, register_asset_routes,
+    register_recurrence_routes
+)
 
 
 class TodoApp:
     """TODO 애플리케이션 클래스"""
 
-    def __init__(self, app_name: str = __name__):
+    IDEMPOTENT_METHODS = frozenset({'POST', 'PUT', 'PATCH', 'DELETE'})  # Idempotency-Key를 적용할 메서드
+    REPLICA_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})  # 팔로워가 처리하는 메서드
+    VERSION_HEADER = 'X-Todo-Version'  # 응답 시점의 저장소 버전 (read-your-writes 토큰)
+    MIN_VERSION_HEADER = 'X-Min-Version'  # 팔로워가 이 버전까지 따라잡은 뒤 응답
+    MAX_STALENESS_HEADER = 'X-Max-Staleness'  # 허용할 복제 지연(초), 설정값보다 우선
+
+    def __init__(self, app_name: str = __name__, admin_token: Optional[str] = None,
+                 config: Optional[dict] = None, repository: Optional[BaseTodoRepository] = None):
         """
         애플리케이션 초기화
         
         Args:
             app_name: Flask 앱 이름
+            admin_token: 관리자 API 토큰 (기본값: 환경 변수 TODO_ADMIN_TOKEN)
+            config: 기본 설정을 덮어쓸 Flask 설정 (예: {'UNDO_WINDOW': 60})
+            repository: 사용할 저장소 백엔드 (기본값: UNDO_WINDOW 설정을 쓰는 TodoRepository,
+                REPLICATION_ROLE이 'follower'이면 ReplicaRepository)
         """
         # 프로젝트 루트 경로
         base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -27,23 +50,311 @@ class TodoApp:
             template_folder=os.path.join(base_path, 'templates'),
             static_folder=os.path.join(base_path, 'static')
         )
-        self._configure_app()
+        self._admin_token = admin_token or os.environ.get('TODO_ADMIN_TOKEN')
+        self._configure_app(config or {})
         
         # 의존성 주입
-        self.repository = TodoRepository()
-        self.service = TodoService(self.repository)
+        role = self.app.config['REPLICATION_ROLE']
+        if repository is None:
+            repository = ReplicaRepository() if role == 'follower' else TodoRepository(
+                undo_window=self.app.config['UNDO_WINDOW']
+            )
+        self.repository = repository
+        self.compactor = TombstoneCompactor(self.repository)  # 만료된 삭제 표시 정리 (run()에서 시작)
+        self.scheduler = DeadlineScheduler()  # 마감 시각에 기한 초과 표시 (run()에서 작업 스레드 시작)
+        self.scheduler.attach(self.repository)
+        self.recurrences = RecurrenceStore()  # 반복 TODO 규칙 (회차는 조회 구간에서만 계산)
+        self.query_index = QueryIndex()  # 조합 조회용 상태/텍스트 인덱스 (저장소 변경 이벤트로 갱신)
+        self.query_index.attach(self.repository)
+        self._configure_archive(role)
+        self.service = TodoService(self.repository, self.scheduler, self.recurrences, self.query_index, self.archive)
         self.serializer = TodoSerializer()
+        self.mirror = ColumnarMirror()  # 통계용 컬럼형 미러 (저장소 변경 이벤트로 갱신)
+        self.mirror.attach(self.repository)
+        # 상태별 개수 시계열 (저장소 변경 이벤트로 갱신, 해상도별 고정 크기 링 버퍼)
+        self.stats_history = StatsHistory(self.app.config['STATS_HISTORY_RESOLUTIONS'], self.archive)
+        self.stats_history.attach(self.repository)
+        self.analytics = AnalyticsService(self.mirror, self.archive, self.stats_history)
+        self.assets = AssetManifest(self.app.static_folder)  # 해시 이름 + 미리 압축한 정적 파일
+        self.admission = AdmissionController(
+            self.app.config['ADMISSION_CLASSES'],
+            self.app.config['ADMISSION_ENDPOINTS']
+        )
+        self._configure_replication(role)
+        self.memory = MemoryDiagnostics(self.app.config['MEMORY_SNAPSHOTS'])  # 관리자용 메모리 진단
         
-        # 라우트 등록
+        # 라우트 및 요청 훅 등록
         self._register_routes()
+        self._register_hooks()
+        self._register_memory_components()
 
-    def _configure_app(self) -> None:
-        """Flask 앱 설정"""
+    def _configure_app(self, overrides: dict) -> None:
+        """Flask 앱 설정 (overrides로 기본값 덮어쓰기)"""
         self.app.config['JSON_AS_ASCII'] = False  # 한글 지원
+        self.app.json = TodoJSONProvider(self.app)  # TodoItem/datetime/Enum 직접 인코딩
+        self.app.config['ADMIN_TOKEN'] = self._admin_token
+        self.app.config['COMPRESS_MIN_SIZE'] = 1024  # 이 크기 미만의 응답은 압축하지 않음
+        self.app.config['COMPRESS_LEVEL'] = 6
+        self.app.config['ASSET_MAX_AGE'] = 365 * 24 * 3600  # 해시 이름 정적 파일의 캐시 시간(초)
+        self.app.config['BOOTSTRAP_LIMIT'] = 100  # 메인 페이지에 함께 내려보낼 목록 첫 페이지 크기
+        self.app.config['UNDO_WINDOW'] = 30.0  # 삭제 후 복구 가능한 시간(초)
+        self.app.config['IDEMPOTENCY_TTL'] = 24 * 3600.0  # Idempotency-Key 응답 보관 시간(초)
+        self.app.config['IDEMPOTENCY_MAX_ENTRIES'] = 10000
+        self.app.config['IDEMPOTENCY_WAIT'] = 10.0  # 같은 키 요청이 처리 중일 때 기다릴 최대 시간(초)
+        # 통계 시계열 해상도: 이름 -> (버킷 길이(초), 버킷 수)
+        self.app.config['STATS_HISTORY_RESOLUTIONS'] = {'minute': (60, 1440), 'hour': (3600, 720), 'day': (86400, 730)}
+        self.app.config['MEMORY_SNAPSHOTS'] = 10  # 보관할 tracemalloc 스냅샷 수
+        self.app.config['TRACEMALLOC_FRAMES'] = 0  # 0보다 크면 시작할 때부터 이 프레임 수로 tracemalloc 추적
+        # 읽기 복제: 'primary'는 변경 로그를 보내고 'follower'는 받아서 읽기 요청만 처리 (None이면 단독 실행)
+        self.app.config['REPLICATION_ROLE'] = None
+        self.app.config['REPLICATION_HOST'] = '127.0.0.1'  # 주 서버 로그 전송 주소
+        self.app.config['REPLICATION_PORT'] = 7001
+        self.app.config['REPLICATION_LOG_SIZE'] = 10000  # 주 서버가 보관할 최근 레코드 수 (넘게 뒤처지면 전체 상태 전송)
+        self.app.config['REPLICA_MAX_STALENESS'] = None  # 팔로워가 응답할 최대 복제 지연(초, None이면 제한 없음)
+        self.app.config['REPLICA_WAIT'] = 2.0  # X-Min-Version 버전을 따라잡을 때까지 기다릴 최대 시간(초)
+        # 보관 계층: 오래된 완료 항목을 이 디렉터리의 압축 세그먼트로 옮김 (None이면 사용하지 않음)
+        self.app.config['ARCHIVE_DIR'] = None
+        self.app.config['ARCHIVE_AFTER'] = 30 * 24 * 3600.0  # 완료(마지막 수정) 후 보관까지 기다릴 시간(초)
+        self.app.config['ARCHIVE_INTERVAL'] = 3600.0  # 보관 작업 주기(초)
+        self.app.config['ARCHIVE_SEGMENT_SIZE'] = 1000  # 세그먼트 파일 하나에 담을 최대 항목 수
+        # 비용이 큰 엔드포인트의 클라이언트별 속도 제한(rate/burst)과 분류별 동시 실행 제한(concurrency/queue)
+        self.app.config['ADMISSION_CLASSES'] = {
+            'expensive': {'rate': 2.0, 'burst': 10, 'concurrency': 2, 'queue': 8, 'queue_timeout': 2.0},  # O(N log N)
+            'list': {'rate': 20.0, 'burst': 50, 'concurrency': 8, 'queue': 32, 'queue_timeout': 1.0},  # O(N)
+        }
+        self.app.config['ADMISSION_ENDPOINTS'] = {
+            'sort_todos_by_date': 'expensive',
+            'reorder_todos': 'expensive',
+            'get_todos': 'list',
+            'get_todos_by_status': 'list',
+            'get_overdue_todos': 'list',
+            'get_stats': 'list',
+            'get_bootstrap': 'list',
+            'get_recurrences': 'list',
+            'query_todos': 'list',
+            'get_archived_todos': 'list',
+            'export_todos': 'expensive',
+            'create_todos_batch': 'list',
+            'index': 'list',
+            'get_completion_rate': 'list',
+            'get_overdue': 'list',
+            'get_completion_time': 'list',
+            'get_stats_history': 'list',
+        }
+        self.app.config.update(overrides)
+        if self.app.config['TRACEMALLOC_FRAMES']:
+            MemoryDiagnostics.start(self.app.config['TRACEMALLOC_FRAMES'])
+
+        # 관리자가 요청한 경우에만 동작하는 프로파일러
+        self.profile_store = ProfileStore()
+        self.app.wsgi_app = ProfilingMiddleware(
+            self.app.wsgi_app,
+            self.profile_store,
+            lambda: self.app.config.get('ADMIN_TOKEN')
+        )
+
+    def _configure_replication(self, role: Optional[str]) -> None:
+        """복제 역할에 따라 로그 전송/수신 준비 (연결은 run()에서 시작)"""
+        self.replication_log = self.shipper = self.follower = None
+        address = (self.app.config['REPLICATION_HOST'], self.app.config['REPLICATION_PORT'])
+        # 반복 규칙과 보관 계층도 저장소 버전에 끼워 함께 복제 (X-Min-Version이 이 변경도 기다림)
+        states = {'recurrences': self.recurrences}
+        if self.archive is not None:
+            states['archive'] = self.archive
+        if role == 'primary':
+            self.replication_log = ReplicationLog(self.repository, self.app.config['REPLICATION_LOG_SIZE'])
+            for name, store in states.items():
+                self.replication_log.add_state(name, store.replication_state)
+                store.add_listener(lambda name=name: self.repository.publish_state(name))
+            self.shipper = LogShipper(self.replication_log, *address)
+        elif role == 'follower':
+            for name, store in states.items():
+                self.repository.add_state(name, store.load_state)
+            self.follower = LogFollower(self.repository, address)
+        elif role is not None:
+            raise ValueError(f"알 수 없는 REPLICATION_ROLE: {role!r}")
+
+    def _configure_archive(self, role: Optional[str]) -> None:
+        """
+        ARCHIVE_DIR이 있으면 보관 계층 준비 (보관 작업은 run()에서 시작)
+
+        팔로워는 주 서버와 같은 ARCHIVE_DIR을 읽기 전용으로 열고, 공개할 세그먼트는
+        복제로 받는다 (보관 작업 없음).
+        """
+        self.archive = self.archiver = None
+        directory = self.app.config['ARCHIVE_DIR']
+        if directory is None:
+            return
+        if role == 'follower':
+            self.archive = ColdStore(directory, replica=True)
+            return
+        self.archive = ColdStore(directory)
+        self.archiver = Archiver(
+            self.repository,
+            self.archive,
+            after=self.app.config['ARCHIVE_AFTER'],
+            interval=self.app.config['ARCHIVE_INTERVAL'],
+            segment_size=self.app.config['ARCHIVE_SEGMENT_SIZE'],
+        )
 
     def _register_routes(self) -> None:
         """라우트 등록"""
         register_routes(self.app, self.service, self.serializer)
+        register_admin_routes(self.app, self.profile_store, self.admission, self.memory)
+        register_analytics_routes(self.app, self.analytics)
+        register_asset_routes(self.app, self.assets)
+        register_recurrence_routes(self.app, self.service)
+
+    def _register_hooks(self) -> None:
+        """요청/응답 훅 등록"""
+        @self.app.before_request
+        def admit_request():
+            """비용이 큰 엔드포인트의 속도/동시 실행 제한 (제한 없는 엔드포인트는 조회 한 번)"""
+            endpoint_class = self.admission.get(request.endpoint)
+            if endpoint_class is None:
+                return None
+            status, retry_after = endpoint_class.admit(request.remote_addr or '-')
+            if status:
+                message = '요청이 너무 많습니다' if status == 429 else '서버가 혼잡합니다'
+                response = jsonify({'error': message})
+                response.status_code = status
+                response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+                return response
+            g.admission = endpoint_class
+
+        @self.app.teardown_request
+        def release_admission(error):
+            """동시 실행 자리 반납"""
+            endpoint_class = g.pop('admission', None)
+            if endpoint_class is not None:
+                endpoint_class.release()
+
+        self.compressor = ResponseCompressor(
+            min_size=self.app.config['COMPRESS_MIN_SIZE'],
+            level=self.app.config['COMPRESS_LEVEL']
+        )
+
+        @self.app.after_request
+        def compress_response(response):
+            """큰 응답을 Accept-Encoding에 맞춰 압축"""
+            return self.compressor.process(response, request.headers.get('Accept-Encoding'))
+
+        self.idempotency = IdempotencyCache(
+            max_entries=self.app.config['IDEMPOTENCY_MAX_ENTRIES'],
+            ttl=self.app.config['IDEMPOTENCY_TTL']
+        )
+
+        @self.app.before_request
+        def deduplicate_write():
+            """Idempotency-Key가 같은 쓰기 요청은 다시 처리하지 않고 첫 응답을 반환"""
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if key is None or request.method not in self.IDEMPOTENT_METHODS:
+                return None
+            if not key or len(key) > MAX_KEY_LENGTH:
+                return jsonify({'error': f'{IDEMPOTENCY_HEADER}는 1~{MAX_KEY_LENGTH}자여야 합니다'}), 400
+
+            fingerprint = request_fingerprint(request.method, request.path, request.get_data())
+            while True:
+                entry, owner = self.idempotency.begin(key, fingerprint)
+                if entry.fingerprint != fingerprint:
+                    return jsonify({'error': f'같은 {IDEMPOTENCY_HEADER}로 다른 요청을 보냈습니다'}), 422
+                if owner:
+                    g.idempotency = (key, entry)
+                    return None
+                if not entry.wait(self.app.config['IDEMPOTENCY_WAIT']):
+                    return jsonify({'error': f'같은 {IDEMPOTENCY_HEADER} 요청을 처리 중입니다'}), 409
+                if entry.response is not None:
+                    status, headers, body = entry.response
+                    replay = Response(body, status=status, headers=headers)
+                    replay.headers[REPLAYED_HEADER] = 'true'
+                    return replay
+                # 먼저 온 요청이 서버 오류로 끝났으면 이 요청이 다시 처리
+
+        # after_request는 등록 역순으로 실행되므로 압축 전의 응답을 저장
+        @self.app.after_request
+        def store_idempotent_response(response):
+            """Idempotency-Key 요청의 응답 저장 (서버 오류는 저장하지 않음)"""
+            pending = g.pop('idempotency', None)
+            if pending is not None:
+                key, entry = pending
+                if response.status_code >= 500 or response.direct_passthrough:
+                    self.idempotency.abandon(key, entry)
+                else:
+                    headers = [(name, value) for name, value in response.headers if name != 'Content-Length']
+                    self.idempotency.complete(entry, (response.status_code, headers, response.get_data()))
+            return response
+
+        @self.app.teardown_request
+        def release_idempotency_key(error):
+            """처리 중 예외로 응답을 저장하지 못한 키 해제"""
+            pending = g.pop('idempotency', None)
+            if pending is not None:
+                self.idempotency.abandon(*pending)
+
+        @self.app.after_request
+        def add_version_header(response):
+            """응답 시점의 저장소 버전 (쓰기 응답의 값을 팔로워에 X-Min-Version으로 보내면 read-your-writes)"""
+            response.headers[self.VERSION_HEADER] = str(self.repository.version)
+            return response
+
+        if self.follower is not None:
+            self._register_replica_hooks()
+
+    def _register_replica_hooks(self) -> None:
+        """팔로워 요청 훅: 쓰기 거부, 버전 대기, 복제 지연 제한 (다른 훅보다 먼저 실행)"""
+        def unavailable(message: str):
+            response = jsonify({'error': message})
+            response.status_code = 503
+            response.headers['Retry-After'] = '1'
+            return response
+
+        def check_replica():
+            if request.method not in self.REPLICA_METHODS:
+                response = jsonify({'error': '읽기 전용 복제본입니다'})
+                response.status_code = 405
+                response.headers['Allow'] = ', '.join(sorted(self.REPLICA_METHODS))
+                return response
+            try:
+                min_version = int(request.headers.get(self.MIN_VERSION_HEADER, 0))
+                max_staleness = request.headers.get(self.MAX_STALENESS_HEADER)
+                max_staleness = (float(max_staleness) if max_staleness is not None
+                                 else self.app.config['REPLICA_MAX_STALENESS'])
+            except ValueError:
+                return jsonify({'error': f'{self.MIN_VERSION_HEADER}/{self.MAX_STALENESS_HEADER} 형식이 잘못되었습니다'}), 400
+            if min_version > self.repository.version and \
+                    not self.follower.wait_for(min_version, self.app.config['REPLICA_WAIT']):
+                return unavailable('복제본이 요청한 버전을 아직 받지 못했습니다')
+            if max_staleness is not None and self.follower.staleness() > max_staleness:
+                return unavailable('복제본이 허용 지연보다 오래되었습니다')
+            return None
+
+        # 쓰기 요청이 Idempotency-Key 처리나 동시 실행 제한 자리를 차지하기 전에 거부
+        self.app.before_request_funcs.setdefault(None, []).insert(0, check_replica)
+
+        @self.app.after_request
+        def add_staleness_header(response):
+            """팔로워의 현재 복제 지연(초)"""
+            response.headers['X-Replica-Staleness'] = f'{self.follower.staleness():.3f}'
+            return response
+
+    def _register_memory_components(self) -> None:
+        """구조별 크기를 잴 구성 요소 등록 (항목 객체는 먼저 등록한 저장소에 포함됨)"""
+        components = [
+            ('repository', self.repository),
+            ('query_index', self.query_index),
+            ('scheduler', self.scheduler),
+            ('mirror', self.mirror),
+            ('stats_history', self.stats_history),
+            ('recurrences', self.recurrences),
+            ('archive', self.archive),
+            ('replication_log', self.replication_log),
+            ('idempotency', self.idempotency),
+            ('profiles', self.profile_store),
+            ('assets', self.assets),
+        ]
+        for name, component in components:
+            if component is not None:
+                self.memory.register(name, component)
 
     def initialize_sample_data(self) -> None:
         """샘플 데이터 초기화"""
@@ -72,4 +383,18 @@ class TodoApp:
             host: 바인드할 호스트
             port: 바인드할 포트
         """
-        self.app.run(debug=debug, host=host, port=port)
+        if self.follower is not None:
+            self.follower.start()  # 마감 표시와 삭제 표시 정리는 주 서버가 하고 그 결과를 복제로 받음
+        else:
+            self.scheduler.start()
+            self.compactor.start()
+            if self.archiver is not None:
+                self.archiver.start()
+        if self.shipper is not None:
+            self.shipper.start()
+        try:
+            self.app.run(debug=debug, host=host, port=port)
+        finally:
+            for worker in (self.shipper, self.follower, self.archiver, self.compactor, self.scheduler):
+                if worker is not None:
+                    worker.stop()
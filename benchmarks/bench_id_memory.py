@@ -0,0 +1,102 @@
+"""항목당 메모리 벤치마크: 문자열 ID 키 구조 vs 정수 대리 키(sid) 구조
+
+TodoItem 객체 자체(와 그 id 문자열)는 두 구조가 공유하므로 측정에서 제외하고,
+저장소가 추가로 유지하는 구조(항목 맵, 순서 구조, 보조 인덱스)만 tracemalloc으로
+측정한다.
+
+- 문자열 키: dict[str, TodoItem] + str 키 순위 dict와 순위/ID 청크 리스트
+  (sid 도입 전 OrderIndex 구조) + dict[str, status] 형태의 보조 인덱스
+- sid: IdTable(dict[str, int]) + sid 색인 항목 리스트 + array 기반 OrderIndex
+  + sid 색인 bytearray 상태 컬럼
+
+    python -m benchmarks.bench_id_memory --items 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+from uuid import uuid4
+from repositories.id_table import IdTable
+from repositories.order_index import OrderIndex
+
+LOAD = OrderIndex._LOAD
+RANK_STEP = OrderIndex._RANK_STEP
+
+
+class _Item:
+    """TodoItem 대용 (id와 상태만 가진 가벼운 객체)"""
+    __slots__ = ('id', 'status')
+
+    def __init__(self, todo_id: str, status: int):
+        self.id = todo_id
+        self.status = status
+
+
+def measure(build) -> tuple:
+    """build()가 만든 구조의 (결과, 증가한 메모리 바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def string_keyed(items: list) -> dict:
+    """문자열 ID를 키로 쓰는 구조의 구성 요소별 메모리"""
+    sizes = {}
+    _, sizes['항목 맵'] = measure(lambda: {item.id: item for item in items})
+
+    def build_order():
+        ids = [item.id for item in items]
+        ranks = [(i + 1) * RANK_STEP for i in range(len(ids))]
+        return (
+            dict(zip(ids, ranks)),
+            [ids[i:i + LOAD] for i in range(0, len(ids), LOAD)],
+            [ranks[i:i + LOAD] for i in range(0, len(ranks), LOAD)],
+        )
+    _, sizes['순서 구조'] = measure(build_order)
+    _, sizes['상태 인덱스'] = measure(lambda: {item.id: item.status for item in items})
+    return sizes
+
+
+def sid_keyed(items: list) -> dict:
+    """sid를 쓰는 구조의 구성 요소별 메모리"""
+    sizes = {}
+
+    def build_map():
+        table = IdTable()
+        slots = []
+        for item in items:
+            table.intern(item.id)
+            slots.append(item)
+        return table, slots
+    (table, _), sizes['항목 맵'] = measure(build_map)
+    _, sizes['순서 구조'] = measure(lambda: OrderIndex(range(len(items))))
+    _, sizes['상태 인덱스'] = measure(lambda: bytearray(item.status for item in items))
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=1_000_000, help='TODO 개수')
+    args = parser.parse_args()
+
+    items = [_Item(str(uuid4()), i % 3) for i in range(args.items)]
+    results = {'문자열 키': string_keyed(items), 'sid': sid_keyed(items)}
+
+    print(f"items={args.items:,} (단위: 항목당 바이트)")
+    print(f"{'구조':<14}{'문자열 키':>12}{'sid':>12}{'절감':>10}")
+    totals = {name: 0 for name in results}
+    for part in results['문자열 키']:
+        row = {name: sizes[part] / args.items for name, sizes in results.items()}
+        for name in totals:
+            totals[name] += results[name][part]
+        saving = 1 - row['sid'] / row['문자열 키']
+        print(f"{part:<14}{row['문자열 키']:>12.1f}{row['sid']:>12.1f}{saving:>10.0%}")
+    before, after = (totals[name] / args.items for name in ('문자열 키', 'sid'))
+    print(f"{'합계':<14}{before:>12.1f}{after:>12.1f}{1 - after / before:>10.0%}")
+
+
+if __name__ == '__main__':
+    main()
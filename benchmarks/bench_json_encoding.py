@@ -0,0 +1,94 @@
+"""JSON 인코딩 처리량 벤치마크
+
+기존 경로(jsonify(serializer.to_list(todos)) + Flask 기본 프로바이더)와
+TodoJSONProvider, TodoSerializer.encode_list 직접 인코딩 경로를 비교한다.
+
+    python -m benchmarks.bench_json_encoding --items 100000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from models import TodoItem, TodoStatus
+from utils import TodoSerializer, TodoJSONProvider
+from utils import json_provider, serializer
+
+
+def build_todos(count: int) -> list:
+    """벤치마크용 TODO 목록 생성"""
+    statuses = list(TodoStatus)
+    base = datetime(2026, 1, 1)
+    return [
+        TodoItem(
+            content=f"벤치마크 항목 {i}",
+            target_date=base + timedelta(minutes=i),
+            status=statuses[i % len(statuses)],
+        )
+        for i in range(count)
+    ]
+
+
+def measure(func, repeat: int) -> float:
+    """가장 빠른 실행 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=50_000, help='TODO 개수')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수')
+    args = parser.parse_args()
+
+    todos = build_todos(args.items)
+
+    default_app = Flask('bench-default')
+    default_app.json = DefaultJSONProvider(default_app)
+    todo_app = Flask('bench-todo')
+    todo_app.json = TodoJSONProvider(todo_app)
+
+    def run_default():
+        with default_app.app_context():
+            return default_app.json.response(TodoSerializer.to_list(todos)).get_data()
+
+    def run_provider():
+        with todo_app.app_context():
+            return todo_app.json.response(TodoSerializer.to_list(todos)).get_data()
+
+    def run_direct():
+        return todo_app.json.raw_response(TodoSerializer.encode_list(todos)).get_data()
+
+    def run_direct_stdlib():
+        fast_encoder, serializer.orjson = serializer.orjson, None
+        try:
+            return run_direct()
+        finally:
+            serializer.orjson = fast_encoder
+
+    cases = [
+        ('jsonify + to_list (기존)', run_default),
+        ('TodoJSONProvider + to_list', run_provider),
+        ('encode_list 직접 인코딩', run_direct),
+    ]
+    if serializer.orjson is not None:
+        cases.append(('encode_list (표준 라이브러리 폴백)', run_direct_stdlib))
+
+    encoder = 'orjson' if json_provider.orjson is not None else 'json (표준 라이브러리)'
+    print(f"items={args.items:,} repeat={args.repeat} provider encoder={encoder}")
+    print(f"{'경로':<32}{'시간(ms)':>12}{'items/s':>14}{'MB/s':>10}")
+    baseline = None
+    for name, func in cases:
+        size = len(func())
+        elapsed = measure(func, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:<32}{elapsed * 1000:>12.1f}{args.items / elapsed:>14,.0f}"
+              f"{size / elapsed / 1e6:>10.1f}  (x{baseline / elapsed:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+"""실제 사용 패턴을 흉내 낸 부하 테스트
+
+로컬에서 TodoApp을 멀티스레드 HTTP 서버로 띄우고, 여러 클라이언트 스레드가
+script.js와 같은 요청 묶음(동작)을 가중치에 따라 무작위로 보낸다.
+예를 들어 생성 동작은 POST 뒤에 목록과 통계를 다시 불러온다.
+
+- load: 첫 화면 (GET /api/todos/all, GET /api/stats)
+- filter: 상태 탭 클릭 (GET /api/todos/<status>)
+- date_view: 날짜순 보기 (GET /api/todos/all?sort=date)
+- stats: 통계 새로고침 (GET /api/stats)
+- create / update / delete: 쓰기 후 목록과 통계 다시 불러오기
+- move: 드래그 앤 드롭 (POST /api/todos/<id>/move)
+- reorder: 전체 순서 저장 (GET /api/todos, PUT /api/todos/reorder)
+
+저장소 크기별로 라우트별 처리량과 p50/p95/p99 지연 시간을 출력하고,
+마지막에 크기에 따른 변화를 요약한다. 외부 서비스나 추가 패키지는 필요 없다.
+
+    python -m benchmarks.bench_load --sizes 100,1000,10000 --clients 8 --duration 5
+    python -m benchmarks.bench_load --mix filter=5,create=1,delete=1
+"""
+import argparse
+import gzip
+import http.client
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+from werkzeug.serving import make_server
+from app import TodoApp
+from models import TodoStatus
+
+# 동작별 기본 가중치 (화면 조회가 대부분이고 쓰기는 일부)
+DEFAULT_MIX = {
+    'load': 10, 'filter': 25, 'date_view': 5, 'stats': 10,
+    'create': 10, 'update': 10, 'move': 15, 'reorder': 5, 'delete': 10,
+}
+STATUS_FILTERS = ['all', '예정', '진행중', '완료']
+STATUSES = [status.value for status in TodoStatus]
+
+
+def parse_mix(text: Optional[str]) -> Dict[str, int]:
+    """'filter=5,create=1' 형식의 가중치 (없는 동작은 0)"""
+    if not text:
+        return dict(DEFAULT_MIX)
+    mix = dict.fromkeys(DEFAULT_MIX, 0)
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name not in mix:
+            raise SystemExit(f"알 수 없는 동작: {name} (가능: {', '.join(DEFAULT_MIX)})")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """정렬된 표본의 q 백분위수 (nearest-rank)"""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, max(0, int(q / 100 * len(samples) + 0.5) - 1))]
+
+
+class LoadClient:
+    """
+    브라우저 한 개를 흉내 내는 클라이언트
+
+    연결을 유지한 채 요청을 보내고, 마지막으로 받은 목록의 ID로 수정/삭제/이동
+    대상을 고른다. 라우트별 지연 시간은 클라이언트마다 따로 모았다가 합친다.
+    """
+
+    def __init__(self, port: int, seed: int):
+        self._conn = http.client.HTTPConnection('127.0.0.1', port)
+        self._random = random.Random(seed)
+        self.ids: List[str] = []
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def request(self, method: str, route: str, path: str, body=None, headers=None):
+        """요청 하나를 보내고 (상태 코드, JSON 본문) 반환"""
+        headers = {'Accept-Encoding': 'gzip', **(headers or {})}
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json'
+        start = time.perf_counter()
+        self._conn.request(method, path, data, headers)
+        response = self._conn.getresponse()
+        payload = response.read()
+        self.latencies[f"{method} {route}"].append(time.perf_counter() - start)
+        if response.status >= 400:
+            self.errors[f"{method} {route}"] += 1
+            return response.status, None
+        if response.getheader('Content-Encoding') == 'gzip':
+            payload = gzip.decompress(payload)
+        return response.status, json.loads(payload) if payload else None
+
+    def close(self) -> None:
+        self._conn.close()
+
+    # ---- 동작 (script.js의 요청 순서) ----
+
+    def refresh(self) -> None:
+        """loadTodos() + updateStats()"""
+        _, todos = self.request('GET', '/api/todos/<status>', '/api/todos/all')
+        if todos is not None:
+            self.ids = [todo['id'] for todo in todos]
+        self.request('GET', '/api/stats', '/api/stats')
+
+    def load(self) -> None:
+        self.refresh()
+
+    def filter(self) -> None:
+        status = self._random.choice(STATUS_FILTERS)
+        self.request('GET', '/api/todos/<status>', f'/api/todos/{quote(status)}')  # 브라우저처럼 한글 경로 인코딩
+
+    def date_view(self) -> None:
+        self.request('GET', '/api/todos/<status>?sort=date', '/api/todos/all?sort=date')
+
+    def stats(self) -> None:
+        self.request('GET', '/api/stats', '/api/stats')
+
+    def create(self) -> None:
+        target = datetime(2026, 1, 1) + timedelta(days=self._random.randrange(365))
+        self.request('POST', '/api/todos', '/api/todos', {
+            'content': f"부하 테스트 {self._random.random():.6f}",
+            'target_date': target.isoformat(),
+            'status': self._random.choice(STATUSES),
+        }, {'Idempotency-Key': str(uuid.uuid4())})
+        self.refresh()
+
+    def update(self) -> None:
+        if not self.ids:
+            return self.refresh()
+        todo_id = self._random.choice(self.ids)
+        self.request('PUT', '/api/todos/<id>', f'/api/todos/{todo_id}', {
+            'status': self._random.choice(STATUSES),
+        }, {'Idempotency-Key': str(uuid.uuid4())})
+        self.refresh()
+
+    def delete(self) -> None:
+        if not self.ids:
+            return self.refresh()
+        todo_id = self.ids.pop(self._random.randrange(len(self.ids)))
+        self.request('DELETE', '/api/todos/<id>', f'/api/todos/{todo_id}',
+                     headers={'Idempotency-Key': str(uuid.uuid4())})
+        self.refresh()
+
+    def move(self) -> None:
+        if len(self.ids) < 2:
+            return self.refresh()
+        todo_id, anchor = self._random.sample(self.ids, 2)
+        status, _ = self.request('POST', '/api/todos/<id>/move', f'/api/todos/{todo_id}/move',
+                                 {self._random.choice(['before', 'after']): anchor},
+                                 {'Idempotency-Key': str(uuid.uuid4())})
+        if status >= 400:
+            self.refresh()  # 실패 시 다시 로드
+
+    def reorder(self) -> None:
+        _, todos = self.request('GET', '/api/todos', '/api/todos')
+        if not todos:
+            return
+        order = [todo['id'] for todo in todos]
+        self._random.shuffle(order)
+        self.request('PUT', '/api/todos/reorder', '/api/todos/reorder', {'order': order},
+                     {'Idempotency-Key': str(uuid.uuid4())})
+
+
+def run_round(size: int, mix: Dict[str, int], clients: int, duration: float,
+              admission: bool, seed: int) -> Tuple[Dict[str, List[float]], Dict[str, int], float]:
+    """
+    항목 size개를 넣은 앱에 duration초 동안 부하를 줌
+
+    Returns:
+        (라우트별 정렬된 지연 시간, 라우트별 오류 수, 실제 측정 시간)
+    """
+    config = {} if admission else {'ADMISSION_ENDPOINTS': {}}
+    todo_app = TodoApp(config=config)
+    rng = random.Random(seed)
+    for i in range(size):
+        todo_app.service.create_todo(
+            f"항목 {i}",
+            datetime(2026, 1, 1) + timedelta(days=rng.randrange(365)),
+            rng.choice(list(TodoStatus))
+        )
+
+    server = make_server('127.0.0.1', 0, todo_app.app, threaded=True)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    todo_app.scheduler.start()
+    todo_app.compactor.start()
+
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    workers = [LoadClient(server.server_port, seed + k) for k in range(clients)]
+    stop = threading.Event()
+
+    def work(client: LoadClient) -> None:
+        client.refresh()
+        client.latencies.clear()  # 워밍업 요청은 제외
+        client.errors.clear()
+        while not stop.is_set():
+            getattr(client, client._random.choices(names, weights)[0])()
+
+    threads = [threading.Thread(target=work, args=(client,)) for client in workers]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    server.shutdown()
+    todo_app.compactor.stop()
+    todo_app.scheduler.stop()
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    for client in workers:
+        client.close()
+        for route, samples in client.latencies.items():
+            latencies[route].extend(samples)
+        for route, count in client.errors.items():
+            errors[route] += count
+    for samples in latencies.values():
+        samples.sort()
+    return latencies, errors, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='100,1000,10000', help='저장소 크기 목록 (쉼표 구분)')
+    parser.add_argument('--clients', type=int, default=8, help='동시 클라이언트 수')
+    parser.add_argument('--duration', type=float, default=5.0, help='크기별 측정 시간(초)')
+    parser.add_argument('--mix', help=f"동작별 가중치 (기본값: {','.join(f'{k}={v}' for k, v in DEFAULT_MIX.items())})")
+    parser.add_argument('--admission', action='store_true', help='요청 진입 제어(속도/동시 실행 제한) 켜기')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)  # 요청별 접근 로그 끄기
+    mix = parse_mix(args.mix)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    summary = []
+
+    for size in sizes:
+        latencies, errors, elapsed = run_round(size, mix, args.clients, args.duration, args.admission, args.seed)
+        total = sum(len(samples) for samples in latencies.values())
+        print(f"\n== items={size:,}, clients={args.clients}, {elapsed:.1f}초, "
+              f"전체 {total:,}건 ({total / elapsed:,.0f} req/s) ==")
+        print(f"{'라우트':<40}{'요청':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'오류':>6}")
+        for route in sorted(latencies):
+            samples = latencies[route]
+            print(f"{route:<40}{len(samples):>8,}{len(samples) / elapsed:>9,.0f}"
+                  f"{percentile(samples, 50) * 1000:>9.2f}{percentile(samples, 95) * 1000:>9.2f}"
+                  f"{percentile(samples, 99) * 1000:>9.2f}{errors.get(route, 0):>6}")
+        merged = sorted(sample for samples in latencies.values() for sample in samples)
+        summary.append((size, total / elapsed, percentile(merged, 50), percentile(merged, 99),
+                        sum(errors.values())))
+
+    print("\n== 저장소 크기별 변화 ==")
+    print(f"{'items':>10}{'req/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'오류':>6}")
+    for size, throughput, p50, p99, error_count in summary:
+        print(f"{size:>10,}{throughput:>10,.0f}{p50 * 1000:>9.2f}{p99 * 1000:>9.2f}{error_count:>6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""반복 TODO 회차 계산 벤치마크
+
+오래전에 시작한 규칙 N개(매일/매주/매월/요일 지정 매주)에 대해 조회 구간의
+회차를 계산하는 시간을 다음 두 방식으로 비교한다.
+
+- rrule.between: 규칙마다 dateutil rrule로 시작 날짜부터 회차를 세는 방식
+- RecurrenceStore: 구간 시작 위치로 바로 건너뛰어 구간 안의 회차만 계산
+
+    python -m benchmarks.bench_recurrence --rules 1000,5000 --days 1,7,31
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from models import RecurrenceRule
+from repositories import RecurrenceStore
+
+
+def timed(func, repeat: int) -> float:
+    """repeat번 실행 중 최단 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def make_rules(count: int, seed: int):
+    """2020~2021년에 시작한 규칙 count개"""
+    rng = random.Random(seed)
+    rules = []
+    for i in range(count):
+        frequency = ["daily", "weekly", "monthly", "weekly"][i % 4]
+        rules.append(RecurrenceRule(
+            content=f"규칙 {i}",
+            start=datetime(2020, 1, 1, 9) + timedelta(days=rng.randrange(730)),
+            frequency=frequency,
+            weekdays=rng.sample(range(7), 2) if i % 4 == 3 else None,
+        ))
+    return rules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rules', default='1000,5000', help='규칙 개수 목록 (쉼표 구분)')
+    parser.add_argument('--days', default='1,7,31', help='조회 구간 길이(일) 목록 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최단 시간 사용)')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    window_start = datetime(2026, 3, 1)
+    print(f"{'규칙':>8}{'구간(일)':>10}{'회차':>10}{'rrule ms':>11}{'store ms':>11}{'배율':>8}")
+    for count in (int(value) for value in args.rules.split(',')):
+        store = RecurrenceStore()
+        rules = [store.add(rule) for rule in make_rules(count, args.seed)]
+        compiled = [store._rules[rule.id].rrule for rule in rules]
+        for days in (int(value) for value in args.days.split(',')):
+            window_end = window_start + timedelta(days=days)
+            occurrences = store.count(window_start, window_end)
+            baseline = timed(lambda: [r.between(window_start, window_end, inc=True) for r in compiled], args.repeat)
+            current = timed(lambda: store.count(window_start, window_end), args.repeat)
+            print(f"{count:>8,}{days:>10}{occurrences:>10,}{baseline * 1000:>11.1f}"
+                  f"{current * 1000:>11.1f}{baseline / current:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""읽기 복제본 수에 따른 읽기 처리량 벤치마크
+
+주 서버 하나와 팔로워 N개를 각각 별도 프로세스로 띄우고, 팔로워마다 클라이언트
+프로세스를 같은 수만큼 붙여 duration초 동안 GET /api/todos/all을 보낸다.
+팔로워 수별 전체 처리량과 팔로워 1개 대비 배율을 출력한다. 프로세스마다
+GIL이 따로 있으므로 CPU 코어가 팔로워+클라이언트 수만큼 있어야 배율이
+팔로워 수에 가깝게 나온다.
+
+측정 전 주 서버에 쓰기를 하나 보내고, 그 응답의 X-Todo-Version을 X-Min-Version으로
+실어 모든 팔로워가 따라잡았는지(read-your-writes) 확인한다.
+
+    python -m benchmarks.bench_replication --followers 1,2,4 --clients 2 --duration 5
+"""
+import argparse
+import http.client
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+READ_PATH = '/api/todos/all'
+
+
+def serve(role: str, replication_port: int, size: int) -> None:
+    """
+    하위 프로세스: 주 서버 또는 팔로워를 띄우고 포트를 JSON 한 줄로 출력
+
+    진입 제어는 끔 (같은 주소의 클라이언트가 속도 제한에 걸리지 않도록).
+    """
+    from werkzeug.serving import make_server
+    from app import TodoApp
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    todo_app = TodoApp(config={
+        'REPLICATION_ROLE': role,
+        'REPLICATION_PORT': replication_port,
+        'ADMISSION_ENDPOINTS': {},
+    })
+    if role == 'primary':
+        for i in range(size):
+            todo_app.service.create_todo(f"항목 {i}", datetime(2026, 1, 1) + timedelta(days=i % 365))
+        todo_app.shipper.start()
+        replication_port = todo_app.shipper.address[1]
+    else:
+        todo_app.follower.start()
+    server = make_server('127.0.0.1', 0, todo_app.app, threaded=True)
+    print(json.dumps({'http': server.server_port, 'replication': replication_port}), flush=True)
+    server.serve_forever()
+
+
+def spawn(stack: ExitStack, role: str, replication_port: int = 0, size: int = 0) -> Dict[str, int]:
+    """serve()를 하위 프로세스로 실행하고 출력한 포트를 반환 (stack을 닫으면 종료)"""
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'benchmarks.bench_replication', '--serve', role,
+         '--replication-port', str(replication_port), '--size', str(size)],
+        cwd=ROOT, stdout=subprocess.PIPE, text=True
+    )
+    stack.callback(process.wait)
+    stack.callback(process.kill)
+    line = process.stdout.readline()
+    if not line:
+        raise RuntimeError(f"{role} 프로세스를 시작하지 못했습니다")
+    return json.loads(line)
+
+
+def request(port: int, method: str, path: str, body=None, headers=None) -> Tuple[int, Dict[str, str], bytes]:
+    """요청 하나 (상태 코드, 헤더, 본문)"""
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    try:
+        payload = None if body is None else json.dumps(body)
+        conn.request(method, path, payload, {'Content-Type': 'application/json', **(headers or {})})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+
+def read_loop(port: int, duration: float) -> int:
+    """클라이언트 프로세스: duration초 동안 목록을 읽은 횟수"""
+    count = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        status, _, _ = request(port, 'GET', READ_PATH)
+        if status == 200:
+            count += 1
+    return count
+
+
+def measure_read_scaling(follower_counts: Iterable[int], clients_per_follower: int = 2,
+                         duration: float = 5.0, size: int = 200) -> Dict[int, float]:
+    """
+    팔로워 수별 전체 읽기 처리량(req/s)
+
+    Raises:
+        RuntimeError: 팔로워가 주 서버의 쓰기를 따라잡지 못함
+    """
+    results = {}
+    with ExitStack() as primary_stack:
+        primary = spawn(primary_stack, 'primary', size=size)
+        for count in follower_counts:
+            with ExitStack() as stack:
+                ports = [spawn(stack, 'follower', primary['replication'])['http'] for _ in range(count)]
+                _, headers, _ = request(primary['http'], 'POST', '/api/todos',
+                                        {'content': '복제 확인', 'target_date': '2026-06-01T00:00:00'})
+                token = {'X-Min-Version': headers['X-Todo-Version']}
+                for port in ports:
+                    for _ in range(50):  # 팔로워의 HTTP 서버는 떠 있어도 첫 연결 전일 수 있음
+                        status, _, _ = request(port, 'GET', READ_PATH, headers=token)
+                        if status == 200:
+                            break
+                    else:
+                        raise RuntimeError(f"팔로워 {port}가 버전 {token['X-Min-Version']}을 받지 못했습니다")
+
+                clients = [ports[k % count] for k in range(count * clients_per_follower)]
+                start = time.perf_counter()
+                with ProcessPoolExecutor(len(clients)) as pool:
+                    total = sum(pool.map(read_loop, clients, [duration] * len(clients)))
+                results[count] = total / (time.perf_counter() - start)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--followers', default='1,2,4', help='팔로워 수 목록 (쉼표 구분)')
+    parser.add_argument('--clients', type=int, default=2, help='팔로워당 클라이언트 프로세스 수')
+    parser.add_argument('--duration', type=float, default=5.0, help='팔로워 수별 측정 시간(초)')
+    parser.add_argument('--size', type=int, default=200, help='주 서버에 넣을 TODO 개수')
+    parser.add_argument('--serve', choices=['primary', 'follower'], help=argparse.SUPPRESS)
+    parser.add_argument('--replication-port', type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.replication_port, args.size)
+        return
+
+    counts: List[int] = [int(count) for count in args.followers.split(',')]
+    print(f"CPU {os.cpu_count()}개, items={args.size:,}, 팔로워당 클라이언트 {args.clients}개, {args.duration}초")
+    results = measure_read_scaling(counts, args.clients, args.duration, args.size)
+    base = results[counts[0]] / counts[0]
+    print(f"{'팔로워':>6}{'클라이언트':>10}{'req/s':>10}{'팔로워 1개 대비':>16}")
+    for count in counts:
+        print(f"{count:>6}{count * args.clients:>10}{results[count]:>10,.0f}{results[count] / base:>15.2f}x")
+
+
+if __name__ == '__main__':
+    main()
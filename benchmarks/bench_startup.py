@@ -0,0 +1,84 @@
+"""시작 시간 벤치마크
+
+각 진입점을 새 인터프리터에서 `-X importtime` 으로 불러와 import 비용과
+웹 스택(Flask) 로딩 여부를 측정하고, TodoApp() 생성과
+initialize_sample_data() 시간을 측정한다.
+
+    python -m benchmarks.bench_startup --repeat 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = [
+    ('repositories', 'import repositories'),
+    ('services', 'import services'),
+    ('utils', 'import utils'),
+    ('app (패키지만)', 'import app'),
+    ('app.TodoApp', 'from app import TodoApp'),
+]
+
+APP_STARTUP_SCRIPT = """
+import time
+started = time.perf_counter()
+from app import TodoApp
+imported = time.perf_counter()
+todo_app = TodoApp()
+constructed = time.perf_counter()
+todo_app.initialize_sample_data()
+initialized = time.perf_counter()
+print(imported - started, constructed - imported, initialized - constructed)
+"""
+
+
+def run_python(args: list) -> subprocess.CompletedProcess:
+    """저장소 루트에서 새 인터프리터 실행"""
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def import_time_ms(statement: str) -> tuple:
+    """-X importtime 결과에서 (총 import 시간 ms, flask 로딩 여부) 계산"""
+    result = run_python(['-X', 'importtime', '-c', statement])
+    total_us = 0
+    loaded_flask = False
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # 들여쓰기가 없는 줄이 최상위 import이며 cumulative는 하위 import를 포함한다
+        if not name.startswith('  ', 1):
+            total_us += int(cumulative)
+        loaded_flask = loaded_flask or name.strip() == 'flask'
+    return total_us / 1000, loaded_flask
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (중앙값 사용)')
+    args = parser.parse_args()
+
+    print(f"{'진입점':<20}{'import(ms)':>12}{'Flask 로딩':>12}")
+    for name, statement in ENTRY_POINTS:
+        samples = [import_time_ms(statement) for _ in range(args.repeat)]
+        median = statistics.median(sample[0] for sample in samples)
+        print(f"{name:<20}{median:>12.1f}{'예' if samples[0][1] else '아니오':>12}")
+
+    timings = []
+    for _ in range(args.repeat):
+        output = run_python(['-c', APP_STARTUP_SCRIPT]).stdout.split()
+        timings.append([float(value) * 1000 for value in output])
+    labels = ['from app import TodoApp', 'TodoApp()', 'initialize_sample_data()']
+    print()
+    print(f"{'단계':<28}{'중앙값(ms)':>12}")
+    for i, label in enumerate(labels):
+        print(f"{label:<28}{statistics.median(sample[i] for sample in timings):>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
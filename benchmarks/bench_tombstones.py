@@ -0,0 +1,75 @@
+"""삭제 표시 비율에 따른 목록 읽기 비용 벤치마크
+
+삭제 표시(tombstone) 비율을 높여 가며 다음 두 방식의 전체 목록 읽기 시간을
+남은 항목 1개당 나노초로 비교하고, 마지막에 모든 삭제 표시를 배치 단위로
+정리하는 시간을 잰다.
+
+- 읽을 때 거르기: 항목 리스트와 삭제 플래그를 두고 매번 걸러 읽는 방식
+- TodoRepository: 삭제 시 순서에서 빼고 삭제 표시만 남기므로 읽기 경로가
+  삭제 항목을 보지 않음
+
+    python -m benchmarks.bench_tombstones --items 200000
+"""
+import argparse
+import random
+import time
+from datetime import datetime
+from repositories import TodoRepository, TombstoneCompactor
+
+
+def timed(func, repeat: int) -> float:
+    """repeat번 실행 중 최단 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=200_000, help='TODO 개수')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최단 시간 사용)')
+    parser.add_argument('--batch', type=int, default=256, help='정리 배치 크기')
+    args = parser.parse_args()
+
+    repo = TodoRepository(undo_window=0)
+    items = [repo.create(f"항목 {i}", datetime(2026, 1, 1)) for i in range(args.items)]
+    dead = bytearray(args.items)  # 비교 기준: 읽을 때 거르는 삭제 플래그
+    victims = list(range(args.items))
+    random.Random(0).shuffle(victims)
+
+    def filtered_read():
+        return [todo for todo, flag in zip(items, dead) if not flag]
+
+    print(f"items={args.items:,} (단위: 남은 항목당 ns)")
+    print(f"{'삭제 비율':>10}{'읽을 때 거르기':>16}{'TodoRepository':>16}")
+    deleted = 0
+    for ratio in (0.0, 0.25, 0.5, 0.75, 0.9):
+        target = int(args.items * ratio)
+        for index in victims[deleted:target]:
+            dead[index] = 1
+            repo.delete(items[index].id)
+        deleted = target
+        live = args.items - deleted
+        baseline = timed(filtered_read, args.repeat) / live * 1e9
+        # 매번 새 스냅샷을 만들도록 캐시를 비우고 측정
+        def repo_read():
+            repo._snapshot = None
+            return repo.get_all()
+        current = timed(repo_read, args.repeat) / live * 1e9
+        print(f"{ratio:>10.0%}{baseline:>16.1f}{current:>16.1f}")
+
+    compactor = TombstoneCompactor(repo, batch_size=args.batch)
+    tombstones = repo.tombstone_count()
+    start = time.perf_counter()
+    purged = compactor.run_once()
+    elapsed = time.perf_counter() - start
+    batches = -(-purged // args.batch)
+    print(f"정리: 삭제 표시 {tombstones:,}개 -> {purged:,}개 정리, "
+          f"{elapsed * 1000:.1f} ms (배치 {batches:,}개, 배치당 {elapsed / max(batches, 1) * 1e6:.0f} µs 잠금)")
+
+
+if __name__ == '__main__':
+    main()
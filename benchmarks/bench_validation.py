@@ -0,0 +1,115 @@
+"""요청 검증 처리량 벤치마크 (POST /api/todos 초당 요청 수)
+
+기존 경로(request.get_json() + datetime.fromisoformat + 저장소의 TodoItem 재검증)와
+CreateTodoRequest로 본문 바이트를 한 번만 검증하는 현재 경로를 Flask 테스트
+클라이언트로 비교한다. 일괄 생성(POST /api/todos/batch)의 항목 처리량과, HTTP 처리를
+뺀 본문 검증 + TodoItem 생성 비용도 함께 잰다.
+
+    python -m benchmarks.bench_validation --requests 5000
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+from flask import jsonify, request
+from app import TodoApp
+from models import TodoItem, TodoStatus
+from utils.dtos import CreateTodoRequest
+
+
+def register_legacy_route(todo_app: TodoApp) -> None:
+    """변경 전 생성 라우트와 같은 처리를 하는 비교용 라우트"""
+    service, serializer = todo_app.service, todo_app.serializer
+
+    @todo_app.app.route('/bench/legacy-create', methods=['POST'])
+    def legacy_create_todo():
+        data = request.get_json()
+        if not data or 'content' not in data or 'target_date' not in data:
+            return jsonify({'error': '필수 필드가 없습니다'}), 400
+        target_date = datetime.fromisoformat(data['target_date'])
+        status = data.get('status', TodoStatus.SCHEDULED)
+        todo = service.create_todo(data['content'], target_date, status)
+        return jsonify(serializer.to_dict(todo)), 201
+
+
+def legacy_parse(body: bytes) -> TodoItem:
+    """기존 경로의 본문 해석과 항목 생성"""
+    data = json.loads(body)
+    return TodoItem(content=data['content'], target_date=datetime.fromisoformat(data['target_date']),
+                    status=data.get('status', TodoStatus.SCHEDULED))
+
+
+def validated_parse(body: bytes) -> TodoItem:
+    """현재 경로의 본문 검증과 항목 생성"""
+    return CreateTodoRequest.model_validate_json(body).to_todo()
+
+
+def measure_parse(func, bodies: list, repeat: int) -> float:
+    """bodies를 모두 해석하는 가장 빠른 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in bodies:
+            func(body)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def measure(client, path: str, bodies: list) -> float:
+    """bodies를 차례로 보내는 데 걸린 시간 (초)"""
+    started = time.perf_counter()
+    for body in bodies:
+        response = client.post(path, data=body, content_type='application/json')
+        assert response.status_code == 201, response.get_data(as_text=True)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=3000, help='경로마다 보낼 요청 수')
+    parser.add_argument('--batch', type=int, default=100, help='일괄 생성 요청 하나의 항목 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (가장 빠른 값 사용)')
+    args = parser.parse_args()
+
+    payloads = [
+        {'content': f"벤치마크 항목 {i}", 'target_date': f"2026-02-{i % 28 + 1:02d}T09:00:00", 'status': '진행중'}
+        for i in range(args.requests)
+    ]
+    single = [json.dumps(payload).encode() for payload in payloads]
+    batches = [
+        json.dumps(payloads[i:i + args.batch]).encode()
+        for i in range(0, args.requests, args.batch)
+    ]
+
+    cases = [
+        ('get_json + 재검증 (기존)', '/bench/legacy-create', single),
+        ('CreateTodoRequest 한 번 검증', '/api/todos', single),
+        (f'일괄 생성 ({args.batch}개씩)', '/api/todos/batch', batches),
+    ]
+
+    print(f"requests={args.requests:,} batch={args.batch} repeat={args.repeat}")
+    print(f"{'경로':<30}{'시간(ms)':>12}{'요청/s':>12}{'항목/s':>12}")
+    baseline = None
+    for name, path, bodies in cases:
+        best = float('inf')
+        for _ in range(args.repeat):
+            # 저장소 크기가 같은 조건에서 재도록 매번 새 앱 사용 (진입 제어는 끔)
+            todo_app = TodoApp(config={'ADMISSION_ENDPOINTS': {}})
+            register_legacy_route(todo_app)
+            best = min(best, measure(todo_app.app.test_client(), path, bodies))
+        items_per_second = args.requests / best
+        baseline = baseline or items_per_second
+        print(f"{name:<30}{best * 1000:>12.1f}{len(bodies) / best:>12,.0f}{items_per_second:>12,.0f}"
+              f"  (x{items_per_second / baseline:.2f})")
+
+    print()
+    print(f"{'본문 검증 + 항목 생성 (HTTP 제외)':<30}{'µs/요청':>12}")
+    baseline = None
+    for name, func in (('json.loads + TodoItem (기존)', legacy_parse), ('CreateTodoRequest.to_todo', validated_parse)):
+        elapsed = measure_parse(func, single, args.repeat) / len(single)
+        baseline = baseline or elapsed
+        print(f"{name:<30}{elapsed * 1e6:>12.2f}  (x{baseline / elapsed:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,14 @@
 """도메인 모델 패키지"""
-from .todo import TodoItem, TodoStatus
+from .todo import TodoItem, TodoStatus, STATUS_CODES, to_local_naive
+from .recurrence import RecurrenceRule, RecurrenceFrequency
+from .query import TodoQuery
 
 __all__ = [
     "TodoItem",
     "TodoStatus",
+    "STATUS_CODES",
+    "to_local_naive",
+    "RecurrenceRule",
+    "RecurrenceFrequency",
+    "TodoQuery",
 ]
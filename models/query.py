@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+from .todo import TodoStatus, to_local_naive
+
+# 정렬 기준 ('-' 접두사는 내림차순, 'order'는 사용자 순서)
+SORT_KEYS = ('order', 'date', 'created', 'updated', 'content')
+
+
+class TodoQuery(BaseModel):
+    """
+    TODO 조합 조회 조건
+
+    모든 조건은 AND로 결합한다. statuses는 그중 하나와 일치(OR), text는 내용의
+    부분 문자열(대소문자 무시), start/end는 목표 날짜 구간(start 포함, end 제외)이다.
+    """
+    statuses: Optional[List[TodoStatus]] = Field(default=None, description="상태 집합 (없으면 전체)")
+    start: Optional[datetime] = Field(default=None, description="목표 날짜 구간 시작 (포함)")
+    end: Optional[datetime] = Field(default=None, description="목표 날짜 구간 끝 (제외)")
+    text: Optional[str] = Field(default=None, description="내용 검색어")
+    sort: str = Field(default="order", description="정렬 기준 (order, date, created, updated, content, '-' 접두사는 내림차순)")
+    offset: int = Field(default=0, ge=0, description="시작 위치")
+    limit: Optional[int] = Field(default=None, ge=0, description="최대 개수 (없으면 끝까지)")
+
+    @field_validator("statuses")
+    @classmethod
+    def dedupe_statuses(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """중복 제거 (빈 목록은 허용하지 않음)"""
+        if v is None:
+            return None
+        if not v:
+            raise ValueError("상태를 하나 이상 지정해야 합니다.")
+        return list(dict.fromkeys(v))
+
+    @field_validator("start", "end")
+    @classmethod
+    def normalize_dates(cls, v: Optional[datetime]) -> Optional[datetime]:
+        """시간대가 있으면 TodoItem의 목표 날짜와 같이 지역 시각으로 변환"""
+        return None if v is None else to_local_naive(v)
+
+    @field_validator("text")
+    @classmethod
+    def strip_text(cls, v: Optional[str]) -> Optional[str]:
+        """앞뒤 공백 제거 (공백뿐이면 조건 없음)"""
+        if v is None or not v.strip():
+            return None
+        return v.strip()
+
+    @field_validator("sort")
+    @classmethod
+    def validate_sort(cls, v: str) -> str:
+        """지원하는 정렬 기준인지 확인"""
+        if v.lstrip("-") not in SORT_KEYS or v == "-order":
+            raise ValueError(f"지원하지 않는 정렬 기준: {v}")
+        return v
+
+    @model_validator(mode="after")
+    def validate_range(self) -> "TodoQuery":
+        """start는 end보다 늦을 수 없음"""
+        if self.start is not None and self.end is not None and self.start > self.end:
+            raise ValueError("start는 end보다 늦을 수 없습니다.")
+        return self
+
+    model_config = ConfigDict(use_enum_values=True)
@@ -0,0 +1,85 @@
+from enum import Enum
+from datetime import datetime
+from typing import List, Optional
+from uuid import uuid4
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+
+# 규칙 하나의 최대 회차 수 (월/연 + 요일 규칙은 생성 시 회차를 모두 펼침)
+MAX_RECURRENCE_COUNT = 10_000
+
+
+class RecurrenceFrequency(str, Enum):
+    """반복 주기 열거형"""
+    DAILY = "daily"      # 매일
+    WEEKLY = "weekly"    # 매주
+    MONTHLY = "monthly"  # 매월
+    YEARLY = "yearly"    # 매년
+
+
+class RecurrenceRule(BaseModel):
+    """
+    반복 TODO 규칙 모델
+
+    규칙 하나가 start부터 주기마다 반복되는 TODO를 나타낸다. 각 회차는 저장하지
+    않고 조회한 날짜 구간 안에서만 계산하며, 회차를 수정하거나 완료하면 그때
+    일반 TodoItem으로 저장된다.
+    """
+    id: str = Field(default_factory=lambda: str(uuid4()), description="고유 ID")
+    content: str = Field(..., min_length=1, description="각 회차의 TODO 내용")
+    start: datetime = Field(..., description="첫 회차 날짜 (초 단위)")
+    frequency: RecurrenceFrequency = Field(..., description="반복 주기")
+    interval: int = Field(default=1, ge=1, description="주기 간격 (예: 2면 격주)")
+    weekdays: Optional[List[int]] = Field(default=None, description="반복 요일 (0=월요일 ~ 6=일요일)")
+    until: Optional[datetime] = Field(default=None, description="마지막 회차 날짜 (포함)")
+    count: Optional[int] = Field(default=None, ge=1, le=MAX_RECURRENCE_COUNT, description="전체 회차 수")
+    created_at: datetime = Field(default_factory=datetime.now, description="생성 날짜")
+
+    @field_validator("content")
+    @classmethod
+    def validate_content(cls, v: str) -> str:
+        """내용이 공백이 아닌지 확인"""
+        if not v or v.strip() == "":
+            raise ValueError("TODO 내용은 비울 수 없습니다.")
+        return v.strip()
+
+    @field_validator("start", "until")
+    @classmethod
+    def truncate_microseconds(cls, v: Optional[datetime]) -> Optional[datetime]:
+        """회차 날짜는 초 단위까지만 사용"""
+        return None if v is None else v.replace(microsecond=0)
+
+    @field_validator("weekdays")
+    @classmethod
+    def validate_weekdays(cls, v: Optional[List[int]]) -> Optional[List[int]]:
+        """요일이 0~6 사이인지 확인 (중복 제거 후 정렬)"""
+        if v is None:
+            return None
+        if not v or any(day < 0 or day > 6 for day in v):
+            raise ValueError("요일은 0(월요일)~6(일요일) 사이여야 합니다.")
+        return sorted(set(v))
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> "RecurrenceRule":
+        """until과 count는 함께 지정할 수 없고, until은 start 이후여야 함"""
+        if self.until is not None and self.count is not None:
+            raise ValueError("until과 count는 함께 지정할 수 없습니다.")
+        if self.until is not None and self.until < self.start:
+            raise ValueError("until은 start 이후여야 합니다.")
+        return self
+
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
+            "example": {
+                "id": "7c9e6679-7425-40de-944b-e07fc1f90ae7",
+                "content": "주간 회의 준비",
+                "start": "2026-01-05T09:00:00",
+                "frequency": "weekly",
+                "interval": 1,
+                "weekdays": [0, 3],
+                "until": None,
+                "count": None,
+                "created_at": "2026-01-01T12:00:00"
+            }
+        }
+    )
@@ -1,6 +1,6 @@
 from enum import Enum
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import uuid4
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
@@ -12,6 +12,21 @@ class TodoStatus(str, Enum):
     COMPLETED = "완료"      # 완료됨
 
 
+# 압축 응답과 컬럼형 통계에서 사용하는 숫자 상태 코드
+STATUS_CODES = {
+    TodoStatus.SCHEDULED.value: 0,
+    TodoStatus.IN_PROGRESS.value: 1,
+    TodoStatus.COMPLETED.value: 2,
+}
+
+
+def to_local_naive(value: datetime) -> datetime:
+    """시간대가 있는 날짜를 같은 순간의 지역 시각(시간대 없음)으로 변환 (없으면 그대로)"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
 class TodoItem(BaseModel):
     """TODO 항목 모델"""
     id: str = Field(default_factory=lambda: str(uuid4()), description="고유 ID")
@@ -32,10 +47,59 @@ class TodoItem(BaseModel):
     @field_validator("target_date")
     @classmethod
     def validate_target_date(cls, v: datetime) -> datetime:
-        """목표 날짜가 유효한 날짜인지 확인"""
+        """목표 날짜가 유효한 날짜인지 확인 (시간대가 있으면 지역 시각으로 변환)"""
         if not isinstance(v, datetime):
             raise ValueError("목표 날짜는 datetime 형식이어야 합니다.")
-        return v
+        return to_local_naive(v)
+
+    @classmethod
+    def trusted(cls, content: str, target_date: datetime, status: str) -> "TodoItem":
+        """
+        이미 같은 규칙으로 검증한 값으로 새 항목 생성 (검증 생략)
+
+        요청 DTO(CreateTodoRequest)가 검증한 값 전용이다. content는 공백을
+        제거한 문자열, status는 TodoStatus 값이어야 한다. model_construct()와
+        같은 결과지만 기본값 처리를 거치지 않아 더 빠르다.
+        """
+        now = datetime.now()
+        todo = cls.__new__(cls)
+        object.__setattr__(todo, '__dict__', {
+            'id': str(uuid4()),
+            'content': content,
+            'target_date': target_date,
+            'status': status,
+            'created_at': now,
+            'updated_at': now,
+        })
+        object.__setattr__(todo, '__pydantic_fields_set__', {'content', 'target_date', 'status'})
+        object.__setattr__(todo, '__pydantic_extra__', None)
+        object.__setattr__(todo, '__pydantic_private__', None)
+        return todo
+
+    def trusted_update(self, changes: Dict[str, Any]) -> "TodoItem":
+        """
+        이미 같은 규칙으로 검증한 변경으로 새 TodoItem 반환 (검증 생략, updated_at 갱신)
+
+        요청 DTO(UpdateTodoRequest)가 검증한 값 전용이다. 검증하지 않은 값은
+        revise()를 사용한다.
+        """
+        return self.model_copy(update={**changes, 'updated_at': datetime.now()})
+
+    def revise(self, **changes) -> "TodoItem":
+        """
+        바꾸는 필드만 검증한 새 TodoItem 반환 (updated_at 갱신, 자신은 그대로)
+
+        검증하지 않은 값을 받는 내부 호출자용이다. 전체 필드를 다시 검증하지
+        않으므로 model_dump() 후 재생성보다 빠르다.
+
+        Raises:
+            ValidationError: 바꾸는 값이 유효하지 않음 (ValueError 하위 클래스)
+        """
+        todo = self.model_copy()
+        for name, value in changes.items():
+            self.__pydantic_validator__.validate_assignment(todo, name, value)
+        todo.updated_at = datetime.now()
+        return todo
 
     def dict(self, **kwargs) -> dict:
         """딕셔너리로 변환 (Flask JSON 응답용)"""
@@ -1,4 +1,42 @@
-"""저장소 계층 패키지"""
+"""저장소 계층 패키지
+
+ColumnarMirror는 NumPy가 필요하므로 처음 사용할 때 불러온다.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+from .base import BaseTodoRepository
 from .todo_repository import TodoRepository
+from .list_repository import ListTodoRepository
+from .snapshot import TodoSnapshot
+from .tombstone import TombstoneCompactor
+from .recurrence import RecurrenceStore
+from .query_index import QueryIndex
+from .replication import ReplicationLog, ReplicaRepository, LogShipper, LogFollower
+from .archive import ColdStore, Archiver
+from .stats_history import StatsHistory
+
+if TYPE_CHECKING:
+    from .columnar import ColumnarMirror
+
+# 지연 로딩 대상: 이름 -> 하위 모듈
+_LAZY_ATTRS = {
+    'ColumnarMirror': '.columnar',
+}
+
+__all__ = ['BaseTodoRepository', 'TodoRepository', 'ListTodoRepository', 'TodoSnapshot', 'TombstoneCompactor', 'RecurrenceStore', 'QueryIndex',
+           'ReplicationLog', 'ReplicaRepository', 'LogShipper', 'LogFollower', 'ColdStore', 'Archiver', 'StatsHistory',
+           'ColumnarMirror']
+
+
+def __getattr__(name):
+    """지연 로딩 대상 속성을 처음 접근할 때 하위 모듈에서 불러옴"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['TodoRepository']
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
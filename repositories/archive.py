@@ -0,0 +1,474 @@
+"""완료 항목 보관 계층 (압축한 디스크 세그먼트와 이동 작업)"""
+import gzip
+import json
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from models import TodoItem, TodoStatus
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+
+def _epoch_seconds(value: datetime) -> int:
+    """columnar.to_epoch_seconds와 같은 기준의 epoch 초 (NumPy 없이 쓰려고 따로 둠)"""
+    return (value.replace(tzinfo=None) - _EPOCH) // _SECOND
+
+
+class _Segment:
+    """
+    세그먼트 파일 하나의 메모리 정보 (항목 본문은 필요할 때 읽음)
+
+    Attributes:
+        number: 세그먼트 번호 (보관 순서)
+        path: 파일 경로
+        ids: 파일에 든 항목 ID (파일 순서)
+        target_date, created_at, updated_at: ids와 같은 순서의 epoch 초 컬럼
+        live: 삭제되지 않은 항목 수
+    """
+
+    __slots__ = ('number', 'path', 'ids', 'target_date', 'created_at', 'updated_at', 'live')
+
+    def __init__(self, number: int, path: str, header: dict):
+        self.number = number
+        self.path = path
+        self.ids: List[str] = header['ids']
+        self.target_date = array('q', header['target_date'])
+        self.created_at = array('q', header['created_at'])
+        self.updated_at = array('q', header['updated_at'])
+        self.live = len(self.ids)
+
+
+class ColdStore:
+    """
+    보관한 완료 항목의 디스크 저장소
+
+    항목은 gzip으로 압축한 JSON Lines 세그먼트 파일(segment-NNNNNN.jsonl.gz)에
+    보관 순서대로 저장한다. 각 파일의 첫 줄은 ID와 날짜 epoch 초 컬럼을 담은
+    머리글이라 시작할 때와 개수/통계 계산에는 머리글만 읽는다. 항목 본문은
+    ID 조회나 페이지 조회 때 세그먼트 단위로 풀어 최근 cache_segments개를
+    메모리에 둔다. 파일은 임시 파일에 쓰고 fsync 후 이름을 바꿔 교체한다.
+
+    보관한 항목의 삭제는 파일을 다시 쓰지 않고 삭제 목록(deleted.txt)에 ID를
+    덧붙여 기록하며, 세그먼트의 항목이 모두 삭제되면 파일을 지운다.
+
+    공개한 세그먼트나 삭제 목록이 바뀌면 잠금을 푼 뒤 변경 리스너를 인자 없이
+    호출한다. 읽기 복제의 팔로워는 replica=True로 주 서버의 디렉터리를 열어
+    파일을 건드리지 않고, 주 서버의 replication_state()를 load_state()로 받아
+    그 세그먼트만 공개한다.
+    """
+
+    PREFIX = 'segment-'
+    SUFFIX = '.jsonl.gz'
+    DELETED_FILE = 'deleted.txt'
+
+    def __init__(self, directory: str, cache_segments: int = 4, replica: bool = False):
+        """
+        Args:
+            directory: 세그먼트를 저장할 디렉터리 (없으면 생성)
+            cache_segments: 본문을 풀어 둘 최근 세그먼트 수
+            replica: 주 서버의 디렉터리를 읽기만 하는 팔로워 (처음에는 비어 있음)
+        """
+        self.directory = directory
+        self.cache_segments = cache_segments
+        self.replica = replica
+        self._lock = threading.Lock()
+        self._segments: Dict[int, _Segment] = {}  # 번호 순서로 추가됨
+        self._where: Dict[str, int] = {}  # 항목 ID -> 세그먼트 번호
+        self._deleted: Dict[int, Set[str]] = {}  # 세그먼트 번호 -> 삭제된 항목 ID
+        self._cache: 'OrderedDict[int, Dict[str, TodoItem]]' = OrderedDict()
+        self._next_number = 0
+        self._listeners: List[Callable[[], None]] = []
+        if not replica:
+            os.makedirs(directory, exist_ok=True)
+            self._load()
+
+    def _load(self) -> None:
+        """디렉터리의 세그먼트 머리글과 삭제 목록 불러오기"""
+        deleted_path = os.path.join(self.directory, self.DELETED_FILE)
+        if os.path.exists(deleted_path):
+            with open(deleted_path, encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        number, todo_id = line.split()
+                        self._deleted.setdefault(int(number), set()).add(todo_id)
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            if name.endswith('.tmp'):
+                os.remove(path)  # 쓰다 중단된 파일
+            elif name.startswith(self.PREFIX) and name.endswith(self.SUFFIX):
+                number = int(name[len(self.PREFIX):-len(self.SUFFIX)])
+                with gzip.open(path, 'rb') as f:
+                    segment = _Segment(number, path, json.loads(f.readline()))
+                self._register(segment)
+                self._next_number = number + 1
+        for number in self._deleted.keys() - self._segments.keys():
+            del self._deleted[number]  # 파일을 지운 뒤 삭제 목록을 다시 쓰기 전에 중단됨
+
+    def _register(self, segment: _Segment) -> None:
+        self._segments[segment.number] = segment
+        deleted = self._deleted.get(segment.number, ())
+        for todo_id in segment.ids:
+            if todo_id in deleted:
+                segment.live -= 1
+            else:
+                self._where[todo_id] = segment.number
+
+    def _path(self, number: int) -> str:
+        return os.path.join(self.directory, f'{self.PREFIX}{number:06d}{self.SUFFIX}')
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """변경 리스너 등록 (공개한 세그먼트나 삭제 목록이 바뀔 때마다 잠금 밖에서 호출)"""
+        self._listeners.append(listener)
+
+    def _changed(self) -> None:
+        for listener in self._listeners:
+            listener()
+
+    # ---- 복제 ----
+
+    def replication_state(self) -> dict:
+        """복제용 전체 상태 (공개한 세그먼트 번호와 각각의 삭제된 항목 ID)"""
+        with self._lock:
+            return {'segments': [[number, sorted(self._deleted.get(number, ()))] for number in self._segments]}
+
+    def load_state(self, state: dict) -> None:
+        """
+        replication_state()로 받은 상태로 교체 (팔로워)
+
+        처음 보는 세그먼트는 머리글만 읽는다. 주 서버가 그 사이 모두 삭제해
+        파일을 지운 세그먼트는 건너뛴다 (삭제를 알리는 상태가 뒤따라 옴).
+        """
+        segments = []
+        for number, _ in state['segments']:
+            segment = self._segments.get(number)
+            if segment is None:
+                path = self._path(number)
+                try:
+                    with gzip.open(path, 'rb') as f:
+                        segment = _Segment(number, path, json.loads(f.readline()))
+                except FileNotFoundError:
+                    continue
+            segments.append(segment)
+        deleted = {number: set(ids) for number, ids in state['segments'] if ids}
+        numbers = {segment.number for segment in segments}
+        with self._lock:
+            for number in list(self._cache):
+                if number not in numbers or deleted.get(number) != self._deleted.get(number):
+                    del self._cache[number]  # 삭제 목록이 바뀐 세그먼트는 본문을 다시 읽음
+            self._segments = {}
+            self._where = {}
+            self._deleted = deleted
+            for segment in segments:
+                segment.live = len(segment.ids)
+                self._register(segment)
+
+    # ---- 쓰기 ----
+
+    def append(self, todos: List[TodoItem],
+               evict: Callable[[List[TodoItem], Callable[[List[TodoItem]], None]], List[TodoItem]]
+               ) -> List[TodoItem]:
+        """
+        항목을 새 세그먼트로 보관하고 evict로 핫 저장소에서 제거
+
+        파일을 먼저 쓰지만 ID 조회와 개수에는 아직 공개하지 않는다. 저장소의
+        evict(todos, on_evicted)가 쓰기 잠금 안에서 항목을 제거하고
+        on_evicted(제거한 항목)를 호출할 때 제거한 항목만 공개하므로, 통계나
+        내보내기가 어느 순간에도 항목을 두 번 세거나 빠뜨리지 않는다. 그 사이
+        수정되어 제거되지 않은 항목은 삭제 목록에 기록해 세그먼트에서 뺀다.
+
+        Args:
+            todos: 보관할 항목
+            evict: (항목, on_evicted)를 받아 실제로 제거한 항목을 반환하는 함수 (저장소의 evict)
+
+        Returns:
+            보관된 항목
+        """
+        if not todos:
+            return []
+        with self._lock:
+            number = self._next_number
+            self._next_number += 1
+        segment = self._write(number, todos)
+        skipped: Set[str] = set()
+        published = []
+
+        def publish(evicted: List[TodoItem]) -> None:
+            # 저장소 쓰기 잠금 안에서 호출되므로 디스크에 쓰지 않고 메모리 정보만 갱신
+            with self._lock:
+                kept = {todo.id for todo in evicted}
+                skipped.update(todo.id for todo in todos if todo.id not in kept)
+                if skipped:
+                    self._deleted[number] = set(skipped)
+                self._register(segment)
+                published.append(True)
+            self._changed()
+
+        evicted = evict(todos, publish)
+        if evicted and not published:
+            publish(evicted)  # on_evicted를 호출하지 않는 저장소 (제거 후 공개)
+        with self._lock:
+            if not evicted:
+                os.remove(segment.path)
+            elif skipped and number in self._segments:
+                # 모두 삭제됐으면 이미 파일이 없음
+                self._append_deleted(number, skipped)
+        return evicted
+
+    def _write(self, number: int, todos: List[TodoItem]) -> _Segment:
+        """세그먼트 파일을 원자적으로 쓰기"""
+        header = {
+            'ids': [todo.id for todo in todos],
+            'target_date': [_epoch_seconds(todo.target_date) for todo in todos],
+            'created_at': [_epoch_seconds(todo.created_at) for todo in todos],
+            'updated_at': [_epoch_seconds(todo.updated_at) for todo in todos],
+        }
+        path = self._path(number)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as raw:
+            with gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(json.dumps(header).encode('utf-8') + b'\n')
+                for todo in todos:
+                    f.write(todo.model_dump_json().encode('utf-8') + b'\n')
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp, path)
+        return _Segment(number, path, header)
+
+    def delete(self, todo_id: str) -> bool:
+        """보관한 항목 삭제 (없으면 False)"""
+        with self._lock:
+            number = self._where.pop(todo_id, None)
+            if number is None:
+                return False
+            segment = self._segments[number]
+            segment.live -= 1
+            items = self._cache.get(number)
+            if items is not None:
+                items.pop(todo_id, None)
+            if segment.live:
+                self._deleted.setdefault(number, set()).add(todo_id)
+                self._append_deleted(number, [todo_id])
+            else:
+                # 모두 삭제된 세그먼트는 파일을 지우고 삭제 목록에서도 뺌
+                self._discard_segment(number)
+                self._deleted.pop(number, None)
+                self._rewrite_deleted()
+        self._changed()
+        return True
+
+    def _discard_segment(self, number: int) -> None:
+        """세그먼트 파일과 메모리 정보 제거 (잠금 안에서 호출)"""
+        segment = self._segments.pop(number)
+        for todo_id in segment.ids:
+            if self._where.get(todo_id) == number:
+                del self._where[todo_id]
+        self._cache.pop(number, None)
+        os.remove(segment.path)
+
+    def _append_deleted(self, number: int, todo_ids: Iterable[str]) -> None:
+        """삭제 목록 파일에 세그먼트의 삭제 항목 덧붙이기 (잠금 안에서 호출)"""
+        with open(os.path.join(self.directory, self.DELETED_FILE), 'a', encoding='utf-8') as f:
+            f.writelines(f'{number} {todo_id}\n' for todo_id in todo_ids)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite_deleted(self) -> None:
+        """삭제 목록 파일을 현재 내용으로 교체"""
+        path = os.path.join(self.directory, self.DELETED_FILE)
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.writelines(f'{number} {todo_id}\n' for number, ids in self._deleted.items() for todo_id in ids)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def clear(self) -> None:
+        """보관한 항목 모두 삭제"""
+        with self._lock:
+            for segment in self._segments.values():
+                os.remove(segment.path)
+            self._segments.clear()
+            self._where.clear()
+            self._deleted.clear()
+            self._cache.clear()
+            self._rewrite_deleted()
+        self._changed()
+
+    # ---- 조회 ----
+
+    def __contains__(self, todo_id: str) -> bool:
+        return todo_id in self._where
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 구조별 깊은 크기 (본문은 캐시한 세그먼트만 메모리에 있음)"""
+        with self._lock:
+            parts = {
+                'headers': self._segments,
+                'locations': self._where,
+                'deleted': self._deleted,
+                'cache': self._cache,
+            }
+        return {name: sizer.size(part) for name, part in parts.items()}
+
+    def get(self, todo_id: str) -> Optional[TodoItem]:
+        """ID로 보관한 항목 조회 (세그먼트 하나를 풀 수 있음)"""
+        with self._lock:
+            number = self._where.get(todo_id)
+            if number is None:
+                return None
+            return self._items(number).get(todo_id)
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[TodoItem], int]:
+        """
+        보관 순서로 일부 조회 (앞쪽 세그먼트는 머리글의 개수만 보고 건너뜀)
+
+        Returns:
+            (TodoItem 리스트, 보관한 전체 개수)
+
+        Raises:
+            ValueError: offset이나 limit이 음수
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset과 limit은 0 이상이어야 합니다")
+        result: List[TodoItem] = []
+        with self._lock:
+            for number, segment in self._segments.items():
+                if limit is not None and len(result) >= limit:
+                    break
+                if offset >= segment.live:
+                    offset -= segment.live
+                    continue
+                items = list(self._items(number).values())[offset:]
+                offset = 0
+                result.extend(items if limit is None else items[:limit - len(result)])
+            return result, len(self._where)
+
+    def iter_all(self) -> Iterator[TodoItem]:
+        """보관한 항목을 보관 순서로 하나씩 (세그먼트마다 잠금을 잡고 풀어 둠)"""
+        with self._lock:
+            numbers = list(self._segments)
+        for number in numbers:
+            with self._lock:
+                items = list(self._items(number).values()) if number in self._segments else []
+            yield from items
+
+    def count_in_range(self, start: datetime, end: datetime) -> int:
+        """목표 날짜가 [start, end) 구간인 보관 항목 수 (머리글 컬럼만 사용)"""
+        low, high = _epoch_seconds(start), _epoch_seconds(end)
+        with self._lock:
+            return sum(
+                1
+                for segment in self._segments.values()
+                for todo_id, target in zip(segment.ids, segment.target_date)
+                if low <= target < high and todo_id not in self._deleted.get(segment.number, ())
+            )
+
+    def columns(self) -> Tuple[array, array, array]:
+        """삭제되지 않은 보관 항목의 (target_date, created_at, updated_at) epoch 초 컬럼"""
+        target_date, created_at, updated_at = array('q'), array('q'), array('q')
+        with self._lock:
+            for segment in self._segments.values():
+                if segment.live == len(segment.ids):
+                    target_date.extend(segment.target_date)
+                    created_at.extend(segment.created_at)
+                    updated_at.extend(segment.updated_at)
+                    continue
+                deleted = self._deleted.get(segment.number, ())
+                for i, todo_id in enumerate(segment.ids):
+                    if todo_id not in deleted:
+                        target_date.append(segment.target_date[i])
+                        created_at.append(segment.created_at[i])
+                        updated_at.append(segment.updated_at[i])
+        return target_date, created_at, updated_at
+
+    def _items(self, number: int) -> Dict[str, TodoItem]:
+        """세그먼트의 삭제되지 않은 항목 (ID -> TodoItem, 파일 순서, 잠금 안에서 호출)"""
+        items = self._cache.get(number)
+        if items is not None:
+            self._cache.move_to_end(number)
+            return items
+        items = {}
+        deleted = self._deleted.get(number, ())
+        try:
+            f = gzip.open(self._segments[number].path, 'rb')
+        except FileNotFoundError:
+            return items  # 팔로워: 주 서버가 모두 삭제해 지운 세그먼트 (삭제 상태를 받기 전)
+        with f:
+            f.readline()  # 머리글
+            for line in f:
+                todo = TodoItem.model_validate_json(line)
+                if todo.id not in deleted:
+                    items[todo.id] = todo
+        self._cache[number] = items
+        while len(self._cache) > self.cache_segments:
+            self._cache.popitem(last=False)
+        return items
+
+
+class Archiver:
+    """
+    오래된 완료 항목을 ColdStore로 옮기는 작업 스레드
+
+    updated_at이 after초보다 오래된 완료 상태 항목을 오래된 순서로
+    segment_size개씩 세그먼트로 쓰고 저장소에서 제거(evict)한다. 세그먼트를 쓰는
+    동안 수정된 항목은 저장소의 객체가 바뀌었으므로 제거되지 않고 남는다.
+    """
+
+    def __init__(self, repository, store: ColdStore, after: float = 30 * 24 * 3600.0,
+                 interval: float = 3600.0, segment_size: int = 1000,
+                 clock: Callable[[], datetime] = datetime.now):
+        """
+        Args:
+            repository: 항목을 옮길 저장소 (evict 지원)
+            store: 보관할 ColdStore
+            after: 완료 후 보관까지 기다릴 시간(초, updated_at 기준)
+            interval: 보관 주기(초)
+            segment_size: 세그먼트 하나에 담을 최대 항목 수
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self._repository = repository
+        self._store = store
+        self.after = after
+        self.interval = interval
+        self.segment_size = segment_size
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> int:
+        """보관할 항목을 모두 옮기고 옮긴 개수 반환"""
+        cutoff = self._clock() - timedelta(seconds=self.after)
+        candidates = sorted(
+            (todo for todo in self._repository.get_by_status(TodoStatus.COMPLETED) if todo.updated_at <= cutoff),
+            key=lambda todo: todo.updated_at
+        )
+        total = 0
+        for i in range(0, len(candidates), self.segment_size):
+            total += len(self._store.append(candidates[i:i + self.segment_size], self._repository.evict))
+        return total
+
+    def start(self) -> None:
+        """작업 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='archiver', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """작업 스레드 종료"""
+        thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.run_once()
@@ -0,0 +1,293 @@
+"""저장소 백엔드 인터페이스"""
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from models import TodoItem, TodoStatus
+from .events import MutationEvent
+
+# create_many()에 넘기는 항목: (내용, 목표 날짜, 상태)
+TodoSpec = Tuple[str, datetime, TodoStatus]
+
+
+def check_page(offset: int, limit: Optional[int]) -> None:
+    """페이지 조회 인자 검사 (음수면 ValueError)"""
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset과 limit은 0 이상이어야 합니다")
+
+
+class BaseTodoRepository(ABC):
+    """
+    TodoService가 사용하는 저장소 인터페이스
+
+    추상 메서드만 구현하면 동작하는 저장소가 되고, 일괄/페이지/색인 조회는
+    추상 메서드를 조합한 기본 구현이 있으므로 더 빠른 방법이 있는 백엔드만
+    재정의한다. 모든 백엔드는 tests/test_repository_conformance.py를 통과해야 한다.
+
+    공통 동작:
+        - 순서: 새 항목은 맨 뒤에 추가되고, 삭제해도 나머지 항목의 상대 순서는 유지
+        - set_order: 모르는 ID와 중복 ID는 무시하고, 빠진 항목은 기존 순서대로 뒤에 붙임
+        - 날짜순: (목표 날짜, 생성 순) 기준이며 사용자 순서와 무관하게 항상 같은 결과
+        - 쓰기 작업마다 version이 1 오르고 리스너에게 MutationEvent 전달
+        - publish_state: 저장소 밖 상태(반복 규칙 등)의 변경도 버전을 올려 같은 순서에 끼워 넣음
+    """
+
+    # ---- 필수 구현 ----
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """마지막 쓰기 작업의 버전"""
+
+    @abstractmethod
+    def add_listener(self, listener: Callable[[MutationEvent], None], replay: bool = False) -> None:
+        """변경 이벤트 리스너 등록 (replay=True면 현재 항목을 CREATE 이벤트로 먼저 전달)"""
+
+    @abstractmethod
+    def remove_listener(self, listener: Callable[[MutationEvent], None]) -> None:
+        """변경 이벤트 리스너 해제"""
+
+    @abstractmethod
+    def create(self, content: str, target_date: datetime, status: TodoStatus = TodoStatus.SCHEDULED) -> TodoItem:
+        """새로운 TODO 항목을 맨 뒤에 생성"""
+
+    @abstractmethod
+    def get_by_id(self, todo_id: str) -> Optional[TodoItem]:
+        """ID로 TODO 항목 조회 (없거나 삭제되었으면 None)"""
+
+    @abstractmethod
+    def get_all(self) -> List[TodoItem]:
+        """모든 TODO 항목 조회 (저장된 순서 유지)"""
+
+    @abstractmethod
+    def update(self, todo_id: str, content: Optional[str] = None,
+               target_date: Optional[datetime] = None,
+               status: Optional[TodoStatus] = None) -> Optional[TodoItem]:
+        """TODO 항목 수정 (없으면 None)"""
+
+    @abstractmethod
+    def delete(self, todo_id: str) -> bool:
+        """TODO 항목 삭제 (없으면 False)"""
+
+    @abstractmethod
+    def restore(self, todo_id: str) -> Optional[TodoItem]:
+        """삭제한 TODO를 원래 위치에 복구 (복구할 수 없으면 None)"""
+
+    @abstractmethod
+    def clear_all(self) -> None:
+        """모든 TODO 항목 삭제 (복구 불가)"""
+
+    @abstractmethod
+    def publish_state(self, name: str) -> None:
+        """항목은 그대로 두고 버전을 올려 STATE 이벤트 전달 (name: 바뀐 상태 이름)"""
+
+    @abstractmethod
+    def set_order(self, order: List[str]) -> None:
+        """TODO 순서 설정"""
+
+    @abstractmethod
+    def move_before(self, todo_id: str, anchor_id: str) -> Optional[int]:
+        """TODO를 anchor_id 항목 바로 앞으로 이동 후 새 위치 반환 (둘 중 하나라도 없으면 None)"""
+
+    @abstractmethod
+    def move_after(self, todo_id: str, anchor_id: str) -> Optional[int]:
+        """TODO를 anchor_id 항목 바로 뒤로 이동 후 새 위치 반환 (둘 중 하나라도 없으면 None)"""
+
+    @abstractmethod
+    def move_to(self, todo_id: str, position: int) -> Optional[int]:
+        """TODO를 position 위치로 이동 후 새 위치 반환 (범위 밖이면 양 끝, 없으면 None)"""
+
+    @abstractmethod
+    def index_of(self, todo_id: str) -> Optional[int]:
+        """TODO의 현재 순서 위치 (없으면 None)"""
+
+    @abstractmethod
+    def get_by_date(self, status: Optional[TodoStatus] = None) -> List[TodoItem]:
+        """사용자 순서를 바꾸지 않고 날짜순으로 조회 (같은 날짜는 생성 순)"""
+
+    @abstractmethod
+    def count(self) -> int:
+        """TODO 항목 개수"""
+
+    # ---- 일괄 작업 (기본 구현: 한 건씩 처리) ----
+
+    def create_many(self, specs: Iterable[TodoSpec]) -> List[TodoItem]:
+        """여러 TODO를 주어진 순서대로 맨 뒤에 생성"""
+        return [self.create(content, target_date, status) for content, target_date, status in specs]
+
+    def insert_many(self, todos: Iterable[TodoItem]) -> List[TodoItem]:
+        """
+        이미 검증한 항목들을 ID와 시각 그대로 주어진 순서대로 맨 뒤에 추가
+
+        요청 DTO로 검증을 마친 항목을 다시 검증하지 않고 저장할 때 쓴다.
+        insert()를 재정의하지 않은(보관 계층을 지원하지 않는) 백엔드는 같은
+        내용/날짜/상태로 create_many()를 호출하므로 ID와 시각은 새로 발급된다.
+
+        Returns:
+            저장된 항목
+
+        Raises:
+            ValueError: 같은 ID의 항목이 이미 있음
+        """
+        todos = list(todos)
+        if type(self).insert is BaseTodoRepository.insert:
+            return self.create_many([(todo.content, todo.target_date, todo.status) for todo in todos])
+        return [self.insert(todo) for todo in todos]
+
+    def apply_update(self, todo_id: str, changes: Dict[str, Any]) -> Optional[TodoItem]:
+        """
+        이미 검증한 변경을 다시 검증하지 않고 적용 (없으면 None)
+
+        요청 DTO로 검증을 마친 수정에 쓴다. 기본 구현은 update()를 호출한다.
+        """
+        return self.update(todo_id, **changes)
+
+    def get_many(self, todo_ids: Iterable[str]) -> List[Optional[TodoItem]]:
+        """여러 ID 조회 (없는 ID 자리는 None)"""
+        return [self.get_by_id(todo_id) for todo_id in todo_ids]
+
+    def index_of_many(self, todo_ids: Iterable[str]) -> List[Optional[int]]:
+        """여러 ID의 현재 순서 위치 (없는 ID 자리는 None)"""
+        positions = {todo_id: position for position, todo_id in enumerate(self.get_order())}
+        return [positions.get(todo_id) for todo_id in todo_ids]
+
+    def delete_many(self, todo_ids: Iterable[str]) -> int:
+        """여러 TODO 삭제 후 실제로 삭제한 개수 반환"""
+        return sum(1 for todo_id in todo_ids if self.delete(todo_id))
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """
+        메모리 진단용 구조별 깊은 크기 (기본 구현: 전체 목록)
+
+        재정의할 때는 잠금 안에서 구조 참조만 모으고 크기는 잠금 밖에서 잰다
+        (큰 저장소는 깊은 크기 계산에 수 초가 걸림).
+
+        Args:
+            sizer: 공유 객체를 한 번만 세는 ObjectSizer
+
+        Returns:
+            {구조 이름: 바이트}
+        """
+        return {'todos': sizer.size(self.get_all())}
+
+    # ---- 보관 계층 (지원하는 백엔드만 재정의) ----
+
+    def insert(self, todo: TodoItem) -> TodoItem:
+        """
+        기존 항목을 ID와 시각 그대로 맨 뒤에 추가 (보관 계층에서 되돌릴 때)
+
+        Raises:
+            ValueError: 같은 ID의 항목이 이미 있음
+        """
+        raise NotImplementedError(f"{type(self).__name__}는 보관 계층을 지원하지 않습니다")
+
+    def evict(self, todos: Iterable[TodoItem],
+              on_evicted: Optional[Callable[[List[TodoItem]], None]] = None) -> List[TodoItem]:
+        """
+        다른 계층으로 옮긴 항목을 삭제 표시 없이 제거
+
+        저장된 항목이 인자로 받은 객체와 같은(읽은 뒤 바뀌지 않은) 경우에만
+        제거하며, 리스너에게는 DELETE 이벤트로 전달한다.
+
+        Args:
+            todos: 제거할 항목
+            on_evicted: 하나 이상 제거했으면 DELETE 이벤트 뒤에 제거한 항목으로 쓰기
+                잠금 안에서 호출 (다른 계층이 제거와 같은 시점에 항목을 공개하도록)
+
+        Returns:
+            실제로 제거한 항목
+        """
+        raise NotImplementedError(f"{type(self).__name__}는 보관 계층을 지원하지 않습니다")
+
+    # ---- 페이지/색인 조회 (기본 구현: 전체 목록에서 계산) ----
+
+    def get_by_status(self, status: TodoStatus) -> List[TodoItem]:
+        """상태별로 TODO 항목 조회 (저장된 순서 유지)"""
+        return [todo for todo in self.get_all() if todo.status == status]
+
+    def get_order(self) -> List[str]:
+        """TODO 순서 조회"""
+        return [todo.id for todo in self.get_all()]
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[TodoItem], int, int]:
+        """
+        저장된 순서의 일부 조회
+
+        기본 구현은 전체 목록을 읽은 뒤 자르므로, 읽는 도중 쓰기가 끼어들 수
+        있는 백엔드는 한 시점에서 읽도록 재정의해야 한다.
+
+        Returns:
+            (TodoItem 리스트, 전체 개수, 버전)
+
+        Raises:
+            ValueError: offset 또는 limit이 음수
+        """
+        check_page(offset, limit)
+        version = self.version
+        todos = self.get_all()
+        end = None if limit is None else offset + limit
+        return todos[offset:end], len(todos), version
+
+    def get_by_date_range(self, start: datetime, end: datetime,
+                          status: Optional[TodoStatus] = None) -> List[TodoItem]:
+        """목표 날짜가 start 이상 end 미만인 항목을 날짜순으로 조회 (같은 날짜는 생성 순)"""
+        return [todo for todo in self.get_by_date(status) if start <= todo.target_date < end]
+
+    def count_by_date_range(self, start: datetime, end: datetime) -> int:
+        """목표 날짜가 start 이상 end 미만인 항목 개수 (조회 계획의 날짜 인덱스 비용 추정)"""
+        return len(self.get_by_date_range(start, end))
+
+    def page_by_date(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[TodoItem], int, int]:
+        """
+        날짜순 보기의 일부 조회
+
+        Returns:
+            (TodoItem 리스트, 전체 개수, 버전)
+
+        Raises:
+            ValueError: offset 또는 limit이 음수
+        """
+        check_page(offset, limit)
+        version = self.version
+        todos = self.get_by_date()
+        end = None if limit is None else offset + limit
+        return todos[offset:end], len(todos), version
+
+    def count_by_status(self) -> Tuple[int, Dict[str, int]]:
+        """
+        전체 개수와 상태별 개수를 같은 시점에서 계산
+
+        Returns:
+            (전체 개수, 상태 -> 개수)
+        """
+        todos = self.get_all()
+        return len(todos), Counter(todo.status for todo in todos)
+
+    def page_with_counts(self, limit: Optional[int] = None) -> Tuple[List[TodoItem], int, Dict[str, int], int]:
+        """
+        저장된 순서의 첫 limit개와 상태별 개수를 한 번의 읽기로 조회
+
+        Returns:
+            (TodoItem 리스트, 전체 개수, 상태 -> 개수, 버전)
+
+        Raises:
+            ValueError: limit이 음수
+        """
+        check_page(0, limit)
+        version = self.version
+        todos = self.get_all()
+        return todos[:limit], len(todos), Counter(todo.status for todo in todos), version
+
+    def sort_by_date(self) -> None:
+        """날짜순 보기를 사용자 순서로 저장"""
+        self.set_order([todo.id for todo in self.get_by_date()])
+
+    # ---- 삭제 표시 정리 (삭제 표시를 남기지 않는 백엔드는 그대로 사용) ----
+
+    def compact(self, batch_size: int = 256) -> int:
+        """복구 가능 시간이 지난 삭제 표시를 최대 batch_size개 정리 후 정리한 개수 반환"""
+        return 0
+
+    def tombstone_count(self) -> int:
+        """정리되지 않은 삭제 표시 개수"""
+        return 0
@@ -0,0 +1,105 @@
+"""저장소의 컬럼형 미러 (통계/리포트용)"""
+import threading
+from datetime import datetime, timedelta
+from typing import Dict
+import numpy as np
+from models import TodoItem, STATUS_CODES
+from .events import MutationEvent
+
+EMPTY_STATUS = -1  # 비어 있는 sid 슬롯
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+
+def to_epoch_seconds(value: datetime) -> int:
+    """datetime을 벽시계 기준 epoch 초로 변환 (시간대 정보는 무시)"""
+    return (value.replace(tzinfo=None) - _EPOCH) // _SECOND
+
+
+def from_epoch_seconds(seconds: int) -> datetime:
+    """epoch 초를 datetime으로 변환"""
+    return _EPOCH + timedelta(seconds=int(seconds))
+
+
+class ColumnarColumns:
+    """한 시점의 살아 있는 항목 컬럼 (모두 같은 길이의 NumPy 배열)"""
+
+    __slots__ = ('status', 'target_date', 'created_at', 'updated_at')
+
+    def __init__(self, status: np.ndarray, target_date: np.ndarray,
+                 created_at: np.ndarray, updated_at: np.ndarray):
+        self.status = status
+        self.target_date = target_date
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+
+class ColumnarMirror:
+    """
+    저장소 항목을 sid로 색인한 NumPy 컬럼에 복제하는 미러
+
+    상태는 int8 코드(STATUS_CODES), 날짜는 int64 epoch 초로 저장한다.
+    저장소의 변경 이벤트를 받아 갱신되므로 통계 계산 시 TodoItem을 순회하지 않는다.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._lock = threading.Lock()
+        self._status = np.full(capacity, EMPTY_STATUS, dtype=np.int8)
+        self._target_date = np.zeros(capacity, dtype=np.int64)
+        self._created_at = np.zeros(capacity, dtype=np.int64)
+        self._updated_at = np.zeros(capacity, dtype=np.int64)
+
+    def attach(self, repository) -> None:
+        """저장소의 현재 항목을 불러오고 이후 변경 이벤트를 구독"""
+        repository.add_listener(self.apply, replay=True)
+
+    def apply(self, event: MutationEvent) -> None:
+        """변경 이벤트 반영"""
+        with self._lock:
+            if event.op in (MutationEvent.CREATE, MutationEvent.UPDATE):
+                self._set_row(event.sid, event.todo)
+            elif event.op == MutationEvent.DELETE:
+                self._status[event.sid] = EMPTY_STATUS
+            elif event.op == MutationEvent.CLEAR:
+                self._status.fill(EMPTY_STATUS)
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 배열 크기 (빈 슬롯을 포함한 용량 기준)"""
+        with self._lock:
+            parts = {
+                'status': self._status,
+                'dates': (self._target_date, self._created_at, self._updated_at),
+            }
+        return {name: sizer.size(part) for name, part in parts.items()}
+
+    def columns(self) -> ColumnarColumns:
+        """살아 있는 항목만 담은 컬럼 복사본 (일관된 한 시점)"""
+        with self._lock:
+            alive = self._status != EMPTY_STATUS
+            return ColumnarColumns(
+                self._status[alive],
+                self._target_date[alive],
+                self._created_at[alive],
+                self._updated_at[alive],
+            )
+
+    def _set_row(self, sid: int, todo: TodoItem) -> None:
+        """sid 행에 항목 값 기록"""
+        if sid >= len(self._status):
+            self._grow(sid + 1)
+        self._status[sid] = STATUS_CODES[todo.status]
+        self._target_date[sid] = to_epoch_seconds(todo.target_date)
+        self._created_at[sid] = to_epoch_seconds(todo.created_at)
+        self._updated_at[sid] = to_epoch_seconds(todo.updated_at)
+
+    def _grow(self, minimum: int) -> None:
+        """배열 용량을 두 배씩 늘림"""
+        capacity = max(minimum, 2 * len(self._status))
+        extra = capacity - len(self._status)
+        self._status = np.concatenate([self._status, np.full(extra, EMPTY_STATUS, dtype=np.int8)])
+        self._target_date = np.concatenate([self._target_date, np.zeros(extra, dtype=np.int64)])
+        self._created_at = np.concatenate([self._created_at, np.zeros(extra, dtype=np.int64)])
+        self._updated_at = np.concatenate([self._updated_at, np.zeros(extra, dtype=np.int64)])
@@ -0,0 +1,153 @@
+"""목표 날짜순 정렬 인덱스"""
+from bisect import bisect_left, insort
+from datetime import datetime
+from itertools import chain
+from typing import Iterator, List, Optional, Sequence, Tuple
+from models import TodoItem
+
+# (target_date, created_at, sid): 같은 날짜는 생성 순 (생성 시각까지 같으면 sid 순)
+DateKey = Tuple
+
+
+class DateView:
+    """
+    날짜순 정렬 청크의 읽기 전용 뷰
+
+    DateIndex.freeze()가 만들며, 청크는 인덱스가 더 이상 수정하지 않는
+    객체이므로 쓰기 잠금 없이 읽어도 만든 시점의 날짜순을 본다.
+    """
+
+    def __init__(self, chunks: Sequence[list], maxes: List[DateKey], size: int):
+        self._chunks = chunks
+        self._maxes = maxes
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[DateKey]:
+        return chain.from_iterable(self._chunks)
+
+    def sids(self) -> List[int]:
+        """날짜순 sid 목록 (O(N), 비교 없음)"""
+        return [key[-1] for key in self]
+
+    def range(self, start: datetime, end: datetime) -> List[int]:
+        """목표 날짜가 start 이상 end 미만인 sid (O(log N + 결과 개수))"""
+        # (날짜,)는 같은 날짜의 모든 키보다 작으므로 경계 키로 사용
+        k = bisect_left(self._maxes, (start,))
+        if k == len(self._maxes):
+            return []
+        result = []
+        j = bisect_left(self._chunks[k], (start,))
+        for chunk in self._chunks[k:]:
+            for key in chunk[j:]:
+                if key[0] >= end:
+                    return result
+                result.append(key[-1])
+            j = 0
+        return result
+
+    def count_range(self, start: datetime, end: datetime) -> int:
+        """목표 날짜가 start 이상 end 미만인 키 개수 (O(N / LOAD + log N), 키를 읽지 않음)"""
+        return max(0, self._rank((end,)) - self._rank((start,)))
+
+    def _rank(self, key: DateKey) -> int:
+        """key보다 작은 키 개수"""
+        k = bisect_left(self._maxes, key)
+        if k == len(self._maxes):
+            return self._size
+        return sum(len(chunk) for chunk in self._chunks[:k]) + bisect_left(self._chunks[k], key)
+
+    def slice(self, offset: int = 0, limit: Optional[int] = None) -> List[int]:
+        """offset 위치부터 최대 limit개의 sid (O(N / LOAD + limit))"""
+        if limit is None:
+            limit = self._size
+        result = []
+        for chunk in self._chunks:
+            if offset >= len(chunk):
+                offset -= len(chunk)
+                continue
+            result.extend(key[-1] for key in chunk[offset:offset + limit - len(result)])
+            offset = 0
+            if len(result) >= limit:
+                break
+        return result
+
+
+class DateIndex(DateView):
+    """
+    항목을 목표 날짜순으로 유지하는 정렬 목록
+
+    키는 일정 크기의 정렬된 청크에 나뉘어 저장되므로 추가/삭제는 bisect로
+    청크를 찾아 그 청크만 수정하고(O(log N) 검색 + 청크 크기만큼의 이동),
+    앞에서부터 k개를 읽을 때는 청크 길이만 보고 건너뛴 뒤 k개만 읽는다.
+    freeze()한 청크는 스냅샷과 공유하므로, 이후 그 청크를 수정할 때만 복사한다.
+    """
+
+    _LOAD = 512  # 청크 목표 크기
+
+    def __init__(self):
+        self.clear()
+
+    @staticmethod
+    def key(sid: int, todo: TodoItem) -> DateKey:
+        """항목의 정렬 키"""
+        return (todo.target_date, todo.created_at, sid)
+
+    def clear(self) -> None:
+        """모든 키 제거"""
+        self._chunks: List[list] = []
+        self._maxes: List[DateKey] = []
+        self._size = 0
+        self._frozen = set()  # 스냅샷과 공유 중인 청크의 id()
+
+    def freeze(self) -> DateView:
+        """현재 청크를 스냅샷용으로 고정하고 읽기 전용 뷰 반환 (O(N / LOAD))"""
+        self._frozen = {id(chunk) for chunk in self._chunks}
+        return DateView(tuple(self._chunks), list(self._maxes), self._size)
+
+    def _own(self, k: int) -> list:
+        """k번째 청크를 수정 가능하게 만듦 (스냅샷과 공유 중이면 복사)"""
+        chunk = self._chunks[k]
+        if id(chunk) in self._frozen:
+            self._frozen.discard(id(chunk))
+            chunk = self._chunks[k] = list(chunk)
+        return chunk
+
+    def add(self, key: DateKey) -> None:
+        """키 추가 (비교할 수 없는 키면 TypeError, 인덱스는 그대로)"""
+        if not self._maxes:
+            self._chunks.append([key])
+            self._maxes.append(key)
+            self._size += 1
+            return
+        k = bisect_left(self._maxes, key)
+        if k == len(self._maxes):
+            k -= 1
+        chunk = self._own(k)
+        insort(chunk, key)
+        self._size += 1
+        self._maxes[k] = chunk[-1]
+        if len(chunk) > 2 * self._LOAD:
+            self._chunks[k:k + 1] = [chunk[:self._LOAD], chunk[self._LOAD:]]
+            self._maxes[k:k + 1] = [chunk[self._LOAD - 1], chunk[-1]]
+
+    def remove(self, key: DateKey) -> bool:
+        """키 제거 (없으면 False)"""
+        k = bisect_left(self._maxes, key)
+        if k == len(self._maxes):
+            return False
+        chunk = self._chunks[k]
+        j = bisect_left(chunk, key)
+        if j == len(chunk) or chunk[j] != key:
+            return False
+        chunk = self._own(k)
+        del chunk[j]
+        self._size -= 1
+        if chunk:
+            self._maxes[k] = chunk[-1]
+        else:
+            del self._chunks[k]
+            del self._maxes[k]
+        return True
@@ -0,0 +1,43 @@
+"""저장소 변경 이벤트"""
+from typing import Optional
+from models import TodoItem
+
+
+class MutationEvent:
+    """
+    저장소 쓰기 작업 하나를 나타내는 이벤트
+
+    저장소는 쓰기 잠금을 쥔 상태에서 변경 직후 리스너에게 이벤트를 전달하므로,
+    리스너는 version 순서대로 빠짐없이 이벤트를 받는다.
+
+    Attributes:
+        op: 작업 종류 (CREATE, UPDATE, DELETE, REORDER, CLEAR, STATE, 삭제 취소는 CREATE)
+        version: 이 변경 이후의 저장소 버전
+        sid: 대상 항목의 정수 대리 키 (REORDER/CLEAR/STATE는 None)
+        todo: 변경 후 항목 (DELETE는 삭제된 항목)
+        previous: UPDATE 이전 값의 복사본
+        name: STATE에서 바뀐 저장소 밖 상태의 이름 (예: 'recurrences', 'archive')
+    """
+
+    CREATE = 'create'
+    UPDATE = 'update'
+    DELETE = 'delete'
+    REORDER = 'reorder'
+    CLEAR = 'clear'
+    STATE = 'state'  # 항목은 그대로이고 버전만 오름 (반복 규칙, 보관 계층 등 함께 복제할 상태 변경)
+
+    __slots__ = ('op', 'version', 'sid', 'todo', 'previous', 'name')
+
+    def __init__(self, op: str, version: int, sid: Optional[int] = None,
+                 todo: Optional[TodoItem] = None, previous: Optional[TodoItem] = None,
+                 name: Optional[str] = None):
+        self.op = op
+        self.version = version
+        self.sid = sid
+        self.todo = todo
+        self.previous = previous
+        self.name = name
+
+    def __repr__(self) -> str:
+        todo_id = self.todo.id if self.todo is not None else None
+        return f"MutationEvent(op={self.op!r}, version={self.version}, id={todo_id!r})"
@@ -0,0 +1,57 @@
+"""TODO ID 인터닝 테이블"""
+from typing import Dict, List, Optional
+
+
+class IdTable:
+    """
+    문자열 TODO ID를 작은 정수 대리 키(sid)로 바꾸는 인터닝 테이블
+
+    저장소 내부의 순서/인덱스 구조는 sid를 배열 색인으로 사용하고,
+    문자열 ID는 저장소 공개 메서드의 입출력에서만 사용한다. 삭제된 sid는
+    재사용하므로 sid 범위는 동시에 존재하는 항목 수를 넘지 않는다.
+    """
+
+    def __init__(self):
+        self._sids: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._next_sid = 0
+
+    def __len__(self) -> int:
+        return len(self._sids)
+
+    def __contains__(self, todo_id) -> bool:
+        return todo_id in self._sids
+
+    @property
+    def capacity(self) -> int:
+        """지금까지 발급된 sid 범위 (배열 크기 결정용)"""
+        return self._next_sid
+
+    def intern(self, todo_id: str) -> int:
+        """ID의 sid 반환 (없으면 새로 발급)"""
+        sid = self._sids.get(todo_id)
+        if sid is None:
+            if self._free:
+                sid = self._free.pop()
+            else:
+                sid = self._next_sid
+                self._next_sid += 1
+            self._sids[todo_id] = sid
+        return sid
+
+    def get(self, todo_id: str) -> Optional[int]:
+        """ID의 sid 조회 (없으면 None)"""
+        return self._sids.get(todo_id)
+
+    def release(self, todo_id: str) -> Optional[int]:
+        """ID를 테이블에서 제거하고 sid를 재사용 목록에 반환"""
+        sid = self._sids.pop(todo_id, None)
+        if sid is not None:
+            self._free.append(sid)
+        return sid
+
+    def clear(self) -> None:
+        """모든 ID 제거"""
+        self._sids.clear()
+        self._free.clear()
+        self._next_sid = 0
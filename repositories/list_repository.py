@@ -0,0 +1,288 @@
+"""리스트 기반 기준 저장소"""
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from models import TodoItem, TodoStatus
+from .base import BaseTodoRepository, check_page
+from .events import MutationEvent
+
+
+class ListTodoRepository(BaseTodoRepository):
+    """
+    딕셔너리와 ID 리스트만으로 구현한 저장소
+
+    이동/삭제/날짜순 조회가 O(N)이지만 구현이 단순해 동작을 한눈에 확인할
+    수 있으므로, 새 백엔드를 만들 때 적합성 테스트의 기준 구현으로 쓴다.
+    sid는 생성할 때마다 새로 발급하고 재사용하지 않는다.
+    """
+
+    def __init__(self, undo_window: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """
+        저장소 초기화
+
+        Args:
+            undo_window: 삭제 후 복구 가능한 시간(초)
+            clock: 삭제 시각 기준 시계 (초 단위)
+        """
+        self._todos: Dict[str, TodoItem] = {}
+        self._sids: Dict[str, int] = {}
+        self._order: List[str] = []
+        self._deleted: Dict[str, Tuple[TodoItem, Optional[str], float]] = {}  # ID -> (항목, 앞 항목 ID, 삭제 시각)
+        self._next_sid = 0
+        self._lock = threading.RLock()
+        self._version = 0
+        self._listeners: List[Callable[[MutationEvent], None]] = []
+        self.undo_window = undo_window
+        self._clock = clock
+
+    @property
+    def version(self) -> int:
+        """마지막 쓰기 작업의 버전"""
+        return self._version
+
+    def add_listener(self, listener: Callable[[MutationEvent], None], replay: bool = False) -> None:
+        """변경 이벤트 리스너 등록 (replay=True면 현재 항목을 CREATE 이벤트로 먼저 전달)"""
+        with self._lock:
+            if replay:
+                for todo_id in self._order:
+                    listener(MutationEvent(MutationEvent.CREATE, self._version, self._sids[todo_id],
+                                           self._todos[todo_id]))
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[MutationEvent], None]) -> None:
+        """변경 이벤트 리스너 해제"""
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def _emit(self, op: str, todo: Optional[TodoItem] = None, previous: Optional[TodoItem] = None,
+              name: Optional[str] = None) -> None:
+        """버전을 올리고 리스너에게 이벤트 전달 (쓰기 잠금 안에서 호출)"""
+        self._version += 1
+        sid = None if todo is None else self._sids[todo.id]
+        event = MutationEvent(op, self._version, sid, todo, previous, name)
+        for listener in self._listeners:
+            listener(event)
+
+    def create(self, content: str, target_date: datetime, status: TodoStatus = TodoStatus.SCHEDULED) -> TodoItem:
+        """새로운 TODO 항목을 맨 뒤에 생성"""
+        todo = TodoItem(content=content, target_date=target_date, status=status)
+        with self._lock:
+            self._sids[todo.id] = self._next_sid
+            self._next_sid += 1
+            self._todos[todo.id] = todo
+            self._order.append(todo.id)
+            self._emit(MutationEvent.CREATE, todo)
+        return todo
+
+    def insert(self, todo: TodoItem) -> TodoItem:
+        """기존 항목을 ID와 시각 그대로 맨 뒤에 추가 (같은 ID나 삭제 표시가 있으면 ValueError)"""
+        with self._lock:
+            if todo.id in self._todos or todo.id in self._deleted:
+                raise ValueError(f"ID '{todo.id}'인 항목이 이미 있습니다")
+            self._sids[todo.id] = self._next_sid
+            self._next_sid += 1
+            self._todos[todo.id] = todo
+            self._order.append(todo.id)
+            self._emit(MutationEvent.CREATE, todo)
+        return todo
+
+    def insert_many(self, todos: Iterable[TodoItem]) -> List[TodoItem]:
+        """이미 검증한 항목들을 순서대로 맨 뒤에 추가 (ID가 하나라도 겹치면 아무것도 추가하지 않고 ValueError)"""
+        todos = list(todos)
+        with self._lock:
+            ids = set()
+            for todo in todos:
+                if todo.id in self._todos or todo.id in self._deleted or todo.id in ids:
+                    raise ValueError(f"ID '{todo.id}'인 항목이 이미 있습니다")
+                ids.add(todo.id)
+            for todo in todos:
+                self._sids[todo.id] = self._next_sid
+                self._next_sid += 1
+                self._todos[todo.id] = todo
+                self._order.append(todo.id)
+                self._emit(MutationEvent.CREATE, todo)
+        return todos
+
+    def get_by_id(self, todo_id: str) -> Optional[TodoItem]:
+        """ID로 TODO 항목 조회"""
+        return self._todos.get(todo_id)
+
+    def get_all(self) -> List[TodoItem]:
+        """모든 TODO 항목 조회 (저장된 순서 유지)"""
+        with self._lock:
+            return [self._todos[todo_id] for todo_id in self._order]
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[TodoItem], int, int]:
+        """저장된 순서의 일부 조회 (O(limit))"""
+        check_page(offset, limit)
+        end = None if limit is None else offset + limit
+        with self._lock:
+            todos = [self._todos[todo_id] for todo_id in self._order[offset:end]]
+            return todos, len(self._order), self._version
+
+    def update(self, todo_id: str, content: Optional[str] = None,
+               target_date: Optional[datetime] = None,
+               status: Optional[TodoStatus] = None) -> Optional[TodoItem]:
+        """TODO 항목 수정 (바꾸는 필드만 검증)"""
+        changes = {'content': content, 'target_date': target_date, 'status': status}
+        changes = {key: value for key, value in changes.items() if value is not None}
+        with self._lock:
+            previous = self._todos.get(todo_id)
+            if previous is None:
+                return None
+            todo = self._todos[todo_id] = previous.revise(**changes)
+            self._emit(MutationEvent.UPDATE, todo, previous)
+            return todo
+
+    def apply_update(self, todo_id: str, changes: Dict[str, Any]) -> Optional[TodoItem]:
+        """이미 검증한 변경을 다시 검증하지 않고 적용"""
+        with self._lock:
+            previous = self._todos.get(todo_id)
+            if previous is None:
+                return None
+            todo = self._todos[todo_id] = previous.trusted_update(changes)
+            self._emit(MutationEvent.UPDATE, todo, previous)
+            return todo
+
+    def delete(self, todo_id: str) -> bool:
+        """TODO 항목 삭제 (undo_window 동안 restore()로 복구 가능)"""
+        with self._lock:
+            todo = self._todos.pop(todo_id, None)
+            if todo is None:
+                return False
+            position = self._order.index(todo_id)
+            self._deleted[todo_id] = (todo, self._order[position - 1] if position > 0 else None, self._clock())
+            del self._order[position]
+            self._emit(MutationEvent.DELETE, todo)
+            return True
+
+    def restore(self, todo_id: str) -> Optional[TodoItem]:
+        """삭제한 TODO를 이전 앞 항목 바로 뒤(맨 앞이었으면 맨 앞)에 복구"""
+        with self._lock:
+            deleted = self._deleted.get(todo_id)
+            if deleted is None or self._clock() - deleted[2] > self.undo_window:
+                return None
+            todo, previous_id, _ = self._deleted.pop(todo_id)
+            if previous_id is None:
+                position = 0
+            elif previous_id in self._todos:
+                position = self._order.index(previous_id) + 1
+            else:
+                position = len(self._order)
+            self._order.insert(position, todo_id)
+            self._todos[todo_id] = todo
+            self._emit(MutationEvent.CREATE, todo)
+            return todo
+
+    def evict(self, todos: Iterable[TodoItem],
+              on_evicted: Optional[Callable[[List[TodoItem]], None]] = None) -> List[TodoItem]:
+        """다른 계층으로 옮긴 항목을 삭제 표시 없이 제거 (읽은 뒤 바뀐 항목은 남김)"""
+        with self._lock:
+            evicted = [todo for todo in todos if self._todos.get(todo.id) is todo]
+            if evicted:
+                gone = {todo.id for todo in evicted}
+                self._order = [todo_id for todo_id in self._order if todo_id not in gone]
+                for todo in evicted:
+                    del self._todos[todo.id]
+                    self._emit(MutationEvent.DELETE, todo)
+                    del self._sids[todo.id]
+                if on_evicted is not None:
+                    on_evicted(evicted)
+            return evicted
+
+    def compact(self, batch_size: int = 256) -> int:
+        """복구 가능 시간이 지난 삭제 표시를 최대 batch_size개 정리"""
+        with self._lock:
+            expired_before = self._clock() - self.undo_window
+            expired = [todo_id for todo_id, (_, _, deleted_at) in self._deleted.items()
+                       if deleted_at < expired_before][:batch_size]
+            for todo_id in expired:
+                del self._deleted[todo_id]
+                del self._sids[todo_id]
+            return len(expired)
+
+    def tombstone_count(self) -> int:
+        """정리되지 않은 삭제 표시 개수"""
+        return len(self._deleted)
+
+    def clear_all(self) -> None:
+        """모든 TODO 항목 삭제 (복구 불가)"""
+        with self._lock:
+            self._todos.clear()
+            self._order.clear()
+            self._deleted.clear()
+            self._sids.clear()
+            self._emit(MutationEvent.CLEAR)
+
+    def publish_state(self, name: str) -> None:
+        """항목은 그대로 두고 버전을 올려 STATE 이벤트 전달 (name: 바뀐 상태 이름)"""
+        with self._lock:
+            self._emit(MutationEvent.STATE, name=name)
+
+    def set_order(self, order: List[str]) -> None:
+        """TODO 순서 설정 (모르는 ID와 중복 ID는 무시, 빠진 항목은 기존 순서대로 뒤에)"""
+        with self._lock:
+            listed = list(dict.fromkeys(todo_id for todo_id in order if todo_id in self._todos))
+            seen = set(listed)
+            self._order = listed + [todo_id for todo_id in self._order if todo_id not in seen]
+            self._emit(MutationEvent.REORDER)
+
+    def move_before(self, todo_id: str, anchor_id: str) -> Optional[int]:
+        """TODO를 anchor_id 항목 바로 앞으로 이동 후 새 위치 반환"""
+        return self._move(todo_id, anchor_id, 0)
+
+    def move_after(self, todo_id: str, anchor_id: str) -> Optional[int]:
+        """TODO를 anchor_id 항목 바로 뒤로 이동 후 새 위치 반환"""
+        return self._move(todo_id, anchor_id, 1)
+
+    def _move(self, todo_id: str, anchor_id: str, offset: int) -> Optional[int]:
+        """anchor_id 위치 + offset으로 이동"""
+        with self._lock:
+            if todo_id not in self._todos or anchor_id not in self._todos:
+                return None
+            if todo_id != anchor_id:
+                self._order.remove(todo_id)
+                self._order.insert(self._order.index(anchor_id) + offset, todo_id)
+            self._emit(MutationEvent.REORDER, self._todos[todo_id])
+            return self._order.index(todo_id)
+
+    def move_to(self, todo_id: str, position: int) -> Optional[int]:
+        """TODO를 position 위치로 이동 후 새 위치 반환 (범위 밖이면 양 끝)"""
+        with self._lock:
+            if todo_id not in self._todos:
+                return None
+            self._order.remove(todo_id)
+            position = max(0, min(position, len(self._order)))
+            self._order.insert(position, todo_id)
+            self._emit(MutationEvent.REORDER, self._todos[todo_id])
+            return position
+
+    def index_of(self, todo_id: str) -> Optional[int]:
+        """TODO의 현재 순서 위치"""
+        with self._lock:
+            return self._order.index(todo_id) if todo_id in self._todos else None
+
+    def get_by_date(self, status: Optional[TodoStatus] = None) -> List[TodoItem]:
+        """날짜순 조회 (같은 날짜는 생성 순)"""
+        with self._lock:
+            todos = sorted(self._todos.values(),
+                           key=lambda todo: (todo.target_date, todo.created_at, self._sids[todo.id]))
+        if status is None:
+            return todos
+        return [todo for todo in todos if todo.status == status]
+
+    def count(self) -> int:
+        """TODO 항목 개수"""
+        return len(self._order)
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 구조별 깊은 크기 (항목 객체는 todos에 포함)"""
+        with self._lock:
+            parts = {
+                'todos': self._todos,
+                'sids': self._sids,
+                'order': self._order,
+                'deleted': self._deleted,
+            }
+        return {name: sizer.size(part) for name, part in parts.items()}
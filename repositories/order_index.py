@@ -0,0 +1,287 @@
+"""TODO 표시 순서 인덱스"""
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+class _Fenwick:
+    """청크 길이의 누적합을 관리하는 Fenwick 트리 (위치 -> 청크 검색용)"""
+
+    def __init__(self, sizes: List[int]):
+        self._tree = [0] * (len(sizes) + 1)
+        for i, size in enumerate(sizes, 1):
+            self._tree[i] += size
+            parent = i + (i & -i)
+            if parent <= len(sizes):
+                self._tree[parent] += self._tree[i]
+
+    def add(self, index: int, delta: int) -> None:
+        """index번째 청크 길이에 delta 더하기"""
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix(self, index: int) -> int:
+        """index번째 청크 앞까지의 원소 개수"""
+        total = 0
+        i = index
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, position: int) -> tuple:
+        """position번째 원소가 속한 (청크 번호, 청크 내 위치)"""
+        index = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = index + step
+            if nxt < len(self._tree) and self._tree[nxt] <= position:
+                index = nxt
+                position -= self._tree[nxt]
+            step >>= 1
+        return index, position
+
+
+class OrderIndex:
+    """
+    순위 키(rank)로 정렬된 sid(IdTable의 정수 대리 키) 목록
+
+    각 sid는 정수 순위 키를 가지며, 키 순서가 곧 표시 순서이다. 원소는
+    일정 크기의 청크로 나뉘어 저장되므로 특정 항목 앞/뒤로 이동할 때 전체
+    목록을 다시 만들지 않고 bisect로 위치를 찾아 한 청크만 수정한다.
+    sid -> 순위 키 매핑과 청크는 모두 array('q')라 항목당 정수 객체를
+    만들지 않는다 (순위 키 0은 '없음'을 뜻함).
+
+    - move_before / move_after: O(log N) 검색 + 청크 크기만큼의 이동
+    - move_to / index: Fenwick 트리로 O(log N) 위치 계산
+    - 두 순위 키 사이에 빈 값이 없으면 전체 키를 다시 매긴다 (드묾)
+    - freeze(): sid 청크를 스냅샷과 공유하고, 이후 공유 중인 청크를 수정할 때만
+      그 청크를 복사한다 (copy-on-write)
+    """
+
+    _LOAD = 512  # 청크 목표 크기
+    _RANK_STEP = 1 << 32  # 새 키 사이의 간격
+    _RANK_LIMIT = (1 << 63) - 1  # array('q')에 담을 수 있는 최대 키
+
+    def __init__(self, sids: Iterable[int] = ()):
+        self.epoch = 0  # 전체 키를 다시 매길 때마다 증가 (이전에 읽은 순위 키가 유효한지 확인용)
+        self.reset(sids)
+
+    def reset(self, sids: Iterable[int]) -> None:
+        """주어진 순서로 전체 인덱스 재구성 (O(N), 중복 sid는 첫 위치만 사용)"""
+        sids = list(dict.fromkeys(sids))
+        ranks = range(self._RANK_STEP, (len(sids) + 1) * self._RANK_STEP, self._RANK_STEP)
+        self._rank_of = array('q', bytes(8 * (max(sids) + 1 if sids else 0)))
+        for sid, rank in zip(sids, ranks):
+            self._rank_of[sid] = rank
+        self._size = len(sids)
+        self._id_chunks: List[array] = [array('q', sids[i:i + self._LOAD]) for i in range(0, len(sids), self._LOAD)]
+        self._rank_chunks: List[array] = [array('q', ranks[i:i + self._LOAD]) for i in range(0, len(ranks), self._LOAD)]
+        self._maxes: List[int] = [chunk[-1] for chunk in self._rank_chunks]
+        self._frozen = set()  # 스냅샷과 공유 중인 sid 청크의 id()
+        self.epoch += 1
+        self._rebuild_positions()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, sid) -> bool:
+        return self._rank(sid) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return chain.from_iterable(self._id_chunks)
+
+    def to_list(self) -> list:
+        """표시 순서대로 sid 리스트 반환"""
+        return list(self)
+
+    def freeze(self) -> Tuple[array, ...]:
+        """현재 sid 청크들을 스냅샷용으로 고정하고 반환 (O(N / LOAD))"""
+        self._frozen = {id(chunk) for chunk in self._id_chunks}
+        return tuple(self._id_chunks)
+
+    def append(self, sid: int) -> None:
+        """맨 뒤에 sid 추가"""
+        if sid in self:
+            return
+        rank = (self._maxes[-1] if self._maxes else 0) + self._RANK_STEP
+        self._insert_rank(rank, sid)
+
+    def discard(self, sid: int) -> bool:
+        """sid 제거 (없으면 False)"""
+        rank = self._rank(sid)
+        if rank is None:
+            return False
+        self._rank_of[sid] = 0
+        self._size -= 1
+        k = bisect_left(self._maxes, rank)
+        j = bisect_left(self._rank_chunks[k], rank)
+        del self._rank_chunks[k][j]
+        del self._own(k)[j]
+        if not self._rank_chunks[k]:
+            self._frozen.discard(id(self._id_chunks[k]))
+            del self._rank_chunks[k]
+            del self._id_chunks[k]
+            del self._maxes[k]
+            self._rebuild_positions()
+        else:
+            self._maxes[k] = self._rank_chunks[k][-1]
+            self._positions.add(k, -1)
+        return True
+
+    def rank(self, sid: int) -> Optional[int]:
+        """sid의 순위 키 (없으면 None, epoch가 바뀌기 전까지만 유효)"""
+        return self._rank(sid)
+
+    def sid_at(self, position: int) -> int:
+        """position 위치의 sid"""
+        k, j = self._positions.find(position)
+        return self._id_chunks[k][j]
+
+    def insert_at_rank(self, sid: int, rank: int) -> None:
+        """rank(이전에 rank()로 읽은 키) 위치에 sid 삽입 (같은 키가 이미 있으면 그 바로 뒤)"""
+        if sid in self:
+            return
+        k = bisect_left(self._maxes, rank)
+        if k < len(self._maxes):
+            chunk = self._rank_chunks[k]
+            j = bisect_left(chunk, rank)
+            if chunk[j] == rank:
+                self._insert_between(rank, self._neighbor_rank(rank, 1), sid)
+                return
+        self._insert_rank(rank, sid)
+
+    def index(self, sid: int) -> int:
+        """sid의 현재 위치 (없으면 ValueError)"""
+        rank = self._rank(sid)
+        if rank is None:
+            raise ValueError(f"{sid!r} is not in order index")
+        k = bisect_left(self._maxes, rank)
+        return self._positions.prefix(k) + bisect_left(self._rank_chunks[k], rank)
+
+    def move_before(self, sid: int, anchor_sid: int) -> bool:
+        """sid를 anchor_sid 바로 앞으로 이동 (둘 중 하나라도 없으면 False)"""
+        if sid not in self or anchor_sid not in self:
+            return False
+        if sid == anchor_sid:
+            return True
+        self.discard(sid)
+        anchor_rank = self._rank_of[anchor_sid]
+        self._insert_between(self._neighbor_rank(anchor_rank, -1), anchor_rank, sid)
+        return True
+
+    def move_after(self, sid: int, anchor_sid: int) -> bool:
+        """sid를 anchor_sid 바로 뒤로 이동 (둘 중 하나라도 없으면 False)"""
+        if sid not in self or anchor_sid not in self:
+            return False
+        if sid == anchor_sid:
+            return True
+        self.discard(sid)
+        anchor_rank = self._rank_of[anchor_sid]
+        self._insert_between(anchor_rank, self._neighbor_rank(anchor_rank, 1), sid)
+        return True
+
+    def move_to(self, sid: int, position: int) -> bool:
+        """sid를 position 위치로 이동 (범위를 벗어나면 양 끝으로 보정)"""
+        if sid not in self:
+            return False
+        self.discard(sid)
+        position = max(0, min(position, self._size))
+        lower = self._rank_at(position - 1) if position > 0 else None
+        upper = self._rank_at(position) if position < self._size else None
+        self._insert_between(lower, upper, sid)
+        return True
+
+    def _rank(self, sid: int) -> Optional[int]:
+        """sid의 순위 키 (없으면 None)"""
+        if 0 <= sid < len(self._rank_of):
+            return self._rank_of[sid] or None
+        return None
+
+    def _rank_at(self, position: int) -> int:
+        """position 위치의 순위 키"""
+        k, j = self._positions.find(position)
+        return self._rank_chunks[k][j]
+
+    def _neighbor_rank(self, rank: int, direction: int) -> Optional[int]:
+        """rank 바로 앞(-1) 또는 뒤(+1) 원소의 순위 키"""
+        k = bisect_left(self._maxes, rank)
+        chunk = self._rank_chunks[k]
+        j = bisect_left(chunk, rank) + direction
+        if 0 <= j < len(chunk):
+            return chunk[j]
+        k += direction
+        if 0 <= k < len(self._rank_chunks):
+            return self._rank_chunks[k][0 if direction > 0 else -1]
+        return None
+
+    def _insert_between(self, lower: Optional[int], upper: Optional[int], sid: int) -> None:
+        """두 순위 키 사이에 새 ID 삽입"""
+        if upper is None:
+            rank = (lower or 0) + self._RANK_STEP
+            if rank > self._RANK_LIMIT:
+                self._renumber_with(lower, sid)
+                return
+        else:
+            rank = ((lower or 0) + upper) // 2
+            if rank == lower or rank == upper or rank <= 0:
+                self._renumber_with(lower, sid)
+                return
+        self._insert_rank(rank, sid)
+
+    def _renumber_with(self, lower: Optional[int], sid: int) -> None:
+        """빈 키가 없을 때 lower 바로 뒤에 끼워 넣으며 전체 키 재발급"""
+        sids = list(self)
+        position = 0 if lower is None else bisect_right(list(chain.from_iterable(self._rank_chunks)), lower)
+        sids.insert(position, sid)
+        self.reset(sids)
+
+    def _insert_rank(self, rank: int, sid: int) -> None:
+        """순위 키 위치에 sid 삽입"""
+        if sid >= len(self._rank_of):
+            self._rank_of.frombytes(bytes(8 * (sid + 1 - len(self._rank_of))))
+        self._rank_of[sid] = rank
+        self._size += 1
+        if not self._maxes:
+            self._rank_chunks.append(array('q', [rank]))
+            self._id_chunks.append(array('q', [sid]))
+            self._maxes.append(rank)
+            self._rebuild_positions()
+            return
+
+        k = bisect_left(self._maxes, rank)
+        if k == len(self._maxes):
+            k -= 1
+        j = bisect_left(self._rank_chunks[k], rank)
+        self._rank_chunks[k].insert(j, rank)
+        self._own(k).insert(j, sid)
+        self._maxes[k] = self._rank_chunks[k][-1]
+
+        if len(self._rank_chunks[k]) > 2 * self._LOAD:
+            self._split(k)
+        else:
+            self._positions.add(k, 1)
+
+    def _split(self, k: int) -> None:
+        """너무 커진 청크를 둘로 나눔"""
+        ranks, ids = self._rank_chunks[k], self._id_chunks[k]
+        self._frozen.discard(id(ids))  # 슬라이스는 새 청크이므로 공유 표시 해제
+        self._rank_chunks[k:k + 1] = [ranks[:self._LOAD], ranks[self._LOAD:]]
+        self._id_chunks[k:k + 1] = [ids[:self._LOAD], ids[self._LOAD:]]
+        self._maxes[k:k + 1] = [ranks[self._LOAD - 1], ranks[-1]]
+        self._rebuild_positions()
+
+    def _own(self, k: int) -> array:
+        """k번째 sid 청크를 수정 가능하게 만듦 (스냅샷과 공유 중이면 복사)"""
+        chunk = self._id_chunks[k]
+        if id(chunk) in self._frozen:
+            self._frozen.discard(id(chunk))
+            chunk = self._id_chunks[k] = array('q', chunk)
+        return chunk
+
+    def _rebuild_positions(self) -> None:
+        """청크 구조가 바뀌었을 때 위치 트리 재구성 (O(N / LOAD))"""
+        self._positions = _Fenwick([len(chunk) for chunk in self._rank_chunks])
@@ -0,0 +1,122 @@
+"""조회 계획용 보조 인덱스 (상태, 내용 텍스트)"""
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set
+from models import TodoItem
+from .events import MutationEvent
+
+
+def normalize_text(text: str) -> str:
+    """텍스트 검색용 정규화 (대소문자 무시)"""
+    return text.casefold()
+
+
+def bigrams(text: str) -> Set[str]:
+    """정규화한 텍스트의 연속한 두 글자 집합"""
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class QueryIndex:
+    """
+    상태별 ID 집합과 내용의 두 글자(bigram) 역색인
+
+    저장소 변경 이벤트로 갱신되며, 조회 계획(QueryPlanner)이 각 인덱스의 후보
+    개수를 비교해 가장 선택적인 인덱스를 고르는 데 쓴다. 텍스트 인덱스의 후보는
+    검색어의 모든 두 글자를 포함하는 항목이므로 실제 부분 문자열 일치 여부는
+    호출한 쪽에서 확인해야 한다. 한 글자 검색어는 인덱스를 쓸 수 없다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_status: Dict[str, Set[str]] = defaultdict(set)
+        self._by_bigram: Dict[str, Set[str]] = defaultdict(set)
+
+    def attach(self, repository) -> None:
+        """저장소의 현재 항목을 불러오고 이후 변경 이벤트를 구독"""
+        repository.add_listener(self.apply, replay=True)
+
+    def apply(self, event: MutationEvent) -> None:
+        """변경 이벤트 반영"""
+        with self._lock:
+            if event.op == MutationEvent.CREATE:
+                self._add(event.todo)
+            elif event.op == MutationEvent.UPDATE:
+                self._remove(event.previous)
+                self._add(event.todo)
+            elif event.op == MutationEvent.DELETE:
+                self._remove(event.todo)
+            elif event.op == MutationEvent.CLEAR:
+                self._by_status.clear()
+                self._by_bigram.clear()
+
+    def _add(self, todo: TodoItem) -> None:
+        self._by_status[todo.status].add(todo.id)
+        for gram in bigrams(normalize_text(todo.content)):
+            self._by_bigram[gram].add(todo.id)
+
+    def _remove(self, todo: TodoItem) -> None:
+        self._by_status[todo.status].discard(todo.id)
+        for gram in bigrams(normalize_text(todo.content)):
+            postings = self._by_bigram.get(gram)
+            if postings is not None:
+                postings.discard(todo.id)
+                if not postings:
+                    del self._by_bigram[gram]
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 인덱스별 깊은 크기"""
+        with self._lock:
+            parts = {'status': self._by_status, 'text': self._by_bigram}
+        return {name: sizer.size(part) for name, part in parts.items()}
+
+    # ---- 상태 인덱스 ----
+
+    def status_count(self, statuses: Iterable[str]) -> int:
+        """상태들에 속한 항목 수 (O(상태 수))"""
+        with self._lock:
+            return sum(len(self._by_status.get(status, ())) for status in statuses)
+
+    def status_ids(self, statuses: Iterable[str]) -> Set[str]:
+        """상태들에 속한 항목 ID 집합 (복사본)"""
+        with self._lock:
+            return set().union(*(self._by_status.get(status, ()) for status in statuses))
+
+    def intersect(self, ids: Set[str], statuses: Optional[Iterable[str]] = None,
+                  text: Optional[str] = None) -> Set[str]:
+        """
+        ids 중 상태 집합에 속하고 검색어의 모든 두 글자를 포함하는 ID
+
+        후보마다 집합 포함 여부만 보므로 비용은 후보 수에 비례한다 (인덱스 목록을 복사하지 않음).
+        """
+        with self._lock:
+            if statuses is not None:
+                groups = [self._by_status.get(status, ()) for status in statuses]
+                ids = {todo_id for todo_id in ids if any(todo_id in group for group in groups)}
+            if text is not None:
+                for gram in bigrams(normalize_text(text)):
+                    postings = self._by_bigram.get(gram, ())
+                    ids = {todo_id for todo_id in ids if todo_id in postings}
+            return ids
+
+    # ---- 텍스트 인덱스 ----
+
+    def text_estimate(self, text: str) -> Optional[int]:
+        """텍스트 후보 수의 상한 (가장 짧은 역색인 목록 길이, 쓸 수 없으면 None)"""
+        grams = bigrams(normalize_text(text))
+        if not grams:
+            return None
+        with self._lock:
+            return min(len(self._by_bigram.get(gram, ())) for gram in grams)
+
+    def text_ids(self, text: str) -> Set[str]:
+        """검색어의 모든 두 글자를 포함하는 항목 ID 집합 (짧은 목록부터 교집합)"""
+        with self._lock:
+            postings = sorted((self._by_bigram.get(gram, set()) for gram in bigrams(normalize_text(text))), key=len)
+            if not postings:
+                raise ValueError("두 글자 이상의 검색어만 텍스트 인덱스를 쓸 수 있습니다")
+            result = set(postings[0])
+            for other in postings[1:]:
+                if not result:
+                    break
+                result.intersection_update(other)
+            return result
@@ -0,0 +1,394 @@
+"""반복 TODO 규칙 저장소"""
+import threading
+from bisect import bisect_left, insort
+from calendar import monthrange
+from datetime import datetime, timedelta
+from functools import lru_cache
+from math import gcd
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from dateutil.rrule import rrule, DAILY, WEEKLY, MONTHLY, YEARLY
+from models import RecurrenceRule, RecurrenceFrequency, TodoItem, TodoStatus
+
+OCCURRENCE_SEPARATOR = '@'  # 회차 ID: '<규칙 ID>@<회차 날짜>' (UUID에는 없는 문자)
+OCCURRENCE_DATE_FORMAT = '%Y%m%dT%H%M%S'
+
+_FREQUENCIES = {
+    RecurrenceFrequency.DAILY.value: DAILY,
+    RecurrenceFrequency.WEEKLY.value: WEEKLY,
+    RecurrenceFrequency.MONTHLY.value: MONTHLY,
+    RecurrenceFrequency.YEARLY.value: YEARLY,
+}
+_MONTHS = {RecurrenceFrequency.MONTHLY.value: 1, RecurrenceFrequency.YEARLY.value: 12}  # 한 주기의 개월 수
+
+
+def occurrence_id(rule_id: str, when: datetime) -> str:
+    """규칙 ID와 회차 날짜로 회차 ID 생성"""
+    # strftime보다 빠른 % 포매팅 (OCCURRENCE_DATE_FORMAT과 같은 형식)
+    return '%s%s%04d%02d%02dT%02d%02d%02d' % (
+        rule_id, OCCURRENCE_SEPARATOR, when.year, when.month, when.day, when.hour, when.minute, when.second
+    )
+
+
+def parse_occurrence_id(todo_id: str) -> Optional[Tuple[str, datetime]]:
+    """회차 ID를 (규칙 ID, 회차 날짜)로 분해 (회차 ID 형식이 아니면 None)"""
+    rule_id, separator, when = todo_id.partition(OCCURRENCE_SEPARATOR)
+    if not separator:
+        return None
+    try:
+        return rule_id, datetime.strptime(when, OCCURRENCE_DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+def _add_months(when: datetime, months: int) -> Optional[datetime]:
+    """months개월 뒤의 같은 날짜 (그 달에 없는 날짜면 None, rrule처럼 건너뜀)"""
+    year, month = divmod(when.month - 1 + months, 12)
+    year += when.year
+    if when.day > monthrange(year, month + 1)[1]:
+        return None
+    return when.replace(year=year, month=month + 1)
+
+
+@lru_cache(maxsize=256)
+def _month_offsets(year: int, month: int, day: int, months: int) -> Tuple[int, Tuple[int, ...]]:
+    """
+    29~31일에 months개월마다 반복할 때 건너뛰지 않는 주기 위치
+
+    없는 날짜의 모양은 12개월(29일은 윤년 때문에 400년)마다 반복되므로
+    한 번 계산해 두고 같은 모양의 규칙이 함께 쓴다.
+
+    Returns:
+        (모양이 반복되는 주기 수, 그 안에서 회차가 있는 위치)
+    """
+    cycle = 4800 if day == 29 else 12
+    period = cycle // gcd(months, cycle)
+    first = datetime(2000 + year, month, day)
+    return period, tuple(k for k in range(period) if _add_months(first, k * months) is not None)
+
+
+class _CompiledRule:
+    """
+    규칙 하나의 회차 계산기
+
+    rrule은 매번 시작 날짜부터 회차를 세므로 오래된 규칙일수록 느려진다.
+    그래서 회차를 '기준 날짜 + k * 주기' 수열로 바꿔 구간 시작 위치의 k를
+    바로 계산한다. 회차 수(count) 제한이 있으면 마지막 회차도 수열에서 바로
+    계산하므로 count에 관계없이 생성 비용이 일정하다. 월/연 단위에 요일까지
+    지정한 규칙만 rrule로 계산하며, 그중 회차 수 제한이 있는 규칙은 한 번
+    펼쳐 두고(최대 MAX_RECURRENCE_COUNT개) bisect로 자른다. 결과는 모두
+    rrule과 같다.
+    """
+
+    __slots__ = ('rule', 'rrule', 'first', 'last', 'series', 'weekdays', 'months', 'dates')
+
+    def __init__(self, rule: RecurrenceRule):
+        self.rule = rule
+        self.rrule = rrule(
+            _FREQUENCIES[rule.frequency],
+            dtstart=rule.start,
+            interval=rule.interval,
+            byweekday=rule.weekdays,
+            until=rule.until,
+            count=rule.count,
+        )
+        self.first = rule.start
+        self.last = rule.until  # None이면 끝없이 반복
+        self.series: Optional[List[Tuple[datetime, timedelta]]] = None  # (기준 날짜, 간격) 수열
+        self.weekdays: Optional[Set[int]] = None  # 수열에서 남길 요일 (매일 + 요일 규칙)
+        self.months: Optional[int] = None  # 월/연 규칙의 회차 간격(개월)
+        self.dates: Optional[List[datetime]] = None  # 회차 수 제한 규칙의 전체 회차
+
+        if rule.frequency == RecurrenceFrequency.DAILY.value:
+            self.series = [(rule.start, timedelta(days=rule.interval))]
+            self.weekdays = None if rule.weekdays is None else set(rule.weekdays)
+        elif rule.frequency == RecurrenceFrequency.WEEKLY.value:
+            # 월요일 시작 주 단위로 interval주마다 지정 요일 (시작 날짜 이전 요일은 다음 주기부터)
+            step = timedelta(weeks=rule.interval)
+            monday = rule.start - timedelta(days=rule.start.weekday())
+            self.series = []
+            for day in rule.weekdays or [rule.start.weekday()]:
+                anchor = monday + timedelta(days=day)
+                self.series.append((anchor if anchor >= rule.start else anchor + step, step))
+        elif rule.weekdays is None:
+            self.months = _MONTHS[rule.frequency] * rule.interval
+        elif rule.count is not None:
+            self.dates = list(self.rrule)
+            self.last = self.dates[-1] if self.dates else rule.start
+
+        if rule.count is not None and self.dates is None:
+            try:
+                self.last = self._nth(rule.count - 1)
+            except (OverflowError, ValueError):
+                self.last = None  # 마지막 회차가 datetime 범위 밖이면 끝없는 규칙과 같음
+
+    def _nth(self, n: int) -> datetime:
+        """
+        n번째(0부터) 회차 날짜 (수열로 계산하는 규칙만)
+
+        회차는 주기마다 같은 모양으로 반복되므로 한 주기 안의 회차 위치만 구해
+        몫과 나머지로 계산한다.
+        """
+        if self.months is not None:
+            if self.first.day <= 28:
+                return _add_months(self.first, n * self.months)
+            period, valid = _month_offsets(self.first.year % 400, self.first.month, self.first.day, self.months)
+            rounds, index = divmod(n, len(valid))
+            return _add_months(self.first, (rounds * period + valid[index]) * self.months)
+
+        # 한 주기(간격)에 기준 날짜마다 회차가 하나씩 있음 (기준 날짜는 start 이후 한 간격 안)
+        anchors = sorted(anchor for anchor, _ in self.series)
+        step = self.series[0][1]
+        if self.weekdays is not None:
+            # 매일 + 요일 규칙: 7회차마다 요일 모양이 반복됨
+            offsets = [k for k in range(7) if (anchors[0] + k * step).weekday() in self.weekdays]
+            if not offsets:
+                return self.first  # 남는 요일이 없으면 회차도 없음
+            rounds, index = divmod(n, len(offsets))
+            return anchors[0] + (rounds * 7 + offsets[index]) * step
+        rounds, index = divmod(n, len(anchors))
+        return anchors[index] + rounds * step
+
+    def between(self, start: datetime, end: datetime) -> List[datetime]:
+        """start 이상 end 미만의 회차 날짜 (날짜순)"""
+        if self.last is not None and end > self.last:
+            end = self.last + timedelta(seconds=1)  # until/마지막 회차 포함
+        if start < self.first:
+            start = self.first
+        if start >= end:
+            return []
+        if self.dates is not None:
+            return self.dates[bisect_left(self.dates, start):bisect_left(self.dates, end)]
+        if self.series is not None:
+            result = []
+            for anchor, step in self.series:
+                when = anchor + max(0, -((anchor - start) // step)) * step  # start 이상인 첫 회차
+                while when < end:
+                    result.append(when)
+                    when += step
+            if self.weekdays is not None:
+                result = [when for when in result if when.weekday() in self.weekdays]
+            if len(self.series) > 1:
+                result.sort()
+            return result
+        if self.months is not None:
+            # start와 end가 속한 달 사이의 주기만 계산 (그 달에 없는 날짜는 건너뜀)
+            first_k = max(0, self._months_from_first(start) // self.months)
+            last_k = self._months_from_first(end) // self.months
+            result = []
+            for k in range(first_k, last_k + 1):
+                when = _add_months(self.first, k * self.months)
+                if when is not None and start <= when < end:
+                    result.append(when)
+            return result
+        return [when for when in self.rrule.between(start, end, inc=True) if when < end]
+
+    def _months_from_first(self, when: datetime) -> int:
+        """첫 회차가 속한 달부터 when이 속한 달까지의 개월 수"""
+        return (when.year - self.first.year) * 12 + when.month - self.first.month
+
+
+class RecurrenceStore:
+    """
+    반복 TODO 규칙과 회차별 예외를 보관하는 저장소
+
+    회차는 저장하지 않고 조회한 날짜 구간에서만 계산한다. 규칙은 시작 날짜순으로
+    정렬해 두어 구간이 끝난 뒤에 시작하는 규칙은 bisect로 건너뛰고, 끝난 규칙은
+    마지막 회차 날짜로 건너뛴다. 수정/완료된 회차는 materialize()로 일반
+    TodoItem이 되고, 삭제된 회차는 skip()으로 표시해 다시 계산하지 않는다.
+
+    변경 리스너는 잠금을 푼 뒤 인자 없이 호출되며, 복제는 리스너에서
+    replication_state()의 전체 상태를 보내고 팔로워가 load_state()로 교체한다.
+    """
+
+    def __init__(self):
+        self._rules: Dict[str, _CompiledRule] = {}
+        self._starts: List[Tuple[datetime, str]] = []  # (시작 날짜, 규칙 ID) 정렬 목록
+        self._exceptions: Dict[str, Set[datetime]] = {}  # 규칙 ID -> 계산하지 않을 회차 날짜
+        self._materialized: Dict[str, str] = {}  # 회차 ID -> 저장된 TODO ID
+        self._listeners: List[Callable[[], None]] = []
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 구조별 깊은 크기"""
+        with self._lock:
+            parts = {
+                'rules': self._rules,
+                'starts': self._starts,
+                'exceptions': self._exceptions,
+                'materialized': self._materialized,
+            }
+        return {name: sizer.size(part) for name, part in parts.items()}
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """변경 리스너 등록 (규칙/예외가 바뀔 때마다 잠금 밖에서 호출)"""
+        self._listeners.append(listener)
+
+    def _changed(self) -> None:
+        for listener in self._listeners:
+            listener()
+
+    def replication_state(self) -> dict:
+        """복제용 전체 상태 (규칙, 회차 예외, 저장된 회차, JSON 직렬화 가능)"""
+        with self._lock:
+            return {
+                'rules': [self._rules[rule_id].rule.model_dump(mode='json') for _, rule_id in self._starts],
+                'exceptions': {rule_id: [when.isoformat() for when in dates]
+                               for rule_id, dates in self._exceptions.items()},
+                'materialized': dict(self._materialized),
+            }
+
+    def load_state(self, state: dict) -> None:
+        """replication_state()로 받은 상태로 교체 (규칙이 같으면 계산기를 다시 만들지 않음)"""
+        rules = {}
+        for data in state['rules']:
+            rule = RecurrenceRule.model_validate(data)
+            compiled = self._rules.get(rule.id)
+            rules[rule.id] = compiled if compiled is not None and compiled.rule == rule else _CompiledRule(rule)
+        exceptions = {rule_id: {datetime.fromisoformat(when) for when in dates}
+                      for rule_id, dates in state['exceptions'].items()}
+        with self._lock:
+            self._rules = rules
+            self._starts = sorted((compiled.first, rule_id) for rule_id, compiled in rules.items())
+            self._exceptions = exceptions
+            self._materialized = dict(state['materialized'])
+
+    def add(self, rule: RecurrenceRule) -> RecurrenceRule:
+        """규칙 추가"""
+        compiled = _CompiledRule(rule)
+        with self._lock:
+            self._rules[rule.id] = compiled
+            insort(self._starts, (rule.start, rule.id))
+        self._changed()
+        return rule
+
+    def get(self, rule_id: str) -> Optional[RecurrenceRule]:
+        """ID로 규칙 조회"""
+        compiled = self._rules.get(rule_id)
+        return None if compiled is None else compiled.rule
+
+    def get_all(self) -> List[RecurrenceRule]:
+        """모든 규칙 조회 (시작 날짜순)"""
+        with self._lock:
+            return [self._rules[rule_id].rule for _, rule_id in self._starts]
+
+    def remove(self, rule_id: str) -> bool:
+        """
+        규칙 삭제 (없으면 False)
+
+        이미 저장된 회차의 TODO는 일반 항목으로 남는다.
+        """
+        with self._lock:
+            compiled = self._rules.pop(rule_id, None)
+            if compiled is None:
+                return False
+            del self._starts[bisect_left(self._starts, (compiled.first, rule_id))]
+            self._exceptions.pop(rule_id, None)
+        self._changed()
+        return True
+
+    def clear(self) -> None:
+        """모든 규칙과 예외 삭제"""
+        with self._lock:
+            self._rules.clear()
+            self._starts.clear()
+            self._exceptions.clear()
+            self._materialized.clear()
+        self._changed()
+
+    def occurrences(self, start: datetime, end: datetime) -> List[TodoItem]:
+        """
+        start 이상 end 미만인 회차를 '예정' 상태의 TodoItem으로 계산
+
+        Returns:
+            (목표 날짜, 규칙 생성 날짜) 순 TodoItem 리스트 (ID는 회차 ID)
+        """
+        todos = [self._occurrence(rule, when) for rule, when in self._expand(start, end)]
+        todos.sort(key=lambda todo: (todo.target_date, todo.created_at))
+        return todos
+
+    def count(self, start: datetime, end: datetime) -> int:
+        """start 이상 end 미만인 회차 개수 (TodoItem을 만들지 않음)"""
+        return len(self._expand(start, end))
+
+    def _expand(self, start: datetime, end: datetime) -> List[Tuple[RecurrenceRule, datetime]]:
+        """구간 안의 (규칙, 회차 날짜) 목록 (저장/삭제된 회차 제외)"""
+        with self._lock:
+            candidates = [self._rules[rule_id] for _, rule_id in self._starts[:bisect_left(self._starts, (end,))]]
+
+        # 예외 집합은 추가만 되므로 잠금 없이 읽는다 (계산 중 추가된 회차는 다음 조회부터 제외)
+        exceptions = self._exceptions
+        expanded = []
+        for compiled in candidates:
+            if compiled.last is not None and compiled.last < start:
+                continue
+            rule = compiled.rule
+            skipped = exceptions.get(rule.id, ())
+            expanded.extend((rule, when) for when in compiled.between(start, end) if when not in skipped)
+        return expanded
+
+    @staticmethod
+    def _occurrence(rule: RecurrenceRule, when: datetime) -> TodoItem:
+        """회차 하나를 TodoItem으로 (규칙 생성 시 내용이 검증되었으므로 다시 검증하지 않음)"""
+        return TodoItem.model_construct(
+            id=occurrence_id(rule.id, when), content=rule.content, target_date=when,
+            status=TodoStatus.SCHEDULED.value, created_at=rule.created_at, updated_at=rule.created_at
+        )
+
+    def occurrence(self, todo_id: str) -> Optional[TodoItem]:
+        """회차 ID로 아직 저장되지 않은 회차 조회 (없거나 저장/삭제된 회차면 None)"""
+        parsed = self._resolve(todo_id)
+        if parsed is None:
+            return None
+        return self._occurrence(*parsed)
+
+    def materialize(self, todo_id: str, create: Callable[[RecurrenceRule, datetime], TodoItem]) -> Optional[TodoItem]:
+        """
+        회차를 일반 TodoItem으로 저장
+
+        create(규칙, 회차 날짜)가 저장한 TodoItem을 반환하면 그 회차는 더 이상
+        계산하지 않는다. create가 예외를 던지면 회차는 그대로 남는다.
+
+        Returns:
+            저장된 TodoItem (없거나 이미 저장/삭제된 회차면 None)
+        """
+        with self._lock:
+            parsed = self._resolve(todo_id)
+            if parsed is None:
+                return None
+            rule, when = parsed
+            todo = create(rule, when)
+            self._exceptions.setdefault(rule.id, set()).add(when)
+            self._materialized[todo_id] = todo.id
+        self._changed()
+        return todo
+
+    def skip(self, todo_id: str) -> bool:
+        """회차 삭제 (없거나 이미 저장/삭제된 회차면 False)"""
+        with self._lock:
+            parsed = self._resolve(todo_id)
+            if parsed is None:
+                return False
+            rule, when = parsed
+            self._exceptions.setdefault(rule.id, set()).add(when)
+        self._changed()
+        return True
+
+    def materialized_id(self, todo_id: str) -> Optional[str]:
+        """저장된 회차의 TODO ID (저장되지 않았으면 None)"""
+        return self._materialized.get(todo_id)
+
+    def _resolve(self, todo_id: str) -> Optional[Tuple[RecurrenceRule, datetime]]:
+        """회차 ID가 가리키는 계산 대상 회차의 (규칙, 날짜)"""
+        parsed = parse_occurrence_id(todo_id)
+        if parsed is None:
+            return None
+        rule_id, when = parsed
+        compiled = self._rules.get(rule_id)
+        if compiled is None or when in self._exceptions.get(rule_id, ()):
+            return None
+        if compiled.between(when, when + timedelta(seconds=1)) != [when]:
+            return None
+        return compiled.rule, when
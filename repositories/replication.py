@@ -0,0 +1,480 @@
+"""로그 전달 방식의 읽기 복제
+
+주 서버(primary)의 저장소 변경 이벤트를 버전 순서의 복제 레코드(JSON 한 줄)로
+기록하고, 같은 장비의 팔로워 프로세스에 소켓으로 흘려보낸다. 팔로워는 레코드를
+ReplicaRepository에 적용해 메모리 복제본을 유지하고 읽기 요청만 처리한다.
+
+레코드 종류 (모두 'v'(적용 후 버전)와 'op' 포함):
+    create   {'todo', 'pos'}   항목 생성/삭제 취소 (pos: 생성 후 위치)
+    update   {'todo'}          항목 교체
+    delete   {'id'}            항목 삭제
+    move     {'id', 'pos'}     항목 하나 이동
+    reorder  {'order'}         전체 순서 교체
+    clear    {}                전체 삭제
+    state    {'name', 'state'} 저장소 밖 상태(반복 규칙, 보관 계층) 하나의 전체 내용
+    snapshot {'log', 'todos', 'states'}  전체 상태 (처음 연결했거나 보관 범위를 벗어난 팔로워)
+    sync     {}                'v'까지 모두 보냈음 (팔로워의 최신 상태 기준 시각)
+
+반복 규칙과 보관 계층은 변경될 때 저장소의 publish_state()로 버전을 올리므로
+X-Min-Version 대기와 레코드 순서가 항목 변경과 같은 버전 번호를 따른다.
+"""
+import json
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from models import TodoItem
+from .base import BaseTodoRepository
+from .events import MutationEvent
+from .snapshot import PagedSlots
+from .date_index import DateIndex
+from .todo_repository import TodoRepository
+
+
+class ReplicationGapError(Exception):
+    """복제본에 적용할 수 없는 레코드 (버전 누락 또는 없는 항목, 전체 상태부터 다시 받아야 함)"""
+    pass
+
+
+class ReadOnlyReplicaError(RuntimeError):
+    """복제본에 쓰기 작업을 시도했을 때 발생"""
+    pass
+
+
+def _encode(record: dict) -> bytes:
+    """레코드를 전송용 JSON 한 줄로 인코딩"""
+    return (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+class ReplicationLog:
+    """
+    주 저장소의 변경을 복제 레코드로 기록하는 로그
+
+    저장소 리스너로 등록되어 쓰기 잠금 안에서 레코드를 만들므로 레코드는 버전
+    순서대로 빠짐없이 쌓인다. 이동/생성 레코드에는 적용 후 위치를 함께 넣어
+    팔로워가 같은 순서를 재현한다. 최근 max_records개만 보관하고, 그보다 뒤처진
+    팔로워에게는 전체 상태(snapshot)를 보낸다.
+
+    add_state()로 등록한 저장소 밖 상태는 STATE 이벤트마다 쓰기 잠금 안에서
+    전체 내용을 읽어 기록한다. 상태를 읽는 순서가 버전 순서와 같으므로 변경이
+    동시에 일어나도 팔로워에는 마지막 상태가 남는다.
+    """
+
+    def __init__(self, repository: BaseTodoRepository, max_records: int = 10000):
+        """
+        로그 생성 후 저장소에 연결
+
+        Args:
+            repository: 주 저장소
+            max_records: 보관할 최근 레코드 수
+        """
+        self.log_id = uuid.uuid4().hex  # 주 서버가 다시 시작되면 바뀌므로 팔로워가 이력 변경을 감지
+        self._repository = repository
+        self._records: Deque[Tuple[int, bytes]] = deque(maxlen=max_records)
+        self._cond = threading.Condition()
+        self._version = repository.version
+        self._states: Dict[str, Callable[[], Any]] = {}
+        repository.add_listener(self._on_event)
+
+    def add_state(self, name: str, get_state: Callable[[], Any]) -> None:
+        """
+        함께 복제할 저장소 밖 상태 등록
+
+        상태가 바뀔 때마다 저장소의 publish_state(name)을 호출해야 한다 (상태의
+        잠금을 쥔 채로 호출하면 안 됨, get_state는 저장소 쓰기 잠금 안에서 불림).
+
+        Args:
+            name: 상태 이름 (팔로워의 ReplicaRepository.add_state와 같은 이름)
+            get_state: JSON으로 직렬화할 수 있는 전체 상태를 반환하는 함수
+        """
+        self._states[name] = get_state
+
+    @property
+    def version(self) -> int:
+        """마지막으로 기록한 버전"""
+        return self._version
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 깊은 크기 (보관 중인 인코딩된 레코드)"""
+        with self._cond:
+            records = self._records
+        return {'records': sizer.size(records)}
+
+    def _on_event(self, event: MutationEvent) -> None:
+        """변경 이벤트를 레코드로 기록 (저장소 쓰기 잠금 안에서 호출)"""
+        line = _encode(self._record(event))
+        with self._cond:
+            self._records.append((event.version, line))
+            self._version = event.version
+            self._cond.notify_all()
+
+    def _record(self, event: MutationEvent) -> dict:
+        """이벤트 하나의 복제 레코드 (위치는 잠금 안에서 저장소에 물어봄)"""
+        record = {'v': event.version}
+        repository = self._repository
+        if event.op == MutationEvent.CREATE:
+            record.update(op='create', todo=event.todo.model_dump(mode='json'),
+                          pos=repository.index_of(event.todo.id))
+        elif event.op == MutationEvent.UPDATE:
+            record.update(op='update', todo=event.todo.model_dump(mode='json'))
+        elif event.op == MutationEvent.DELETE:
+            record.update(op='delete', id=event.todo.id)
+        elif event.op == MutationEvent.REORDER and event.todo is not None:
+            record.update(op='move', id=event.todo.id, pos=repository.index_of(event.todo.id))
+        elif event.op == MutationEvent.REORDER:
+            record.update(op='reorder', order=repository.get_order())
+        elif event.op == MutationEvent.STATE:
+            get_state = self._states.get(event.name)
+            record.update(op='state', name=event.name, state=None if get_state is None else get_state())
+        else:
+            record.update(op='clear')
+        return record
+
+    def snapshot(self) -> Tuple[int, bytes]:
+        """전체 상태 레코드 (버전, 인코딩된 한 줄)"""
+        todos, _, version = self._repository.page()  # 항목과 버전을 같은 시점에서 읽음
+        # 저장소 밖 상태는 그 뒤에 읽으므로 version 이후의 변경이 들어 있을 수 있지만,
+        # 그 변경의 state 레코드가 뒤따라 와서 같은 상태로 다시 교체한다
+        states = {name: get_state() for name, get_state in self._states.items()}
+        return version, _encode({
+            'v': version, 'op': 'snapshot', 'log': self.log_id,
+            'todos': [todo.model_dump(mode='json') for todo in todos], 'states': states,
+        })
+
+    def read(self, after: int, timeout: float) -> Optional[List[bytes]]:
+        """
+        after 버전 이후의 레코드
+
+        새 레코드가 없으면 최대 timeout초 기다린 뒤 빈 리스트를 반환한다.
+
+        Returns:
+            인코딩된 레코드 리스트 (보관 범위를 벗어났으면 None)
+        """
+        with self._cond:
+            if after == self._version:
+                self._cond.wait(timeout)
+            if after > self._version:
+                return None
+            if after == self._version:
+                return []
+            if not self._records or self._records[0][0] > after + 1:
+                return None
+            # 버전은 1씩 증가하므로 위치를 바로 계산
+            return [line for _, line in islice(self._records, after + 1 - self._records[0][0], None)]
+
+
+class ReplicaRepository(TodoRepository):
+    """
+    팔로워의 읽기 전용 복제 저장소
+
+    읽기 경로(스냅샷, 날짜 인덱스 등)는 TodoRepository와 같고, 쓰기는 apply()로
+    받은 복제 레코드만 반영한다. 버전은 주 서버의 버전을 그대로 따르며 공개
+    쓰기 메서드는 ReadOnlyReplicaError를 던진다. 저장소 밖 상태는 add_state()로
+    등록한 함수에 state/snapshot 레코드의 내용을 넘겨 교체한다.
+    """
+
+    def __init__(self, undo_window: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        super().__init__(undo_window, clock)
+        self._states: Dict[str, Callable[[Any], None]] = {}
+
+    def add_state(self, name: str, load_state: Callable[[Any], None]) -> None:
+        """주 서버의 ReplicationLog.add_state(name, ...) 상태를 받을 함수 등록 (복제 잠금 안에서 호출됨)"""
+        self._states[name] = load_state
+
+    def _read_only(self, *args, **kwargs):
+        raise ReadOnlyReplicaError("읽기 전용 복제본에는 쓸 수 없습니다")
+
+    create = create_many = insert = insert_many = update = apply_update = delete = delete_many = _read_only
+    evict = restore = clear_all = set_order = move_before = move_after = move_to = sort_by_date = _read_only
+    publish_state = _read_only
+
+    def apply(self, record: dict) -> None:
+        """
+        복제 레코드 하나 적용
+
+        Raises:
+            ReplicationGapError: 버전이 이어지지 않거나 레코드가 가리키는 항목이 없음
+        """
+        op = record['op']
+        with self._lock:
+            if op == 'snapshot':
+                self._load(record['v'], [TodoItem.model_validate(data) for data in record['todos']])
+                for name, state in record.get('states', {}).items():
+                    self._load_state(name, state)
+                return
+            if op == 'sync':
+                return
+            if record['v'] != self._version + 1:
+                raise ReplicationGapError(f"버전 {self._version} 다음에 {record['v']}를 받았습니다")
+            self._version = record['v']
+            getattr(self, f'_apply_{op}')(record)
+
+    def _apply_create(self, record: dict) -> None:
+        todo = TodoItem.model_validate(record['todo'])
+        sid = self._insert(todo)
+        if record['pos'] != len(self._order) - 1:
+            self._order.move_to(sid, record['pos'])
+        self._notify(MutationEvent.CREATE, sid, todo)
+
+    def _apply_update(self, record: dict) -> None:
+        todo = TodoItem.model_validate(record['todo'])
+        sid = self._require(todo.id)
+        previous = self._items[sid]
+        self._items[sid] = todo
+        if todo.target_date != previous.target_date:
+            self._by_date.remove(DateIndex.key(sid, previous))
+            self._by_date.add(DateIndex.key(sid, todo))
+        self._notify(MutationEvent.UPDATE, sid, todo, previous)
+
+    def _apply_delete(self, record: dict) -> None:
+        sid = self._require(record['id'])
+        todo = self._items[sid]
+        self._items[sid] = None
+        self._order.discard(sid)
+        self._by_date.remove(DateIndex.key(sid, todo))
+        self._notify(MutationEvent.DELETE, sid, todo)
+        self._ids.release(todo.id)  # 삭제 취소는 create 레코드로 다시 오므로 삭제 표시를 두지 않음
+
+    def _apply_move(self, record: dict) -> None:
+        sid = self._require(record['id'])
+        self._order.move_to(sid, record['pos'])
+        self._notify(MutationEvent.REORDER, sid, self._items[sid])
+
+    def _apply_reorder(self, record: dict) -> None:
+        sids = [self._require(todo_id) for todo_id in record['order']]
+        if len(sids) != len(self._order):
+            raise ReplicationGapError("전체 순서의 항목 수가 복제본과 다릅니다")
+        self._order.reset(sids)
+        self._notify(MutationEvent.REORDER)
+
+    def _apply_clear(self, record: dict) -> None:
+        self._reset()
+        self._notify(MutationEvent.CLEAR)
+
+    def _apply_state(self, record: dict) -> None:
+        self._load_state(record['name'], record['state'])
+        self._notify(MutationEvent.STATE, name=record['name'])
+
+    def _load_state(self, name: str, state: Any) -> None:
+        """등록한 함수로 상태 교체 (등록하지 않은 상태나 주 서버에 없는 상태는 무시)"""
+        load_state = self._states.get(name)
+        if load_state is not None and state is not None:
+            load_state(state)
+
+    def _load(self, version: int, todos: List[TodoItem]) -> None:
+        """전체 상태로 교체 (리스너에게는 CLEAR 뒤 CREATE로 전달)"""
+        self._reset()
+        self._version = version
+        self._snapshot = None  # 같은 버전 번호라도 다른 주 서버의 상태일 수 있음
+        self._notify(MutationEvent.CLEAR)
+        for todo in todos:
+            self._notify(MutationEvent.CREATE, self._insert(todo), todo)
+
+    def _reset(self) -> None:
+        """모든 항목 제거"""
+        self._ids.clear()
+        self._tombstones.clear()
+        self._items = PagedSlots()
+        self._order.reset([])
+        self._by_date.clear()
+
+    def _insert(self, todo: TodoItem) -> int:
+        """받은 항목을 ID와 시각 그대로 맨 뒤에 추가"""
+        if todo.id in self._ids:
+            raise ReplicationGapError(f"ID '{todo.id}'인 항목이 이미 있습니다")
+        return super()._insert(todo)
+
+    def _require(self, todo_id: str) -> int:
+        """레코드가 가리키는 항목의 sid (없으면 ReplicationGapError)"""
+        sid = self._live_sid(todo_id)
+        if sid is None:
+            raise ReplicationGapError(f"ID '{todo_id}'인 항목이 복제본에 없습니다")
+        return sid
+
+    def _notify(self, op: str, sid: Optional[int] = None, todo: Optional[TodoItem] = None,
+                previous: Optional[TodoItem] = None, name: Optional[str] = None) -> None:
+        """버전을 올리지 않고 리스너에게 이벤트 전달 (버전은 레코드를 따름)"""
+        if self._listeners:
+            event = MutationEvent(op, self._version, sid, todo, previous, name)
+            for listener in self._listeners:
+                listener(event)
+
+
+class LogShipper:
+    """
+    복제 로그를 팔로워에게 보내는 TCP 서버
+
+    팔로워마다 스레드 하나가 {'log': 로그 ID, 'from': 버전} 인사를 받고, 이어서
+    보낼 수 있으면 그 뒤 레코드부터, 아니면 전체 상태부터 보낸다. 레코드를
+    한 묶음 보낼 때마다(새 레코드가 없으면 heartbeat초마다) sync 레코드를 붙여
+    팔로워가 언제 기준으로 최신인지 알 수 있게 한다.
+    """
+
+    def __init__(self, log: ReplicationLog, host: str = '127.0.0.1', port: int = 0, heartbeat: float = 0.5):
+        """
+        Args:
+            log: 보낼 복제 로그
+            host, port: 바인드할 주소 (port=0이면 임의 포트, start() 후 address로 확인)
+            heartbeat: 새 레코드가 없을 때 sync를 보내는 간격(초)
+        """
+        self._log = log
+        self._bind = (host, port)
+        self.heartbeat = heartbeat
+        self.address: Optional[Tuple[str, int]] = None
+        self._server: Optional[socket.socket] = None
+        self._connections: List[socket.socket] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """포트를 열고 연결 수락 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._server = socket.create_server(self._bind)
+        self._server.settimeout(self.heartbeat)  # stop() 확인 간격 (닫힌 소켓이 accept()를 깨우지 않음)
+        self.address = self._server.getsockname()[:2]
+        self._thread = threading.Thread(target=self._accept, name='log-shipper', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """포트와 모든 팔로워 연결을 닫음"""
+        self._stop.set()
+        if self._server is not None:
+            self._server.close()
+        with self._lock:
+            for connection in self._connections:
+                _close(connection)
+            self._connections.clear()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _accept(self) -> None:
+        while not self._stop.is_set():
+            try:
+                connection, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return  # stop()으로 닫힘
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self._connections.append(connection)
+            threading.Thread(target=self._serve, args=(connection,), name='log-shipper-follower',
+                             daemon=True).start()
+
+    def _serve(self, connection: socket.socket) -> None:
+        """팔로워 하나에게 레코드 전송"""
+        try:
+            hello = json.loads(connection.makefile('rb').readline() or b'{}')
+            after = hello.get('from') if hello.get('log') == self._log.log_id else None
+            while not self._stop.is_set():
+                lines = None if after is None else self._log.read(after, self.heartbeat)
+                if lines is None:
+                    after, line = self._log.snapshot()
+                    lines = [line]
+                else:
+                    after += len(lines)
+                connection.sendall(b''.join(lines) + _encode({'v': after, 'op': 'sync'}))
+        except (OSError, ValueError):
+            pass  # 팔로워 연결 종료 또는 잘못된 인사
+        finally:
+            with self._lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+            _close(connection)
+
+
+class LogFollower:
+    """
+    주 서버의 복제 로그를 받아 ReplicaRepository에 적용하는 클라이언트
+
+    연결이 끊기거나 적용할 수 없는 레코드를 받으면 retry초 뒤 다시 연결하며,
+    이어받을 수 없으면 주 서버가 전체 상태부터 다시 보낸다.
+    """
+
+    def __init__(self, replica: ReplicaRepository, address: Tuple[str, int], retry: float = 0.5,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            replica: 레코드를 적용할 복제 저장소
+            address: 주 서버 LogShipper 주소
+            retry: 재연결 간격(초)
+            clock: sync 수신 시각 기준 시계 (초 단위)
+        """
+        self.replica = replica
+        self.address = address
+        self.retry = retry
+        self._clock = clock
+        self._log_id: Optional[str] = None
+        self._synced_at: Optional[float] = None
+        self._cond = threading.Condition()
+        self._socket: Optional[socket.socket] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """수신 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='log-follower', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """연결을 닫고 수신 스레드 종료"""
+        self._stop.set()
+        if self._socket is not None:
+            _close(self._socket)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def staleness(self) -> float:
+        """마지막으로 주 서버와 같은 상태였던 시점부터 지난 시간(초, 아직 없으면 inf)"""
+        synced_at = self._synced_at
+        return float('inf') if synced_at is None else self._clock() - synced_at
+
+    def wait_for(self, version: int, timeout: float) -> bool:
+        """복제본 버전이 version 이상이 될 때까지 최대 timeout초 대기 (도달하면 True)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.replica.version >= version, timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._socket = socket.create_connection(self.address)
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._socket.sendall(_encode({'log': self._log_id, 'from': self.replica.version}))
+                for line in self._socket.makefile('rb'):
+                    self._receive(json.loads(line))
+            except (OSError, ValueError, ReplicationGapError):
+                self._log_id = None  # 이어받을 수 없으므로 전체 상태부터 다시 받음
+            finally:
+                if self._socket is not None:
+                    _close(self._socket)
+            self._stop.wait(self.retry)
+
+    def _receive(self, record: dict) -> None:
+        """레코드 하나 적용 후 대기 중인 요청 깨우기"""
+        self.replica.apply(record)
+        if record['op'] == 'snapshot':
+            self._log_id = record['log']
+        with self._cond:
+            if record['op'] == 'sync':
+                self._synced_at = self._clock()
+            self._cond.notify_all()
+
+
+def _close(connection: socket.socket) -> None:
+    """소켓을 양방향으로 닫음 (다른 스레드의 블로킹 읽기도 깨움)"""
+    try:
+        connection.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    connection.close()
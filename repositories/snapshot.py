@@ -0,0 +1,134 @@
+"""copy-on-write 항목 저장 구조와 일관된 읽기 스냅샷"""
+from bisect import bisect_right
+from datetime import datetime
+from itertools import accumulate
+from typing import Iterator, List, Optional, Tuple
+from models import TodoItem, TodoStatus
+from .date_index import DateView
+
+
+class PagedSlots:
+    """
+    sid로 색인하는 항목 슬롯 (고정 크기 페이지 단위 copy-on-write)
+
+    freeze()가 돌려준 페이지는 이후 수정하지 않는다. 얼린 페이지에 쓰기가
+    들어오면 그 페이지 하나만 복사해 교체하므로, 스냅샷을 만들 때 전체
+    항목을 복사하지 않고 쓰기 한 번당 최대 한 페이지만 복사한다.
+    """
+
+    _SHIFT = 9
+    _PAGE = 1 << _SHIFT
+    _MASK = _PAGE - 1
+
+    def __init__(self):
+        self._pages: List[list] = []
+        self._size = 0
+        self._frozen = set()  # 스냅샷과 공유 중인 페이지의 id()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, sid: int) -> Optional[TodoItem]:
+        if not 0 <= sid < self._size:
+            raise IndexError(sid)
+        return self._pages[sid >> self._SHIFT][sid & self._MASK]
+
+    def __setitem__(self, sid: int, todo: Optional[TodoItem]) -> None:
+        if not 0 <= sid < self._size:
+            raise IndexError(sid)
+        self._own(sid >> self._SHIFT)[sid & self._MASK] = todo
+
+    def append(self, todo: TodoItem) -> None:
+        """맨 뒤 슬롯에 항목 추가"""
+        if self._size & self._MASK == 0:
+            self._pages.append([])
+        self._own(len(self._pages) - 1).append(todo)
+        self._size += 1
+
+    def freeze(self) -> Tuple[list, ...]:
+        """현재 페이지들을 스냅샷용으로 고정하고 반환 (O(N / PAGE))"""
+        self._frozen = {id(page) for page in self._pages}
+        return tuple(self._pages)
+
+    def _own(self, k: int) -> list:
+        """k번째 페이지를 수정 가능하게 만듦 (스냅샷과 공유 중이면 복사)"""
+        page = self._pages[k]
+        if id(page) in self._frozen:
+            self._frozen.discard(id(page))
+            page = self._pages[k] = list(page)
+        return page
+
+
+class TodoSnapshot:
+    """
+    특정 버전의 저장소를 읽는 읽기 전용 뷰
+
+    순서 청크, 날짜순 청크와 항목 페이지는 저장소가 더 이상 수정하지 않는
+    객체이므로, 스냅샷을 읽는 동안 쓰기 작업이 진행되어도 잠금 없이 같은
+    버전을 본다.
+    """
+
+    __slots__ = ('version', '_order_chunks', '_pages', '_starts', '_dates')
+
+    def __init__(self, version: int, order_chunks: Tuple, pages: Tuple[list, ...], dates: DateView):
+        self.version = version
+        self._order_chunks = order_chunks
+        self._pages = pages
+        self._dates = dates
+        self._starts = [0, *accumulate(len(chunk) for chunk in order_chunks)]  # 청크별 시작 위치
+
+    def __len__(self) -> int:
+        return self._starts[-1]
+
+    def __iter__(self) -> Iterator[TodoItem]:
+        pages, shift, mask = self._pages, PagedSlots._SHIFT, PagedSlots._MASK
+        for chunk in self._order_chunks:
+            for sid in chunk:
+                yield pages[sid >> shift][sid & mask]
+
+    def get_all(self) -> List[TodoItem]:
+        """표시 순서대로 모든 항목 (O(살아 있는 항목 수), 삭제/해제된 슬롯은 건너뜀)"""
+        pages, shift, mask = self._pages, PagedSlots._SHIFT, PagedSlots._MASK
+        return [pages[sid >> shift][sid & mask] for chunk in self._order_chunks for sid in chunk]
+
+    def get_by_status(self, status: TodoStatus) -> List[TodoItem]:
+        """표시 순서대로 상태가 같은 항목"""
+        return [todo for todo in self.get_all() if todo.status == status]
+
+    def page(self, offset: int, limit: int) -> List[TodoItem]:
+        """offset 위치부터 최대 limit개 항목 (O(log N + limit))"""
+        if offset < 0 or limit < 0:
+            raise ValueError("offset과 limit은 0 이상이어야 합니다")
+        if offset >= len(self) or limit == 0:
+            return []
+        pages, shift, mask = self._pages, PagedSlots._SHIFT, PagedSlots._MASK
+        result = []
+        k = bisect_right(self._starts, offset) - 1
+        j = offset - self._starts[k]
+        while k < len(self._order_chunks) and len(result) < limit:
+            for sid in self._order_chunks[k][j:j + limit - len(result)]:
+                result.append(pages[sid >> shift][sid & mask])
+            k, j = k + 1, 0
+        return result
+
+    # ---- 날짜순 ----
+
+    def _items(self, sids: List[int]) -> List[TodoItem]:
+        pages, shift, mask = self._pages, PagedSlots._SHIFT, PagedSlots._MASK
+        return [pages[sid >> shift][sid & mask] for sid in sids]
+
+    def by_date(self) -> List[TodoItem]:
+        """날짜순 모든 항목 (같은 날짜는 생성 순)"""
+        return self._items(self._dates.sids())
+
+    def by_date_range(self, start: datetime, end: datetime) -> List[TodoItem]:
+        """목표 날짜가 start 이상 end 미만인 항목 (O(log N + 결과 개수))"""
+        return self._items(self._dates.range(start, end))
+
+    def count_date_range(self, start: datetime, end: datetime) -> int:
+        """목표 날짜 구간의 항목 개수 (항목을 읽지 않음)"""
+        return self._dates.count_range(start, end)
+
+    def page_by_date(self, offset: int, limit: Optional[int]) -> List[TodoItem]:
+        """날짜순 offset 위치부터 최대 limit개 항목 (O(N / 청크 크기 + limit))"""
+        return self._items(self._dates.slice(offset, limit))
@@ -0,0 +1,214 @@
+"""상태별 개수의 시계열 (해상도별 고정 크기 링 버퍼)"""
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+from models import TodoItem, TodoStatus, STATUS_CODES
+from .events import MutationEvent
+
+_EPOCH = datetime(1970, 1, 1)
+
+# 기본 해상도: 이름 -> (버킷 길이(초), 버킷 수) = 1분 x 1일, 1시간 x 30일, 1일 x 2년
+DEFAULT_RESOLUTIONS = {
+    'minute': (60, 1440),
+    'hour': (3600, 720),
+    'day': (86400, 730),
+}
+
+# 시계열 값 순서 (STATUS_CODES의 코드 순서와 같음)
+SERIES = ('scheduled', 'in_progress', 'completed')
+_COMPLETED = STATUS_CODES[TodoStatus.COMPLETED.value]
+
+
+class _Ring:
+    """
+    한 해상도의 링 버퍼
+
+    버킷 번호(epoch 초 // 버킷 길이)를 capacity로 나눈 나머지 칸에 그 버킷의
+    마지막 값을 기록한다. 칸마다 버킷 번호를 함께 저장하므로 오래 비어 있던
+    구간은 조회할 때 직전 값으로 채운다. 새 버킷이 덮어쓴 가장 최근 버킷의 값은
+    floor로 남겨 두어 창 밖의 마지막 값도 잃지 않는다.
+    """
+
+    __slots__ = ('seconds', 'capacity', 'buckets', 'values', 'latest', 'floor_bucket', 'floor')
+
+    def __init__(self, seconds: int, capacity: int):
+        if seconds < 1 or capacity < 1:
+            raise ValueError("버킷 길이와 버킷 수는 1 이상이어야 합니다")
+        self.seconds = seconds
+        self.capacity = capacity
+        self.buckets = array('q', [-1]) * capacity
+        self.values = [array('q', [0]) * capacity for _ in SERIES]
+        self.latest = -1
+        self.floor_bucket = -1
+        self.floor: Optional[Tuple[int, ...]] = None
+
+    def put(self, seconds: int, counts: List[int]) -> None:
+        """현재 시각의 버킷에 값 기록 (시계가 뒤로 가면 가장 최근 버킷에 기록)"""
+        bucket = max(seconds // self.seconds, self.latest)
+        slot = bucket % self.capacity
+        old = self.buckets[slot]
+        if old != bucket:
+            if old > self.floor_bucket:
+                self.floor_bucket = old
+                self.floor = tuple(column[slot] for column in self.values)
+            self.buckets[slot] = bucket
+        for column, count in zip(self.values, counts):
+            column[slot] = count
+        self.latest = bucket
+
+    def points(self, seconds: int, limit: int) -> List[Tuple[int, Tuple[int, ...]]]:
+        """현재 시각까지 최근 limit개 버킷의 (버킷 번호, 값) 목록 (첫 기록 이전 버킷은 제외)"""
+        end = max(seconds // self.seconds, self.latest)
+        start = end - min(limit, self.capacity) + 1
+
+        # 창 이전의 마지막 값 (덮어쓴 버킷 또는 아직 덮어쓰지 않은 오래된 칸)
+        carry_bucket, carry = self.floor_bucket, self.floor
+        for slot, bucket in enumerate(self.buckets):
+            if carry_bucket < bucket < start:
+                carry_bucket, carry = bucket, tuple(column[slot] for column in self.values)
+
+        result = []
+        for bucket in range(start, end + 1):
+            slot = bucket % self.capacity
+            if self.buckets[slot] == bucket:
+                carry = tuple(column[slot] for column in self.values)
+            if carry is not None:
+                result.append((bucket, carry))
+        return result
+
+
+class StatsHistory:
+    """
+    상태별 개수(예정/진행중/완료)의 시계열
+
+    저장소 변경 이벤트로 현재 개수를 갱신하고, 버킷이 바뀌거나 조회할 때
+    마지막 변경 시각의 버킷에 값을 기록한다(폴링하지 않음). 개수는 게이지 값이므로 굵은
+    해상도의 버킷은 그 구간의 마지막 값으로 축약(downsampling)되며, 가는
+    해상도가 링 버퍼에서 밀려나도 굵은 해상도에는 남는다. 버퍼 크기가
+    고정이므로 실행 시간과 항목 수에 관계없이 메모리 사용량이 일정하다.
+
+    보관 계층이 있으면 보관한 항목 수를 완료 개수에 더해 /api/stats와 같은
+    기준으로 기록한다. 보관 계층만 바뀌는 작업(보관 항목 삭제)은 이벤트가
+    없으므로 다음 변경이나 조회 시점에 반영된다.
+    """
+
+    def __init__(self, resolutions: Optional[Dict[str, Tuple[int, int]]] = None, archive=None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            resolutions: 이름 -> (버킷 길이(초), 버킷 수) (기본값: DEFAULT_RESOLUTIONS)
+            archive: 보관한 항목 수를 완료 개수에 더할 ColdStore (없으면 저장소 항목만)
+            clock: 현재 시각 (epoch 초, 버킷은 지역 시간 기준으로 나눔)
+        """
+        self._rings = {
+            name: _Ring(seconds, capacity)
+            for name, (seconds, capacity) in (resolutions or DEFAULT_RESOLUTIONS).items()
+        }
+        self._archive = archive
+        self._clock = clock
+        self._utc_offset = time.localtime(clock()).tm_gmtoff  # 기록할 때마다 갱신 (서머타임 대비)
+        self._counts = [0] * len(SERIES)
+        self._changed_at: Optional[int] = None  # 아직 기록하지 않은 마지막 변경 시각 (epoch 초)
+        self._flush_at = 0  # 이 시각 이후의 변경 전에 기록해야 함
+        self._lock = threading.Lock()
+
+    @property
+    def resolutions(self) -> Dict[str, Tuple[int, int]]:
+        """이름 -> (버킷 길이(초), 버킷 수)"""
+        return {name: (ring.seconds, ring.capacity) for name, ring in self._rings.items()}
+
+    def attach(self, repository) -> None:
+        """저장소의 현재 항목을 불러오고 이후 변경 이벤트를 구독"""
+        repository.add_listener(self.apply, replay=True)
+
+    def apply(self, event: MutationEvent) -> None:
+        """변경 이벤트 반영 (버킷이 바뀔 때 직전 값을 기록)"""
+        with self._lock:
+            if event.op == MutationEvent.UPDATE and event.todo.status == event.previous.status:
+                return
+            if event.op not in (MutationEvent.CREATE, MutationEvent.UPDATE,
+                                MutationEvent.DELETE, MutationEvent.CLEAR):
+                return
+            now = self._now()
+            if self._changed_at is not None and now >= self._flush_at:
+                self._flush()
+            if self._changed_at is None:
+                # 가장 먼저 끝나는 버킷의 경계 (그 전까지의 변경은 같은 버킷들에 속함)
+                self._flush_at = min((now // ring.seconds + 1) * ring.seconds for ring in self._rings.values())
+            if event.op == MutationEvent.CREATE:
+                self._add(event.todo, 1)
+            elif event.op == MutationEvent.UPDATE:
+                self._add(event.previous, -1)
+                self._add(event.todo, 1)
+            elif event.op == MutationEvent.DELETE:
+                self._add(event.todo, -1)
+            else:
+                self._counts = [0] * len(SERIES)
+            self._changed_at = now
+
+    def history(self, resolution: str, limit: Optional[int] = None) -> dict:
+        """
+        해상도별 최근 시계열 (현재 값을 먼저 기록한 뒤 조회)
+
+        Args:
+            resolution: 해상도 이름 (예: 'minute', 'hour', 'day')
+            limit: 최근 버킷 수 (기본값: 버킷 수 전체)
+
+        Returns:
+            {'resolution', 'seconds', 'points': [{'time', 'total', 'scheduled', 'in_progress', 'completed'}]}
+
+        Raises:
+            ValueError: 지원하지 않는 해상도 또는 limit이 1 미만
+        """
+        ring = self._rings.get(resolution)
+        if ring is None:
+            raise ValueError(f"지원하지 않는 해상도: {resolution} (가능한 값: {', '.join(self._rings)})")
+        if limit is not None and limit < 1:
+            raise ValueError("limit은 1 이상이어야 합니다")
+        with self._lock:
+            now = self._now()
+            self._flush()
+            self._changed_at = now  # 보관 계층만 바뀐 경우도 반영되도록 현재 버킷에도 기록
+            self._flush()
+            points = ring.points(now, ring.capacity if limit is None else limit)
+        return {
+            'resolution': resolution,
+            'seconds': ring.seconds,
+            'points': [
+                dict(time=(_EPOCH + timedelta(seconds=bucket * ring.seconds)).isoformat(),
+                     total=sum(values), **dict(zip(SERIES, values)))
+                for bucket, values in points
+            ],
+        }
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 해상도별 버퍼 크기 (항목 수와 무관하게 일정)"""
+        with self._lock:
+            parts = {name: (ring.buckets, ring.values) for name, ring in self._rings.items()}
+        return {name: sizer.size(part) for name, part in parts.items()}
+
+    def _add(self, todo: TodoItem, delta: int) -> None:
+        self._counts[STATUS_CODES[todo.status]] += delta
+
+    def _now(self) -> int:
+        """현재 지역 시각 (벽시계 기준 epoch 초, 쓰기마다 호출하므로 datetime을 만들지 않음)"""
+        return int(self._clock()) + self._utc_offset
+
+    def _flush(self) -> None:
+        """
+        마지막으로 바뀐 시각의 버킷에 현재 개수 기록 (잠금 안에서 호출)
+
+        같은 버킷 안의 변경은 개수만 갱신하고, 버킷이 바뀌거나 조회할 때 한 번만
+        기록하므로 쓰기마다 링 버퍼를 갱신하지 않는다.
+        """
+        if self._changed_at is None:
+            return
+        counts = list(self._counts)
+        if self._archive is not None:
+            counts[_COMPLETED] += len(self._archive)
+        for ring in self._rings.values():
+            ring.put(self._changed_at, counts)
+        self._changed_at = None
+        self._utc_offset = time.localtime(self._clock()).tm_gmtoff
@@ -1,15 +1,87 @@
-from typing import List, Optional
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 from models import TodoItem, TodoStatus
+from .base import BaseTodoRepository, TodoSpec, check_page
+from .events import MutationEvent
+from .id_table import IdTable
+from .order_index import OrderIndex
+from .date_index import DateIndex
+from .snapshot import PagedSlots, TodoSnapshot
+from .tombstone import Tombstone
 
 
-class TodoRepository:
-    """TODO 항목을 메모리에 저장하고 관리하는 저장소"""
+class TodoRepository(BaseTodoRepository):
+    """
+    TODO 항목을 메모리에 저장하고 관리하는 저장소
 
-    def __init__(self):
-        """저장소 초기화"""
-        self._todos: dict[str, TodoItem] = {}
-        self._order: List[str] = []  # TODO ID의 순서를 유지
+    문자열 ID는 공개 메서드의 입출력에서만 사용하고, 내부 구조는 IdTable이
+    발급한 정수 대리 키(sid)로 항목과 순서를 관리한다. 모든 쓰기 작업은
+    버전을 1 올리고 등록된 리스너에게 MutationEvent를 전달한다.
+
+    목록 조회는 snapshot()이 돌려주는 특정 버전의 읽기 전용 뷰를 사용한다.
+    항목은 수정 시 새 객체로 교체하고, 항목 슬롯과 순서 청크는 스냅샷과
+    공유 중일 때만 해당 청크를 복사하므로 읽기가 쓰기를 막지 않는다.
+
+    delete()는 항목을 순서에서 빼고 삭제 표시(Tombstone)만 남기므로 읽기
+    경로는 삭제 항목을 거르지 않는다. undo_window 동안 restore()로 원래
+    위치에 복구할 수 있고, 그 뒤에는 compact()가 일정 개수씩 sid를 해제한다.
+    """
+
+    def __init__(self, undo_window: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        """
+        저장소 초기화
+
+        Args:
+            undo_window: 삭제 후 복구 가능한 시간(초)
+            clock: 삭제 시각 기준 시계 (초 단위)
+        """
+        self._ids = IdTable()  # 문자열 ID -> sid
+        self._items = PagedSlots()  # sid로 색인하는 항목 슬롯
+        self._order = OrderIndex()  # sid의 순서를 유지
+        self._by_date = DateIndex()  # 사용자 순서와 별개로 유지하는 날짜순 보기
+        self._lock = threading.RLock()  # 쓰기 작업 직렬화 (동시 이동 요청의 결정적 처리)
+        self._version = 0
+        self._listeners: List[Callable[[MutationEvent], None]] = []
+        self._snapshot: Optional[TodoSnapshot] = None  # 마지막으로 만든 스냅샷 (버전별 재사용)
+        self._tombstones: 'OrderedDict[int, Tombstone]' = OrderedDict()  # 삭제 순서 = 만료 순서
+        self.undo_window = undo_window
+        self._clock = clock
+
+    @property
+    def version(self) -> int:
+        """마지막 쓰기 작업의 버전"""
+        return self._version
+
+    def add_listener(self, listener: Callable[[MutationEvent], None], replay: bool = False) -> None:
+        """
+        변경 이벤트 리스너 등록
+
+        Args:
+            listener: MutationEvent를 받는 함수
+            replay: True이면 등록 전에 현재 항목들을 CREATE 이벤트로 먼저 전달
+        """
+        with self._lock:
+            if replay:
+                for sid in self._order:
+                    listener(MutationEvent(MutationEvent.CREATE, self._version, sid, self._items[sid]))
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[MutationEvent], None]) -> None:
+        """변경 이벤트 리스너 해제"""
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def _emit(self, op: str, sid: Optional[int] = None, todo: Optional[TodoItem] = None,
+              previous: Optional[TodoItem] = None, name: Optional[str] = None) -> None:
+        """버전을 올리고 리스너에게 이벤트 전달 (쓰기 잠금 안에서 호출)"""
+        self._version += 1
+        if self._listeners:
+            event = MutationEvent(op, self._version, sid, todo, previous, name)
+            for listener in self._listeners:
+                listener(event)
 
     def create(self, content: str, target_date: datetime, status: TodoStatus = TodoStatus.SCHEDULED) -> TodoItem:
         """새로운 TODO 항목 생성"""
@@ -18,31 +90,142 @@ class TodoRepository:
             target_date=target_date,
             status=status
         )
-        self._todos[todo.id] = todo
-        self._order.append(todo.id)  # 순서 목록에 추가
+        with self._lock:
+            self._emit(MutationEvent.CREATE, self._insert(todo), todo)
         return todo
 
+    def create_many(self, specs: Iterable[TodoSpec]) -> List[TodoItem]:
+        """여러 TODO를 주어진 순서대로 생성 (검증은 잠금 밖에서, 추가는 잠금 한 번으로)"""
+        todos = [
+            TodoItem(content=content, target_date=target_date, status=status)
+            for content, target_date, status in specs
+        ]
+        with self._lock:
+            for todo in todos:
+                self._emit(MutationEvent.CREATE, self._insert(todo), todo)
+        return todos
+
+    def insert(self, todo: TodoItem) -> TodoItem:
+        """
+        기존 항목을 ID와 시각 그대로 맨 뒤에 추가 (보관 계층에서 되돌릴 때)
+
+        Raises:
+            ValueError: 같은 ID의 항목이나 삭제 표시가 이미 있음
+        """
+        with self._lock:
+            if todo.id in self._ids:
+                raise ValueError(f"ID '{todo.id}'인 항목이 이미 있습니다")
+            self._emit(MutationEvent.CREATE, self._insert(todo), todo)
+        return todo
+
+    def insert_many(self, todos: Iterable[TodoItem]) -> List[TodoItem]:
+        """
+        이미 검증한 항목들을 주어진 순서대로 맨 뒤에 추가 (잠금 한 번, 전부 추가하거나 하나도 추가하지 않음)
+
+        Raises:
+            ValueError: 같은 ID의 항목이 이미 있거나 목록 안에서 ID가 겹침
+        """
+        todos = list(todos)
+        with self._lock:
+            ids = set()
+            for todo in todos:
+                if todo.id in self._ids or todo.id in ids:
+                    raise ValueError(f"ID '{todo.id}'인 항목이 이미 있습니다")
+                ids.add(todo.id)
+            for todo in todos:
+                self._emit(MutationEvent.CREATE, self._insert(todo), todo)
+        return todos
+
+    def _insert(self, todo: TodoItem) -> int:
+        """
+        항목을 맨 뒤에 추가하고 sid 반환 (쓰기 잠금 안에서 호출)
+
+        날짜 인덱스에 먼저 넣으므로 키를 비교할 수 없으면(시간대가 섞인 날짜)
+        다른 구조를 바꾸지 않고 ValueError를 던진다.
+        """
+        sid = self._ids.intern(todo.id)
+        try:
+            self._by_date.add(DateIndex.key(sid, todo))
+        except TypeError as e:
+            self._ids.release(todo.id)
+            raise ValueError(f"목표 날짜를 정렬할 수 없습니다: {e}")
+        if sid == len(self._items):
+            self._items.append(todo)
+        else:
+            self._items[sid] = todo  # 삭제된 sid 재사용
+        self._order.append(sid)  # 순서 목록에 추가
+        return sid
+
     def get_by_id(self, todo_id: str) -> Optional[TodoItem]:
         """ID로 TODO 항목 조회"""
-        return self._todos.get(todo_id)
+        sid = self._ids.get(todo_id)
+        return None if sid is None else self._items[sid]
+
+    def get_many(self, todo_ids: Iterable[str]) -> List[Optional[TodoItem]]:
+        """여러 ID를 같은 시점에서 조회 (없는 ID 자리는 None)"""
+        with self._lock:
+            sids = map(self._ids.get, todo_ids)
+            return [None if sid is None else self._items[sid] for sid in sids]
+
+    def index_of_many(self, todo_ids: Iterable[str]) -> List[Optional[int]]:
+        """여러 ID의 현재 순서 위치를 같은 시점에서 조회 (항목당 O(log N))"""
+        with self._lock:
+            sids = map(self._live_sid, todo_ids)
+            return [None if sid is None else self._order.index(sid) for sid in sids]
+
+    def snapshot(self) -> TodoSnapshot:
+        """
+        현재 버전의 읽기 전용 스냅샷
+
+        같은 버전이면 이전 스냅샷을 재사용하고, 새로 만들 때도 청크 참조만
+        고정하므로(O(N / 청크 크기)) 쓰기 잠금은 아주 짧게만 잡는다.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self._version:
+            return snapshot
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != self._version:
+                self._snapshot = TodoSnapshot(
+                    self._version, self._order.freeze(), self._items.freeze(), self._by_date.freeze()
+                )
+            return self._snapshot
 
     def get_all(self) -> List[TodoItem]:
         """모든 TODO 항목 조회 (저장된 순서 유지)"""
-        # _order 리스트 기준으로 정렬하여 반환
-        return [self._todos[todo_id] for todo_id in self._order if todo_id in self._todos]
+        return self.snapshot().get_all()
 
     def get_by_status(self, status: TodoStatus) -> List[TodoItem]:
         """상태별로 TODO 항목 조회 (저장된 순서 유지)"""
-        return [self._todos[todo_id] for todo_id in self._order if todo_id in self._todos and self._todos[todo_id].status == status]
+        return self.snapshot().get_by_status(status)
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[TodoItem], int, int]:
+        """
+        저장된 순서의 일부를 한 스냅샷에서 조회 (O(log N + limit))
+
+        Returns:
+            (TodoItem 리스트, 전체 개수, 스냅샷 버전)
+        """
+        check_page(offset, limit)
+        snapshot = self.snapshot()
+        todos = snapshot.page(offset, len(snapshot) if limit is None else limit)
+        return todos, len(snapshot), snapshot.version
+
+    def page_with_counts(self, limit: Optional[int] = None) -> Tuple[List[TodoItem], int, Dict[str, int], int]:
+        """첫 limit개 항목과 상태별 개수를 한 스냅샷에서 조회"""
+        check_page(0, limit)
+        snapshot = self.snapshot()
+        todos = snapshot.page(0, len(snapshot) if limit is None else limit)
+        return todos, len(snapshot), Counter(todo.status for todo in snapshot), snapshot.version
+
+    def count_by_status(self) -> Tuple[int, Dict[str, int]]:
+        """전체 개수와 상태별 개수를 한 스냅샷에서 계산"""
+        snapshot = self.snapshot()
+        return len(snapshot), Counter(todo.status for todo in snapshot)
 
     def update(self, todo_id: str, content: Optional[str] = None, 
                target_date: Optional[datetime] = None, 
                status: Optional[TodoStatus] = None) -> Optional[TodoItem]:
-        """TODO 항목 수정"""
-        todo = self._todos.get(todo_id)
-        if not todo:
-            return None
-
+        """TODO 항목 수정 (바꾸는 필드만 검증)"""
         # 수정할 데이터 준비
         update_data = {}
         if content is not None:
@@ -51,49 +234,251 @@ class TodoRepository:
             update_data['target_date'] = target_date
         if status is not None:
             update_data['status'] = status
-        
-        # Pydantic의 model_validate를 사용하여 검증하면서 업데이트
-        if update_data:
-            # 기존 데이터를 딕셔너리로 변환
-            todo_dict = todo.model_dump()
-            # 새로운 데이터로 업데이트
-            todo_dict.update(update_data)
-            # 검증하면서 새로운 TodoItem 생성
-            validated_todo = TodoItem(**todo_dict)
-            # 기존 객체 업데이트
-            todo.content = validated_todo.content
-            todo.target_date = validated_todo.target_date
-            todo.status = validated_todo.status
-
-        todo.updated_at = datetime.now()
+
+        with self._lock:
+            return self._update(todo_id, update_data, validated=False)
+
+    def apply_update(self, todo_id: str, changes: Dict[str, Any]) -> Optional[TodoItem]:
+        """이미 검증한 변경을 다시 검증하지 않고 적용"""
+        with self._lock:
+            return self._update(todo_id, changes, validated=True)
+
+    def _update(self, todo_id: str, changes: Dict[str, Any], validated: bool) -> Optional[TodoItem]:
+        """TODO 항목 수정 (쓰기 잠금 안에서 호출)"""
+        sid = self._live_sid(todo_id)
+        if sid is None:
+            return None
+        previous = self._items[sid]
+
+        # 바뀐 필드로 만든 새 TodoItem으로 교체 (스냅샷이 참조하는 기존 객체는 수정하지 않음)
+        todo = previous.trusted_update(changes) if validated else previous.revise(**changes)
+
+        if todo.target_date != previous.target_date:
+            try:
+                self._by_date.add(DateIndex.key(sid, todo))  # 실패하면 아무것도 바꾸지 않음
+            except TypeError as e:
+                raise ValueError(f"목표 날짜를 정렬할 수 없습니다: {e}")
+            self._by_date.remove(DateIndex.key(sid, previous))
+        self._items[sid] = todo
+        self._emit(MutationEvent.UPDATE, sid, todo, previous)
         return todo
 
     def delete(self, todo_id: str) -> bool:
-        """TODO 항목 삭제"""
-        if todo_id in self._todos:
-            del self._todos[todo_id]
-            if todo_id in self._order:
-                self._order.remove(todo_id)  # 순서 목록에서도 제거
+        """TODO 항목 삭제 (undo_window 동안 restore()로 복구 가능)"""
+        with self._lock:
+            sid = self._live_sid(todo_id)
+            if sid is None:
+                return False
+            todo = self._items[sid]
+            position = self._order.index(sid)
+            self._tombstones[sid] = Tombstone(
+                todo,
+                self._order.rank(sid),
+                self._order.epoch,
+                self._order.sid_at(position - 1) if position > 0 else None,
+                self._clock()
+            )
+            self._items[sid] = None
+            self._order.discard(sid)  # 순서 목록에서도 제거
+            self._by_date.remove(DateIndex.key(sid, todo))
+            self._emit(MutationEvent.DELETE, sid, todo)
             return True
-        return False
+
+    def delete_many(self, todo_ids: Iterable[str]) -> int:
+        """여러 TODO를 잠금 한 번으로 삭제 후 실제로 삭제한 개수 반환"""
+        with self._lock:
+            return sum(1 for todo_id in todo_ids if self.delete(todo_id))
+
+    def evict(self, todos: Iterable[TodoItem],
+              on_evicted: Optional[Callable[[List[TodoItem]], None]] = None) -> List[TodoItem]:
+        """다른 계층으로 옮긴 항목을 삭제 표시 없이 제거 (읽은 뒤 바뀐 항목은 남김)"""
+        evicted = []
+        with self._lock:
+            for todo in todos:
+                sid = self._live_sid(todo.id)
+                if sid is None or self._items[sid] is not todo:
+                    continue
+                self._items[sid] = None
+                self._order.discard(sid)
+                self._by_date.remove(DateIndex.key(sid, todo))
+                self._emit(MutationEvent.DELETE, sid, todo)
+                self._ids.release(todo.id)
+                evicted.append(todo)
+            if evicted and on_evicted is not None:
+                on_evicted(evicted)
+        return evicted
+
+    def restore(self, todo_id: str) -> Optional[TodoItem]:
+        """삭제한 TODO를 원래 위치에 복구 (삭제 표시가 없거나 만료되었으면 None)"""
+        with self._lock:
+            sid = self._ids.get(todo_id)
+            tombstone = None if sid is None else self._tombstones.get(sid)
+            if tombstone is None or self._clock() - tombstone.deleted_at > self.undo_window:
+                return None
+            del self._tombstones[sid]
+            self._items[sid] = tombstone.todo
+            if tombstone.epoch == self._order.epoch:
+                self._order.insert_at_rank(sid, tombstone.rank)
+            else:
+                # 그 사이 전체 순서가 재구성되었으면 이전 앞 항목 뒤(맨 앞이었으면 맨 앞)로
+                self._order.append(sid)
+                if tombstone.previous_sid is None:
+                    self._order.move_to(sid, 0)
+                elif tombstone.previous_sid in self._order:
+                    self._order.move_after(sid, tombstone.previous_sid)
+            self._by_date.add(DateIndex.key(sid, tombstone.todo))
+            self._emit(MutationEvent.CREATE, sid, tombstone.todo)
+            return tombstone.todo
+
+    def compact(self, batch_size: int = 256) -> int:
+        """
+        복구 가능 시간이 지난 삭제 표시를 최대 batch_size개 정리
+
+        삭제 표시는 삭제 순서로 저장되어 있으므로 앞에서부터 만료된 것만
+        꺼내 sid를 해제한다 (배치당 O(batch_size), 버전은 바뀌지 않음).
+
+        Returns:
+            정리한 개수
+        """
+        with self._lock:
+            expired_before = self._clock() - self.undo_window
+            purged = 0
+            while self._tombstones and purged < batch_size:
+                sid, tombstone = next(iter(self._tombstones.items()))
+                if tombstone.deleted_at >= expired_before:
+                    break
+                del self._tombstones[sid]
+                self._ids.release(tombstone.todo.id)  # sid 재사용 허용
+                purged += 1
+            return purged
+
+    def tombstone_count(self) -> int:
+        """정리되지 않은 삭제 표시 개수"""
+        return len(self._tombstones)
 
     def clear_all(self) -> None:
-        """모든 TODO 항목 삭제"""
-        self._todos.clear()
-        self._order.clear()  # 순서 목록도 초기화
+        """모든 TODO 항목 삭제 (복구 불가)"""
+        with self._lock:
+            self._ids.clear()
+            self._tombstones.clear()
+            self._items = PagedSlots()
+            self._order.reset([])  # 순서 목록도 초기화
+            self._by_date.clear()
+            self._emit(MutationEvent.CLEAR)
+
+    def publish_state(self, name: str) -> None:
+        """항목은 그대로 두고 버전을 올려 STATE 이벤트 전달 (name: 바뀐 상태 이름)"""
+        with self._lock:
+            self._emit(MutationEvent.STATE, name=name)
     
     def set_order(self, order: List[str]) -> None:
-        """TODO 순서 설정"""
-        self._order = [todo_id for todo_id in order if todo_id in self._todos]
+        """
+        TODO 순서 설정
+
+        존재하지 않는 ID는 무시하고, 목록에 빠진 항목은 기존 순서대로 뒤에 붙인다.
+        """
+        with self._lock:
+            known = [sid for sid in map(self._live_sid, order) if sid is not None]
+            listed = set(known)
+            self._order.reset(known + [sid for sid in self._order if sid not in listed])
+            self._emit(MutationEvent.REORDER)
+
+    def move_before(self, todo_id: str, anchor_id: str) -> Optional[int]:
+        """TODO를 anchor_id 항목 바로 앞으로 이동 후 새 위치 반환 (둘 중 하나라도 없으면 None)"""
+        with self._lock:
+            sid, anchor_sid = self._live_sid(todo_id), self._live_sid(anchor_id)
+            if sid is None or anchor_sid is None:
+                return None
+            self._order.move_before(sid, anchor_sid)
+            self._emit(MutationEvent.REORDER, sid, self._items[sid])
+            return self._order.index(sid)
+
+    def move_after(self, todo_id: str, anchor_id: str) -> Optional[int]:
+        """TODO를 anchor_id 항목 바로 뒤로 이동 후 새 위치 반환 (둘 중 하나라도 없으면 None)"""
+        with self._lock:
+            sid, anchor_sid = self._live_sid(todo_id), self._live_sid(anchor_id)
+            if sid is None or anchor_sid is None:
+                return None
+            self._order.move_after(sid, anchor_sid)
+            self._emit(MutationEvent.REORDER, sid, self._items[sid])
+            return self._order.index(sid)
+
+    def move_to(self, todo_id: str, position: int) -> Optional[int]:
+        """TODO를 position 위치로 이동 후 새 위치 반환 (없으면 None)"""
+        with self._lock:
+            sid = self._live_sid(todo_id)
+            if sid is None:
+                return None
+            self._order.move_to(sid, position)
+            self._emit(MutationEvent.REORDER, sid, self._items[sid])
+            return self._order.index(sid)
+
+    def index_of(self, todo_id: str) -> Optional[int]:
+        """TODO의 현재 순서 위치 (없으면 None)"""
+        with self._lock:
+            sid = self._live_sid(todo_id)
+            return None if sid is None else self._order.index(sid)
     
     def get_order(self) -> List[str]:
         """TODO 순서 조회"""
-        return self._order.copy()
+        return [todo.id for todo in self.snapshot()]
     
+    def get_by_date(self, status: Optional[TodoStatus] = None) -> List[TodoItem]:
+        """사용자 순서를 바꾸지 않고 날짜순으로 조회 (같은 날짜는 생성 순)"""
+        todos = self.snapshot().by_date()
+        if status is None:
+            return todos
+        return [todo for todo in todos if todo.status == status]
+
+    def get_by_date_range(self, start: datetime, end: datetime,
+                          status: Optional[TodoStatus] = None) -> List[TodoItem]:
+        """목표 날짜 구간 조회 (날짜 인덱스에서 구간만 읽으므로 O(log N + 결과 개수))"""
+        todos = self.snapshot().by_date_range(start, end)
+        if status is None:
+            return todos
+        return [todo for todo in todos if todo.status == status]
+
+    def count_by_date_range(self, start: datetime, end: datetime) -> int:
+        """목표 날짜 구간의 항목 개수 (날짜 인덱스의 청크 길이만 더하므로 항목을 읽지 않음)"""
+        return self.snapshot().count_date_range(start, end)
+
+    def page_by_date(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[TodoItem], int, int]:
+        """
+        날짜순 보기의 일부 조회 (O(N / 청크 크기 + limit))
+
+        Returns:
+            (TodoItem 리스트, 전체 개수, 버전)
+        """
+        check_page(offset, limit)
+        snapshot = self.snapshot()
+        return snapshot.page_by_date(offset, limit), len(snapshot), snapshot.version
+
     def sort_by_date(self) -> None:
-        """날짜순으로 정렬"""
-        self._order.sort(key=lambda todo_id: self._todos[todo_id].target_date if todo_id in self._todos else datetime.max)
+        """날짜순 보기를 사용자 순서로 저장 (다시 정렬하지 않고 O(N))"""
+        with self._lock:
+            self._order.reset(self._by_date.sids())
+            self._emit(MutationEvent.REORDER)
 
     def count(self) -> int:
         """TODO 항목 개수 반환"""
-        return len(self._todos)
+        return len(self._order)
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 구조별 깊은 크기 (항목 객체는 items에 포함)"""
+        with self._lock:
+            parts = {
+                'items': self._items,
+                'ids': self._ids,
+                'order': self._order,
+                'date_index': self._by_date,
+                'tombstones': self._tombstones,
+                'snapshot': self._snapshot,
+            }
+        return {name: sizer.size(part) for name, part in parts.items()}
+
+    def _live_sid(self, todo_id: str) -> Optional[int]:
+        """삭제되지 않은 항목의 sid (없거나 삭제 표시된 항목이면 None)"""
+        sid = self._ids.get(todo_id)
+        if sid is None or self._items[sid] is None:
+            return None
+        return sid
@@ -0,0 +1,77 @@
+"""삭제 표시(tombstone)와 백그라운드 정리 작업"""
+import threading
+from typing import Optional
+from models import TodoItem
+
+
+class Tombstone:
+    """
+    삭제 표시된 항목의 복구 정보
+
+    Attributes:
+        todo: 삭제된 항목
+        rank: 삭제 직전 OrderIndex 순위 키
+        epoch: rank를 읽을 때의 OrderIndex.epoch (달라졌으면 rank는 무효)
+        previous_sid: 삭제 직전 바로 앞 항목의 sid (맨 앞이었으면 None)
+        deleted_at: 삭제 시각 (저장소 clock 기준)
+    """
+
+    __slots__ = ('todo', 'rank', 'epoch', 'previous_sid', 'deleted_at')
+
+    def __init__(self, todo: TodoItem, rank: int, epoch: int,
+                 previous_sid: Optional[int], deleted_at: float):
+        self.todo = todo
+        self.rank = rank
+        self.epoch = epoch
+        self.previous_sid = previous_sid
+        self.deleted_at = deleted_at
+
+
+class TombstoneCompactor:
+    """
+    복구 가능 시간이 지난 삭제 표시를 주기적으로 정리하는 작업 스레드
+
+    TodoRepository.compact()를 batch_size 단위로 반복 호출하므로 배치 사이에
+    쓰기 잠금이 풀려 다른 요청이 오래 기다리지 않는다.
+    """
+
+    def __init__(self, repository, interval: float = 5.0, batch_size: int = 256):
+        """
+        Args:
+            repository: 정리할 TodoRepository
+            interval: 정리 주기(초)
+            batch_size: 한 번에 잠금을 잡고 정리할 최대 개수
+        """
+        self._repository = repository
+        self.interval = interval
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> int:
+        """만료된 삭제 표시를 모두 정리하고 정리한 개수 반환"""
+        total = 0
+        while True:
+            purged = self._repository.compact(self.batch_size)
+            total += purged
+            if purged < self.batch_size:
+                return total
+
+    def start(self) -> None:
+        """작업 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='tombstone-compactor', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """작업 스레드 종료"""
+        thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.run_once()
@@ -1,4 +1,33 @@
-"""비즈니스 로직 계층 패키지"""
+"""비즈니스 로직 계층 패키지
+
+AnalyticsService는 NumPy가 필요하므로 처음 사용할 때 불러온다.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
 from .todo_service import TodoService
+from .deadline_scheduler import DeadlineScheduler
+from .query_planner import QueryPlanner, QueryPlan
+
+if TYPE_CHECKING:
+    from .analytics_service import AnalyticsService
+
+# 지연 로딩 대상: 이름 -> 하위 모듈
+_LAZY_ATTRS = {
+    'AnalyticsService': '.analytics_service',
+}
+
+__all__ = ['TodoService', 'DeadlineScheduler', 'QueryPlanner', 'QueryPlan', 'AnalyticsService']
+
+
+def __getattr__(name):
+    """지연 로딩 대상 속성을 처음 접근할 때 하위 모듈에서 불러옴"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['TodoService']
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
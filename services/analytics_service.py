@@ -0,0 +1,183 @@
+"""TODO 통계/리포트 서비스 (컬럼형 미러 기반)"""
+from datetime import datetime
+from typing import List, Optional
+import numpy as np
+from models import TodoStatus, STATUS_CODES
+from repositories import ColdStore, StatsHistory
+from repositories.columnar import ColumnarMirror, ColumnarColumns, to_epoch_seconds, from_epoch_seconds
+
+DAY = 86400
+WEEK = 7 * DAY
+_WEEK_OFFSET = 4 * DAY  # 1970-01-01은 목요일이므로 4일 뒤(월요일)를 주 시작 기준으로 사용
+_COMPLETED = STATUS_CODES[TodoStatus.COMPLETED.value]
+
+# 완료 소요 시간 분포 구간 (초)
+COMPLETION_TIME_EDGES = np.array([0, 3600, 6 * 3600, DAY, 3 * DAY, 7 * DAY, 30 * DAY], dtype=np.int64)
+COMPLETION_TIME_LABELS = ['<1h', '1h-6h', '6h-1d', '1d-3d', '3d-7d', '7d-30d', '30d+']
+
+
+class AnalyticsService:
+    """
+    통계/리포트 계산 서비스
+
+    ColumnarMirror가 유지하는 상태 코드/epoch 초 배열에 대해 NumPy 벡터 연산으로
+    집계하므로 TodoItem을 하나씩 순회하지 않는다. 완료 시각은 별도로 기록하지
+    않으므로 완료 상태 항목의 updated_at을 완료 시각으로 간주한다. 보관 계층이
+    있으면 보관한 항목(모두 완료)의 머리글 컬럼을 이어 붙여 함께 집계한다.
+    """
+
+    PERIODS = {'day': DAY, 'week': WEEK}
+
+    def __init__(self, mirror: ColumnarMirror, archive: Optional[ColdStore] = None,
+                 history: Optional[StatsHistory] = None):
+        """
+        서비스 초기화
+
+        Args:
+            mirror: 저장소에 연결된 ColumnarMirror (의존성 주입)
+            archive: 오래된 완료 항목을 보관한 ColdStore (없으면 미러만 집계)
+            history: 저장소에 연결된 StatsHistory (없으면 시계열 조회 불가)
+        """
+        self._mirror = mirror
+        self._archive = archive
+        self._history = history
+
+    def stats_history(self, resolution: str = 'hour', limit: Optional[int] = None) -> dict:
+        """
+        상태별 개수의 시계열
+
+        Args:
+            resolution: 해상도 이름 (기본: 'minute', 'hour', 'day')
+            limit: 최근 버킷 수 (기본값: 해상도의 버킷 수 전체)
+
+        Raises:
+            ValueError: 시계열이 없거나 지원하지 않는 해상도, limit이 1 미만
+        """
+        if self._history is None:
+            raise ValueError("통계 시계열을 사용하지 않습니다")
+        return self._history.history(resolution, limit)
+
+    def _columns(self) -> ColumnarColumns:
+        """미러 컬럼 뒤에 보관한 항목의 컬럼을 이어 붙인 컬럼"""
+        columns = self._mirror.columns()
+        if self._archive is None or not len(self._archive):
+            return columns
+        archived = [np.frombuffer(column, dtype=np.int64) for column in self._archive.columns()]
+        return ColumnarColumns(
+            np.concatenate([columns.status, np.full(len(archived[0]), _COMPLETED, dtype=np.int8)]),
+            *(np.concatenate([hot, cold]) for hot, cold in zip(
+                (columns.target_date, columns.created_at, columns.updated_at), archived
+            ))
+        )
+
+    def completion_rate(self, period: str = 'day') -> List[dict]:
+        """
+        기간별 생성/완료 개수와 누적 완료율
+
+        Args:
+            period: 집계 단위 ('day' 또는 'week')
+
+        Returns:
+            기간 시작 순으로 정렬된 {period_start, created, completed, rate} 리스트
+            (생성/완료가 모두 없는 기간은 생략)
+
+        Raises:
+            ValueError: 지원하지 않는 period
+        """
+        if period not in self.PERIODS:
+            raise ValueError(f"지원하지 않는 기간 단위: {period} (가능한 값: {', '.join(self.PERIODS)})")
+        columns = self._columns()
+        if not len(columns):
+            return []
+
+        created = self._bucket(columns.created_at, period)
+        completed = self._bucket(columns.updated_at[columns.status == _COMPLETED], period)
+        first = created.min() if not len(completed) else min(created.min(), completed.min())
+        last = created.max() if not len(completed) else max(created.max(), completed.max())
+        size = int(last - first) + 1
+
+        created_counts = np.bincount(created - first, minlength=size)
+        completed_counts = np.bincount(completed - first, minlength=size)
+        cumulative_created = np.cumsum(created_counts)
+        cumulative_completed = np.cumsum(completed_counts)
+        rates = np.divide(cumulative_completed, cumulative_created,
+                          out=np.zeros(size), where=cumulative_created > 0)
+
+        active = np.flatnonzero(created_counts | completed_counts)
+        return [
+            {
+                'period_start': self._bucket_start(first + i, period).isoformat(),
+                'created': int(created_counts[i]),
+                'completed': int(completed_counts[i]),
+                'rate': round(float(rates[i]), 4),
+            }
+            for i in active
+        ]
+
+    def overdue_by_week(self, now: Optional[datetime] = None) -> dict:
+        """
+        목표 날짜가 지난 미완료 TODO를 목표 날짜의 주(월요일 시작)별로 집계
+
+        Args:
+            now: 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            {'total': 전체 개수, 'weeks': [{week_start, count}, ...]}
+        """
+        columns = self._columns()
+        now_seconds = to_epoch_seconds(now or datetime.now())
+        overdue = (columns.status != _COMPLETED) & (columns.target_date < now_seconds)
+        weeks, counts = np.unique(self._bucket(columns.target_date[overdue], 'week'), return_counts=True)
+        return {
+            'total': int(counts.sum()),
+            'weeks': [
+                {'week_start': self._bucket_start(week, 'week').isoformat(), 'count': int(count)}
+                for week, count in zip(weeks, counts)
+            ],
+        }
+
+    def completion_time(self) -> dict:
+        """
+        완료된 TODO의 생성~완료 소요 시간 분포
+
+        Returns:
+            개수, 평균/백분위수(시간 단위), 구간별 히스토그램
+        """
+        columns = self._columns()
+        done = columns.status == _COMPLETED
+        durations = np.maximum(columns.updated_at[done] - columns.created_at[done], 0)
+        bins = np.searchsorted(COMPLETION_TIME_EDGES, durations, side='right') - 1
+        histogram = np.bincount(bins, minlength=len(COMPLETION_TIME_LABELS))
+
+        result = {
+            'count': int(len(durations)),
+            'mean_hours': None,
+            'p50_hours': None,
+            'p90_hours': None,
+            'p99_hours': None,
+            'histogram': [
+                {'bucket': label, 'count': int(count)}
+                for label, count in zip(COMPLETION_TIME_LABELS, histogram)
+            ],
+        }
+        if len(durations):
+            p50, p90, p99 = np.percentile(durations, [50, 90, 99]) / 3600
+            result.update(
+                mean_hours=round(float(durations.mean()) / 3600, 2),
+                p50_hours=round(float(p50), 2),
+                p90_hours=round(float(p90), 2),
+                p99_hours=round(float(p99), 2),
+            )
+        return result
+
+    def _bucket(self, seconds: np.ndarray, period: str) -> np.ndarray:
+        """epoch 초 배열을 기간 번호 배열로 변환"""
+        if period == 'week':
+            return (seconds - _WEEK_OFFSET) // WEEK
+        return seconds // DAY
+
+    def _bucket_start(self, bucket: int, period: str) -> datetime:
+        """기간 번호의 시작 시각"""
+        if period == 'week':
+            return from_epoch_seconds(int(bucket) * WEEK + _WEEK_OFFSET)
+        return from_epoch_seconds(int(bucket) * DAY)
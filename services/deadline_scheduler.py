@@ -0,0 +1,198 @@
+"""목표 날짜(마감) 스케줄러"""
+import heapq
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from models import TodoItem, TodoStatus
+from repositories.events import MutationEvent
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """
+    미완료 TODO의 target_date를 최소 힙으로 관리하여 마감 시각에 기한 초과로 표시
+
+    저장소의 변경 이벤트로 힙을 갱신하므로(O(log N)) 요청마다 전체 항목을
+    훑지 않는다. 수정/삭제된 항목의 이전 힙 원소는 바로 지우지 않고 꺼낼 때
+    버리며(지연 삭제), 버릴 원소가 살아 있는 원소보다 많아지면 힙을 다시 만든다.
+
+    마감이 지난 항목은 overdue()에 포함되고, add_callback()으로 등록한 함수가
+    해당 항목을 인자로 한 번 호출된다 (알림, 상태 자동 변경 등).
+    """
+
+    _COMPACT_MIN = 64  # 힙 재구성을 고려할 최소 버릴 원소 수
+    _MAX_WAIT = 60.0  # 시계 변경에 대비한 작업 스레드의 최대 대기 시간(초)
+
+    def __init__(self, clock: Callable[[], datetime] = datetime.now):
+        """
+        스케줄러 초기화
+
+        Args:
+            clock: 현재 시각 함수 (target_date와 같은 기준의 naive datetime 반환)
+        """
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[datetime, int, int]] = []  # (마감, 순번, sid)
+        self._pending: Dict[int, Tuple[datetime, int]] = {}  # sid -> 유효한 힙 원소의 (마감, 순번)
+        self._todos: Dict[int, TodoItem] = {}  # 추적 중인 미완료 항목
+        self._overdue: Dict[int, TodoItem] = {}  # 마감이 지난 미완료 항목
+        self._stale = 0  # 힙에 남아 있는 무효 원소 수
+        self._seq = 0
+        self._callbacks: List[Callable[[TodoItem], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def attach(self, repository) -> None:
+        """저장소의 현재 항목을 등록하고 이후 변경 이벤트를 구독"""
+        repository.add_listener(self.apply, replay=True)
+
+    def add_callback(self, callback: Callable[[TodoItem], None]) -> None:
+        """마감이 지난 항목마다 호출할 함수 등록 (스케줄러 잠금 밖에서 호출됨)"""
+        self._callbacks.append(callback)
+
+    def apply(self, event: MutationEvent) -> None:
+        """변경 이벤트 반영"""
+        with self._cond:
+            if event.op in (MutationEvent.CREATE, MutationEvent.UPDATE):
+                self._schedule(event.sid, event.todo)
+            elif event.op == MutationEvent.DELETE:
+                self._cancel(event.sid)
+            elif event.op == MutationEvent.CLEAR:
+                self._heap.clear()
+                self._pending.clear()
+                self._todos.clear()
+                self._overdue.clear()
+                self._stale = 0
+
+    def run_pending(self, now: Optional[datetime] = None) -> List[TodoItem]:
+        """
+        마감이 지난 항목을 기한 초과로 옮기고 콜백 호출
+
+        Args:
+            now: 기준 시각 (기본값: clock())
+
+        Returns:
+            이번에 기한 초과가 된 항목 (마감 순)
+        """
+        fired = []
+        with self._cond:
+            now = now or self._clock()
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                deadline, seq, sid = heapq.heappop(heap)
+                if self._pending.get(sid) != (deadline, seq):
+                    self._stale -= 1
+                    continue
+                del self._pending[sid]
+                todo = self._overdue[sid] = self._todos[sid]
+                fired.append(todo)
+
+        for todo in fired:
+            for callback in self._callbacks:
+                try:
+                    callback(todo)
+                except Exception:
+                    logger.exception("기한 초과 콜백 실패: %s", todo.id)
+        return fired
+
+    def overdue(self) -> List[TodoItem]:
+        """기한이 지난 미완료 항목 (목표 날짜 순)"""
+        self.run_pending()
+        with self._cond:
+            todos = list(self._overdue.values())
+        return sorted(todos, key=lambda todo: todo.target_date)
+
+    def next_deadline(self) -> Optional[datetime]:
+        """아직 지나지 않은 가장 이른 마감 (없으면 None)"""
+        with self._cond:
+            return self._peek()
+
+    def __len__(self) -> int:
+        """마감을 기다리는 항목 수"""
+        return len(self._pending)
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 구조별 깊은 크기 (무효 원소가 남은 힙 포함)"""
+        with self._cond:
+            parts = {
+                'heap': self._heap,
+                'pending': self._pending,
+                'todos': self._todos,
+                'overdue': self._overdue,
+            }
+        return {name: sizer.size(part) for name, part in parts.items()}
+
+    def start(self) -> None:
+        """마감 시각마다 깨어나는 백그라운드 작업 스레드 시작"""
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name='deadline-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """작업 스레드 종료"""
+        with self._cond:
+            thread, self._thread = self._thread, None
+            self._stopped = True
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        """다음 마감까지 기다렸다가 run_pending() 실행 (작업 스레드)"""
+        while True:
+            self.run_pending()
+            with self._cond:
+                if self._stopped:
+                    return
+                deadline = self._peek()
+                timeout = self._MAX_WAIT
+                if deadline is not None:
+                    timeout = min(timeout, max((deadline - self._clock()).total_seconds(), 0))
+                self._cond.wait(timeout)
+
+    def _schedule(self, sid: int, todo: TodoItem) -> None:
+        """항목의 마감 등록/갱신 (잠금 안에서 호출)"""
+        if todo.status == TodoStatus.COMPLETED:
+            self._cancel(sid)
+            return
+        deadline = todo.target_date.replace(tzinfo=None)
+        entry = self._pending.get(sid)
+        if entry is not None and entry[0] == deadline:
+            self._todos[sid] = todo  # 마감이 그대로면 항목 참조만 갱신
+            return
+        if sid in self._overdue and self._overdue[sid].target_date == todo.target_date:
+            self._todos[sid] = self._overdue[sid] = todo
+            return
+
+        self._cancel(sid)
+        self._seq += 1
+        self._pending[sid] = (deadline, self._seq)
+        self._todos[sid] = todo
+        heapq.heappush(self._heap, (deadline, self._seq, sid))
+        if self._heap[0][1] == self._seq:
+            self._cond.notify_all()  # 가장 이른 마감이 바뀌면 작업 스레드를 깨움
+
+    def _cancel(self, sid: int) -> None:
+        """항목의 마감과 기한 초과 표시 제거 (잠금 안에서 호출)"""
+        self._todos.pop(sid, None)
+        self._overdue.pop(sid, None)
+        if self._pending.pop(sid, None) is None:
+            return
+        self._stale += 1
+        if self._stale > self._COMPACT_MIN and self._stale > len(self._pending):
+            self._heap = [(deadline, seq, sid) for sid, (deadline, seq) in self._pending.items()]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _peek(self) -> Optional[datetime]:
+        """무효 원소를 버린 뒤 힙 최솟값의 마감 (잠금 안에서 호출)"""
+        heap = self._heap
+        while heap and self._pending.get(heap[0][2]) != heap[0][:2]:
+            heapq.heappop(heap)
+            self._stale -= 1
+        return heap[0][0] if heap else None
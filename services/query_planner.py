@@ -0,0 +1,169 @@
+"""TODO 조합 조회 계획"""
+from datetime import datetime
+from operator import attrgetter
+from typing import Dict, List, Tuple
+from models import TodoItem, TodoQuery
+from repositories import BaseTodoRepository, QueryIndex
+from repositories.query_index import normalize_text
+
+# 비용이 같으면 앞쪽 인덱스 사용 (날짜 인덱스는 결과가 이미 날짜순)
+INDEX_PREFERENCE = ('date', 'status', 'text', 'scan')
+
+SORT_KEYS = {
+    'date': lambda todo: (todo.target_date, todo.created_at),
+    'created': attrgetter('created_at'),
+    'updated': attrgetter('updated_at'),
+    'content': lambda todo: normalize_text(todo.content),
+}
+
+
+class QueryPlan:
+    """
+    실행한 조회 계획 (explain 응답)
+
+    Attributes:
+        index: 후보를 가져온 인덱스 ('status', 'date', 'text', 전체 순회는 'scan')
+        estimates: 사용할 수 있었던 인덱스별 예상 후보 수
+        candidates: 인덱스에서 가져온 실제 후보 수
+        intersected: 후보 ID와 교집합한 다른 인덱스
+        filters: 항목마다 직접 확인한 조건
+        sort: 정렬 방법 ('order': 이미 사용자 순서, 'index': 인덱스 순서,
+            'positions': 후보의 순서 위치 조회 후 정렬, 'order_scan': 사용자 순서로
+            전체를 읽으며 결과만 고름, 'sort': 키로 정렬)
+        matched: 모든 조건을 만족한 항목 수
+    """
+
+    __slots__ = ('index', 'estimates', 'candidates', 'intersected', 'filters', 'sort', 'matched')
+
+    def __init__(self, index: str, estimates: Dict[str, int]):
+        self.index = index
+        self.estimates = estimates
+        self.candidates = 0
+        self.intersected: List[str] = []
+        self.filters: List[str] = []
+        self.sort = 'order'
+        self.matched = 0
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class QueryPlanner:
+    """
+    조합 조회 조건에 맞는 인덱스를 골라 실행하는 계획기
+
+    조건마다 쓸 수 있는 인덱스(상태: QueryIndex 상태 집합, 날짜: 저장소의 날짜
+    인덱스, 텍스트: QueryIndex 두 글자 역색인)의 후보 수를 추정하고 전체 개수와
+    비교해 가장 적은 쪽에서 후보를 가져온다. 나머지 상태/텍스트 인덱스는 후보
+    ID와 교집합하고, 남은 조건은 항목마다 확인한다. 인덱스는 쓰기와 별도로
+    갱신되므로 후보 항목은 항상 모든 조건으로 다시 확인한다.
+    """
+
+    def __init__(self, repository: BaseTodoRepository, index: QueryIndex):
+        """
+        Args:
+            repository: 조회할 저장소
+            index: 저장소에 연결된 QueryIndex
+        """
+        self._repository = repository
+        self._index = index
+
+    def estimates(self, query: TodoQuery) -> Dict[str, int]:
+        """조건에 쓸 수 있는 인덱스별 예상 후보 수 ('scan'은 전체 개수)"""
+        estimates = {'scan': self._repository.count()}
+        if query.statuses is not None:
+            estimates['status'] = self._index.status_count(query.statuses)
+        if query.start is not None or query.end is not None:
+            estimates['date'] = self._repository.count_by_date_range(*self._date_range(query))
+        if query.text is not None:
+            estimate = self._index.text_estimate(query.text)
+            if estimate is not None:
+                estimates['text'] = estimate
+        return estimates
+
+    def execute(self, query: TodoQuery) -> Tuple[List[TodoItem], int, QueryPlan]:
+        """
+        조회 실행
+
+        Returns:
+            (offset/limit으로 자른 TodoItem 리스트, 조건을 만족한 전체 개수, 실행 계획)
+        """
+        estimates = self.estimates(query)
+        plan = QueryPlan(min(estimates, key=lambda name: (estimates[name], INDEX_PREFERENCE.index(name))), estimates)
+        todos = self._fetch(query, plan)
+        plan.candidates = len(todos)
+        todos = [todo for todo in todos if self._matches(query, todo)]
+        plan.matched = len(todos)
+        todos = self._sort(query, plan, todos)
+        end = None if query.limit is None else query.offset + query.limit
+        return todos[query.offset:end], len(todos), plan
+
+    def _fetch(self, query: TodoQuery, plan: QueryPlan) -> List[TodoItem]:
+        """계획한 인덱스에서 후보 항목을 가져오고 확인할 조건을 기록"""
+        conditions = [name for name, value in (('status', query.statuses), ('text', query.text)) if value is not None]
+        if query.start is not None or query.end is not None:
+            conditions.append('date')
+
+        if plan.index == 'scan':
+            plan.filters = conditions
+            return self._repository.get_all()
+        if plan.index == 'date':
+            plan.filters = [name for name in conditions if name != 'date']
+            return self._repository.get_by_date_range(*self._date_range(query))
+
+        if plan.index == 'status':
+            ids = self._index.status_ids(query.statuses)
+        else:
+            ids = self._index.text_ids(query.text)
+        if plan.index != 'text' and 'text' in plan.estimates:
+            plan.intersected.append('text')
+        if plan.index != 'status' and 'status' in conditions:
+            plan.intersected.append('status')
+        if plan.intersected:
+            ids = self._index.intersect(
+                ids,
+                statuses=query.statuses if 'status' in plan.intersected else None,
+                text=query.text if 'text' in plan.intersected else None,
+            )
+        # 텍스트 인덱스는 두 글자 포함 여부만 보장하므로 부분 문자열은 직접 확인
+        plan.filters = [name for name in conditions
+                        if name == 'text' or (name != plan.index and name not in plan.intersected)]
+        return [todo for todo in self._repository.get_many(ids) if todo is not None]
+
+    def _sort(self, query: TodoQuery, plan: QueryPlan, todos: List[TodoItem]) -> List[TodoItem]:
+        """정렬 기준에 맞춰 정렬 (후보를 가져온 순서를 쓸 수 있으면 그대로 사용)"""
+        key = query.sort.lstrip('-')
+        descending = query.sort.startswith('-')
+        if key == 'order':
+            if plan.index == 'scan':
+                return todos
+            total = plan.estimates['scan']
+            if len(todos) * max(1, total.bit_length()) < total:
+                plan.sort = 'positions'
+                positions = self._repository.index_of_many(todo.id for todo in todos)
+                ranked = sorted((position, i) for i, position in enumerate(positions) if position is not None)
+                return [todos[i] for _, i in ranked]
+            plan.sort = 'order_scan'
+            matched = {todo.id for todo in todos}
+            return [todo for todo in self._repository.get_all() if todo.id in matched and self._matches(query, todo)]
+        if key == 'date' and plan.index == 'date':
+            plan.sort = 'index'
+            return todos[::-1] if descending else todos
+        plan.sort = 'sort'
+        return sorted(todos, key=SORT_KEYS[key], reverse=descending)
+
+    @staticmethod
+    def _matches(query: TodoQuery, todo: TodoItem) -> bool:
+        """항목이 모든 조건을 만족하는지"""
+        if query.statuses is not None and todo.status not in query.statuses:
+            return False
+        if query.start is not None and todo.target_date < query.start:
+            return False
+        if query.end is not None and todo.target_date >= query.end:
+            return False
+        return query.text is None or normalize_text(query.text) in normalize_text(todo.content)
+
+    @staticmethod
+    def _date_range(query: TodoQuery) -> Tuple[datetime, datetime]:
+        """열린 구간을 datetime 최솟값/최댓값으로 채운 날짜 구간"""
+        return query.start or datetime.min, query.end or datetime.max
@@ -1,22 +1,45 @@
 """TODO 비즈니스 로직 계층"""
-from typing import List, Optional
+import heapq
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime
-from models import TodoItem, TodoStatus
-from repositories import TodoRepository
+from models import TodoItem, TodoStatus, TodoQuery, RecurrenceRule, RecurrenceFrequency
+from repositories import BaseTodoRepository, RecurrenceStore, QueryIndex, ColdStore
+from repositories.recurrence import parse_occurrence_id
 from utils import TodoNotFoundError, InvalidTodoError
+from .deadline_scheduler import DeadlineScheduler
+from .query_planner import QueryPlanner, QueryPlan
+
+if TYPE_CHECKING:
+    from utils.dtos import CreateTodoRequest, UpdateTodoRequest
 
 
 class TodoService:
     """TODO 관련 비즈니스 로직을 담당하는 서비스 클래스"""
 
-    def __init__(self, repository: TodoRepository):
+    SORT_OPTIONS = (None, 'date')  # 목록 조회 정렬 기준 (None: 사용자 순서)
+
+    def __init__(self, repository: BaseTodoRepository, scheduler: Optional[DeadlineScheduler] = None,
+                 recurrences: Optional[RecurrenceStore] = None, query_index: Optional[QueryIndex] = None,
+                 archive: Optional[ColdStore] = None):
         """
         서비스 초기화
         
         Args:
-            repository: TodoRepository 인스턴스 (의존성 주입)
+            repository: BaseTodoRepository를 구현한 저장소 (의존성 주입)
+            scheduler: 저장소에 연결된 DeadlineScheduler (없으면 기한 초과 조회 시 전체 검사)
+            recurrences: 반복 TODO 규칙 저장소 (없으면 새로 생성)
+            query_index: 저장소에 연결된 조합 조회용 QueryIndex (없으면 새로 만들어 연결)
+            archive: 오래된 완료 항목을 보관한 ColdStore (없으면 보관 계층 없음)
         """
         self._repository = repository
+        self._scheduler = scheduler
+        self._recurrences = recurrences if recurrences is not None else RecurrenceStore()
+        if query_index is None:
+            query_index = QueryIndex()
+            query_index.attach(repository)
+        self._planner = QueryPlanner(repository, query_index)
+        self._archive = archive
 
     def create_todo(self, content: str, target_date: datetime, 
                     status: TodoStatus = TodoStatus.SCHEDULED) -> TodoItem:
@@ -39,6 +62,27 @@ class TodoService:
         except ValueError as e:
             raise InvalidTodoError(f"TODO 생성 실패: {str(e)}")
 
+    def create_todos(self, requests: Sequence['CreateTodoRequest']) -> List[TodoItem]:
+        """
+        검증을 마친 생성 요청들로 TODO를 주어진 순서대로 생성
+
+        요청 DTO가 TodoItem과 같은 규칙으로 이미 검증했으므로 항목을 다시
+        검증하지 않고 만들어 저장소에 한 번에 추가한다.
+
+        Args:
+            requests: CreateTodoRequest 목록
+
+        Returns:
+            생성된 TodoItem 리스트
+
+        Raises:
+            InvalidTodoError: 저장소가 항목을 받지 않음
+        """
+        try:
+            return self._repository.insert_many([request.to_todo() for request in requests])
+        except ValueError as e:
+            raise InvalidTodoError(f"TODO 생성 실패: {str(e)}")
+
     def get_all_todos(self) -> List[TodoItem]:
         """
         모든 TODO 조회
@@ -48,12 +92,92 @@ class TodoService:
         """
         return self._repository.get_all()
 
+    def get_todos_page(self, offset: int = 0, limit: Optional[int] = None,
+                       sort: Optional[str] = None) -> Tuple[List[TodoItem], int, int]:
+        """
+        TODO 목록의 일부 조회
+
+        항목, 전체 개수, 버전을 모두 같은 시점에서 읽으므로 조회 중에 다른
+        요청이 순서를 바꾸거나 항목을 추가해도 서로 어긋나지 않는다.
+
+        Args:
+            offset: 시작 위치
+            limit: 최대 개수 (기본값: 끝까지)
+            sort: None이면 사용자 순서, 'date'이면 날짜순 보기
+
+        Returns:
+            (TodoItem 리스트, 전체 개수, 버전)
+
+        Raises:
+            InvalidTodoError: offset 또는 limit이 음수이거나 지원하지 않는 sort
+        """
+        self._check_sort(sort)
+        try:
+            if sort == 'date':
+                return self._repository.page_by_date(offset, limit)
+            return self._repository.page(offset, limit)
+        except ValueError as e:
+            raise InvalidTodoError(str(e))
+
+    def get_todos_by_date(self, status: Optional[TodoStatus] = None) -> List[TodoItem]:
+        """
+        사용자 순서를 바꾸지 않고 날짜순으로 TODO 조회
+
+        Args:
+            status: 지정하면 해당 상태만 조회
+
+        Returns:
+            목표 날짜순(같은 날짜는 생성 순) TodoItem 리스트
+        """
+        return self._repository.get_by_date(status)
+
+    def get_todos_in_range(self, start: datetime, end: datetime,
+                           status: Optional[TodoStatus] = None) -> List[TodoItem]:
+        """
+        목표 날짜가 start 이상 end 미만인 TODO를 반복 TODO 회차와 함께 조회
+
+        반복 TODO는 이 구간의 회차만 계산하며, 아직 저장되지 않은 회차는
+        '예정' 상태이고 ID가 회차 ID('<규칙 ID>@<날짜>')이다.
+
+        Args:
+            start: 구간 시작 (포함)
+            end: 구간 끝 (제외)
+            status: 지정하면 해당 상태만 조회
+
+        Returns:
+            목표 날짜순(같은 날짜는 생성 순) TodoItem 리스트
+
+        Raises:
+            InvalidTodoError: start가 end보다 늦음
+        """
+        self._check_range(start, end)
+        todos = self._repository.get_by_date_range(start, end, status)
+        if status is not None and status != TodoStatus.SCHEDULED:
+            return todos
+        occurrences = self._recurrences.occurrences(start, end)
+        return list(heapq.merge(todos, occurrences, key=lambda todo: (todo.target_date, todo.created_at)))
+
+    def query_todos(self, query: TodoQuery) -> Tuple[List[TodoItem], int, QueryPlan]:
+        """
+        상태 집합, 날짜 구간, 내용 검색, 정렬, 페이지를 조합한 TODO 조회
+
+        가장 선택적인 인덱스에서 후보를 가져오며, 저장된 TODO만 대상으로 한다
+        (반복 TODO 회차는 포함하지 않음).
+
+        Args:
+            query: 조회 조건
+
+        Returns:
+            (TodoItem 리스트, 조건을 만족한 전체 개수, 실행 계획)
+        """
+        return self._planner.execute(query)
+
     def get_todo_by_id(self, todo_id: str) -> TodoItem:
         """
-        특정 TODO 조회
+        특정 TODO 조회 (저장되지 않은 반복 TODO 회차와 보관한 항목 포함)
         
         Args:
-            todo_id: TODO ID
+            todo_id: TODO ID 또는 회차 ID
             
         Returns:
             TodoItem
@@ -61,7 +185,9 @@ class TodoService:
         Raises:
             TodoNotFoundError: TODO를 찾을 수 없음
         """
-        todo = self._repository.get_by_id(todo_id)
+        todo = self._repository.get_by_id(todo_id) or self._recurrences.occurrence(todo_id)
+        if not todo and self._archive is not None:
+            todo = self._archive.get(todo_id)
         if not todo:
             raise TodoNotFoundError(f"ID '{todo_id}'인 TODO를 찾을 수 없습니다")
         return todo
@@ -78,14 +204,34 @@ class TodoService:
         """
         return self._repository.get_by_status(status)
 
+    def get_overdue_todos(self) -> List[TodoItem]:
+        """
+        목표 날짜가 지난 미완료 TODO 조회
+
+        Returns:
+            목표 날짜 순 TodoItem 리스트
+        """
+        if self._scheduler is not None:
+            return self._scheduler.overdue()
+        now = datetime.now()
+        return sorted(
+            (todo for todo in self._repository.get_all()
+             if todo.status != TodoStatus.COMPLETED and todo.target_date <= now),
+            key=lambda todo: todo.target_date
+        )
+
     def update_todo(self, todo_id: str, content: Optional[str] = None,
                     target_date: Optional[datetime] = None,
                     status: Optional[TodoStatus] = None) -> TodoItem:
         """
         TODO 수정
+
+        반복 TODO 회차를 수정(완료 포함)하면 수정한 값으로 일반 TODO가 새로
+        저장되고 새 ID를 가진 TodoItem이 반환된다. 이후 그 회차는 계산하지 않는다.
+        보관한 항목을 수정하면 목록 맨 뒤로 되돌린 뒤 수정한다.
         
         Args:
-            todo_id: TODO ID
+            todo_id: TODO ID 또는 회차 ID
             content: 새로운 내용 (선택사항)
             target_date: 새로운 목표 날짜 (선택사항)
             status: 새로운 상태 (선택사항)
@@ -98,19 +244,56 @@ class TodoService:
             InvalidTodoError: 유효하지 않은 입력
         """
         try:
-            todo = self._repository.update(todo_id, content, target_date, status)
-            if not todo:
-                raise TodoNotFoundError(f"ID '{todo_id}'인 TODO를 찾을 수 없습니다")
-            return todo
+            if parse_occurrence_id(todo_id) is not None:
+                return self._materialize(todo_id, content, target_date, status)
+            return self._update_stored(
+                todo_id, lambda: self._repository.update(todo_id, content, target_date, status)
+            )
         except ValueError as e:
             raise InvalidTodoError(f"TODO 수정 실패: {str(e)}")
 
+    def apply_update(self, todo_id: str, request: 'UpdateTodoRequest') -> TodoItem:
+        """
+        검증을 마친 수정 요청으로 TODO 수정
+
+        요청 DTO가 바꾸는 필드를 TodoItem과 같은 규칙으로 이미 검증했으므로
+        저장소가 변경을 다시 검증하지 않고 적용한다. 회차와 보관한 항목은
+        update_todo()와 같이 처리한다.
+
+        Args:
+            todo_id: TODO ID 또는 회차 ID
+            request: UpdateTodoRequest
+
+        Returns:
+            수정된 TodoItem
+
+        Raises:
+            TodoNotFoundError: TODO를 찾을 수 없음
+            InvalidTodoError: 유효하지 않은 입력
+        """
+        if parse_occurrence_id(todo_id) is not None:
+            return self.update_todo(todo_id, request.content, request.target_date, request.status)
+        changes = request.changes()
+        try:
+            return self._update_stored(todo_id, lambda: self._repository.apply_update(todo_id, changes))
+        except ValueError as e:
+            raise InvalidTodoError(f"TODO 수정 실패: {str(e)}")
+
+    def _update_stored(self, todo_id: str, update: Callable[[], Optional[TodoItem]]) -> TodoItem:
+        """저장소의 항목을 update()로 수정 (보관한 항목이면 되돌린 뒤 수정)"""
+        todo = update()
+        if not todo and self._unarchive(todo_id):
+            todo = update()
+        if not todo:
+            raise TodoNotFoundError(f"ID '{todo_id}'인 TODO를 찾을 수 없습니다")
+        return todo
+
     def delete_todo(self, todo_id: str) -> bool:
         """
         TODO 삭제
         
         Args:
-            todo_id: TODO ID
+            todo_id: TODO ID 또는 회차 ID (회차는 그 회차만 삭제)
             
         Returns:
             성공 여부
@@ -118,26 +301,129 @@ class TodoService:
         Raises:
             TodoNotFoundError: TODO를 찾을 수 없음
         """
-        if not self._repository.delete(todo_id):
+        if parse_occurrence_id(todo_id) is not None:
+            if not self._recurrences.skip(todo_id):
+                raise TodoNotFoundError(f"ID '{todo_id}'인 TODO를 찾을 수 없습니다")
+            return True
+        # 보관한 항목은 저장소로 되돌린 뒤 지워야 톰스톤과 변경 이벤트가 남아 복구할 수 있음
+        if not self._repository.delete(todo_id) and not (self._unarchive(todo_id) and self._repository.delete(todo_id)):
             raise TodoNotFoundError(f"ID '{todo_id}'인 TODO를 찾을 수 없습니다")
         return True
 
-    def get_statistics(self) -> dict:
+    def _unarchive(self, todo_id: str) -> bool:
+        """보관한 항목을 저장소 맨 뒤로 되돌림 (보관한 항목이 아니면 False)"""
+        todo = self._archive.get(todo_id) if self._archive is not None else None
+        if todo is None:
+            return False
+        try:
+            self._repository.insert(todo)
+        except ValueError:
+            pass  # 동시에 온 다른 요청이 먼저 되돌림
+        self._archive.delete(todo_id)
+        return True
+
+    def restore_todo(self, todo_id: str) -> TodoItem:
         """
-        TODO 통계 조회
+        삭제한 TODO 복구 (삭제 후 복구 가능 시간 이내)
+
+        Args:
+            todo_id: TODO ID
+
+        Returns:
+            복구된 TodoItem
+
+        Raises:
+            TodoNotFoundError: 복구할 수 있는 삭제 항목이 없음
+        """
+        todo = self._repository.restore(todo_id)
+        if todo is None:
+            raise TodoNotFoundError(f"ID '{todo_id}'인 삭제된 TODO를 복구할 수 없습니다")
+        return todo
+
+    def get_statistics(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> dict:
+        """
+        TODO 통계 조회 (보관한 항목은 완료 개수에 포함)
         
+        Args:
+            start, end: 지정하면 목표 날짜가 이 구간인 TODO와 반복 TODO 회차만 집계
+
         Returns:
             통계 정보 딕셔너리
+
+        Raises:
+            InvalidTodoError: start와 end 중 하나만 지정했거나 start가 end보다 늦음
         """
-        all_todos = self.get_all_todos()
-        
+        if start is None and end is None:
+            # 같은 시점에서 세어 합계와 상태별 개수가 항상 일치하도록 함
+            return self._statistics(*self._repository.count_by_status())
+        self._check_range(start, end)
+        todos = self._repository.get_by_date_range(start, end)
+        counts = Counter(todo.status for todo in todos)
+        occurrences = self._recurrences.count(start, end)  # 회차는 모두 '예정'
+        counts[TodoStatus.SCHEDULED] += occurrences
+        archived = self._archive.count_in_range(start, end) if self._archive is not None else 0
+        return self._statistics(len(todos) + occurrences, counts, archived)
+
+    def get_bootstrap(self, limit: int) -> dict:
+        """
+        첫 화면에 필요한 목록 첫 페이지와 통계 조회
+
+        목록과 통계를 저장소를 한 번 읽어 함께 계산하므로 첫 화면의 목록과
+        통계가 서로 다른 시점을 보여 주지 않는다.
+
+        Args:
+            limit: 목록 첫 페이지 크기
+
+        Returns:
+            {'todos': TodoItem 리스트, 'total': 전체 개수, 'version': 버전, 'stats': 통계}
+
+        Raises:
+            InvalidTodoError: limit이 음수
+        """
+        try:
+            todos, total, counts, version = self._repository.page_with_counts(limit)
+        except ValueError as e:
+            raise InvalidTodoError(str(e))
+        return {'todos': todos, 'total': total, 'version': version, 'stats': self._statistics(total, counts)}
+
+    def _statistics(self, total: int, counts: Dict[str, int], archived: Optional[int] = None) -> dict:
+        """전체 개수와 상태별 개수로 통계 응답 구성 (archived: 보관한 항목 수, 기본값은 전체)"""
+        if archived is None:
+            archived = len(self._archive) if self._archive is not None else 0
         return {
-            'total': len(all_todos),
-            'scheduled': len(self.get_todos_by_status(TodoStatus.SCHEDULED)),
-            'in_progress': len(self.get_todos_by_status(TodoStatus.IN_PROGRESS)),
-            'completed': len(self.get_todos_by_status(TodoStatus.COMPLETED))
+            'total': total + archived,
+            'scheduled': counts.get(TodoStatus.SCHEDULED, 0),
+            'in_progress': counts.get(TodoStatus.IN_PROGRESS, 0),
+            'completed': counts.get(TodoStatus.COMPLETED, 0) + archived
         }
 
+    def get_archived_page(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[List[TodoItem], int]:
+        """
+        보관한 완료 항목을 보관 순서로 일부 조회
+
+        Returns:
+            (TodoItem 리스트, 보관한 전체 개수)
+
+        Raises:
+            InvalidTodoError: offset이나 limit이 음수
+        """
+        if self._archive is None:
+            return [], 0
+        try:
+            return self._archive.page(offset, limit)
+        except ValueError as e:
+            raise InvalidTodoError(str(e))
+
+    def get_archived_count(self) -> int:
+        """보관한 완료 항목 수"""
+        return len(self._archive) if self._archive is not None else 0
+
+    def export_todos(self) -> Iterator[TodoItem]:
+        """모든 TODO를 하나씩 (사용자 순서의 저장소 항목 다음에 보관 순서의 보관 항목)"""
+        yield from self._repository.get_all()
+        if self._archive is not None:
+            yield from self._archive.iter_all()
+
     def reorder_todos(self, order: List[str]) -> None:
         """
         TODO 순서 변경
@@ -147,9 +433,48 @@ class TodoService:
         """
         self._repository.set_order(order)
 
+    def move_todo(self, todo_id: str, before: Optional[str] = None,
+                  after: Optional[str] = None, position: Optional[int] = None) -> int:
+        """
+        TODO 하나의 순서 이동
+
+        before, after, position 중 정확히 하나를 지정해야 한다. 이동은 요청이
+        도착한 순서대로 적용되며, 기준 항목의 적용 시점 위치를 기준으로 한다.
+        
+        Args:
+            todo_id: 이동할 TODO ID
+            before: 이 ID 바로 앞으로 이동
+            after: 이 ID 바로 뒤로 이동
+            position: 이 위치(0부터 시작)로 이동
+            
+        Returns:
+            이동 후 위치
+            
+        Raises:
+            TodoNotFoundError: TODO 또는 기준 TODO를 찾을 수 없음
+            InvalidTodoError: 이동 대상 지정 오류
+        """
+        targets = [value for value in (before, after, position) if value is not None]
+        if len(targets) != 1:
+            raise InvalidTodoError("before, after, position 중 하나만 지정해야 합니다")
+        if position is not None and (isinstance(position, bool) or not isinstance(position, int)):
+            raise InvalidTodoError("position은 정수여야 합니다")
+
+        if before is not None:
+            index = self._repository.move_before(todo_id, before)
+        elif after is not None:
+            index = self._repository.move_after(todo_id, after)
+        else:
+            index = self._repository.move_to(todo_id, position)
+
+        if index is None:
+            missing = todo_id if self._repository.get_by_id(todo_id) is None else (before or after)
+            raise TodoNotFoundError(f"ID '{missing}'인 TODO를 찾을 수 없습니다")
+        return index
+
     def sort_by_date(self) -> List[TodoItem]:
         """
-        TODO를 날짜순으로 정렬
+        날짜순 보기를 사용자 순서로 저장
         
         Returns:
             정렬된 TodoItem 리스트
@@ -158,8 +483,77 @@ class TodoService:
         return self._repository.get_all()
 
     def clear_all_todos(self) -> None:
-        """모든 TODO 삭제"""
+        """모든 TODO(보관한 항목 포함)와 반복 TODO 규칙 삭제"""
+        if self._archive is not None:
+            self._archive.clear()  # 저장소의 CLEAR 이벤트를 받는 쪽이 보관 항목도 비어 있는 상태를 보도록 먼저 비움
         self._repository.clear_all()
+        self._recurrences.clear()
+
+    def create_recurrence(self, content: str, start: datetime, frequency: RecurrenceFrequency,
+                          interval: int = 1, weekdays: Optional[List[int]] = None,
+                          until: Optional[datetime] = None, count: Optional[int] = None) -> RecurrenceRule:
+        """
+        반복 TODO 규칙 생성 (회차는 조회할 때 계산하므로 TodoItem을 만들지 않음)
+
+        Args:
+            content: 각 회차의 내용
+            start: 첫 회차 날짜
+            frequency: 반복 주기 (daily, weekly, monthly, yearly)
+            interval: 주기 간격 (예: 2면 격주)
+            weekdays: 반복 요일 (0=월요일 ~ 6=일요일)
+            until: 마지막 회차 날짜 (포함)
+            count: 전체 회차 수 (until과 함께 지정할 수 없음)
+
+        Returns:
+            생성된 RecurrenceRule
+
+        Raises:
+            InvalidTodoError: 유효하지 않은 입력
+        """
+        try:
+            rule = RecurrenceRule(content=content, start=start, frequency=frequency, interval=interval,
+                                  weekdays=weekdays, until=until, count=count)
+        except ValueError as e:
+            raise InvalidTodoError(f"반복 TODO 생성 실패: {str(e)}")
+        return self._recurrences.add(rule)
+
+    def get_recurrences(self) -> List[RecurrenceRule]:
+        """
+        반복 TODO 규칙 목록 조회
+
+        Returns:
+            시작 날짜순 RecurrenceRule 리스트
+        """
+        return self._recurrences.get_all()
+
+    def delete_recurrence(self, rule_id: str) -> bool:
+        """
+        반복 TODO 규칙 삭제 (이미 저장된 회차는 일반 TODO로 남음)
+
+        Args:
+            rule_id: 규칙 ID
+
+        Returns:
+            성공 여부
+
+        Raises:
+            TodoNotFoundError: 규칙을 찾을 수 없음
+        """
+        if not self._recurrences.remove(rule_id):
+            raise TodoNotFoundError(f"ID '{rule_id}'인 반복 TODO를 찾을 수 없습니다")
+        return True
+
+    def _materialize(self, todo_id: str, content: Optional[str],
+                     target_date: Optional[datetime], status: Optional[TodoStatus]) -> TodoItem:
+        """반복 TODO 회차를 수정한 값으로 저장"""
+        todo = self._recurrences.materialize(todo_id, lambda rule, when: self._repository.create(
+            content if content is not None else rule.content,
+            target_date if target_date is not None else when,
+            status if status is not None else TodoStatus.SCHEDULED
+        ))
+        if todo is None:
+            raise TodoNotFoundError(f"ID '{todo_id}'인 TODO를 찾을 수 없습니다")
+        return todo
 
     def get_todo_count(self) -> int:
         """
@@ -169,3 +563,16 @@ class TodoService:
             TODO 개수
         """
         return self._repository.count()
+
+    @staticmethod
+    def _check_range(start: Optional[datetime], end: Optional[datetime]) -> None:
+        """날짜 구간 확인 (둘 다 있어야 하고 start <= end)"""
+        if start is None or end is None:
+            raise InvalidTodoError("start와 end를 함께 지정해야 합니다")
+        if start > end:
+            raise InvalidTodoError("start는 end보다 늦을 수 없습니다")
+
+    def _check_sort(self, sort: Optional[str]) -> None:
+        """지원하는 정렬 기준인지 확인"""
+        if sort not in self.SORT_OPTIONS:
+            raise InvalidTodoError(f"지원하지 않는 정렬 기준: {sort}")
@@ -3,6 +3,7 @@
 // ========================================
 
 let currentFilter = 'all';
+let dateView = false; // 날짜순 보기 (사용자 순서는 그대로 유지)
 let currentEditId = null;
 
 // ========================================
@@ -29,12 +30,34 @@ const cancelEditBtn = document.getElementById('cancel-edit');
 // ========================================
 
 document.addEventListener('DOMContentLoaded', () => {
-    loadTodos();
-    updateStats();
     setupEventListeners();
     setDefaultDate();
+
+    // 서버가 페이지에 넣어 준 첫 화면 데이터가 있으면 요청 없이 바로 표시
+    const bootstrap = readBootstrap();
+    if (bootstrap) {
+        renderTodos(bootstrap.todos);
+        showStats(bootstrap.stats);
+        if (bootstrap.total > bootstrap.todos.length) {
+            loadTodos();  // 나머지 항목은 화면을 그린 뒤 불러옴
+        }
+    } else {
+        loadTodos();
+        updateStats();
+    }
 });
 
+function readBootstrap() {
+    const element = document.getElementById('bootstrap-data');
+    if (!element) return null;
+    try {
+        return JSON.parse(element.textContent);
+    } catch (error) {
+        console.error('Error reading bootstrap data:', error);
+        return null;
+    }
+}
+
 // ========================================
 // 기본 날짜 설정 (내일)
 // ========================================
@@ -66,6 +89,7 @@ function setupEventListeners() {
             filterTabs.forEach(t => t.classList.remove('active'));
             e.target.classList.add('active');
             currentFilter = e.target.dataset.filter;
+            todoList.scrollTop = 0;
             loadTodos();
         });
     });
@@ -73,6 +97,16 @@ function setupEventListeners() {
     // 날짜순 정렬 버튼
     sortDateBtn.addEventListener('click', handleSortByDate);
 
+    // 스크롤/크기 변경 시 보이는 구간만 다시 그림
+    todoList.addEventListener('scroll', scheduleRender);
+    window.addEventListener('resize', () => {
+        rowPitch = 0;  // 행 높이 다시 측정
+        scheduleRender();
+    });
+
+    // 드래그-앤-드롭 (목록 컨테이너에 위임)
+    setupDragAndDrop();
+
     // 모달 닫기
     closeModalBtn.addEventListener('click', closeModal);
     cancelEditBtn.addEventListener('click', closeModal);
@@ -106,7 +140,8 @@ async function handleAddTodo(e) {
         const response = await fetch('/api/todos', {
             method: 'POST',
             headers: {
-                'Content-Type': 'application/json'
+                'Content-Type': 'application/json',
+                'Idempotency-Key': crypto.randomUUID()
             },
             body: JSON.stringify(newTodo)
         });
@@ -114,7 +149,7 @@ async function handleAddTodo(e) {
         if (response.ok) {
             todoForm.reset();
             setDefaultDate();
-            loadTodos();
+            upsertTodo(await response.json());
             updateStats();
         } else {
             const error = await response.json();
@@ -127,28 +162,15 @@ async function handleAddTodo(e) {
 }
 
 // ========================================
-// TODO 날짜순 정렬
+// TODO 날짜순 보기
 // ========================================
 
-async function handleSortByDate() {
-    try {
-        const response = await fetch('/api/todos/sort/date', {
-            method: 'PUT',
-            headers: {
-                'Content-Type': 'application/json'
-            }
-        });
-
-        if (response.ok) {
-            loadTodos();
-            updateStats();
-        } else {
-            alert('정렬에 실패했습니다.');
-        }
-    } catch (error) {
-        console.error('Error sorting todos:', error);
-        alert('정렬 중 오류가 발생했습니다.');
-    }
+function handleSortByDate() {
+    // 서버에 저장된 순서를 바꾸지 않고 날짜순 보기만 켜고 끔
+    dateView = !dateView;
+    sortDateBtn.classList.toggle('active', dateView);
+    todoList.scrollTop = 0;
+    loadTodos();
 }
 
 // ========================================
@@ -158,11 +180,13 @@ async function handleSortByDate() {
 async function loadTodos() {
     try {
         let url = `/api/todos/${currentFilter}`;
+        if (dateView) url += '?sort=date';
         const response = await fetch(url);
 
         if (!response.ok) throw new Error('Failed to load todos');
 
         const todos = await response.json();
+        resetArchive(Number(response.headers.get('X-Archived-Count')) || 0);
         renderTodos(todos);
     } catch (error) {
         console.error('Error loading todos:', error);
@@ -171,39 +195,216 @@ async function loadTodos() {
 }
 
 // ========================================
-// TODO 렌더링
+// TODO 렌더링 (가상 스크롤)
 // ========================================
 
-function renderTodos(todos) {
+// 전체 목록은 todos에만 두고, 스크롤 위치 주변의 행만 DOM으로 만든다.
+// 행은 ID를 키로 재사용하므로 생성/수정/삭제 후에도 바뀐 행만 다시 그린다.
+const OVERSCAN = 8;             // 화면 위아래로 미리 그려 둘 행 수
+const DEFAULT_ROW_PITCH = 100;  // 첫 행을 측정하기 전의 행 간격 추정값(px)
+
+let todos = [];                 // 현재 필터/정렬의 전체 목록
+const rowNodes = new Map();     // 그려진 행: TODO ID -> DOM 요소
+let rowPitch = 0;               // 행 높이 + 행 사이 간격 (처음 그린 행에서 측정)
+let renderPending = false;
+
+const todoWindow = document.createElement('div');
+todoWindow.className = 'todo-window';
+
+// 보관한 완료 항목은 완료 필터에서 목록 끝에 닿을 때 페이지씩 불러와 뒤에 붙인다.
+// (날짜순 보기에서도 보관 순서로 맨 뒤에 붙으며, 보관 항목은 순서를 바꿀 수 없다)
+const ARCHIVE_PAGE_SIZE = 100;
+const archivedIds = new Set();  // 불러온 보관 항목 ID
+let archiveOffset = 0;          // 다음에 불러올 보관 항목 위치
+let archiveTotal = 0;           // 보관 항목 전체 개수
+let archiveLoading = false;
+let archiveGeneration = 0;      // 목록을 다시 불러오면 늘려 이전 요청의 응답을 버림
+
+function renderTodos(list) {
+    todos = list;
+    renderWindow();
+}
+
+function scheduleRender() {
+    if (renderPending) return;
+    renderPending = true;
+    requestAnimationFrame(() => {
+        renderPending = false;
+        renderWindow();
+    });
+}
+
+function renderWindow() {
     if (todos.length === 0) {
+        rowNodes.clear();
+        todoWindow.replaceChildren();
         todoList.innerHTML = '<div class="empty-state"><div class="empty-state-icon">📋</div><div class="empty-state-text">TODO가 없습니다.</div></div>';
+        loadMoreArchived();
         return;
     }
+    if (todoWindow.parentNode !== todoList) {
+        todoList.replaceChildren(todoWindow);
+    }
 
-    todoList.innerHTML = todos.map(todo => {
-        const targetDate = new Date(todo.target_date);
-        const formattedDate = formatDate(targetDate);
-        const statusClass = getStatusClass(todo.status);
-
-        return `
-            <div class="todo-item ${statusClass}" draggable="true" data-todo-id="${todo.id}" data-todo-content="${escapeHtml(todo.content)}" data-todo-date="${todo.target_date}" data-todo-status="${todo.status}">
-                <div class="todo-info">
-                    <div class="todo-content">${escapeHtml(todo.content)}</div>
-                    <div class="todo-meta">
-                        <div class="todo-date">📅 ${formattedDate}</div>
-                        <span class="todo-status ${statusClass}">${todo.status}</span>
-                    </div>
-                </div>
-                <div class="todo-actions">
-                    <button class="todo-btn edit-btn" onclick="openEditModal('${todo.id}')">편집</button>
-                    <button class="todo-btn delete-btn" onclick="deleteTodo('${todo.id}')">삭제</button>
-                </div>
+    // 스크롤 위치로 그릴 구간 계산
+    const pitch = rowPitch || DEFAULT_ROW_PITCH;
+    const first = Math.max(0, Math.floor(todoList.scrollTop / pitch) - OVERSCAN);
+    const last = Math.min(todos.length, first + Math.ceil(todoList.clientHeight / pitch) + 2 * OVERSCAN);
+    if (last >= todos.length - OVERSCAN) loadMoreArchived();
+
+    // 구간 밖으로 나간 행 제거 (드래그 중인 행은 드래그가 끝날 때까지 유지)
+    const inWindow = new Set();
+    for (let i = first; i < last; i++) inWindow.add(todos[i].id);
+    rowNodes.forEach((node, id) => {
+        if (inWindow.has(id)) {
+            node.classList.remove('offscreen');
+        } else if (id === draggedId) {
+            node.classList.add('offscreen');
+        } else {
+            node.remove();
+            rowNodes.delete(id);
+        }
+    });
+
+    // 구간 안의 행을 순서대로 배치 (새 행만 만들고, 바뀐 행만 다시 그림)
+    let cursor = todoWindow.firstChild;
+    for (let i = first; i < last; i++) {
+        const todo = todos[i];
+        let node = rowNodes.get(todo.id);
+        if (!node) {
+            node = document.createElement('div');
+            rowNodes.set(todo.id, node);
+        }
+        if (node.dataset.rev !== rowRevision(todo)) {
+            fillRow(node, todo);
+        }
+        if (node === cursor) {
+            cursor = cursor.nextSibling;
+        } else {
+            todoWindow.insertBefore(node, cursor);
+        }
+    }
+
+    todoWindow.style.paddingTop = `${first * pitch}px`;
+    todoWindow.style.paddingBottom = `${(todos.length - last) * pitch}px`;
+
+    if (!rowPitch) {
+        const gap = parseFloat(getComputedStyle(todoWindow).rowGap) || 0;
+        rowPitch = todoWindow.firstElementChild.offsetHeight + gap;
+        if (rowPitch) scheduleRender();
+    }
+}
+
+function resetArchive(total) {
+    archivedIds.clear();
+    archiveOffset = 0;
+    archiveTotal = total;
+    archiveLoading = false;
+    archiveGeneration++;
+}
+
+async function loadMoreArchived() {
+    if (archiveLoading || archiveOffset >= archiveTotal) return;
+    archiveLoading = true;
+    const generation = archiveGeneration;
+    try {
+        const response = await fetch(`/api/archive?offset=${archiveOffset}&limit=${ARCHIVE_PAGE_SIZE}`);
+        if (!response.ok) throw new Error('Failed to load archived todos');
+        const page = await response.json();
+        if (generation !== archiveGeneration) return;
+
+        archiveOffset += page.length;
+        archiveTotal = page.length ? Number(response.headers.get('X-Total-Count')) : archiveOffset;
+        page.forEach(todo => archivedIds.add(todo.id));
+        todos.push(...page);
+        archiveLoading = false;
+        renderWindow();
+    } catch (error) {
+        console.error('Error loading archived todos:', error);
+        if (generation === archiveGeneration) archiveTotal = archiveOffset;  // 다시 불러오기 전까지 중단
+    }
+}
+
+function forgetArchived(todoId) {
+    // 수정하면 서버가 목록으로 되돌리고, 삭제하면 보관 계층에서 지우므로 다음 페이지 위치가 하나 당겨짐
+    if (!archivedIds.delete(todoId)) return;
+    archiveOffset--;
+    archiveTotal--;
+}
+
+function rowRevision(todo) {
+    return `${todo.updated_at}|${dateView}`;
+}
+
+function fillRow(node, todo) {
+    const formattedDate = formatDate(new Date(todo.target_date));
+    const statusClass = getStatusClass(todo.status);
+
+    const archived = archivedIds.has(todo.id);
+    node.className = `todo-item ${statusClass}${archived ? ' archived' : ''}`;
+    node.draggable = !dateView && !archived;
+    node.dataset.todoId = todo.id;
+    node.dataset.rev = rowRevision(todo);
+    node.innerHTML = `
+        <div class="todo-info">
+            <div class="todo-content">${escapeHtml(todo.content)}</div>
+            <div class="todo-meta">
+                <div class="todo-date">📅 ${formattedDate}</div>
+                <span class="todo-status ${statusClass}">${todo.status}</span>
             </div>
-        `;
-    }).join('');
-    
-    // 드래그-앤-드롭 이벤트 리스너 설정
-    setupDragAndDrop();
+        </div>
+        <div class="todo-actions">
+            <button class="todo-btn edit-btn" onclick="openEditModal('${todo.id}')">편집</button>
+            <button class="todo-btn delete-btn" onclick="deleteTodo('${todo.id}')">삭제</button>
+        </div>
+    `;
+}
+
+// ========================================
+// 목록 부분 갱신 (다시 불러오지 않고 응답으로 반영)
+// ========================================
+
+function matchesFilter(todo) {
+    return currentFilter === 'all' || todo.status === currentFilter;
+}
+
+function compareByDate(a, b) {
+    if (a.target_date !== b.target_date) return a.target_date < b.target_date ? -1 : 1;
+    if (a.created_at !== b.created_at) return a.created_at < b.created_at ? -1 : 1;
+    return 0;
+}
+
+function upsertTodo(todo) {
+    forgetArchived(todo.id);
+    const index = todos.findIndex(t => t.id === todo.id);
+    if (index !== -1) todos.splice(index, 1);
+
+    if (matchesFilter(todo)) {
+        if (dateView) {
+            // 이진 탐색으로 날짜순 위치에 삽입 (같은 날짜는 뒤에)
+            let low = 0;
+            let high = todos.length;
+            while (low < high) {
+                const mid = (low + high) >> 1;
+                if (compareByDate(todos[mid], todo) <= 0) low = mid + 1;
+                else high = mid;
+            }
+            todos.splice(low, 0, todo);
+        } else if (index !== -1) {
+            todos.splice(index, 0, todo);
+        } else {
+            todos.push(todo);
+        }
+    }
+    renderWindow();
+}
+
+function removeTodo(todoId) {
+    forgetArchived(todoId);
+    const index = todos.findIndex(t => t.id === todoId);
+    if (index === -1) return;
+    todos.splice(index, 1);
+    renderWindow();
 }
 
 // ========================================
@@ -219,7 +420,7 @@ async function deleteTodo(todoId) {
         });
 
         if (response.ok) {
-            loadTodos();
+            removeTodo(todoId);
             updateStats();
         } else {
             alert('오류: TODO를 삭제할 수 없습니다.');
@@ -238,22 +439,18 @@ async function openEditModal(todoId) {
     currentEditId = todoId;
 
     try {
-        // DOM에서 TODO 데이터 찾기
-        const todoElement = document.querySelector(`[data-todo-id="${todoId}"]`);
+        // 목록 모델에서 TODO 데이터 찾기
+        const todo = todos.find(t => t.id === todoId);
         
-        if (!todoElement) {
-            throw new Error('TODO element not found');
+        if (!todo) {
+            throw new Error('TODO not found');
         }
 
-        const content = todoElement.getAttribute('data-todo-content');
-        const targetDateStr = todoElement.getAttribute('data-todo-date');
-        const status = todoElement.getAttribute('data-todo-status');
-
-        editContent.value = content;
-        editStatus.value = status;
+        editContent.value = todo.content;
+        editStatus.value = todo.status;
 
         // datetime-local 형식으로 변환
-        const targetDate = new Date(targetDateStr);
+        const targetDate = new Date(todo.target_date);
         const year = targetDate.getFullYear();
         const month = String(targetDate.getMonth() + 1).padStart(2, '0');
         const date = String(targetDate.getDate()).padStart(2, '0');
@@ -307,7 +504,7 @@ async function handleEditTodo(e) {
 
         if (response.ok) {
             closeModal();
-            loadTodos();
+            upsertTodo(await response.json());
             updateStats();
         } else {
             const error = await response.json();
@@ -328,103 +525,109 @@ async function updateStats() {
         const response = await fetch('/api/stats');
         if (!response.ok) throw new Error('Failed to load stats');
 
-        const stats = await response.json();
-
-        document.getElementById('stat-total').textContent = stats.total;
-        document.getElementById('stat-scheduled').textContent = stats.scheduled;
-        document.getElementById('stat-in-progress').textContent = stats.in_progress;
-        document.getElementById('stat-completed').textContent = stats.completed;
+        showStats(await response.json());
     } catch (error) {
         console.error('Error loading stats:', error);
     }
 }
 
+function showStats(stats) {
+    document.getElementById('stat-total').textContent = stats.total;
+    document.getElementById('stat-scheduled').textContent = stats.scheduled;
+    document.getElementById('stat-in-progress').textContent = stats.in_progress;
+    document.getElementById('stat-completed').textContent = stats.completed;
+}
+
 // ========================================
 // 드래그-앤-드롭 기능
 // ========================================
 
-let draggedElement = null;
+// 행은 스크롤에 따라 다시 만들어지므로 이벤트는 목록 컨테이너에 한 번만 등록
+let draggedId = null;
 
 function setupDragAndDrop() {
-    const todoItems = document.querySelectorAll('.todo-item');
-    
-    todoItems.forEach(item => {
-        item.addEventListener('dragstart', handleDragStart);
-        item.addEventListener('dragend', handleDragEnd);
-        item.addEventListener('dragover', handleDragOver);
-        item.addEventListener('drop', handleDrop);
-        item.addEventListener('dragenter', handleDragEnter);
-        item.addEventListener('dragleave', handleDragLeave);
-    });
+    todoList.addEventListener('dragstart', handleDragStart);
+    todoList.addEventListener('dragend', handleDragEnd);
+    todoList.addEventListener('dragover', handleDragOver);
+    todoList.addEventListener('drop', handleDrop);
+    todoList.addEventListener('dragenter', handleDragEnter);
+    todoList.addEventListener('dragleave', handleDragLeave);
 }
 
 function handleDragStart(e) {
-    draggedElement = this;
-    this.classList.add('dragging');
+    const item = e.target.closest('.todo-item');
+    if (!item) return;
+    draggedId = item.dataset.todoId;
+    item.classList.add('dragging');
     e.dataTransfer.effectAllowed = 'move';
-    e.dataTransfer.setData('text/html', this.innerHTML);
+    e.dataTransfer.setData('text/plain', draggedId);
 }
 
 function handleDragEnd(e) {
-    this.classList.remove('dragging');
-    
-    // 모든 todo-item에서 drag-over 클래스 제거
+    draggedId = null;
+
+    // 모든 todo-item에서 드래그 표시 제거
     document.querySelectorAll('.todo-item').forEach(item => {
-        item.classList.remove('drag-over');
+        item.classList.remove('drag-over', 'dragging');
     });
+    renderWindow();  // 화면 밖으로 나간 채 유지하던 행 정리
 }
 
 function handleDragOver(e) {
     e.preventDefault();
     e.dataTransfer.dropEffect = 'move';
+
+    // 목록 위/아래 끝 근처에서는 자동 스크롤
+    const rect = todoList.getBoundingClientRect();
+    const edge = 40;
+    if (e.clientY < rect.top + edge) todoList.scrollTop -= 20;
+    else if (e.clientY > rect.bottom - edge) todoList.scrollTop += 20;
     return false;
 }
 
 function handleDragEnter(e) {
-    if (this !== draggedElement) {
-        this.classList.add('drag-over');
+    const item = e.target.closest('.todo-item');
+    if (item && item.dataset.todoId !== draggedId) {
+        item.classList.add('drag-over');
     }
 }
 
 function handleDragLeave(e) {
-    this.classList.remove('drag-over');
+    const item = e.target.closest('.todo-item');
+    if (item && !item.contains(e.relatedTarget)) {
+        item.classList.remove('drag-over');
+    }
 }
 
 async function handleDrop(e) {
     e.preventDefault();
     e.stopPropagation();
-    
-    if (this === draggedElement) {
+
+    const target = e.target.closest('.todo-item');
+    if (!target || draggedId === null || target.dataset.todoId === draggedId || archivedIds.has(target.dataset.todoId)) {
         return false;
     }
-    
-    // 드래그된 요소와 드롭 위치 요소 교환
-    const todoContainer = document.getElementById('todo-list');
-    const allItems = Array.from(todoContainer.querySelectorAll('.todo-item'));
-    
-    const draggedIndex = allItems.indexOf(draggedElement);
-    const targetIndex = allItems.indexOf(this);
-    
-    // DOM에서 위치 교환
-    if (draggedIndex < targetIndex) {
-        draggedElement.parentNode.insertBefore(draggedElement, this.nextSibling);
-    } else {
-        draggedElement.parentNode.insertBefore(draggedElement, this);
-    }
-    
-    // 새로운 순서 정보 저장
-    const newOrder = Array.from(todoContainer.querySelectorAll('.todo-item')).map(item => item.getAttribute('data-todo-id'));
-    
-    // 백엔드에 순서 업데이트 요청
+
+    // 목록 모델에서 이동 후 보이는 구간만 다시 배치 (기준 항목의 앞/뒤)
+    const targetId = target.dataset.todoId;
+    const draggedIndex = todos.findIndex(t => t.id === draggedId);
+    const targetIndex = todos.findIndex(t => t.id === targetId);
+    const [dragged] = todos.splice(draggedIndex, 1);
+    todos.splice(targetIndex, 0, dragged);  // 아래로 옮기면 기준 뒤, 위로 옮기면 기준 앞
+    const move = draggedIndex < targetIndex ? { after: targetId } : { before: targetId };
+    target.classList.remove('drag-over');
+    renderWindow();
+
+    // 백엔드에 이동한 항목 하나만 전송
     try {
-        const response = await fetch('/api/todos/reorder', {
-            method: 'PUT',
+        const response = await fetch(`/api/todos/${dragged.id}/move`, {
+            method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
             },
-            body: JSON.stringify({ order: newOrder })
+            body: JSON.stringify(move)
         });
-        
+
         if (!response.ok) {
             console.error('Failed to update order');
             loadTodos(); // 실패 시 다시 로드
@@ -433,7 +636,7 @@ async function handleDrop(e) {
         console.error('Error updating order:', error);
         loadTodos();
     }
-    
+
     return false;
 }
 
@@ -0,0 +1,127 @@
+import threading
+import pytest
+from app import TodoApp
+from utils.admission import AdmissionController, ConcurrencyLimiter, RateLimiter
+
+
+class TestRateLimiter:
+    """토큰 버킷 테스트"""
+
+    def test_burst_then_refill(self):
+        """버킷 크기만큼 허용 후 경과 시간만큼 다시 허용"""
+        now = [0.0]
+        limiter = RateLimiter(rate=2, burst=3, clock=lambda: now[0])
+
+        assert [limiter.acquire('a') for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.acquire('a') == pytest.approx(0.5)
+        assert limiter.acquire('b') == 0.0  # 클라이언트별 버킷
+
+        now[0] = 0.5
+        assert limiter.acquire('a') == 0.0
+        assert limiter.acquire('a') > 0
+
+    def test_client_count_is_bounded(self):
+        """오래 쓰지 않은 클라이언트부터 제거"""
+        limiter = RateLimiter(rate=1, burst=1, max_clients=2, clock=lambda: 0.0)
+        for client in 'abc':
+            limiter.acquire(client)
+
+        assert list(limiter._buckets) == ['b', 'c']
+
+
+class TestConcurrencyLimiter:
+    """동시 실행 제한 테스트"""
+
+    def test_queue_full_is_rejected_immediately(self):
+        """대기열이 없으면 즉시 거절"""
+        limiter = ConcurrencyLimiter(limit=1, max_queue=0)
+
+        assert limiter.acquire() == (True, 0.0)
+        assert limiter.acquire() == (False, 0.0)
+        limiter.release()
+        assert limiter.acquire()[0] is True
+
+    def test_queued_request_waits_for_release(self):
+        """대기열의 요청은 자리가 나면 실행"""
+        limiter = ConcurrencyLimiter(limit=1, max_queue=1, queue_timeout=2.0)
+        limiter.acquire()
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(limiter.acquire()))
+        waiter.start()
+
+        threading.Timer(0.05, limiter.release).start()
+        waiter.join()
+
+        admitted, waited = result[0]
+        assert admitted is True
+        assert waited > 0
+
+    def test_queue_timeout(self):
+        """시간 안에 자리가 나지 않으면 거절"""
+        limiter = ConcurrencyLimiter(limit=1, max_queue=1, queue_timeout=0.01)
+        limiter.acquire()
+
+        admitted, waited = limiter.acquire()
+
+        assert admitted is False
+        assert waited >= 0.01
+
+
+class TestAdmissionRoutes:
+    """엔드포인트 진입 제어 테스트"""
+
+    @pytest.fixture
+    def todo_app(self):
+        todo_app = TodoApp(admin_token='secret', config={
+            'ADMISSION_CLASSES': {
+                'expensive': {'rate': 0.001, 'burst': 2},
+                'list': {'concurrency': 1},
+            },
+        })
+        todo_app.initialize_sample_data()
+        return todo_app
+
+    def test_rate_limited_endpoint(self, todo_app):
+        """버킷을 다 쓰면 429와 Retry-After"""
+        client = todo_app.app.test_client()
+
+        assert client.put('/api/todos/sort/date').status_code == 200
+        assert client.put('/api/todos/sort/date').status_code == 200
+        response = client.put('/api/todos/sort/date')
+
+        assert response.status_code == 429
+        assert int(response.headers['Retry-After']) >= 1
+        # 저렴한 요청은 영향 없음
+        response = client.post('/api/todos', json={'content': '새 항목', 'target_date': '2026-02-01T00:00:00'})
+        assert response.status_code == 201
+
+    def test_concurrency_cap_rejects_with_503(self, todo_app):
+        """동시 실행 자리가 없으면 503"""
+        todo_app.admission.classes['list'].slots.acquire()  # 다른 요청이 실행 중인 상황
+        client = todo_app.app.test_client()
+
+        assert client.get('/api/todos').status_code == 503
+
+        todo_app.admission.classes['list'].release()
+        assert client.get('/api/todos').status_code == 200
+        assert client.get('/api/todos').status_code == 200  # 요청이 끝나면 자리 반납
+
+    def test_metrics_endpoint(self, todo_app):
+        """관리자 지표에 허용/거절 횟수 기록"""
+        client = todo_app.app.test_client()
+        for _ in range(3):
+            client.put('/api/todos/sort/date')
+
+        assert client.get('/api/admin/admission').status_code == 403
+        metrics = client.get('/api/admin/admission', headers={'X-Admin-Token': 'secret'}).get_json()
+
+        assert metrics['expensive']['admitted'] == 2
+        assert metrics['expensive']['rejected']['rate_limited'] == 1
+        assert metrics['list']['queue_wait']['count'] == 0
+
+    def test_unlisted_endpoint_has_no_class(self):
+        """분류에 없는 엔드포인트는 제한하지 않음"""
+        controller = AdmissionController({'list': {'rate': 1, 'burst': 1}}, {'get_todos': 'list'})
+
+        assert controller.get('get_todo') is None
+        assert controller.get('get_todos').name == 'list'
@@ -0,0 +1,171 @@
+import pytest
+from datetime import datetime, timedelta
+from app import TodoApp
+from models import TodoItem, TodoStatus
+from repositories import TodoRepository, ColumnarMirror
+from repositories.events import MutationEvent
+from services import AnalyticsService
+
+
+def make_todo(created_at: datetime, target_date: datetime,
+              status: TodoStatus = TodoStatus.SCHEDULED, updated_at: datetime = None) -> TodoItem:
+    """생성/수정 시각을 지정한 TodoItem"""
+    return TodoItem(
+        content="항목",
+        target_date=target_date,
+        status=status,
+        created_at=created_at,
+        updated_at=updated_at or created_at
+    )
+
+
+class TestColumnarMirror:
+    """ColumnarMirror 동기화 테스트"""
+
+    def test_mirror_follows_repository(self):
+        """생성/수정/삭제/초기화가 컬럼에 반영됨"""
+        repo = TodoRepository()
+        existing = repo.create("기존 항목", datetime(2026, 1, 10))
+        mirror = ColumnarMirror(capacity=1)
+        mirror.attach(repo)
+
+        second = repo.create("새 항목", datetime(2026, 1, 20))
+        repo.update(second.id, status=TodoStatus.COMPLETED)
+        assert sorted(mirror.columns().status.tolist()) == [0, 2]
+
+        repo.delete(existing.id)
+        columns = mirror.columns()
+        assert columns.status.tolist() == [2]
+        assert columns.target_date.tolist() == [int((datetime(2026, 1, 20) - datetime(1970, 1, 1)).total_seconds())]
+
+        repo.clear_all()
+        assert len(mirror.columns()) == 0
+
+    def test_repository_emits_versioned_events(self):
+        """쓰기 작업마다 버전이 증가하는 이벤트 발생"""
+        repo = TodoRepository()
+        events = []
+        repo.add_listener(events.append)
+
+        todo = repo.create("항목", datetime.now())
+        repo.update(todo.id, content="수정")
+        repo.move_to(todo.id, 0)
+        repo.delete(todo.id)
+
+        assert [event.op for event in events] == [
+            MutationEvent.CREATE, MutationEvent.UPDATE, MutationEvent.REORDER, MutationEvent.DELETE
+        ]
+        assert [event.version for event in events] == [1, 2, 3, 4]
+        assert events[1].previous.content == "항목"
+        assert repo.version == 4
+
+
+class TestAnalyticsService:
+    """AnalyticsService 집계 테스트"""
+
+    @pytest.fixture
+    def analytics(self):
+        """시각을 지정한 항목 5개가 있는 통계 서비스"""
+        mirror = ColumnarMirror()
+        todos = [
+            # 2026-01-05(월) 생성, 2시간 뒤 완료
+            make_todo(datetime(2026, 1, 5, 9), datetime(2026, 1, 6), TodoStatus.COMPLETED,
+                      datetime(2026, 1, 5, 11)),
+            # 2026-01-05 생성, 이틀 뒤 완료
+            make_todo(datetime(2026, 1, 5, 10), datetime(2026, 1, 8), TodoStatus.COMPLETED,
+                      datetime(2026, 1, 7, 10)),
+            # 2026-01-07 생성, 기한 초과(2026-01-09, 같은 주)
+            make_todo(datetime(2026, 1, 7), datetime(2026, 1, 9), TodoStatus.IN_PROGRESS),
+            # 2026-01-12 생성, 기한 초과(2026-01-13, 다음 주)
+            make_todo(datetime(2026, 1, 12), datetime(2026, 1, 13)),
+            # 기한이 남은 항목
+            make_todo(datetime(2026, 1, 12), datetime(2026, 2, 1)),
+        ]
+        for sid, todo in enumerate(todos):
+            mirror.apply(MutationEvent(MutationEvent.CREATE, sid + 1, sid, todo))
+        return AnalyticsService(mirror)
+
+    def test_completion_rate_by_day(self, analytics):
+        """일별 생성/완료 개수와 누적 완료율"""
+        report = analytics.completion_rate('day')
+
+        assert report == [
+            {'period_start': '2026-01-05T00:00:00', 'created': 2, 'completed': 1, 'rate': 0.5},
+            {'period_start': '2026-01-07T00:00:00', 'created': 1, 'completed': 1, 'rate': 0.6667},
+            {'period_start': '2026-01-12T00:00:00', 'created': 2, 'completed': 0, 'rate': 0.4},
+        ]
+
+    def test_completion_rate_by_week(self, analytics):
+        """주는 월요일부터 시작"""
+        report = analytics.completion_rate('week')
+
+        assert [row['period_start'] for row in report] == ['2026-01-05T00:00:00', '2026-01-12T00:00:00']
+        assert [row['created'] for row in report] == [3, 2]
+        assert [row['completed'] for row in report] == [2, 0]
+
+    def test_completion_rate_invalid_period(self, analytics):
+        """지원하지 않는 기간 단위는 ValueError"""
+        with pytest.raises(ValueError):
+            analytics.completion_rate('year')
+
+    def test_overdue_by_week(self, analytics):
+        """기한 초과 미완료 항목을 목표 날짜의 주별로 집계"""
+        report = analytics.overdue_by_week(now=datetime(2026, 1, 20))
+
+        assert report == {
+            'total': 2,
+            'weeks': [
+                {'week_start': '2026-01-05T00:00:00', 'count': 1},
+                {'week_start': '2026-01-12T00:00:00', 'count': 1},
+            ],
+        }
+
+    def test_completion_time(self, analytics):
+        """완료 소요 시간 통계와 구간 분포"""
+        report = analytics.completion_time()
+
+        assert report['count'] == 2
+        assert report['mean_hours'] == 25.0
+        assert report['p50_hours'] == 25.0
+        histogram = {row['bucket']: row['count'] for row in report['histogram']}
+        assert histogram['1h-6h'] == 1
+        assert histogram['1d-3d'] == 1
+        assert sum(histogram.values()) == 2
+
+    def test_empty_store(self):
+        """항목이 없어도 동작"""
+        analytics = AnalyticsService(ColumnarMirror())
+
+        assert analytics.completion_rate() == []
+        assert analytics.overdue_by_week() == {'total': 0, 'weeks': []}
+        assert analytics.completion_time()['count'] == 0
+        assert analytics.completion_time()['p50_hours'] is None
+
+
+class TestAnalyticsRoutes:
+    """리포트 API 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """샘플 데이터가 있는 테스트 클라이언트"""
+        todo_app = TodoApp()
+        todo_app.initialize_sample_data()
+        return todo_app.app.test_client()
+
+    def test_report_endpoints(self, client):
+        """리포트 엔드포인트 응답"""
+        response = client.get('/api/stats/completion-rate?period=week')
+        assert response.status_code == 200
+        assert sum(row['created'] for row in response.get_json()) == 3
+
+        response = client.get('/api/stats/completion-time')
+        assert response.status_code == 200
+        assert response.get_json()['count'] == 1
+
+        response = client.get('/api/stats/overdue')
+        assert response.status_code == 200
+        assert 'weeks' in response.get_json()
+
+    def test_invalid_period(self, client):
+        """잘못된 기간 단위는 400"""
+        assert client.get('/api/stats/completion-rate?period=year').status_code == 400
@@ -0,0 +1,274 @@
+import gzip
+import json
+import os
+import pytest
+from datetime import datetime, timedelta
+from app import TodoApp
+from models import TodoItem, TodoStatus
+from repositories import TodoRepository, ListTodoRepository, ColdStore, Archiver
+from repositories.events import MutationEvent
+
+
+def make_todos(count, status=TodoStatus.COMPLETED):
+    return [
+        TodoItem(content=f"완료 {i}", target_date=datetime(2026, 1, 1 + i % 28), status=status)
+        for i in range(count)
+    ]
+
+
+def keep_all(todos, on_evicted):
+    on_evicted(list(todos))
+    return list(todos)
+
+
+class TestColdStore:
+    """디스크 세그먼트 저장소 테스트"""
+
+    def test_append_get_page_and_reload(self, tmp_path):
+        """세그먼트로 나눠 쓴 항목을 ID/페이지로 조회하고, 다시 열어도 같음"""
+        store = ColdStore(str(tmp_path))
+        todos = make_todos(25)
+        for i in range(0, 25, 10):
+            store.append(todos[i:i + 10], keep_all)
+
+        assert len(store) == 25
+        assert store.get(todos[13].id) == todos[13]
+        page, total = store.page(12, 5)
+        assert [todo.id for todo in page] == [todo.id for todo in todos[12:17]]
+        assert total == 25
+
+        reopened = ColdStore(str(tmp_path), cache_segments=1)
+        assert [todo.id for todo in reopened.iter_all()] == [todo.id for todo in todos]
+        assert reopened.get(todos[24].id) == todos[24]
+        with gzip.open(os.path.join(str(tmp_path), 'segment-000000.jsonl.gz')) as f:
+            assert json.loads(f.readline())['ids'] == [todo.id for todo in todos[:10]]
+
+    def test_delete_persists_and_drops_empty_segment(self, tmp_path):
+        """삭제는 다시 열어도 유지되고, 모두 삭제된 세그먼트는 파일을 지움"""
+        store = ColdStore(str(tmp_path))
+        first, second = make_todos(2), make_todos(2)
+        store.append(first, keep_all)
+        store.append(second, keep_all)
+
+        assert store.delete(first[0].id)
+        assert not store.delete(first[0].id)
+        assert store.delete(second[0].id) and store.delete(second[1].id)
+
+        reopened = ColdStore(str(tmp_path))
+        assert [todo.id for todo in reopened.iter_all()] == [first[1].id]
+        assert sorted(name for name in os.listdir(str(tmp_path)) if name.startswith('segment-')) == \
+            ['segment-000000.jsonl.gz']
+
+    def test_partial_evict_keeps_only_evicted(self, tmp_path):
+        """evict가 일부만 제거하면 제거한 항목만 보관되고, 하나도 제거하지 않으면 파일을 남기지 않음"""
+        store = ColdStore(str(tmp_path))
+        todos = make_todos(3)
+
+        def evict_tail(batch, on_evicted):
+            on_evicted(batch[1:])
+            return batch[1:]
+
+        archived = store.append(todos, evict_tail)
+
+        assert archived == todos[1:]
+        assert todos[0].id not in store and len(store) == 2
+        assert [todo.id for todo in ColdStore(str(tmp_path)).iter_all()] == [todo.id for todo in todos[1:]]
+
+        assert store.append(make_todos(2), lambda batch, on_evicted: []) == []
+        assert len(store) == 2
+        assert sorted(name for name in os.listdir(str(tmp_path)) if name.startswith('segment-')) == \
+            ['segment-000000.jsonl.gz']
+
+    def test_ids_are_published_with_eviction(self, tmp_path):
+        """세그먼트를 쓴 뒤 저장소에서 제거하기 전에는 보관 항목으로 보이지 않음"""
+        store = ColdStore(str(tmp_path))
+        todos = make_todos(2)
+        seen = []
+
+        def evict(batch, on_evicted):
+            seen.append((len(store), todos[0].id in store, store.get(todos[0].id), store.page()[1]))
+            on_evicted(batch)
+            seen.append((len(store), todos[0].id in store, store.get(todos[0].id), store.page()[1]))
+            return batch
+
+        store.append(todos, evict)
+
+        assert seen == [(0, False, None, 0), (2, True, todos[0], 2)]
+
+    def test_rearchive_after_delete(self, tmp_path):
+        """되돌렸다가(삭제) 다시 보관한 항목은 새 세그먼트에서 조회됨"""
+        store = ColdStore(str(tmp_path))
+        todos = make_todos(2)
+        store.append(todos, keep_all)
+        store.delete(todos[0].id)
+
+        store.append([todos[0]], keep_all)
+
+        assert store.get(todos[0].id) == todos[0]
+        assert len(ColdStore(str(tmp_path))) == 2
+
+    def test_range_count_and_columns(self, tmp_path):
+        """목표 날짜 구간 개수와 날짜 컬럼은 머리글로 계산하고 삭제 항목은 제외"""
+        store = ColdStore(str(tmp_path))
+        todos = make_todos(10)
+        store.append(todos, keep_all)
+        store.delete(todos[2].id)
+
+        assert store.count_in_range(datetime(2026, 1, 1), datetime(2026, 1, 5)) == 3
+        target_date, created_at, updated_at = store.columns()
+        assert len(target_date) == len(created_at) == len(updated_at) == 9
+
+
+class TestArchiver:
+    """보관 작업 테스트"""
+
+    @pytest.mark.parametrize('backend', [TodoRepository, ListTodoRepository])
+    def test_moves_only_old_completed_items(self, backend, tmp_path):
+        """오래된 완료 항목만 오래된 순서로 옮기고 저장소에서는 삭제 표시 없이 제거"""
+        repo = backend()
+        done = [repo.create(f"완료 {i}", datetime(2026, 1, 1), TodoStatus.COMPLETED) for i in range(5)]
+        active = repo.create("진행 중", datetime(2026, 1, 1), TodoStatus.IN_PROGRESS)
+        events = []
+        repo.add_listener(events.append)
+        store = ColdStore(str(tmp_path))
+        now = max(todo.updated_at for todo in done)
+        archiver = Archiver(repo, store, after=0, segment_size=2, clock=lambda: now)
+
+        assert archiver.run_once() == 5
+        assert repo.get_order() == [active.id]
+        assert sorted(todo.id for todo in store.iter_all()) == sorted(todo.id for todo in done)
+        assert {event.op for event in events} == {MutationEvent.DELETE}
+        assert archiver.run_once() == 0
+
+        recent = Archiver(repo, store, after=3600, clock=lambda: now)
+        repo.update(active.id, status=TodoStatus.COMPLETED)
+        assert recent.run_once() == 0
+
+
+class TestArchiveApp:
+    """보관 계층을 켠 앱 테스트"""
+
+    @pytest.fixture
+    def todo_app(self, tmp_path):
+        todo_app = TodoApp(config={'ARCHIVE_DIR': str(tmp_path), 'ARCHIVE_AFTER': 0})
+        service = todo_app.service
+        for i in range(3):
+            service.create_todo(f"완료 {i}", datetime(2026, 1, 10 + i), TodoStatus.COMPLETED)
+        service.create_todo("예정", datetime(2026, 1, 20))
+        assert todo_app.archiver.run_once() == 3
+        return todo_app
+
+    def test_stats_and_lookups_include_archive(self, todo_app):
+        """통계/분석/ID 조회에 보관 항목 포함"""
+        client = todo_app.app.test_client()
+        archived = next(todo_app.archive.iter_all())
+
+        assert client.get('/api/stats').get_json() == {
+            'total': 4, 'scheduled': 1, 'in_progress': 0, 'completed': 3
+        }
+        stats = client.get('/api/stats?start=2026-01-11T00:00:00&end=2026-01-31T00:00:00').get_json()
+        assert stats['completed'] == 2 and stats['total'] == 3
+        assert client.get('/api/bootstrap').get_json()['stats']['completed'] == 3
+        assert client.get('/api/stats/completion-time').get_json()['count'] == 3
+        assert todo_app.service.get_todo_by_id(archived.id) == archived
+
+    @pytest.mark.parametrize('backend', [TodoRepository, ListTodoRepository])
+    def test_totals_during_archiving(self, backend, tmp_path, monkeypatch):
+        """보관 중(세그먼트를 쓴 뒤 제거 전, 제거 직후)에도 통계/시계열/내보내기가 항목을 한 번씩만 셈"""
+        todo_app = TodoApp(repository=backend(), config={'ARCHIVE_DIR': str(tmp_path), 'ARCHIVE_AFTER': 0})
+        service = todo_app.service
+        for i in range(3):
+            service.create_todo(f"완료 {i}", datetime(2026, 1, 10 + i), TodoStatus.COMPLETED)
+        service.create_todo("예정", datetime(2026, 1, 20))
+        client = todo_app.app.test_client()
+        expected = client.get('/api/stats').get_json()
+        seen = []
+
+        def totals():
+            point = todo_app.stats_history.history('minute')['points'][-1]
+            return (client.get('/api/stats').get_json(), client.get('/api/bootstrap').get_json()['stats'],
+                    {key: point[key] for key in expected}, len(list(service.export_todos())))
+
+        evict = todo_app.repository.evict
+
+        def checked_evict(todos, on_evicted):
+            seen.append(totals())
+            evicted = evict(todos, on_evicted)
+            seen.append(totals())
+            return evicted
+
+        monkeypatch.setattr(todo_app.repository, 'evict', checked_evict)
+        assert todo_app.archiver.run_once() == 3
+
+        assert seen == [(expected, expected, expected, 4)] * 2
+        assert len(todo_app.archive) == 3
+
+    def test_completed_filter_and_archive_pages(self, todo_app):
+        """완료 필터는 보관 개수를 알려 주고 보관 항목은 페이지로 조회"""
+        client = todo_app.app.test_client()
+
+        response = client.get('/api/todos/완료')
+        assert response.get_json() == []
+        assert response.headers['X-Archived-Count'] == '3'
+
+        response = client.get('/api/archive?offset=1&limit=5')
+        assert [todo['content'] for todo in response.get_json()] == ["완료 1", "완료 2"]
+        assert response.headers['X-Total-Count'] == '3'
+        assert client.get('/api/archive?offset=-1').status_code == 400
+
+    def test_update_reinstates_and_delete_removes(self, todo_app):
+        """보관 항목을 수정하면 목록 맨 뒤로 되돌리고, 삭제하면 보관 계층에서 지움"""
+        client = todo_app.app.test_client()
+        first, second, _ = todo_app.archive.iter_all()
+
+        response = client.put(f'/api/todos/{first.id}', json={'status': '진행중'})
+        assert response.status_code == 200
+        assert todo_app.repository.get_order()[-1] == first.id
+        assert first.id not in todo_app.archive
+
+        assert client.delete(f'/api/todos/{second.id}').status_code == 200
+        assert second.id not in todo_app.archive
+        assert client.delete(f'/api/todos/{second.id}').status_code == 404
+        assert client.get('/api/stats').get_json()['completed'] == 1
+
+    def test_deleted_archive_item_can_be_restored(self, todo_app):
+        """보관 항목 삭제도 변경 이벤트와 톰스톤을 남겨 통계 시계열에 반영되고 복구 가능"""
+        client = todo_app.app.test_client()
+        archived = next(todo_app.archive.iter_all())
+        events = []
+        todo_app.repository.add_listener(lambda event: events.append(event.op))
+
+        assert client.delete(f'/api/todos/{archived.id}').status_code == 200
+        assert MutationEvent.DELETE in events
+        assert todo_app.stats_history.history('minute')['points'][-1]['completed'] == 2
+
+        response = client.post(f'/api/todos/{archived.id}/restore')
+        assert response.status_code == 200
+        assert todo_app.service.get_todo_by_id(archived.id) == archived
+        assert client.get('/api/stats').get_json()['completed'] == 3
+
+    def test_get_by_id_route(self, todo_app):
+        """상태 이름이 아닌 경로는 ID 조회로 가며 보관 항목도 돌려줌"""
+        client = todo_app.app.test_client()
+        archived = next(todo_app.archive.iter_all())
+        hot = todo_app.repository.get_all()[0]
+
+        assert client.get(f'/api/todos/{hot.id}').get_json()['content'] == "예정"
+        assert client.get(f'/api/todos/{archived.id}').get_json()['id'] == archived.id
+        assert client.get('/api/todos/없는-ID').status_code == 404
+        assert [todo['content'] for todo in client.get('/api/todos/예정').get_json()] == ["예정"]
+
+    def test_export_streams_hot_then_archive(self, todo_app):
+        """내보내기는 저장소 항목 다음에 보관 항목을 한 줄씩"""
+        response = todo_app.app.test_client().get('/api/export')
+
+        assert response.mimetype == 'application/x-ndjson'
+        contents = [json.loads(line)['content'] for line in response.get_data(as_text=True).splitlines()]
+        assert contents == ["예정", "완료 0", "완료 1", "완료 2"]
+
+    def test_clear_all_clears_archive(self, todo_app):
+        """전체 삭제는 보관 항목도 지움"""
+        todo_app.service.clear_all_todos()
+
+        assert len(todo_app.archive) == 0
+        assert todo_app.service.get_statistics()['total'] == 0
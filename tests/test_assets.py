@@ -0,0 +1,90 @@
+import gzip
+import re
+import pytest
+from app import TodoApp
+from utils import AssetManifest
+
+
+class TestAssets:
+    """해시 이름 정적 파일 테스트"""
+
+    @pytest.fixture
+    def todo_app(self):
+        return TodoApp()
+
+    @pytest.fixture
+    def client(self, todo_app):
+        return todo_app.app.test_client()
+
+    def asset_path(self, client, filename):
+        """메인 페이지가 참조하는 해시 이름 경로"""
+        html = client.get('/').get_data(as_text=True)
+        stem, ext = filename.rsplit('.', 1)
+        return re.search(rf'/assets/{stem}\.[0-9a-f]{{12}}\.{ext}', html).group(0)
+
+    def test_index_uses_hashed_names(self, client, todo_app):
+        """템플릿이 원래 이름 대신 해시 이름을 참조"""
+        html = client.get('/').get_data(as_text=True)
+
+        assert f"/assets/{todo_app.assets.hashed_name('js/script.js')}" in html
+        assert f"/assets/{todo_app.assets.hashed_name('css/style.css')}" in html
+        assert '/static/js/script.js' not in html
+
+    def test_serves_gzip_when_accepted(self, client, todo_app):
+        """gzip을 받는 클라이언트에는 미리 압축한 본문"""
+        path = self.asset_path(client, 'js/script.js')
+        with open(f"{todo_app.app.static_folder}/js/script.js", 'rb') as f:
+            original = f.read()
+
+        response = client.get(path, headers={'Accept-Encoding': 'gzip'})
+
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(response.data) == original
+        assert response.mimetype == 'text/javascript'
+
+    def test_serves_identity_otherwise(self, client, todo_app):
+        """압축을 받지 않으면 원본"""
+        path = self.asset_path(client, 'css/style.css')
+        with open(f"{todo_app.app.static_folder}/css/style.css", 'rb') as f:
+            original = f.read()
+
+        response = client.get(path)
+
+        assert 'Content-Encoding' not in response.headers
+        assert response.data == original
+
+    def test_immutable_cache_headers(self, client):
+        """만료 없는 캐시 헤더와 ETag"""
+        response = client.get(self.asset_path(client, 'js/script.js'))
+
+        assert response.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert response.headers['ETag']
+
+    def test_not_modified(self, client):
+        """같은 ETag로 다시 요청하면 304"""
+        path = self.asset_path(client, 'js/script.js')
+        etag = client.get(path).headers['ETag']
+
+        response = client.get(path, headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_unknown_name(self, client):
+        """목록에 없는 이름은 404"""
+        assert client.get('/assets/js/script.000000000000.js').status_code == 404
+
+    def test_hash_changes_with_content(self, tmp_path):
+        """내용이 바뀌면 build() 후 해시 이름도 바뀜"""
+        (tmp_path / 'app.js').write_text('console.log(1);')
+        manifest = AssetManifest(str(tmp_path))
+        before = manifest.hashed_name('app.js')
+
+        (tmp_path / 'app.js').write_text('console.log(2);')
+        manifest.build()
+
+        assert manifest.hashed_name('app.js') != before
+        assert manifest.get(before) is None
+        assert manifest.hashed_name('missing.js') is None
@@ -0,0 +1,50 @@
+import json
+import re
+import pytest
+from app import TodoApp
+
+
+class TestBootstrap:
+    """첫 화면 데이터 테스트"""
+
+    @pytest.fixture
+    def todo_app(self):
+        todo_app = TodoApp(config={'BOOTSTRAP_LIMIT': 2})
+        todo_app.initialize_sample_data()
+        return todo_app
+
+    @pytest.fixture
+    def client(self, todo_app):
+        return todo_app.app.test_client()
+
+    def test_endpoint(self, client):
+        """목록 첫 페이지와 통계를 한 번에 반환"""
+        data = client.get('/api/bootstrap').get_json()
+
+        assert [todo['id'] for todo in data['todos']] == [todo['id'] for todo in client.get('/api/todos').get_json()[:2]]
+        assert data['total'] == 3
+        assert data['stats'] == client.get('/api/stats').get_json()
+
+    def test_index_embeds_data(self, client, todo_app):
+        """메인 페이지에 같은 데이터가 들어 있음"""
+        todo_app.service.create_todo("<script>alert(1)</script>", todo_app.repository.get_all()[0].target_date)
+
+        html = client.get('/').get_data(as_text=True)
+
+        match = re.search(r'<script id="bootstrap-data" type="application/json">(.*?)</script>', html, re.S)
+        data = json.loads(match.group(1))
+        assert data['total'] == 4 and len(data['todos']) == 2
+        assert data['stats']['total'] == 4
+        assert data['version'] == todo_app.repository.version
+        assert '<script>alert' not in html
+
+    def test_page_with_counts_is_one_snapshot(self, todo_app):
+        """목록과 개수가 같은 버전에서 계산됨"""
+        repo = todo_app.repository
+
+        todos, total, counts, version = repo.page_with_counts(2)
+
+        assert len(todos) == 2 and total == 3 and sum(counts.values()) == 3
+        assert version == repo.version
+        with pytest.raises(ValueError):
+            repo.page_with_counts(-1)
@@ -0,0 +1,114 @@
+import gzip
+import json
+import pytest
+from datetime import datetime, timedelta
+from app import TodoApp
+from models import TodoItem, TodoStatus
+from utils import TodoSerializer, ResponseCompressor
+from utils.compression import parse_accept_encoding
+
+
+class TestResponseCompression:
+    """응답 압축 테스트"""
+
+    @pytest.fixture
+    def todo_app(self):
+        """큰 목록을 가진 앱"""
+        todo_app = TodoApp()
+        for i in range(50):
+            todo_app.service.create_todo(f"항목 {i}", datetime(2026, 3, 1) + timedelta(days=i))
+        return todo_app
+
+    @pytest.fixture
+    def client(self, todo_app):
+        """테스트 클라이언트"""
+        return todo_app.app.test_client()
+
+    def test_large_response_is_gzipped(self, client):
+        """임계값 이상의 응답은 gzip으로 압축"""
+        response = client.get('/api/todos', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        todos = json.loads(gzip.decompress(response.data))
+        assert len(todos) == 50
+
+    def test_no_compression_without_accept_encoding(self, client):
+        """Accept-Encoding이 없으면 압축하지 않음"""
+        response = client.get('/api/todos')
+
+        assert 'Content-Encoding' not in response.headers
+        assert len(response.get_json()) == 50
+
+    def test_small_response_is_not_compressed(self, client):
+        """임계값 미만의 응답은 압축하지 않음"""
+        response = client.get('/api/stats', headers={'Accept-Encoding': 'gzip'})
+
+        assert 'Content-Encoding' not in response.headers
+        assert response.get_json()['total'] == 50
+
+    def test_threshold_is_configurable(self, todo_app, client):
+        """압축 임계값 설정"""
+        todo_app.compressor.min_size = 1
+
+        response = client.get('/api/stats', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+
+    def test_parse_accept_encoding(self):
+        """Accept-Encoding q값 파싱"""
+        assert parse_accept_encoding('gzip;q=0.5, br, identity;q=0') == {
+            'gzip': 0.5, 'br': 1.0, 'identity': 0.0
+        }
+
+    def test_rejected_encoding(self):
+        """q=0인 인코딩은 선택하지 않음"""
+        compressor = ResponseCompressor()
+
+        assert compressor.choose_encoding('gzip;q=0') is None
+        assert compressor.choose_encoding('*') is not None
+
+
+class TestCompactFields:
+    """압축 필드 모드 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """샘플 데이터가 있는 테스트 클라이언트"""
+        todo_app = TodoApp()
+        todo_app.initialize_sample_data()
+        return todo_app.app.test_client()
+
+    def test_sparse_fieldset(self, client):
+        """?fields= 로 필요한 필드만 조회"""
+        todos = client.get('/api/todos?fields=id,status').get_json()
+
+        assert len(todos) == 3
+        assert set(todos[0]) == {'id', 'status'}
+
+    def test_compact_mode(self, client):
+        """compact 모드는 숫자 상태 코드와 epoch 초 사용"""
+        todos = client.get('/api/todos/진행중?compact=1&fields=status,target_date').get_json()
+
+        assert todos == [{'status': 1, 'target_date': int(datetime(2026, 1, 20).timestamp())}]
+
+    def test_unknown_field(self, client):
+        """알 수 없는 필드는 400"""
+        response = client.get('/api/todos?fields=id,password')
+
+        assert response.status_code == 400
+
+    def test_unknown_field_does_not_sort(self, client):
+        """필드 검증 실패 시 정렬하지 않음"""
+        before = [todo['id'] for todo in client.get('/api/todos').get_json()]
+
+        response = client.put('/api/todos/sort/date?fields=bogus')
+
+        assert response.status_code == 400
+        assert [todo['id'] for todo in client.get('/api/todos').get_json()] == before
+
+    def test_sparse_list_matches_full_serialization(self):
+        """필드를 지정하지 않으면 to_list와 같은 결과"""
+        todo = TodoItem(content="항목", target_date=datetime(2026, 1, 1), status=TodoStatus.COMPLETED)
+
+        assert TodoSerializer.to_sparse_list([todo]) == TodoSerializer.to_list([todo])
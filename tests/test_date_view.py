@@ -0,0 +1,187 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from app import TodoApp
+from models import TodoItem, TodoStatus
+from repositories import TodoRepository
+from repositories.date_index import DateIndex
+
+
+class TestDateView:
+    """날짜순 인덱스 테스트"""
+
+    @pytest.fixture
+    def small_chunks(self, monkeypatch):
+        """여러 청크에 걸치도록 크기 축소"""
+        monkeypatch.setattr(DateIndex, '_LOAD', 2)
+
+    @pytest.fixture
+    def repo(self, small_chunks):
+        """목표 날짜가 생성 순서와 반대인 항목 6개"""
+        repo = TodoRepository()
+        for i in range(6):
+            repo.create(f"항목 {i}", datetime(2026, 1, 10 - i))
+        return repo
+
+    def test_view_keeps_custom_order(self, repo):
+        """날짜순 보기는 사용자 순서를 바꾸지 않음"""
+        order = repo.get_order()
+
+        by_date = repo.get_by_date()
+
+        assert [todo.content for todo in by_date] == [f"항목 {i}" for i in range(5, -1, -1)]
+        assert repo.get_order() == order
+
+    def test_updates_reposition_item(self, repo):
+        """목표 날짜를 바꾸면 날짜순 위치가 바뀌고, 상태 필터도 적용됨"""
+        first = repo.get_all()[0]
+
+        repo.update(first.id, target_date=datetime(2025, 12, 1), status=TodoStatus.COMPLETED)
+
+        assert repo.get_by_date()[0].id == first.id
+        assert [todo.id for todo in repo.get_by_date(TodoStatus.COMPLETED)] == [first.id]
+        assert first.id not in [todo.id for todo in repo.get_by_date(TodoStatus.SCHEDULED)]
+
+    def test_delete_and_restore(self, repo):
+        """삭제한 항목은 보기에서 빠지고 복구하면 다시 들어감"""
+        earliest = repo.get_by_date()[0]
+
+        repo.delete(earliest.id)
+        assert earliest.id not in [todo.id for todo in repo.get_by_date()]
+
+        repo.restore(earliest.id)
+        assert repo.get_by_date()[0].id == earliest.id
+
+    def test_ties_follow_creation_order(self):
+        """같은 날짜는 생성 순서대로"""
+        repo = TodoRepository()
+        same_day = datetime(2026, 3, 1)
+        ids = [repo.create(f"같은 날 {i}", same_day).id for i in range(5)]
+        repo.move_to(ids[4], 0)
+
+        assert [todo.id for todo in repo.get_by_date()] == ids
+
+    def test_page_by_date(self, repo):
+        """앞에서부터 일부만 읽기"""
+        todos, total, version = repo.page_by_date(1, 2)
+
+        assert [todo.content for todo in todos] == ["항목 4", "항목 3"]
+        assert total == 6 and version == repo.version
+        with pytest.raises(ValueError):
+            repo.page_by_date(-1, 2)
+
+    def test_commit_sorted_order(self, repo):
+        """sort_by_date()는 날짜순 보기를 사용자 순서로 저장"""
+        expected = [todo.id for todo in repo.get_by_date()]
+
+        repo.sort_by_date()
+
+        assert repo.get_order() == expected
+        assert [todo.id for todo in repo.get_by_date()] == expected
+
+    def test_unsortable_date_changes_nothing(self, repo):
+        """날짜 인덱스에 넣을 수 없는 항목은 ValueError이고 어떤 구조도 바뀌지 않음"""
+        order, by_date = repo.get_order(), repo.get_by_date()
+        aware = TodoItem.model_construct(
+            id="aware", content="시간대", target_date=datetime(2026, 1, 2, tzinfo=timezone.utc),
+            status=TodoStatus.SCHEDULED.value, created_at=datetime.now(), updated_at=datetime.now()
+        )
+        version, events = repo.version, []
+        repo.add_listener(events.append)
+
+        with pytest.raises(ValueError):
+            repo.insert(aware)
+
+        assert repo.get_by_id("aware") is None
+        assert repo.get_order() == order and repo.get_by_date() == by_date
+        assert len(repo._by_date) == len(order) and repo.version == version and events == []
+        assert repo.create("다음", datetime(2026, 1, 3)).id in repo.get_order()
+
+    def test_index_add_failure_keeps_size(self):
+        """비교할 수 없는 키 추가가 실패해도 크기는 그대로"""
+        index = DateIndex()
+        index.add((datetime(2026, 1, 1), datetime(2026, 1, 1), 0))
+
+        with pytest.raises(TypeError):
+            index.add((datetime(2026, 1, 2, tzinfo=timezone.utc), datetime(2026, 1, 1), 1))
+
+        assert len(index) == 1 and index.sids() == [0]
+
+    def test_snapshot_keeps_date_order(self, repo, monkeypatch):
+        """스냅샷의 날짜순 보기는 이후 쓰기에 영향받지 않고, 읽을 때 쓰기 잠금을 잡지 않음"""
+        snapshot = repo.snapshot()
+        before = [todo.id for todo in snapshot.by_date()]
+        first, last = repo.get_by_date()[0], repo.get_by_date()[-1]
+
+        early = repo.create("가장 이른 항목", datetime(2025, 1, 1))
+        repo.update(last.id, target_date=datetime(2024, 1, 1))
+        repo.delete(first.id)
+
+        assert [todo.id for todo in snapshot.by_date()] == before
+        assert snapshot.count_date_range(datetime(2020, 1, 1), datetime(2030, 1, 1)) == 6
+        assert [todo.id for todo in repo.get_by_date()][:1] == [last.id]
+        assert len(repo.get_by_date()) == 6
+
+        repo.snapshot()
+        monkeypatch.setattr(repo, '_lock', None)  # 같은 버전의 스냅샷만 읽으면 잠금을 쓰지 않음
+        assert [todo.id for todo in repo.page_by_date(0, 2)[0]] == [last.id, early.id]
+        assert len(repo.get_by_date_range(datetime(2026, 1, 1), datetime(2026, 2, 1))) == 4
+        assert repo.count_by_date_range(datetime(2024, 1, 1), datetime(2025, 1, 2)) == 2
+
+    def test_clear_all(self, repo):
+        """전체 삭제 후 보기 비움"""
+        repo.clear_all()
+
+        assert repo.get_by_date() == []
+        assert len(repo._by_date) == 0
+
+
+class TestDateViewRoutes:
+    """?sort=date 조회 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        todo_app = TodoApp()
+        todo_app.initialize_sample_data()
+        return todo_app.app.test_client()
+
+    def test_sorted_list_does_not_change_order(self, client):
+        """날짜순으로 조회해도 기본 목록 순서는 그대로"""
+        order = [todo['id'] for todo in client.get('/api/todos').get_json()]
+
+        by_date = client.get('/api/todos?sort=date').get_json()
+
+        dates = [todo['target_date'] for todo in by_date]
+        assert dates == sorted(dates)
+        assert [todo['id'] for todo in client.get('/api/todos').get_json()] == order
+
+    def test_paginated_and_filtered(self, client):
+        """페이지 조회와 상태별 조회에도 적용"""
+        by_date = client.get('/api/todos?sort=date').get_json()
+
+        response = client.get('/api/todos?sort=date&offset=1&limit=1')
+        assert [todo['id'] for todo in response.get_json()] == [by_date[1]['id']]
+        assert response.headers['X-Total-Count'] == str(len(by_date))
+
+        response = client.get('/api/todos/all?sort=date')
+        assert [todo['id'] for todo in response.get_json()] == [todo['id'] for todo in by_date]
+
+    def test_aware_dates_are_local_time(self, client):
+        """시간대가 있는 날짜는 같은 순간의 지역 시각으로 저장하고 목록과 날짜순 보기가 일치"""
+        aware = datetime(2026, 1, 1, tzinfo=timezone(timedelta(hours=9)))
+        local = aware.astimezone().replace(tzinfo=None)
+
+        response = client.post('/api/todos', json={'content': "시간대", 'target_date': aware.isoformat()})
+        assert response.status_code == 201
+        assert response.get_json()['target_date'] == local.isoformat()
+        todo_id = response.get_json()['id']
+        response = client.put(f'/api/todos/{todo_id}', json={'target_date': '2026-01-05T00:00:00+00:00'})
+        assert response.status_code == 200
+
+        listed = {todo['id'] for todo in client.get('/api/todos').get_json()}
+        assert {todo['id'] for todo in client.get('/api/todos?sort=date').get_json()} == listed
+        assert TodoItem(content="x", target_date=aware).target_date == local
+
+    def test_unknown_sort(self, client):
+        """지원하지 않는 정렬 기준은 400"""
+        assert client.get('/api/todos?sort=content').status_code == 400
+        assert client.get('/api/todos/all?sort=content').status_code == 400
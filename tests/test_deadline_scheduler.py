@@ -0,0 +1,129 @@
+import threading
+import pytest
+from datetime import datetime, timedelta
+from app import TodoApp
+from models import TodoStatus
+from repositories import TodoRepository
+from services import TodoService, DeadlineScheduler
+
+NOW = datetime(2026, 1, 10, 12, 0)
+
+
+class TestDeadlineScheduler:
+    """DeadlineScheduler 테스트"""
+
+    @pytest.fixture
+    def clock(self):
+        """테스트에서 움직일 수 있는 시계"""
+        class Clock:
+            now = NOW
+
+            def __call__(self):
+                return self.now
+        return Clock()
+
+    @pytest.fixture
+    def repo(self):
+        return TodoRepository()
+
+    @pytest.fixture
+    def scheduler(self, repo, clock):
+        scheduler = DeadlineScheduler(clock=clock)
+        scheduler.attach(repo)
+        return scheduler
+
+    def test_fires_in_deadline_order(self, repo, scheduler):
+        """마감 순서대로 한 번씩만 기한 초과 처리"""
+        late = repo.create("늦은 마감", NOW + timedelta(hours=2))
+        early = repo.create("이른 마감", NOW + timedelta(hours=1))
+        repo.create("남은 항목", NOW + timedelta(days=1))
+
+        assert scheduler.run_pending(NOW) == []
+        assert scheduler.next_deadline() == early.target_date
+        fired = scheduler.run_pending(NOW + timedelta(hours=3))
+        assert [todo.id for todo in fired] == [early.id, late.id]
+        assert scheduler.run_pending(NOW + timedelta(hours=3)) == []
+        assert len(scheduler) == 1
+
+    def test_existing_items_are_replayed(self, clock):
+        """연결 전에 있던 항목도 추적"""
+        repo = TodoRepository()
+        todo = repo.create("기존 항목", NOW - timedelta(days=1))
+        scheduler = DeadlineScheduler(clock=clock)
+        scheduler.attach(repo)
+
+        assert [item.id for item in scheduler.overdue()] == [todo.id]
+
+    def test_update_reschedules_or_cancels(self, repo, scheduler, clock):
+        """마감 변경, 완료, 삭제가 힙에 반영"""
+        moved = repo.create("미뤄진 항목", NOW - timedelta(hours=1))
+        done = repo.create("완료될 항목", NOW - timedelta(hours=1))
+        deleted = repo.create("삭제될 항목", NOW - timedelta(hours=1))
+        assert len(scheduler.overdue()) == 3
+
+        repo.update(moved.id, target_date=NOW + timedelta(hours=1))
+        repo.update(done.id, status=TodoStatus.COMPLETED)
+        repo.delete(deleted.id)
+        assert scheduler.overdue() == []
+
+        clock.now = NOW + timedelta(hours=2)
+        assert [todo.id for todo in scheduler.overdue()] == [moved.id]
+
+    def test_content_update_keeps_overdue_flag(self, repo, scheduler):
+        """마감과 무관한 수정은 다시 알리지 않고 항목만 갱신"""
+        calls = []
+        scheduler.add_callback(calls.append)
+        todo = repo.create("항목", NOW - timedelta(hours=1))
+        scheduler.run_pending()
+
+        repo.update(todo.id, content="수정")
+
+        assert scheduler.run_pending() == []
+        assert len(calls) == 1
+        assert scheduler.overdue()[0].content == "수정"
+
+    def test_callback_can_transition_status(self, repo, scheduler):
+        """콜백에서 저장소를 수정해도 교착 없이 동작"""
+        service = TodoService(repo, scheduler)
+        scheduler.add_callback(lambda todo: service.update_todo(todo.id, status=TodoStatus.COMPLETED))
+        todo = repo.create("자동 완료", NOW - timedelta(minutes=1))
+
+        scheduler.run_pending()
+
+        assert repo.get_by_id(todo.id).status == TodoStatus.COMPLETED
+        assert service.get_overdue_todos() == []
+
+    def test_stale_entries_are_compacted(self, repo, scheduler):
+        """반복 수정으로 쌓인 무효 원소는 힙 재구성으로 정리"""
+        todo = repo.create("항목", NOW + timedelta(days=1))
+        for minutes in range(200):
+            repo.update(todo.id, target_date=NOW + timedelta(days=1, minutes=minutes))
+
+        assert len(scheduler._heap) <= 2 * DeadlineScheduler._COMPACT_MIN
+        assert scheduler.next_deadline() == NOW + timedelta(days=1, minutes=199)
+
+    def test_worker_thread_fires_at_deadline(self):
+        """작업 스레드는 마감 시각에 깨어나 콜백 호출"""
+        repo = TodoRepository()
+        scheduler = DeadlineScheduler()
+        scheduler.attach(repo)
+        fired = threading.Event()
+        scheduler.add_callback(lambda todo: fired.set())
+        scheduler.start()
+        try:
+            repo.create("곧 마감", datetime.now() + timedelta(milliseconds=50))
+            assert fired.wait(2)
+        finally:
+            scheduler.stop(timeout=2)
+
+    def test_overdue_endpoint(self):
+        """GET /api/todos/overdue"""
+        todo_app = TodoApp()
+        todo_app.service.create_todo("지난 항목", datetime.now() - timedelta(days=1))
+        todo_app.service.create_todo("남은 항목", datetime.now() + timedelta(days=1))
+        client = todo_app.app.test_client()
+
+        response = client.get('/api/todos/overdue')
+
+        assert response.status_code == 200
+        assert [todo['content'] for todo in response.get_json()] == ["지난 항목"]
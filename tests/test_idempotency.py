@@ -0,0 +1,151 @@
+import threading
+import time
+import pytest
+from app import TodoApp
+from utils import IdempotencyCache
+
+
+class TestIdempotencyCache:
+    """IdempotencyCache 단위 테스트"""
+
+    def test_only_first_begin_owns_key(self):
+        """같은 키는 처음 요청만 처리 권한을 얻음"""
+        cache = IdempotencyCache()
+
+        entry, owner = cache.begin('k', 'fp')
+        again, second_owner = cache.begin('k', 'fp')
+
+        assert owner is True and second_owner is False
+        assert again is entry
+
+    def test_abandon_allows_retry(self):
+        """실패로 버린 키는 다시 처리 가능"""
+        cache = IdempotencyCache()
+        entry, _ = cache.begin('k', 'fp')
+
+        cache.abandon('k', entry)
+
+        assert entry.wait(0) is True
+        assert cache.begin('k', 'fp')[1] is True
+
+    def test_entries_expire_and_are_bounded(self):
+        """만료 시간과 최대 개수를 넘은 항목은 앞에서부터 제거"""
+        now = [0.0]
+        cache = IdempotencyCache(max_entries=2, ttl=10, clock=lambda: now[0])
+        for key in 'abc':
+            cache.complete(cache.begin(key, 'fp')[0], (200, [], b''))
+
+        assert len(cache) == 2
+        assert cache.begin('a', 'fp')[1] is True  # 개수 제한으로 제거됨
+
+        now[0] = 20.0
+        cache.begin('d', 'fp')
+        assert len(cache) == 1
+
+
+class TestIdempotentRoutes:
+    """Idempotency-Key 헤더 처리 테스트"""
+
+    @pytest.fixture
+    def todo_app(self):
+        todo_app = TodoApp()
+        todo_app.initialize_sample_data()
+        return todo_app
+
+    @pytest.fixture
+    def client(self, todo_app):
+        return todo_app.app.test_client()
+
+    def test_retried_create_returns_original(self, client, todo_app):
+        """재시도한 생성 요청은 새 항목을 만들지 않고 첫 응답 반환"""
+        payload = {'content': '한 번만', 'target_date': '2026-02-01T00:00:00'}
+        headers = {'Idempotency-Key': 'create-1'}
+
+        first = client.post('/api/todos', json=payload, headers=headers)
+        second = client.post('/api/todos', json=payload, headers=headers)
+
+        assert first.status_code == second.status_code == 201
+        assert second.get_json() == first.get_json()
+        assert second.headers['Idempotent-Replayed'] == 'true'
+        assert 'Idempotent-Replayed' not in first.headers
+        assert todo_app.repository.count() == 4
+
+    def test_update_and_reorder(self, client):
+        """수정/순서 변경도 같은 키면 한 번만 처리"""
+        ids = [todo['id'] for todo in client.get('/api/todos').get_json()]
+        headers = {'Idempotency-Key': 'update-1'}
+
+        client.put(f'/api/todos/{ids[0]}', json={'content': '수정'}, headers=headers)
+        replay = client.put(f'/api/todos/{ids[0]}', json={'content': '수정'}, headers=headers)
+        assert replay.headers['Idempotent-Replayed'] == 'true'
+
+        headers = {'Idempotency-Key': 'reorder-1'}
+        order = [ids[2], ids[0], ids[1]]
+        assert client.put('/api/todos/reorder', json={'order': order}, headers=headers).status_code == 200
+        client.put('/api/todos/reorder', json={'order': ids}, headers={'Idempotency-Key': 'reorder-2'})
+        replay = client.put('/api/todos/reorder', json={'order': order}, headers=headers)
+        assert replay.headers['Idempotent-Replayed'] == 'true'
+        assert [todo['id'] for todo in client.get('/api/todos').get_json()] == ids  # 다시 적용되지 않음
+
+    def test_key_reuse_with_different_body(self, client):
+        """같은 키로 다른 요청을 보내면 422"""
+        headers = {'Idempotency-Key': 'reuse'}
+        client.post('/api/todos', json={'content': 'A', 'target_date': '2026-02-01T00:00:00'}, headers=headers)
+
+        response = client.post('/api/todos', json={'content': 'B', 'target_date': '2026-02-01T00:00:00'},
+                               headers=headers)
+
+        assert response.status_code == 422
+
+    def test_invalid_key(self, client):
+        """빈 키나 너무 긴 키는 400"""
+        payload = {'content': 'A', 'target_date': '2026-02-01T00:00:00'}
+
+        assert client.post('/api/todos', json=payload, headers={'Idempotency-Key': ''}).status_code == 400
+        assert client.post('/api/todos', json=payload, headers={'Idempotency-Key': 'x' * 256}).status_code == 400
+
+    def test_server_error_is_not_cached(self, client, todo_app, monkeypatch):
+        """서버 오류 응답은 저장하지 않아 재시도가 다시 처리됨"""
+        original = todo_app.service.create_todos
+        calls = []
+
+        def flaky(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("일시적 오류")
+            return original(*args, **kwargs)
+        monkeypatch.setattr(todo_app.service, 'create_todos', flaky)
+        payload = {'content': '재시도', 'target_date': '2026-02-01T00:00:00'}
+        headers = {'Idempotency-Key': 'flaky'}
+
+        assert client.post('/api/todos', json=payload, headers=headers).status_code == 500
+        assert client.post('/api/todos', json=payload, headers=headers).status_code == 201
+        assert len(calls) == 2
+
+    def test_concurrent_duplicates(self, todo_app, monkeypatch):
+        """동시에 들어온 중복 요청은 한 번만 처리되고 같은 응답을 받음"""
+        original = todo_app.service.create_todos
+        calls = []
+
+        def slow(*args, **kwargs):
+            calls.append(1)
+            time.sleep(0.1)
+            return original(*args, **kwargs)
+        monkeypatch.setattr(todo_app.service, 'create_todos', slow)
+        payload = {'content': '동시 요청', 'target_date': '2026-02-01T00:00:00'}
+        responses = []
+
+        def send():
+            client = todo_app.app.test_client()
+            response = client.post('/api/todos', json=payload, headers={'Idempotency-Key': 'race'})
+            responses.append((response.status_code, response.get_json()))
+
+        threads = [threading.Thread(target=send) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len({response[1]['id'] for response in responses}) == 1
+        assert {response[0] for response in responses} == {201}
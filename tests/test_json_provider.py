@@ -0,0 +1,63 @@
+import json
+import pytest
+from datetime import datetime
+from app import TodoApp
+from models import TodoItem, TodoStatus
+from utils import TodoSerializer, serializer, json_provider
+
+
+class TestTodoJSONProvider:
+    """JSON 프로바이더 및 직접 인코딩 테스트"""
+
+    @pytest.fixture
+    def todo_app(self):
+        """샘플 데이터가 있는 앱"""
+        todo_app = TodoApp()
+        todo_app.initialize_sample_data()
+        return todo_app
+
+    @pytest.fixture(params=['fast', 'stdlib'])
+    def encoder(self, request, monkeypatch):
+        """orjson 사용/미사용 두 경로 모두 검증"""
+        if request.param == 'stdlib':
+            monkeypatch.setattr(serializer, 'orjson', None)
+            monkeypatch.setattr(json_provider, 'orjson', None)
+        elif serializer.orjson is None:
+            pytest.skip('orjson이 설치되어 있지 않음')
+        return request.param
+
+    def test_encode_list_matches_to_list(self, encoder):
+        """encode_list 결과가 to_list와 같은 JSON"""
+        todos = [
+            TodoItem(content='따옴표 " 와 역슬래시 \\', target_date=datetime(2026, 1, 1, 9, 30)),
+            TodoItem(content='완료 항목', target_date=datetime(2026, 2, 1), status=TodoStatus.COMPLETED),
+        ]
+
+        assert json.loads(TodoSerializer.encode_list(todos)) == TodoSerializer.to_list(todos)
+
+    def test_encode_empty_list(self, encoder):
+        """빈 목록 인코딩"""
+        assert json.loads(TodoSerializer.encode_list([])) == []
+
+    def test_provider_handles_domain_types(self, todo_app, encoder):
+        """TodoItem, datetime, Enum 직접 인코딩"""
+        todo = todo_app.service.get_all_todos()[0]
+        with todo_app.app.app_context():
+            encoded = todo_app.app.json.dumps({
+                'todo': todo,
+                'date': datetime(2026, 1, 1),
+                'status': TodoStatus.IN_PROGRESS,
+            })
+
+        data = json.loads(encoded)
+        assert data['todo'] == TodoSerializer.to_dict(todo)
+        assert data['date'] == '2026-01-01T00:00:00'
+        assert data['status'] == '진행중'
+
+    def test_list_response_is_utf8(self, todo_app, encoder):
+        """한글을 이스케이프하지 않고 응답"""
+        response = todo_app.app.test_client().get('/api/todos')
+
+        assert response.mimetype == 'application/json'
+        assert '테스트 코드 작성'.encode('utf-8') in response.data
+        assert response.get_json() == TodoSerializer.to_list(todo_app.service.get_all_todos())
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(statement: str) -> set:
+    """새 인터프리터에서 statement 실행 후 로딩된 모듈 이름"""
+    script = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, '-c', script], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    """경량 진입점의 지연 로딩 테스트"""
+
+    @pytest.mark.parametrize('statement', [
+        'import repositories',
+        'from services import TodoService',
+        'from utils import TodoNotFoundError',
+        'import app',
+    ])
+    def test_lightweight_entry_points_skip_web_stack(self, statement):
+        """저장소/서비스만 쓰는 진입점은 Flask, DTO, NumPy를 불러오지 않음"""
+        modules = loaded_modules(statement)
+
+        assert 'flask' not in modules
+        assert 'utils.dtos' not in modules
+        assert 'numpy' not in modules
+
+    def test_lazy_attributes_resolve(self):
+        """지연 로딩 속성도 기존처럼 import 가능"""
+        from app import TodoApp
+        from utils import TodoSerializer, CreateTodoRequest
+
+        assert TodoApp.__name__ == 'TodoApp'
+        assert TodoSerializer.__module__ == 'utils.serializer'
+        assert CreateTodoRequest.__module__ == 'utils.dtos'
+
+    def test_unknown_attribute(self):
+        """없는 속성은 AttributeError"""
+        import utils
+
+        with pytest.raises(AttributeError):
+            utils.DoesNotExist
@@ -0,0 +1,115 @@
+import sys
+import threading
+import tracemalloc
+import pytest
+from datetime import datetime
+from app import TodoApp
+from repositories import TodoRepository, ListTodoRepository
+from utils.memory import ObjectSizer
+
+ADMIN_TOKEN = 'test-admin-token'
+HEADERS = {'X-Admin-Token': ADMIN_TOKEN}
+
+
+class TestObjectSizer:
+    """깊은 크기 계산 테스트"""
+
+    def test_shared_objects_are_counted_once(self):
+        """같은 계산기로 다시 재면 이미 센 객체는 0"""
+        payload = ['x' * 1000]
+        sizer = ObjectSizer()
+
+        first = sizer.size({'a': payload})
+        assert first >= sys.getsizeof(payload[0])
+        assert sizer.size(payload) == 0
+        assert ObjectSizer().size(payload) > 0
+
+    def test_methods_are_not_followed(self):
+        """바운드 메서드를 통해 다른 객체 그래프로 넘어가지 않음"""
+        big = ['y' * 100000]
+        assert ObjectSizer().size([big.append]) < 1000
+
+    @pytest.mark.parametrize('backend', [TodoRepository, ListTodoRepository])
+    def test_repository_usage_grows_with_items(self, backend):
+        """저장소 구조별 크기는 항목 수에 따라 늘어남"""
+        repo = backend()
+        empty = sum(repo.memory_usage(ObjectSizer()).values())
+        for i in range(200):
+            repo.create(f"항목 {i}", datetime(2026, 1, 1))
+
+        usage = repo.memory_usage(ObjectSizer())
+
+        assert sum(usage.values()) > empty + 200 * 100
+        assert max(usage, key=usage.get) in ('items', 'todos')
+
+    @pytest.mark.parametrize('backend', [TodoRepository, ListTodoRepository])
+    def test_sizing_does_not_block_writes(self, backend):
+        """구조 참조만 잠금 안에서 모으고 크기는 잠금 밖에서 재므로 재는 동안에도 쓰기가 진행됨"""
+        repo = backend()
+        repo.create("항목", datetime(2026, 1, 1))
+        written = []
+
+        class WritingSizer(ObjectSizer):
+            def size(self, obj):
+                if not written:
+                    writer = threading.Thread(target=lambda: written.append(repo.create("쓰기", datetime(2026, 1, 2))))
+                    writer.start()
+                    writer.join(1)
+                    assert written, "크기를 재는 동안 쓰기 잠금을 쥐고 있음"
+                return super().size(obj)
+
+        repo.memory_usage(WritingSizer())
+        assert repo.count() == 2
+
+
+class TestMemoryRoutes:
+    """메모리 진단 관리자 API 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        todo_app = TodoApp(admin_token=ADMIN_TOKEN)
+        todo_app.initialize_sample_data()
+        yield todo_app.app.test_client()
+        tracemalloc.stop()
+
+    def test_requires_admin_token(self, client):
+        """토큰이 없으면 403"""
+        assert client.get('/api/admin/memory').status_code == 403
+        assert client.post('/api/admin/memory/snapshots').status_code == 403
+
+    def test_overview(self, client):
+        """GC 통계와 구성 요소별 크기 (합계는 겹치지 않음)"""
+        body = client.get('/api/admin/memory', headers=HEADERS).get_json()
+
+        structures = body['structures']
+        assert {'repository', 'query_index', 'scheduler', 'mirror', 'idempotency', 'assets'} <= \
+            set(structures['components'])
+        assert structures['total'] == sum(c['total'] for c in structures['components'].values())
+        assert structures['components']['repository']['parts']['items'] > 0
+        assert len(body['gc']['generations']) == 3
+        assert 'structures' not in client.get('/api/admin/memory?structures=0', headers=HEADERS).get_json()
+
+    def test_snapshot_and_diff(self, client):
+        """추적 시작 후 두 스냅샷의 차이에 그 사이 할당한 위치가 나타남"""
+        assert client.post('/api/admin/memory/snapshots', headers=HEADERS).status_code == 409
+        assert client.post('/api/admin/memory/tracing', json={'frames': 2}, headers=HEADERS) \
+            .get_json()['tracing'] is True
+
+        base = client.post('/api/admin/memory/snapshots', headers=HEADERS).get_json()
+        retained = [bytearray(1024) for _ in range(200)]  # 이 줄에서 약 200KB 할당
+        later = client.post('/api/admin/memory/snapshots', headers=HEADERS).get_json()
+
+        diff = client.get(f"/api/admin/memory/snapshots/{later['id']}?base={base['id']}&limit=5",
+                          headers=HEADERS).get_json()
+        assert any(__file__ in stat['location'][0] and stat['size_diff'] >= 200 * 1024 for stat in diff['stats'])
+        top = client.get(f"/api/admin/memory/snapshots/{later['id']}?group_by=filename", headers=HEADERS)
+        assert top.status_code == 200 and top.get_json()['stats']
+        assert [s['id'] for s in client.get('/api/admin/memory/snapshots', headers=HEADERS).get_json()] == \
+            [later['id'], base['id']]
+        assert client.get(f"/api/admin/memory/snapshots/{later['id']}?group_by=x", headers=HEADERS).status_code == 400
+        assert client.get('/api/admin/memory/snapshots/missing', headers=HEADERS).status_code == 404
+        del retained
+
+        assert client.delete('/api/admin/memory/tracing', headers=HEADERS).get_json()['tracing'] is False
+        client.delete('/api/admin/memory/snapshots', headers=HEADERS)
+        assert client.get('/api/admin/memory/snapshots', headers=HEADERS).get_json() == []
@@ -0,0 +1,185 @@
+import pytest
+from datetime import datetime, timedelta
+from app import TodoApp
+from repositories import TodoRepository
+from repositories.id_table import IdTable
+from repositories.order_index import OrderIndex
+from services import TodoService
+from utils import TodoNotFoundError, InvalidTodoError
+
+
+class TestOrderIndex:
+    """OrderIndex 자료구조 테스트"""
+
+    @pytest.fixture
+    def small_chunks(self, monkeypatch):
+        """청크 분할이 자주 일어나도록 청크 크기 축소"""
+        monkeypatch.setattr(OrderIndex, '_LOAD', 2)
+
+    def test_append_and_iterate(self, small_chunks):
+        """추가한 순서대로 순회"""
+        index = OrderIndex()
+        for sid in range(7):
+            index.append(sid)
+
+        assert list(index) == [0, 1, 2, 3, 4, 5, 6]
+        assert len(index) == 7
+        assert index.index(4) == 4
+
+    def test_move_before_and_after(self, small_chunks):
+        """기준 항목 앞/뒤로 이동"""
+        index = OrderIndex(range(6))
+
+        index.move_before(5, 1)
+        assert list(index) == [0, 5, 1, 2, 3, 4]
+
+        index.move_after(0, 4)
+        assert list(index) == [5, 1, 2, 3, 4, 0]
+
+    def test_move_to_position_is_clamped(self, small_chunks):
+        """위치 이동은 범위를 벗어나면 양 끝으로 보정"""
+        index = OrderIndex(range(5))
+
+        index.move_to(4, 1)
+        assert list(index) == [0, 4, 1, 2, 3]
+
+        index.move_to(0, 100)
+        index.move_to(3, -5)
+        assert list(index) == [3, 4, 1, 2, 0]
+
+    def test_move_with_unknown_ids(self):
+        """없는 sid는 이동하지 않음"""
+        index = OrderIndex([0, 1, 2])
+
+        assert index.move_before(9, 0) is False
+        assert index.move_after(0, 9) is False
+        assert list(index) == [0, 1, 2]
+
+    def test_exhausted_rank_gap_is_renumbered(self, small_chunks):
+        """같은 자리로 반복 이동해 키 간격이 소진되어도 순서 유지"""
+        index = OrderIndex(range(4))
+        expected = [0, 1, 2, 3]
+
+        for _ in range(80):
+            sid = expected[-1]
+            index.move_after(sid, 0)
+            expected.remove(sid)
+            expected.insert(1, sid)
+
+        assert list(index) == expected
+        assert [index.index(sid) for sid in expected] == [0, 1, 2, 3]
+
+    def test_discard(self, small_chunks):
+        """제거 후 위치 재계산 및 sid 재사용"""
+        index = OrderIndex(range(6))
+
+        assert index.discard(2) is True
+        assert index.discard(2) is False
+        assert list(index) == [0, 1, 3, 4, 5]
+        assert index.index(5) == 4
+
+        index.append(2)
+        assert list(index) == [0, 1, 3, 4, 5, 2]
+
+
+class TestIdTable:
+    """IdTable 인터닝 테이블 테스트"""
+
+    def test_intern_is_stable(self):
+        """같은 ID는 같은 sid"""
+        table = IdTable()
+
+        assert table.intern('a') == table.intern('a') == 0
+        assert table.intern('b') == 1
+        assert len(table) == 2
+
+    def test_released_sid_is_reused(self):
+        """삭제된 sid는 재사용되어 범위가 커지지 않음"""
+        table = IdTable()
+        for todo_id in 'abc':
+            table.intern(todo_id)
+
+        assert table.release('b') == 1
+        assert table.get('b') is None
+        assert table.intern('d') == 1
+        assert table.capacity == 3
+
+    def test_repository_reuses_slots(self):
+        """저장소는 삭제 표시 정리 후 생성 시 항목 슬롯을 재사용"""
+        repo = TodoRepository(undo_window=0)
+        first = repo.create("항목 1", datetime.now())
+        second = repo.create("항목 2", datetime.now())
+
+        repo.delete(first.id)
+        assert repo.compact() == 1
+        third = repo.create("항목 3", datetime.now())
+
+        assert len(repo._items) == 2
+        assert [todo.id for todo in repo.get_all()] == [second.id, third.id]
+        assert repo.get_by_id(first.id) is None
+        assert repo.get_order() == [second.id, third.id]
+
+
+class TestMoveTodo:
+    """TODO 이동 API 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        """TODO 4개가 있는 서비스"""
+        service = TodoService(TodoRepository())
+        for i in range(4):
+            service.create_todo(f"항목 {i}", datetime.now() + timedelta(days=i))
+        return service
+
+    def test_move_todo_before(self, service):
+        """서비스 계층 이동"""
+        a, b, c, d = service.get_all_todos()
+
+        index = service.move_todo(d.id, before=b.id)
+
+        assert index == 1
+        assert [todo.id for todo in service.get_all_todos()] == [a.id, d.id, b.id, c.id]
+
+    def test_move_todo_requires_single_target(self, service):
+        """이동 대상은 하나만 지정"""
+        a, b, _, _ = service.get_all_todos()
+
+        with pytest.raises(InvalidTodoError):
+            service.move_todo(a.id)
+        with pytest.raises(InvalidTodoError):
+            service.move_todo(a.id, before=b.id, position=0)
+
+    def test_move_todo_unknown_anchor(self, service):
+        """기준 항목이 없으면 TodoNotFoundError"""
+        a = service.get_all_todos()[0]
+
+        with pytest.raises(TodoNotFoundError):
+            service.move_todo(a.id, after='non-existent-id')
+        with pytest.raises(TodoNotFoundError):
+            service.move_todo('non-existent-id', position=0)
+
+    def test_set_order_keeps_unlisted_items(self, service):
+        """전체 순서 설정 시 빠진 항목은 뒤에 유지"""
+        a, b, c, d = service.get_all_todos()
+
+        service.reorder_todos([c.id, 'unknown', a.id])
+
+        assert [todo.id for todo in service.get_all_todos()] == [c.id, a.id, b.id, d.id]
+
+    def test_move_endpoint(self):
+        """POST /api/todos/<id>/move"""
+        todo_app = TodoApp()
+        todo_app.initialize_sample_data()
+        client = todo_app.app.test_client()
+        ids = [todo['id'] for todo in client.get('/api/todos').get_json()]
+
+        response = client.post(f'/api/todos/{ids[2]}/move', json={'position': 0})
+        assert response.status_code == 200
+        assert response.get_json() == {'id': ids[2], 'index': 0}
+
+        response = client.post(f'/api/todos/{ids[2]}/move', json={'after': ids[1]})
+        assert response.get_json()['index'] == 2
+        assert [todo['id'] for todo in client.get('/api/todos').get_json()] == ids
+
+        assert client.post(f'/api/todos/{ids[0]}/move', json={}).status_code == 400
+        assert client.post(f'/api/todos/{ids[0]}/move', json={'before': 'nope'}).status_code == 404
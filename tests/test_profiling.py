@@ -0,0 +1,97 @@
+import marshal
+import pytest
+from app import TodoApp
+
+ADMIN_TOKEN = 'test-admin-token'
+
+
+class TestRequestProfiling:
+    """요청 단위 프로파일링 테스트"""
+
+    @pytest.fixture
+    def todo_app(self):
+        """관리자 토큰이 설정된 앱"""
+        todo_app = TodoApp(admin_token=ADMIN_TOKEN)
+        todo_app.initialize_sample_data()
+        return todo_app
+
+    @pytest.fixture
+    def client(self, todo_app):
+        """테스트 클라이언트"""
+        return todo_app.app.test_client()
+
+    def test_request_without_flag_is_not_profiled(self, client, todo_app):
+        """플래그가 없으면 프로파일링하지 않음"""
+        response = client.put('/api/todos/sort/date')
+
+        assert response.status_code == 200
+        assert 'X-Profile-Id' not in response.headers
+        assert todo_app.profile_store.list() == []
+
+    def test_flag_without_admin_token_is_ignored(self, client, todo_app):
+        """관리자 토큰이 없으면 플래그를 무시"""
+        response = client.put('/api/todos/sort/date', headers={'X-Profile': '1'})
+
+        assert response.status_code == 200
+        assert 'X-Profile-Id' not in response.headers
+        assert todo_app.profile_store.list() == []
+
+    def test_profile_with_header(self, client, todo_app):
+        """헤더로 요청한 프로파일이 저장됨"""
+        response = client.put(
+            '/api/todos/sort/date',
+            headers={'X-Profile': '1', 'X-Admin-Token': ADMIN_TOKEN}
+        )
+
+        assert response.status_code == 200
+        assert len(response.get_json()) == 3
+        profile_id = response.headers['X-Profile-Id']
+        record = todo_app.profile_store.get(profile_id)
+        assert record.method == 'PUT'
+        assert record.path == '/api/todos/sort/date'
+
+    def test_profile_with_query_flag(self, client, todo_app):
+        """쿼리 플래그로 프로파일링"""
+        response = client.get('/api/stats?_profile=1', headers={'X-Admin-Token': ADMIN_TOKEN})
+
+        assert response.status_code == 200
+        assert todo_app.profile_store.get(response.headers['X-Profile-Id']) is not None
+
+    def test_list_and_download_profiles(self, client):
+        """프로파일 목록 조회 및 다운로드"""
+        headers = {'X-Admin-Token': ADMIN_TOKEN}
+        profiled = client.get('/api/todos', headers={**headers, 'X-Profile': '1'})
+        profile_id = profiled.headers['X-Profile-Id']
+
+        listing = client.get('/api/admin/profiles', headers=headers)
+        assert listing.status_code == 200
+        assert listing.get_json()[0]['id'] == profile_id
+
+        download = client.get(f'/api/admin/profiles/{profile_id}', headers=headers)
+        assert download.status_code == 200
+        stats = marshal.loads(download.data)
+        assert any(func[2] == 'get_todos' for func in stats)
+
+        text = client.get(f'/api/admin/profiles/{profile_id}?format=text', headers=headers)
+        assert 'function calls' in text.get_data(as_text=True)
+
+    def test_admin_routes_require_token(self, client):
+        """관리자 라우트는 토큰 필요"""
+        assert client.get('/api/admin/profiles').status_code == 403
+        assert client.get('/api/admin/profiles', headers={'X-Admin-Token': 'wrong'}).status_code == 403
+
+    def test_admin_disabled_without_configured_token(self, monkeypatch):
+        """토큰이 설정되지 않으면 관리자 기능 비활성화"""
+        monkeypatch.delenv('TODO_ADMIN_TOKEN', raising=False)
+        client = TodoApp().app.test_client()
+
+        response = client.get('/api/todos', headers={'X-Profile': '1', 'X-Admin-Token': ''})
+
+        assert 'X-Profile-Id' not in response.headers
+        assert client.get('/api/admin/profiles').status_code == 403
+
+    def test_profile_not_found(self, client):
+        """존재하지 않는 프로파일"""
+        response = client.get('/api/admin/profiles/unknown', headers={'X-Admin-Token': ADMIN_TOKEN})
+
+        assert response.status_code == 404
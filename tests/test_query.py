@@ -0,0 +1,213 @@
+import random
+import pytest
+from datetime import datetime, timedelta, timezone
+from app import TodoApp
+from models import TodoQuery, TodoStatus
+from repositories import TodoRepository, ListTodoRepository, QueryIndex
+from repositories.date_index import DateIndex
+from services import QueryPlanner
+
+WORDS = ['회의 준비', '보고서 작성', 'Python 공부', '운동', '장보기', 'Flask 배포', '코드 리뷰']
+STATUSES = [status.value for status in TodoStatus]
+
+
+def fill(repo, count, seed=0):
+    """무작위 내용/날짜/상태의 항목 count개"""
+    rng = random.Random(seed)
+    for i in range(count):
+        repo.create(f"{rng.choice(WORDS)} {i}", datetime(2026, 1, 1) + timedelta(days=rng.randrange(120)),
+                    rng.choice(list(TodoStatus)))
+
+
+def brute_force(repo, query):
+    """저장소 전체를 걸러 계산한 기대 결과"""
+    todos = [todo for todo in repo.get_all()
+             if (query.statuses is None or todo.status in query.statuses)
+             and (query.start is None or todo.target_date >= query.start)
+             and (query.end is None or todo.target_date < query.end)
+             and (query.text is None or query.text.casefold() in todo.content.casefold())]
+    key = query.sort.lstrip('-')
+    if key == 'date':
+        todos = [todo for todo in repo.get_by_date() if todo in todos]
+    elif key != 'order':
+        field = {'created': 'created_at', 'updated': 'updated_at', 'content': 'content'}[key]
+        todos.sort(key=lambda todo: getattr(todo, field) if key != 'content' else todo.content.casefold())
+    if query.sort.startswith('-'):
+        todos.reverse()
+    return todos
+
+
+class TestQueryIndex:
+    """상태/텍스트 인덱스 갱신 테스트"""
+
+    def test_follows_mutations(self):
+        """생성/수정/삭제/전체 삭제를 반영하고 대소문자를 무시"""
+        repo = TodoRepository()
+        a = repo.create("Flask 배포", datetime(2026, 1, 1))
+        index = QueryIndex()
+        index.attach(repo)  # 이미 있는 항목도 불러옴
+        b = repo.create("flask 공부", datetime(2026, 1, 2), TodoStatus.COMPLETED)
+
+        assert index.text_ids("FLASK") == {a.id, b.id}
+        assert index.status_count(["예정", "완료"]) == 2
+
+        repo.update(a.id, content="배포 준비", status=TodoStatus.IN_PROGRESS)
+        assert index.text_ids("flask") == {b.id}
+        assert index.status_ids(["진행중"]) == {a.id}
+        assert index.intersect({a.id, b.id}, statuses=["완료"], text="fl") == {b.id}
+
+        repo.delete(b.id)
+        assert index.text_ids("flask") == set()
+        assert index.text_estimate("x") is None
+        repo.clear_all()
+        assert index.status_count(STATUSES) == 0
+
+
+class TestQueryPlanner:
+    """조회 계획 선택과 결과 테스트"""
+
+    @pytest.fixture
+    def planner(self):
+        repo = TodoRepository()
+        fill(repo, 600)
+        index = QueryIndex()
+        index.attach(repo)
+        return QueryPlanner(repo, index)
+
+    @pytest.mark.parametrize('backend', [TodoRepository, ListTodoRepository])
+    def test_matches_brute_force(self, backend):
+        """무작위 조건 조합의 결과가 전체를 걸러 계산한 것과 같음"""
+        repo = backend()
+        fill(repo, 400)
+        index = QueryIndex()
+        index.attach(repo)
+        planner = QueryPlanner(repo, index)
+        rng = random.Random(1)
+        for _ in range(200):
+            start = datetime(2026, 1, 1) + timedelta(days=rng.randrange(120))
+            query = TodoQuery(
+                statuses=rng.choice([None, rng.sample(STATUSES, rng.randint(1, 2))]),
+                start=rng.choice([None, start]),
+                end=rng.choice([None, start + timedelta(days=rng.randint(1, 30))]),
+                text=rng.choice([None, '회의', 'python', '운', '1', '보고서 작성']),
+                sort=rng.choice(['order', 'date', '-date', 'created', '-updated', 'content']),
+            )
+            todos, total, plan = planner.execute(query)
+            assert todos == brute_force(repo, query), plan.to_dict()
+            assert total == plan.matched == len(todos)
+
+    def test_picks_most_selective_index(self, planner):
+        """예상 후보가 가장 적은 인덱스를 고르고 나머지는 교집합/필터로 처리"""
+        _, _, plan = planner.execute(TodoQuery())
+        assert plan.index == 'scan'
+
+        _, _, plan = planner.execute(TodoQuery(statuses=['완료'], text='배포'))
+        assert plan.index == 'text'
+        assert plan.intersected == ['status']
+        assert plan.filters == ['text']
+
+        _, _, plan = planner.execute(TodoQuery(statuses=['완료'], text='배포',
+                                               start=datetime(2026, 2, 1), end=datetime(2026, 2, 3)))
+        assert plan.index == 'date'
+        assert plan.candidates == plan.estimates['date']
+        assert plan.filters == ['status', 'text']
+
+        _, _, plan = planner.execute(TodoQuery(statuses=['완료', '진행중'], text='운'))
+        assert plan.index == 'status'  # 한 글자 검색어는 텍스트 인덱스를 쓸 수 없음
+        assert 'text' not in plan.estimates
+
+    def test_sort_strategies(self, planner):
+        """적은 결과는 순서 위치로, 많은 결과는 사용자 순서로 전체를 읽어 정렬"""
+        _, _, plan = planner.execute(TodoQuery(start=datetime(2026, 2, 1), end=datetime(2026, 2, 2)))
+        assert plan.sort == 'positions'
+        _, _, plan = planner.execute(TodoQuery(statuses=STATUSES[:2]))
+        assert plan.sort == 'order_scan'
+        todos, _, plan = planner.execute(TodoQuery(start=datetime(2026, 2, 1), sort='-date'))
+        assert plan.sort == 'index'
+        assert todos[0].target_date >= todos[-1].target_date
+
+    def test_pagination(self, planner):
+        """offset/limit은 정렬한 뒤 적용하고 전체 개수는 자르기 전 기준"""
+        everything, total, _ = planner.execute(TodoQuery(text='리뷰', sort='content'))
+        page, page_total, _ = planner.execute(TodoQuery(text='리뷰', sort='content', offset=5, limit=10))
+
+        assert page == everything[5:15]
+        assert page_total == total
+
+
+class TestQueryValidation:
+    """조회 조건 검증"""
+
+    @pytest.mark.parametrize('kwargs', [
+        {'sort': 'priority'}, {'sort': '-order'}, {'statuses': []}, {'statuses': ['없음']},
+        {'offset': -1}, {'start': datetime(2026, 2, 1), 'end': datetime(2026, 1, 1)},
+    ])
+    def test_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            TodoQuery(**kwargs)
+
+    def test_normalizes(self):
+        query = TodoQuery(statuses=['완료', '완료'], text='  ')
+        assert query.statuses == ['완료']
+        assert query.text is None
+
+    def test_aware_dates_are_local_time(self):
+        """시간대가 있는 구간은 목표 날짜와 같은 규칙으로 지역 시각으로 변환"""
+        start = datetime(2026, 1, 2, tzinfo=timezone(timedelta(hours=9)))
+        query = TodoQuery(start=start, end=datetime(2026, 1, 3))
+        assert query.start == start.astimezone().replace(tzinfo=None)
+
+
+class TestQueryRoute:
+    """조합 조회 API 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        todo_app = TodoApp()
+        fill(todo_app.repository, 50)
+        return todo_app.app.test_client()
+
+    def test_query_and_explain(self, client):
+        """조건을 조합해 조회하고 explain=1이면 실행 계획을 반환"""
+        response = client.get('/api/todos/query?status=예정,완료&q=python&sort=-date&limit=2')
+
+        assert response.status_code == 200
+        todos = response.get_json()
+        assert len(todos) <= 2
+        assert all(todo['status'] in ('예정', '완료') and 'python' in todo['content'].lower() for todo in todos)
+        assert response.headers['X-Query-Index'] in ('status', 'text')
+
+        response = client.get('/api/todos/query?start=2026-02-01&end=2026-02-03&explain=1')
+        body = response.get_json()
+        assert body['plan']['index'] == 'date'
+        assert body['total'] == body['plan']['matched']
+
+    def test_invalid_query(self, client):
+        assert client.get('/api/todos/query?sort=priority').status_code == 400
+        assert client.get('/api/todos/query?status=없음').status_code == 400
+        assert client.get('/api/todos/query?start=어제').status_code == 400
+
+    def test_aware_range(self, client):
+        """시간대가 있는 start/end도 500이 아니라 지역 시각 기준으로 조회"""
+        naive = client.get('/api/todos/query?start=2026-02-01T00:00:00&end=2026-02-03T00:00:00').get_json()
+        offset = datetime(2026, 2, 1).astimezone().strftime('%z')
+        offset = f'{offset[:3]}:{offset[3:]}'.replace('+', '%2B')
+        response = client.get(f'/api/todos/query?start=2026-02-01T00:00:00{offset}'
+                              f'&end=2026-02-03T00:00:00{offset}&sort=-date')
+
+        assert response.status_code == 200
+        assert sorted(todo['id'] for todo in response.get_json()) == sorted(todo['id'] for todo in naive)
+
+
+class TestDateIndexCount:
+    """날짜 구간 개수 테스트"""
+
+    def test_count_range_matches_range(self, monkeypatch):
+        monkeypatch.setattr(DateIndex, '_LOAD', 4)
+        repo = TodoRepository()
+        fill(repo, 200)
+        rng = random.Random(2)
+        for _ in range(50):
+            start = datetime(2026, 1, 1) + timedelta(days=rng.randrange(130))
+            end = start + timedelta(days=rng.randrange(40))
+            assert repo.count_by_date_range(start, end) == len(repo.get_by_date_range(start, end))
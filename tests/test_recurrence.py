@@ -0,0 +1,306 @@
+import random
+import time
+import pytest
+from datetime import datetime, timedelta
+from app import TodoApp
+from models import RecurrenceRule, TodoStatus
+from models.recurrence import MAX_RECURRENCE_COUNT
+from repositories import RecurrenceStore, TodoRepository
+from repositories.recurrence import occurrence_id, _CompiledRule
+from services import TodoService
+from utils import InvalidTodoError, TodoNotFoundError
+
+MARCH = (datetime(2026, 3, 1), datetime(2026, 4, 1))
+
+
+def dates(todos):
+    """TodoItem 목록의 목표 날짜"""
+    return [todo.target_date for todo in todos]
+
+
+class TestRecurrenceExpansion:
+    """회차 계산 테스트"""
+
+    @pytest.fixture
+    def store(self):
+        return RecurrenceStore()
+
+    def test_daily_window(self, store):
+        """구간 안의 회차만 계산 (start 포함, end 제외)"""
+        rule = store.add(RecurrenceRule(content="물 마시기", start=datetime(2025, 1, 1, 9), frequency="daily"))
+
+        todos = store.occurrences(datetime(2026, 3, 1, 9), datetime(2026, 3, 4, 9))
+
+        assert dates(todos) == [datetime(2026, 3, d, 9) for d in (1, 2, 3)]
+        assert all(todo.status == TodoStatus.SCHEDULED for todo in todos)
+        assert todos[0].id == occurrence_id(rule.id, datetime(2026, 3, 1, 9))
+
+    def test_weekly_weekdays_and_interval(self, store):
+        """격주 월/목 반복 (시작 날짜 이전 요일은 제외)"""
+        store.add(RecurrenceRule(content="회의", start=datetime(2026, 3, 4, 10), frequency="weekly",
+                                 interval=2, weekdays=[0, 3]))
+
+        todos = store.occurrences(*MARCH)
+
+        assert dates(todos) == [datetime(2026, 3, 5, 10), datetime(2026, 3, 16, 10),
+                                datetime(2026, 3, 19, 10), datetime(2026, 3, 30, 10)]
+
+    def test_monthly_skips_missing_days(self, store):
+        """31일 반복은 31일이 없는 달을 건너뜀"""
+        store.add(RecurrenceRule(content="정산", start=datetime(2026, 1, 31), frequency="monthly"))
+
+        todos = store.occurrences(datetime(2026, 1, 1), datetime(2026, 8, 1))
+
+        assert [when.month for when in dates(todos)] == [1, 3, 5, 7]
+
+    def test_until_and_count(self, store):
+        """until은 마지막 회차 포함, count는 전체 회차 수"""
+        store.add(RecurrenceRule(content="A", start=datetime(2026, 3, 1), frequency="daily",
+                                 until=datetime(2026, 3, 3)))
+        store.add(RecurrenceRule(content="B", start=datetime(2026, 3, 1), frequency="weekly", count=2))
+
+        todos = store.occurrences(*MARCH)
+
+        assert [(todo.content, todo.target_date.day) for todo in todos] == [
+            ("A", 1), ("B", 1), ("A", 2), ("A", 3), ("B", 8)
+        ]
+        assert store.count(*MARCH) == 5
+
+    def test_matches_rrule(self):
+        """직접 계산한 회차가 dateutil rrule의 결과와 같음"""
+        rng = random.Random(0)
+        for _ in range(500):
+            options = {
+                'content': "x",
+                'start': datetime(2020, rng.randint(1, 12), rng.randint(1, 28), rng.randrange(24)),
+                'frequency': rng.choice(["daily", "weekly", "monthly", "yearly"]),
+                'interval': rng.randint(1, 4),
+            }
+            if rng.random() < 0.2:  # 없는 달이 있는 날짜
+                options['start'] = rng.choice([datetime(2020, 1, 31, 8), datetime(2020, 2, 29, 8)])
+            if rng.random() < 0.5:
+                options['weekdays'] = rng.sample(range(7), rng.randint(1, 3))
+            if rng.random() < 0.3:
+                options['until'] = options['start'] + timedelta(days=rng.randrange(2000))
+            elif rng.random() < 0.3:
+                options['count'] = rng.randint(1, 40) if rng.random() < 0.8 else rng.randint(1, 2_000)
+            compiled = _CompiledRule(RecurrenceRule(**options))
+            start = datetime(2019, 6, 1) + timedelta(days=rng.randrange(2500), hours=rng.randrange(24))
+            end = start + timedelta(days=rng.randrange(1, 800))
+
+            expected = [when for when in compiled.rrule.between(start, end, inc=True) if when < end]
+            assert compiled.between(start, end) == expected, options
+
+    @pytest.mark.parametrize('options', [
+        {'frequency': "daily"},
+        {'frequency': "daily", 'interval': 3, 'weekdays': [1, 5]},
+        {'frequency': "weekly", 'interval': 2, 'weekdays': [0, 4, 6]},
+        {'frequency': "monthly", 'start': datetime(2020, 1, 31)},
+        {'frequency': "monthly", 'start': datetime(2020, 1, 29), 'interval': 5},
+        {'frequency': "yearly", 'start': datetime(2020, 2, 29)},
+    ])
+    def test_large_count_is_not_expanded(self, options):
+        """회차 수 제한 규칙도 수열로 계산하면 회차를 펼치지 않고 마지막 회차를 바로 계산"""
+        options = {'content': "x", 'start': datetime(2020, 3, 4, 9), 'count': MAX_RECURRENCE_COUNT, **options}
+
+        compiled = _CompiledRule(RecurrenceRule(**options))
+        expected = list(compiled.rrule)
+
+        assert compiled.dates is None
+        if len(expected) == MAX_RECURRENCE_COUNT:
+            assert compiled.last == expected[-1]
+        else:  # rrule은 9999년에서 멈추므로 datetime 범위 밖의 마지막 회차는 끝없는 규칙으로 취급
+            assert compiled.last is None
+        window = (expected[-1] - timedelta(days=400), expected[-1] + timedelta(days=400))
+        assert compiled.between(*window) == [when for when in expected if window[0] <= when < window[1]]
+
+    def test_count_upper_bound(self):
+        """회차 수는 MAX_RECURRENCE_COUNT까지 (요일을 지정한 월/연 규칙은 펼쳐 두므로)"""
+        start = datetime(2026, 3, 2)
+        compiled = _CompiledRule(RecurrenceRule(content="x", start=start, frequency="monthly",
+                                                weekdays=[0], count=MAX_RECURRENCE_COUNT))
+        assert len(compiled.dates) == MAX_RECURRENCE_COUNT
+        with pytest.raises(ValueError):
+            RecurrenceRule(content="x", start=start, frequency="daily", count=MAX_RECURRENCE_COUNT + 1)
+
+    def test_invalid_rules(self):
+        """잘못된 규칙은 생성 시 거부"""
+        start = datetime(2026, 3, 1)
+        with pytest.raises(ValueError):
+            RecurrenceRule(content=" ", start=start, frequency="daily")
+        with pytest.raises(ValueError):
+            RecurrenceRule(content="x", start=start, frequency="hourly")
+        with pytest.raises(ValueError):
+            RecurrenceRule(content="x", start=start, frequency="weekly", weekdays=[7])
+        with pytest.raises(ValueError):
+            RecurrenceRule(content="x", start=start, frequency="daily", until=start, count=3)
+        with pytest.raises(ValueError):
+            RecurrenceRule(content="x", start=start, frequency="daily", until=start - timedelta(days=1))
+
+    def test_thousands_of_rules(self, store):
+        """오래전에 시작한 규칙 5천 개의 한 달 구간 계산"""
+        for i in range(5_000):
+            store.add(RecurrenceRule(content=f"규칙 {i}", start=datetime(2020, 1, 1) + timedelta(days=i % 700),
+                                     frequency=["daily", "weekly"][i % 2]))
+
+        started = time.perf_counter()
+        count = store.count(*MARCH)
+        elapsed = time.perf_counter() - started
+
+        assert 2_500 * (31 + 4) <= count <= 2_500 * (31 + 5)  # 매일 31회 + 매주 4~5회
+        assert elapsed < 1.0
+
+
+class TestRecurringTodoService:
+    """반복 TODO 서비스 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        return TodoService(TodoRepository())
+
+    @pytest.fixture
+    def rule(self, service):
+        return service.create_recurrence("운동", datetime(2026, 3, 2, 7), "daily")
+
+    def test_rules_are_not_materialized(self, service, rule):
+        """규칙을 만들어도 저장소에는 항목이 생기지 않음"""
+        assert service.get_todo_count() == 0
+        assert service.get_recurrences() == [rule]
+
+    def test_range_merges_stored_todos(self, service, rule):
+        """구간 조회는 저장된 TODO와 회차를 날짜순으로 합침"""
+        todo = service.create_todo("보고서", datetime(2026, 3, 3, 12), TodoStatus.IN_PROGRESS)
+
+        todos = service.get_todos_in_range(datetime(2026, 3, 2), datetime(2026, 3, 5))
+
+        assert [(t.content, t.target_date.day) for t in todos] == [
+            ("운동", 2), ("운동", 3), ("보고서", 3), ("운동", 4)
+        ]
+        assert [t.id for t in service.get_todos_in_range(datetime(2026, 3, 2), datetime(2026, 3, 5),
+                                                         TodoStatus.IN_PROGRESS)] == [todo.id]
+        assert len(service.get_todos_in_range(datetime(2026, 3, 2), datetime(2026, 3, 5),
+                                              TodoStatus.SCHEDULED)) == 3
+
+    def test_complete_materializes_occurrence(self, service, rule):
+        """회차를 완료하면 일반 TODO로 저장되고 그 회차는 다시 계산하지 않음"""
+        occurrence = occurrence_id(rule.id, datetime(2026, 3, 3, 7))
+
+        todo = service.update_todo(occurrence, status=TodoStatus.COMPLETED)
+
+        assert todo.id != occurrence and todo.status == TodoStatus.COMPLETED
+        assert todo.content == "운동" and todo.target_date == datetime(2026, 3, 3, 7)
+        assert service.get_todo_count() == 1
+        window = service.get_todos_in_range(datetime(2026, 3, 3), datetime(2026, 3, 4))
+        assert [t.id for t in window] == [todo.id]
+        with pytest.raises(TodoNotFoundError):
+            service.update_todo(occurrence, status=TodoStatus.COMPLETED)
+
+    def test_invalid_update_keeps_occurrence(self, service, rule):
+        """수정 값이 잘못되면 회차를 저장하지 않음"""
+        occurrence = occurrence_id(rule.id, datetime(2026, 3, 3, 7))
+
+        with pytest.raises(InvalidTodoError):
+            service.update_todo(occurrence, content=" ")
+
+        assert service.get_todo_count() == 0
+        assert service.get_todo_by_id(occurrence).content == "운동"
+
+    def test_delete_occurrence(self, service, rule):
+        """회차 삭제는 그 회차만 제외"""
+        occurrence = occurrence_id(rule.id, datetime(2026, 3, 3, 7))
+
+        service.delete_todo(occurrence)
+
+        window = service.get_todos_in_range(datetime(2026, 3, 2), datetime(2026, 3, 5))
+        assert [t.target_date.day for t in window] == [2, 4]
+        with pytest.raises(TodoNotFoundError):
+            service.delete_todo(occurrence)
+        with pytest.raises(TodoNotFoundError):
+            service.get_todo_by_id(occurrence_id(rule.id, datetime(2026, 3, 3, 8)))  # 회차가 아닌 시각
+
+    def test_delete_rule_keeps_materialized(self, service, rule):
+        """규칙을 삭제해도 저장된 회차는 남음"""
+        todo = service.update_todo(occurrence_id(rule.id, datetime(2026, 3, 3, 7)), content="달리기")
+
+        service.delete_recurrence(rule.id)
+
+        window = service.get_todos_in_range(*MARCH)
+        assert [t.id for t in window] == [todo.id]
+        with pytest.raises(TodoNotFoundError):
+            service.delete_recurrence(rule.id)
+
+    def test_statistics_window(self, service, rule):
+        """구간 통계는 회차를 '예정'으로 집계"""
+        service.create_todo("보고서", datetime(2026, 3, 10), TodoStatus.COMPLETED)
+        service.create_todo("다음 달", datetime(2026, 4, 10))
+        service.update_todo(occurrence_id(rule.id, datetime(2026, 3, 5, 7)), status=TodoStatus.IN_PROGRESS)
+
+        stats = service.get_statistics(*MARCH)
+
+        assert stats == {'total': 31, 'scheduled': 29, 'in_progress': 1, 'completed': 1}
+        assert service.get_statistics()['total'] == 3
+        with pytest.raises(InvalidTodoError):
+            service.get_statistics(MARCH[1], MARCH[0])
+
+
+class TestRecurrenceRoutes:
+    """반복 TODO API 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        return TodoApp().app.test_client()
+
+    @pytest.fixture
+    def rule(self, client):
+        response = client.post('/api/recurrences', json={
+            'content': "주간 보고", 'start': "2026-03-02T09:00:00", 'frequency': "weekly", 'weekdays': [0, 4]
+        })
+        assert response.status_code == 201
+        return response.get_json()
+
+    def test_create_and_list(self, client, rule):
+        """규칙 생성/조회/삭제"""
+        assert rule['frequency'] == "weekly" and rule['weekdays'] == [0, 4]
+        assert client.get('/api/recurrences').get_json() == [rule]
+        assert client.get('/api/todos').get_json() == []
+
+        assert client.delete(f"/api/recurrences/{rule['id']}").status_code == 200
+        assert client.delete(f"/api/recurrences/{rule['id']}").status_code == 404
+
+    def test_invalid_rule(self, client):
+        """잘못된 규칙은 400"""
+        assert client.post('/api/recurrences', json={'content': "x"}).status_code == 400
+        response = client.post('/api/recurrences', json={
+            'content': "x", 'start': "2026-03-02", 'frequency': "hourly"
+        })
+        assert response.status_code == 400
+        response = client.post('/api/recurrences', json={
+            'content': "x", 'start': "2026-03-02", 'frequency': "monthly", 'weekdays': [0],
+            'count': MAX_RECURRENCE_COUNT + 1
+        })
+        assert response.status_code == 400
+
+    def test_range_query_and_filters(self, client, rule):
+        """상태 필터 라우트의 ?start=&end= 구간 조회"""
+        todos = client.get('/api/todos/all?start=2026-03-01&end=2026-03-15').get_json()
+
+        assert [todo['target_date'] for todo in todos] == [
+            "2026-03-02T09:00:00", "2026-03-06T09:00:00", "2026-03-09T09:00:00", "2026-03-13T09:00:00"
+        ]
+        assert len(client.get('/api/todos/예정?start=2026-03-01&end=2026-03-15').get_json()) == 4
+        assert client.get('/api/todos/완료?start=2026-03-01&end=2026-03-15').get_json() == []
+        assert client.get('/api/todos/all?start=2026-03-01').status_code == 400
+        assert client.get('/api/todos/all?start=2026-03-15&end=2026-03-01').status_code == 400
+
+    def test_update_and_delete_occurrence(self, client, rule):
+        """회차 ID로 완료/삭제"""
+        todos = client.get('/api/todos/all?start=2026-03-01&end=2026-03-15').get_json()
+
+        response = client.put(f"/api/todos/{todos[0]['id']}", json={'status': "완료"})
+        assert response.status_code == 200
+        assert response.get_json()['status'] == "완료" and '@' not in response.get_json()['id']
+        assert client.delete(f"/api/todos/{todos[1]['id']}").status_code == 200
+
+        stats = client.get('/api/stats?start=2026-03-01&end=2026-03-15').get_json()
+        assert stats == {'total': 3, 'scheduled': 2, 'in_progress': 0, 'completed': 1}
+        assert client.get('/api/stats').get_json()['total'] == 1
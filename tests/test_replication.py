@@ -0,0 +1,282 @@
+import json
+import os
+import random
+import time
+import pytest
+from datetime import datetime, timedelta
+from app import TodoApp
+from models import RecurrenceRule, TodoStatus
+from repositories import TodoRepository, ListTodoRepository, RecurrenceStore, ColdStore
+from repositories.replication import (
+    ReplicationLog, ReplicaRepository, ReplicationGapError, ReadOnlyReplicaError
+)
+
+
+def ship(log, replica):
+    """로그에서 복제본에 아직 없는 레코드를 읽어 적용 (보관 범위를 벗어나면 전체 상태)"""
+    lines = log.read(replica.version, 0)
+    if lines is None:
+        lines = [log.snapshot()[1]]
+    for line in lines:
+        replica.apply(json.loads(line))
+
+
+def dump(repo):
+    return [todo.model_dump() for todo in repo.get_all()]
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        time.sleep(0.01)
+
+
+class TestReplicaRepository:
+    """복제 레코드 적용 테스트"""
+
+    @pytest.mark.parametrize('backend', [TodoRepository, ListTodoRepository])
+    def test_random_operations_converge(self, backend):
+        """무작위 쓰기를 중간중간 복제하면 항목/순서/날짜순/버전이 주 저장소와 같음"""
+        primary = backend()
+        log = ReplicationLog(primary, max_records=40)
+        replica = ReplicaRepository()
+        rng = random.Random(7)
+        for i in range(1500):
+            ids = primary.get_order()
+            roll = rng.random()
+            if roll < 0.3 or not ids:
+                primary.create(f"항목 {i}", datetime(2026, 1, 1) + timedelta(days=rng.randrange(30)))
+            elif roll < 0.45:
+                primary.update(rng.choice(ids), content=f"수정 {i}", target_date=datetime(2026, 2, rng.randint(1, 28)))
+            elif roll < 0.6:
+                victim = rng.choice(ids)
+                primary.delete(victim)
+                if rng.random() < 0.5:
+                    primary.restore(victim)
+            elif roll < 0.75:
+                primary.move_to(rng.choice(ids), rng.randrange(len(ids)))
+            elif roll < 0.8:
+                primary.move_before(rng.choice(ids), rng.choice(ids))
+            elif roll < 0.85:
+                primary.sort_by_date()
+            elif roll < 0.88:
+                rng.shuffle(ids)
+                primary.set_order(ids)
+            elif roll < 0.885:
+                primary.clear_all()
+            if rng.random() < 0.2:
+                ship(log, replica)
+        ship(log, replica)
+
+        assert dump(replica) == dump(primary)
+        assert [todo.id for todo in replica.get_by_date()] == [todo.id for todo in primary.get_by_date()]
+        assert replica.version == primary.version
+
+    def test_restore_keeps_original_position(self):
+        """삭제 취소는 원래 위치의 create 레코드로 전달"""
+        primary = TodoRepository()
+        log = ReplicationLog(primary)
+        replica = ReplicaRepository()
+        ids = [primary.create(f"항목 {i}", datetime(2026, 1, 1)).id for i in range(4)]
+        ship(log, replica)
+
+        primary.delete(ids[1])
+        primary.restore(ids[1])
+        ship(log, replica)
+
+        assert replica.get_order() == ids
+        assert replica.get_by_id(ids[1]).created_at == primary.get_by_id(ids[1]).created_at
+
+    def test_gap_is_rejected(self):
+        """버전이 이어지지 않는 레코드는 적용하지 않음"""
+        primary = TodoRepository()
+        log = ReplicationLog(primary)
+        replica = ReplicaRepository()
+        primary.create("하나", datetime(2026, 1, 1))
+        primary.create("둘", datetime(2026, 1, 2))
+        second = json.loads(log.read(1, 0)[0])
+
+        with pytest.raises(ReplicationGapError):
+            replica.apply(second)
+        assert replica.count() == 0
+
+    def test_trimmed_log_requires_snapshot(self):
+        """보관 범위보다 뒤처지면 read()가 None을 반환하고 전체 상태로 따라잡음"""
+        primary = TodoRepository()
+        log = ReplicationLog(primary, max_records=3)
+        replica = ReplicaRepository()
+        for i in range(5):
+            primary.create(f"항목 {i}", datetime(2026, 1, 1))
+
+        assert log.read(0, 0) is None
+        assert len(log.read(2, 0)) == 3
+        assert log.read(5, 0) == []
+        ship(log, replica)
+        assert dump(replica) == dump(primary)
+        assert replica.version == 5
+
+    def test_side_state_follows_versions(self, tmp_path):
+        """반복 규칙/보관 계층 변경은 저장소 버전을 올리는 state 레코드로 복제"""
+        primary = TodoRepository()
+        log = ReplicationLog(primary)
+        rules, archive = RecurrenceStore(), ColdStore(str(tmp_path))
+        for name, store in (('recurrences', rules), ('archive', archive)):
+            log.add_state(name, store.replication_state)
+            store.add_listener(lambda name=name: primary.publish_state(name))
+        replica = ReplicaRepository()
+        replica_rules, replica_archive = RecurrenceStore(), ColdStore(str(tmp_path), replica=True)
+        replica.add_state('recurrences', replica_rules.load_state)
+        replica.add_state('archive', replica_archive.load_state)
+
+        rule = rules.add(RecurrenceRule(content="매일", start=datetime(2026, 1, 1), frequency='daily'))
+        rules.skip(f"{rule.id}@20260103T000000")
+        done = [primary.create(f"완료 {i}", datetime(2026, 1, 1), TodoStatus.COMPLETED) for i in range(3)]
+        archive.append(done, primary.evict)
+        archive.delete(done[0].id)
+        ship(log, replica)
+
+        assert replica.version == primary.version == 10  # 규칙 2 + 생성 3 + 보관(삭제 3 + 공개 1) + 보관 삭제 1
+        week = (datetime(2026, 1, 1), datetime(2026, 1, 8))
+        assert replica_rules.get_all() == rules.get_all() and replica_rules.count(*week) == 6
+        assert len(replica_archive) == 2 and replica_archive.get(done[1].id) == done[1]
+        assert replica.count() == 0
+
+        fresh_rules = RecurrenceStore()
+        fresh = ReplicaRepository()
+        fresh.add_state('recurrences', fresh_rules.load_state)
+        fresh.apply(json.loads(log.snapshot()[1]))
+        assert fresh.version == primary.version and fresh_rules.count(*week) == 6
+
+        rules.clear()
+        ship(log, replica)
+        assert replica_rules.get_all() == []
+
+    def test_writes_are_rejected(self):
+        """복제본의 공개 쓰기 메서드는 ReadOnlyReplicaError"""
+        replica = ReplicaRepository()
+        with pytest.raises(ReadOnlyReplicaError):
+            replica.create("항목", datetime(2026, 1, 1))
+        with pytest.raises(ReadOnlyReplicaError):
+            replica.clear_all()
+        with pytest.raises(ReadOnlyReplicaError):
+            replica.publish_state('recurrences')
+
+
+class TestReplicationOverSocket:
+    """주 서버/팔로워 앱을 소켓으로 연결한 테스트"""
+
+    @pytest.fixture
+    def primary(self, tmp_path):
+        todo_app = TodoApp(config={
+            'REPLICATION_ROLE': 'primary', 'REPLICATION_PORT': 0,
+            'ARCHIVE_DIR': str(tmp_path), 'ARCHIVE_AFTER': 0,
+        })
+        todo_app.shipper.heartbeat = 0.05
+        todo_app.shipper.start()
+        yield todo_app
+        todo_app.shipper.stop()
+
+    @pytest.fixture
+    def follower(self, primary, tmp_path):
+        todo_app = TodoApp(config={
+            'REPLICATION_ROLE': 'follower',
+            'REPLICATION_PORT': primary.shipper.address[1],
+            'ARCHIVE_DIR': str(tmp_path),
+        })
+        todo_app.follower.retry = 0.05
+        todo_app.follower.start()
+        yield todo_app
+        todo_app.follower.stop()
+
+    def test_read_your_writes(self, primary, follower):
+        """쓰기 응답의 버전을 X-Min-Version으로 보내면 팔로워가 그 쓰기를 반영한 뒤 응답"""
+        response = primary.app.test_client().post(
+            '/api/todos', json={'content': '복제 항목', 'target_date': '2026-03-01T00:00:00'}
+        )
+        token = response.headers['X-Todo-Version']
+
+        response = follower.app.test_client().get('/api/todos', headers={'X-Min-Version': token})
+
+        assert response.status_code == 200
+        assert [todo['content'] for todo in response.get_json()] == ['복제 항목']
+        assert int(response.headers['X-Todo-Version']) >= int(token)
+
+    def test_recurrences_and_archive_reach_follower(self, primary, follower):
+        """반복 규칙과 보관 계층도 X-Min-Version으로 기다린 팔로워가 주 서버와 같게 응답"""
+        writer, reader = primary.app.test_client(), follower.app.test_client()
+        primary.service.create_todo("완료", datetime(2026, 1, 3), TodoStatus.COMPLETED)
+        response = writer.post('/api/recurrences', json={
+            'content': '매일', 'start': '2026-01-01T00:00:00', 'frequency': 'daily'
+        })
+        token = response.headers['X-Todo-Version']
+
+        stats = '/api/stats?start=2026-01-01T00:00:00&end=2026-01-08T00:00:00'
+        headers = {'X-Min-Version': token}
+        assert reader.get(stats, headers=headers).get_json() == writer.get(stats).get_json()
+        assert reader.get('/api/recurrences', headers=headers).get_json() == \
+            writer.get('/api/recurrences').get_json()
+
+        assert primary.archiver.run_once() == 1
+        headers = {'X-Min-Version': str(primary.repository.version)}
+        for path in (stats, '/api/stats', '/api/archive'):
+            assert reader.get(path, headers=headers).get_json() == writer.get(path).get_json()
+
+        rule_id = writer.get('/api/recurrences').get_json()[0]['id']
+        token = writer.delete(f'/api/recurrences/{rule_id}').headers['X-Todo-Version']
+        assert reader.get('/api/recurrences', headers={'X-Min-Version': token}).get_json() == []
+
+    def test_follower_rejects_writes(self, follower):
+        """팔로워는 쓰기 요청을 405로 거부"""
+        response = follower.app.test_client().post(
+            '/api/todos', json={'content': '항목', 'target_date': '2026-03-01T00:00:00'}
+        )
+        assert response.status_code == 405
+        assert 'GET' in response.headers['Allow']
+
+    def test_unreachable_version_and_staleness(self, primary, follower):
+        """따라잡지 못한 버전이나 허용 지연 초과는 503"""
+        follower.app.config['REPLICA_WAIT'] = 0.05
+        client = follower.app.test_client()
+        wait_until(lambda: follower.follower.staleness() < 1)
+
+        assert client.get('/api/todos', headers={'X-Min-Version': '999'}).status_code == 503
+        assert client.get('/api/todos', headers={'X-Max-Staleness': '1'}).status_code == 200
+
+        primary.shipper.stop()
+        time.sleep(0.2)
+        response = client.get('/api/todos', headers={'X-Max-Staleness': '0.1'})
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+        assert client.get('/api/todos').status_code == 200  # 제한이 없으면 오래된 복제본도 응답
+
+    def test_resync_after_primary_restart(self, primary, follower):
+        """주 서버 로그가 바뀌면(재시작) 팔로워가 전체 상태부터 다시 받음"""
+        primary.service.create_todo("이전 항목", datetime(2026, 1, 1))
+        wait_until(lambda: follower.repository.count() == 1)
+        primary.shipper.stop()
+
+        restarted = TodoApp(config={
+            'REPLICATION_ROLE': 'primary',
+            'REPLICATION_PORT': primary.shipper.address[1],
+        })
+        restarted.service.create_todo("새 항목", datetime(2026, 1, 2))
+        restarted.service.create_todo("새 항목 2", datetime(2026, 1, 3))
+        restarted.shipper.start()
+        try:
+            wait_until(lambda: [t.content for t in follower.repository.get_all()] == ["새 항목", "새 항목 2"])
+        finally:
+            restarted.shipper.stop()
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="읽기 확장을 보려면 CPU 코어가 4개 이상 필요")
+class TestReadScaling:
+    """여러 프로세스로 띄운 팔로워의 읽기 처리량 테스트"""
+
+    def test_two_followers_serve_more_reads(self):
+        """팔로워를 2개로 늘리면 (클라이언트도 2배) 읽기 처리량이 늘어남"""
+        from benchmarks.bench_replication import measure_read_scaling
+
+        results = measure_read_scaling([1, 2], clients_per_follower=1, duration=2.0)
+
+        assert results[2] > 1.4 * results[1]
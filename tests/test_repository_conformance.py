@@ -0,0 +1,497 @@
+"""모든 저장소 백엔드가 통과해야 하는 적합성/성능 테스트
+
+새 백엔드는 BACKENDS에 (undo_window, clock)을 받는 생성자를 추가한다.
+"""
+import time
+import pytest
+from datetime import datetime
+from app import TodoApp
+from models import TodoItem, TodoStatus
+from repositories import BaseTodoRepository, ListTodoRepository, TodoRepository
+from repositories.events import MutationEvent
+
+BACKENDS = [TodoRepository, ListTodoRepository]
+
+
+class MinimalRepository(ListTodoRepository):
+    """추상 메서드만 구현한 백엔드처럼 보관 계층 메서드는 기본 구현을 쓰는 저장소"""
+    insert = BaseTodoRepository.insert
+    insert_many = BaseTodoRepository.insert_many
+    apply_update = BaseTodoRepository.apply_update
+    evict = BaseTodoRepository.evict
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda backend: backend.__name__)
+def backend(request):
+    """저장소 생성자"""
+    return request.param
+
+
+@pytest.fixture
+def clock():
+    """테스트에서 조작하는 시계"""
+    now = [0.0]
+    tick = lambda: now[0]
+    tick.now = now
+    return tick
+
+
+@pytest.fixture
+def repo(backend, clock) -> BaseTodoRepository:
+    return backend(undo_window=30.0, clock=clock)
+
+
+def fill(repo, count, date=None):
+    """항목 count개 생성 후 ID 목록 반환"""
+    return [repo.create(f"항목 {i}", date or datetime(2026, 1, 1 + i % 28)).id for i in range(count)]
+
+
+class TestCrudConformance:
+    """기본 생성/조회/수정 동작"""
+
+    def test_is_backend(self, repo):
+        """BaseTodoRepository 구현"""
+        assert isinstance(repo, BaseTodoRepository)
+
+    def test_create_appends_and_bumps_version(self, repo):
+        """생성한 항목은 맨 뒤에 붙고 쓰기마다 버전이 1씩 오름"""
+        ids = fill(repo, 3)
+
+        assert repo.get_order() == ids
+        assert repo.count() == 3
+        assert repo.version == 3
+        assert repo.get_by_id(ids[1]).content == "항목 1"
+        assert repo.get_by_id("없는-id") is None
+
+    def test_update(self, repo):
+        """수정은 지정한 필드만 바꾸고 새 객체를 돌려줌"""
+        [todo_id] = fill(repo, 1)
+        before = repo.get_by_id(todo_id)
+
+        updated = repo.update(todo_id, status=TodoStatus.COMPLETED)
+
+        assert updated.status == TodoStatus.COMPLETED
+        assert updated.content == before.content
+        assert before.status == TodoStatus.SCHEDULED
+        assert repo.update("없는-id", content="x") is None
+
+    def test_update_validates_changed_fields(self, repo):
+        """수정 값이 잘못되면 ValueError이고 항목은 그대로"""
+        [todo_id] = fill(repo, 1)
+        before = repo.get_by_id(todo_id)
+
+        with pytest.raises(ValueError):
+            repo.update(todo_id, content="   ")
+        with pytest.raises(ValueError):
+            repo.update(todo_id, status="없는 상태")
+
+        assert repo.get_by_id(todo_id) is before
+        assert repo.update(todo_id, content="  공백 제거  ").content == "공백 제거"
+
+    def test_apply_update(self, repo):
+        """검증한 변경은 바꾸는 필드와 수정 시각만 바꾸고 UPDATE 이벤트로 전달"""
+        todo_id, other_id = fill(repo, 2)
+        before = repo.get_by_id(todo_id)
+        events = []
+        repo.add_listener(events.append)
+
+        todo = repo.apply_update(todo_id, {'status': TodoStatus.COMPLETED.value,
+                                           'target_date': datetime(2026, 3, 1)})
+
+        assert repo.get_by_id(todo_id) is todo and before.status == TodoStatus.SCHEDULED
+        assert (todo.content, todo.status, todo.target_date) == \
+            (before.content, TodoStatus.COMPLETED, datetime(2026, 3, 1))
+        assert todo.created_at == before.created_at and todo.updated_at >= before.updated_at
+        assert [(event.op, event.previous) for event in events] == [(MutationEvent.UPDATE, before)]
+        assert [item.id for item in repo.get_by_date()] == [other_id, todo_id]
+        assert repo.apply_update("없는 ID", {'status': TodoStatus.COMPLETED.value}) is None
+
+    def test_events(self, repo):
+        """이벤트는 버전 순서대로 빠짐없이 전달되고 replay로 현재 항목을 받음"""
+        fill(repo, 2)
+        events = []
+        repo.add_listener(events.append, replay=True)
+        todo_id = repo.create("새 항목", datetime(2026, 2, 1)).id
+        repo.delete(todo_id)
+        repo.set_order([])
+        repo.publish_state('recurrences')
+
+        assert [event.op for event in events] == [
+            MutationEvent.CREATE, MutationEvent.CREATE, MutationEvent.CREATE,
+            MutationEvent.DELETE, MutationEvent.REORDER, MutationEvent.STATE,
+        ]
+        assert [event.version for event in events[2:]] == [3, 4, 5, 6]
+        assert len({event.sid for event in events[:3]}) == 3
+        assert events[-1].name == 'recurrences' and repo.count() == 2
+
+        repo.remove_listener(events.append)
+        repo.create("무시", datetime(2026, 2, 1))
+        assert len(events) == 6
+
+
+class TestOrderingAfterDelete:
+    """삭제 후 순서"""
+
+    def test_delete_keeps_relative_order(self, repo):
+        """삭제해도 나머지 항목의 상대 순서와 위치가 유지됨"""
+        ids = fill(repo, 5)
+
+        assert repo.delete(ids[2]) is True
+        assert repo.delete(ids[2]) is False
+
+        assert repo.get_order() == ids[:2] + ids[3:]
+        assert repo.index_of(ids[3]) == 2
+        assert repo.index_of(ids[2]) is None
+        assert repo.get_by_id(ids[2]) is None
+        assert repo.count() == 4
+
+    def test_create_after_delete_appends(self, repo):
+        """삭제 후 새로 만든 항목은 삭제된 자리가 아니라 맨 뒤에"""
+        ids = fill(repo, 3)
+        repo.delete(ids[0])
+
+        new_id = repo.create("새 항목", datetime(2026, 2, 1)).id
+
+        assert repo.get_order() == ids[1:] + [new_id]
+
+    def test_deleted_items_cannot_move(self, repo):
+        """삭제된 항목은 이동 대상이나 기준이 될 수 없음"""
+        ids = fill(repo, 3)
+        repo.delete(ids[1])
+
+        assert repo.move_to(ids[1], 0) is None
+        assert repo.move_before(ids[0], ids[1]) is None
+        assert repo.move_after(ids[1], ids[0]) is None
+        assert repo.get_order() == [ids[0], ids[2]]
+
+    def test_restore_returns_to_position(self, repo):
+        """복구하면 원래 위치로"""
+        ids = fill(repo, 4)
+        repo.delete(ids[2])
+
+        assert repo.restore(ids[2]).id == ids[2]
+        assert repo.get_order() == ids
+        assert repo.restore(ids[2]) is None
+
+    def test_restore_after_reorder_follows_previous_item(self, repo):
+        """삭제 후 전체 순서가 바뀌었으면 이전 앞 항목 바로 뒤로"""
+        ids = fill(repo, 4)
+        repo.delete(ids[2])
+        repo.set_order([ids[1], ids[3], ids[0]])
+
+        repo.restore(ids[2])
+
+        assert repo.get_order() == [ids[1], ids[2], ids[3], ids[0]]
+
+    def test_restore_expires(self, repo, clock):
+        """복구 가능 시간이 지나면 복구할 수 없고 정리 대상이 됨"""
+        ids = fill(repo, 2)
+        repo.delete(ids[0])
+        clock.now[0] = 31.0
+
+        assert repo.restore(ids[0]) is None
+        assert repo.compact() == 1
+        assert repo.tombstone_count() == 0
+
+    def test_clear_all(self, repo):
+        """전체 삭제는 복구할 수 없음"""
+        ids = fill(repo, 3)
+
+        repo.clear_all()
+
+        assert repo.count() == 0 and repo.get_all() == []
+        assert repo.restore(ids[0]) is None
+
+
+class TestSetOrder:
+    """set_order 동작"""
+
+    def test_unknown_ids_are_ignored(self, repo):
+        """모르는 ID는 무시"""
+        ids = fill(repo, 3)
+
+        repo.set_order(["없는-id", ids[2], "또-없는-id", ids[0], ids[1]])
+
+        assert repo.get_order() == [ids[2], ids[0], ids[1]]
+
+    def test_missing_ids_keep_previous_order(self, repo):
+        """빠진 항목은 기존 순서대로 뒤에 붙음"""
+        ids = fill(repo, 5)
+
+        repo.set_order([ids[3], ids[1]])
+
+        assert repo.get_order() == [ids[3], ids[1], ids[0], ids[2], ids[4]]
+
+    def test_duplicates_and_deleted_ids(self, repo):
+        """중복 ID는 첫 위치만, 삭제된 ID는 무시"""
+        ids = fill(repo, 3)
+        repo.delete(ids[0])
+
+        repo.set_order([ids[2], ids[0], ids[2], ids[1]])
+
+        assert repo.get_order() == [ids[2], ids[1]]
+        assert repo.count() == 2
+
+    def test_moves(self, repo):
+        """앞/뒤/위치 이동과 범위 밖 위치 보정"""
+        ids = fill(repo, 4)
+
+        assert repo.move_before(ids[3], ids[0]) == 0
+        assert repo.move_after(ids[0], ids[2]) == 3
+        assert repo.move_to(ids[1], 99) == 3
+        assert repo.move_to(ids[2], -5) == 0
+        assert repo.get_order() == [ids[2], ids[3], ids[0], ids[1]]
+        assert repo.move_before(ids[0], ids[0]) == 2
+
+
+class TestDateSortStability:
+    """날짜순 정렬의 안정성"""
+
+    def test_equal_dates_follow_creation_order(self, repo):
+        """같은 날짜는 사용자 순서와 무관하게 생성 순"""
+        ids = fill(repo, 6, date=datetime(2026, 3, 1))
+        repo.set_order(list(reversed(ids)))
+
+        assert [todo.id for todo in repo.get_by_date()] == ids
+
+    def test_sort_is_repeatable(self, repo):
+        """날짜순 저장을 반복해도 결과가 같음"""
+        ids = [repo.create(f"항목 {i}", datetime(2026, 1, 1 + i % 3)).id for i in range(9)]
+        expected = [ids[i] for i in (0, 3, 6, 1, 4, 7, 2, 5, 8)]
+
+        repo.sort_by_date()
+        assert repo.get_order() == expected
+        repo.move_to(expected[0], 8)
+        repo.sort_by_date()
+        assert repo.get_order() == expected
+
+    def test_date_change_and_filter(self, repo):
+        """날짜를 바꾸면 위치가 바뀌고, 상태 필터는 날짜순 유지"""
+        ids = fill(repo, 4)
+        repo.update(ids[3], target_date=datetime(2025, 1, 1), status=TodoStatus.COMPLETED)
+        repo.update(ids[1], status=TodoStatus.COMPLETED)
+
+        assert [todo.id for todo in repo.get_by_date()] == [ids[3], ids[0], ids[1], ids[2]]
+        assert [todo.id for todo in repo.get_by_date(TodoStatus.COMPLETED)] == [ids[3], ids[1]]
+        assert repo.get_order() == ids
+
+
+class TestBulkAndIndexedQueries:
+    """일괄/페이지/색인 조회"""
+
+    def test_create_many_and_get_many(self, repo):
+        """일괄 생성은 순서대로 맨 뒤에, 일괄 조회는 없는 ID 자리에 None"""
+        fill(repo, 1)
+        created = repo.create_many([
+            ("A", datetime(2026, 1, 1), TodoStatus.SCHEDULED),
+            ("B", datetime(2026, 1, 2), TodoStatus.COMPLETED),
+        ])
+
+        assert [todo.content for todo in repo.get_all()[1:]] == ["A", "B"]
+        found = repo.get_many([created[1].id, "없는-id", created[0].id])
+        assert [todo.content if todo else None for todo in found] == ["B", None, "A"]
+
+    def test_delete_many(self, repo):
+        """일괄 삭제는 실제로 삭제한 개수 반환"""
+        ids = fill(repo, 4)
+
+        assert repo.delete_many([ids[0], "없는-id", ids[2], ids[0]]) == 2
+        assert repo.get_order() == [ids[1], ids[3]]
+
+    def test_page(self, repo):
+        """페이지 조회는 전체 목록의 구간과 같고 개수/버전을 함께 반환"""
+        fill(repo, 7)
+        repo.move_to(repo.get_order()[6], 0)
+        everything = repo.get_all()
+
+        for offset, limit in ((0, 3), (3, 3), (6, 3), (9, 3), (2, 0), (4, None)):
+            todos, total, version = repo.page(offset, limit)
+            end = None if limit is None else offset + limit
+            assert todos == everything[offset:end]
+            assert total == 7 and version == repo.version
+        with pytest.raises(ValueError):
+            repo.page(-1, 3)
+        with pytest.raises(ValueError):
+            repo.page(0, -1)
+
+    def test_page_by_date(self, repo):
+        """날짜순 페이지 조회"""
+        fill(repo, 5)
+        by_date = repo.get_by_date()
+
+        todos, total, _ = repo.page_by_date(1, 2)
+
+        assert todos == by_date[1:3] and total == 5
+        with pytest.raises(ValueError):
+            repo.page_by_date(0, -1)
+
+    def test_get_by_date_range(self, repo):
+        """날짜 구간 조회는 start 포함, end 제외이며 날짜순 보기의 구간과 같음"""
+        ids = fill(repo, 40)
+        repo.update(ids[5], status=TodoStatus.COMPLETED)
+        by_date = repo.get_by_date()
+        start, end = datetime(2026, 1, 6), datetime(2026, 1, 9)
+
+        todos = repo.get_by_date_range(start, end)
+
+        assert todos == [todo for todo in by_date if start <= todo.target_date < end]
+        assert {todo.target_date.day for todo in todos} == {6, 7, 8}
+        assert [todo.id for todo in repo.get_by_date_range(start, end, TodoStatus.COMPLETED)] == [ids[5]]
+        assert repo.get_by_date_range(datetime(2027, 1, 1), datetime(2028, 1, 1)) == []
+        assert repo.count_by_date_range(start, end) == len(todos)
+        assert repo.count_by_date_range(datetime.min, datetime.max) == 40
+        assert repo.count_by_date_range(datetime(2027, 1, 1), datetime(2028, 1, 1)) == 0
+
+    def test_index_of_many(self, repo):
+        """여러 ID의 순서 위치 (삭제되었거나 없는 ID는 None)"""
+        ids = fill(repo, 5)
+        repo.move_to(ids[4], 0)
+        repo.delete(ids[2])
+
+        assert repo.index_of_many([ids[4], ids[2], 'missing', ids[3]]) == [0, None, None, 3]
+
+    def test_page_with_counts(self, repo):
+        """첫 페이지와 상태별 개수를 함께 조회"""
+        ids = fill(repo, 5)
+        repo.update(ids[0], status=TodoStatus.COMPLETED)
+
+        todos, total, counts, version = repo.page_with_counts(2)
+
+        assert [todo.id for todo in todos] == ids[:2]
+        assert total == 5 and version == repo.version
+        assert counts.get(TodoStatus.COMPLETED, 0) == 1 and sum(counts.values()) == 5
+        assert len(repo.page_with_counts()[0]) == 5
+
+    def test_status_queries(self, repo):
+        """상태별 조회는 저장된 순서를 유지하고, 상태별 개수의 합은 전체 개수"""
+        ids = fill(repo, 5)
+        repo.update(ids[3], status=TodoStatus.COMPLETED)
+        repo.update(ids[1], status=TodoStatus.COMPLETED)
+        repo.move_to(ids[3], 0)
+
+        assert [todo.id for todo in repo.get_by_status(TodoStatus.COMPLETED)] == [ids[3], ids[1]]
+        total, counts = repo.count_by_status()
+        assert total == 5
+        assert counts.get(TodoStatus.COMPLETED, 0) == 2
+        assert counts.get(TodoStatus.SCHEDULED, 0) == 3
+        assert counts.get(TodoStatus.IN_PROGRESS, 0) == 0
+
+    def test_evict_and_insert(self, repo):
+        """evict는 바뀌지 않은 항목만 삭제 표시 없이 제거하고, insert는 ID/시각 그대로 맨 뒤에 추가"""
+        ids = fill(repo, 4)
+        stale, kept = repo.get_by_id(ids[0]), repo.get_by_id(ids[1])
+        repo.update(ids[1], content="읽은 뒤 수정")
+        events = []
+        repo.add_listener(events.append)
+
+        published = []
+        assert repo.evict([stale, kept], lambda evicted: published.append((evicted, len(events)))) == [stale]
+        assert repo.get_order() == ids[1:]
+        assert repo.restore(ids[0]) is None
+        assert [event.op for event in events] == [MutationEvent.DELETE]
+        assert published == [([stale], 1)]  # DELETE 이벤트 뒤에 한 번
+        assert repo.evict([stale], published.append) == [] and len(published) == 1
+
+        assert repo.insert(stale) is stale
+        assert repo.get_order() == ids[1:] + [ids[0]]
+        assert repo.get_by_id(ids[0]).created_at == stale.created_at
+        with pytest.raises(ValueError):
+            repo.insert(stale)
+
+    def test_insert_many_is_all_or_nothing(self, repo):
+        """insert_many는 순서대로 추가하고, ID가 하나라도 겹치면 아무것도 추가하지 않음"""
+        [existing] = fill(repo, 1)
+        todos = [TodoItem(content=f"일괄 {i}", target_date=datetime(2026, 1, 1)) for i in range(3)]
+        version = repo.version
+
+        with pytest.raises(ValueError):
+            repo.insert_many(todos + [repo.get_by_id(existing)])
+        with pytest.raises(ValueError):
+            repo.insert_many([todos[0], todos[0]])
+        assert repo.version == version
+
+        assert repo.insert_many(todos) == todos
+        assert repo.get_order() == [existing] + [todo.id for todo in todos]
+        assert repo.version == version + 3
+
+    def test_create_routes_on_minimal_backend(self):
+        """insert()를 재정의하지 않은 백엔드도 생성/일괄 생성 API가 동작"""
+        client = TodoApp(repository=MinimalRepository()).app.test_client()
+
+        assert client.post('/api/todos', json={'content': ' A ', 'target_date': '2026-02-01T00:00:00'}) \
+            .status_code == 201
+        created = client.post('/api/todos/batch', json=[
+            {'content': 'B', 'target_date': '2026-02-02T00:00:00', 'status': '완료'},
+            {'content': 'C', 'target_date': '2026-02-03T00:00:00'},
+        ])
+        assert created.status_code == 201
+        listed = client.get('/api/todos?offset=0&limit=5').get_json()
+        assert [todo['content'] for todo in listed] == ['A', 'B', 'C']
+        assert [todo['id'] for todo in listed[1:]] == [todo['id'] for todo in created.get_json()]
+        assert client.get('/api/stats').get_json()['completed'] == 1
+        response = client.put(f"/api/todos/{listed[0]['id']}", json={'content': ' A2 ', 'status': '진행중'})
+        assert response.status_code == 200 and response.get_json()['content'] == 'A2'
+
+    def test_app_runs_on_backend(self, backend):
+        """TodoApp에 주입한 백엔드로 API가 동작"""
+        client = TodoApp(repository=backend()).app.test_client()
+        created = client.post('/api/todos', json={'content': 'A', 'target_date': '2026-02-01T00:00:00'})
+
+        assert created.status_code == 201
+        assert [todo['content'] for todo in client.get('/api/todos?offset=0&limit=5').get_json()] == ['A']
+        assert client.get('/api/stats').get_json()['total'] == 1
+        assert client.get('/api/stats/completion-rate').status_code == 200
+
+
+def best_time(func, repeat=3) -> float:
+    """repeat번 실행 중 최단 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class TestBackendPerformance:
+    """
+    백엔드 성능 하한
+
+    느린 테스트 환경에서도 통과하도록 여유 있게 잡은 기준이며, 알고리즘
+    차수가 잘못된 경우(예: 페이지 조회가 O(N))를 잡는 것이 목적이다.
+    """
+
+    def test_bulk_create(self, backend):
+        """2만 건 일괄 생성"""
+        repo = backend()
+        specs = [(f"항목 {i}", datetime(2026, 1, 1 + i % 28), TodoStatus.SCHEDULED) for i in range(20_000)]
+
+        elapsed = best_time(lambda: repo.create_many(specs), repeat=1)
+
+        assert repo.count() == 20_000
+        assert elapsed < 5.0
+
+    def test_page_cost_does_not_grow_with_size(self, backend):
+        """페이지 조회 비용은 전체 크기가 16배가 되어도 크게 늘지 않음"""
+        costs = []
+        for size in (2_000, 32_000):
+            repo = backend()
+            repo.create_many([(f"항목 {i}", datetime(2026, 1, 1), TodoStatus.SCHEDULED) for i in range(size)])
+            repo.page(0, 20)  # 첫 조회 준비 비용 제외
+            costs.append(best_time(lambda: [repo.page(size // 2, 20) for _ in range(200)], repeat=5))
+
+        assert costs[1] < costs[0] * 4 + 0.005
+
+    def test_moves(self, backend):
+        """2만 건에서 이동 2천 번"""
+        repo = backend()
+        ids = [todo.id for todo in repo.create_many(
+            [(f"항목 {i}", datetime(2026, 1, 1), TodoStatus.SCHEDULED) for i in range(20_000)]
+        )]
+
+        def moves():
+            for i in range(2_000):
+                repo.move_before(ids[(i * 7919) % len(ids)], ids[(i * 104729) % len(ids)])
+
+        assert best_time(moves, repeat=1) < 2.0
+        assert sorted(repo.get_order()) == sorted(ids)
@@ -0,0 +1,103 @@
+import pytest
+from datetime import datetime
+from app import TodoApp
+from models import TodoStatus
+from repositories import TodoRepository
+from repositories.order_index import OrderIndex
+from repositories.snapshot import PagedSlots
+from services import TodoService
+from utils import InvalidTodoError
+
+
+class TestSnapshot:
+    """copy-on-write 스냅샷 테스트"""
+
+    @pytest.fixture
+    def small_chunks(self, monkeypatch):
+        """여러 청크/페이지에 걸치도록 크기 축소"""
+        monkeypatch.setattr(OrderIndex, '_LOAD', 2)
+        monkeypatch.setattr(PagedSlots, '_SHIFT', 1)
+        monkeypatch.setattr(PagedSlots, '_PAGE', 2)
+        monkeypatch.setattr(PagedSlots, '_MASK', 1)
+
+    @pytest.fixture
+    def repo(self, small_chunks):
+        """항목 6개가 있는 저장소"""
+        repo = TodoRepository()
+        for i in range(6):
+            repo.create(f"항목 {i}", datetime(2026, 1, 10 - i))
+        return repo
+
+    def test_snapshot_is_unaffected_by_writes(self, repo):
+        """스냅샷을 만든 뒤의 쓰기는 스냅샷에 보이지 않음"""
+        snapshot = repo.snapshot()
+        before = [(todo.id, todo.content, todo.status) for todo in snapshot]
+        first, second = snapshot.get_all()[:2]
+
+        repo.move_to(before[5][0], 0)
+        repo.update(first.id, content="수정", status=TodoStatus.COMPLETED)
+        repo.delete(second.id)
+        repo.create("새 항목", datetime(2026, 2, 1))
+        repo.sort_by_date()
+
+        assert [(todo.id, todo.content, todo.status) for todo in snapshot] == before
+        assert len(snapshot) == 6
+        assert repo.get_by_id(first.id).content == "수정"
+        assert len(repo.get_all()) == 6
+        assert repo.snapshot().version > snapshot.version
+
+    def test_update_replaces_item(self, repo):
+        """수정은 기존 객체를 바꾸지 않고 새 객체로 교체"""
+        todo = repo.get_all()[0]
+
+        updated = repo.update(todo.id, content="수정")
+
+        assert updated is not todo
+        assert todo.content == "항목 0"
+        assert updated.created_at == todo.created_at
+        assert updated.updated_at >= todo.updated_at
+
+    def test_snapshot_reused_until_write(self, repo):
+        """버전이 같으면 같은 스냅샷을 재사용"""
+        snapshot = repo.snapshot()
+        assert repo.snapshot() is snapshot
+
+        repo.create("새 항목", datetime.now())
+        assert repo.snapshot() is not snapshot
+
+    def test_page(self, repo):
+        """청크 경계를 넘는 페이지 조회"""
+        snapshot = repo.snapshot()
+        ids = [todo.id for todo in snapshot]
+
+        assert [todo.id for todo in snapshot.page(1, 4)] == ids[1:5]
+        assert [todo.id for todo in snapshot.page(5, 10)] == ids[5:]
+        assert snapshot.page(6, 3) == []
+        with pytest.raises(ValueError):
+            snapshot.page(-1, 2)
+
+    def test_service_page_and_statistics(self, repo):
+        """서비스 페이지 조회와 통계는 한 스냅샷 기준"""
+        service = TodoService(repo)
+        todos, total, version = service.get_todos_page(2, 2)
+
+        assert [todo.content for todo in todos] == ["항목 2", "항목 3"]
+        assert (total, version) == (6, repo.version)
+        assert service.get_statistics() == {'total': 6, 'scheduled': 6, 'in_progress': 0, 'completed': 0}
+        with pytest.raises(InvalidTodoError):
+            service.get_todos_page(0, -1)
+
+    def test_paginated_endpoint(self):
+        """GET /api/todos?offset=&limit="""
+        todo_app = TodoApp()
+        todo_app.initialize_sample_data()
+        client = todo_app.app.test_client()
+
+        response = client.get('/api/todos?offset=1&limit=1')
+        assert response.status_code == 200
+        assert [todo['content'] for todo in response.get_json()] == ["TODO 앱 완성"]
+        assert response.headers['X-Total-Count'] == '3'
+        assert response.headers['X-Snapshot-Version'] == str(todo_app.repository.version)
+
+        assert client.get('/api/todos?offset=abc').status_code == 400
+        assert client.get('/api/todos?limit=-1').status_code == 400
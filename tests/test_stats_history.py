@@ -0,0 +1,128 @@
+import pytest
+from datetime import datetime
+from app import TodoApp
+from models import TodoStatus
+from repositories import TodoRepository, ListTodoRepository, StatsHistory
+from utils.memory import ObjectSizer
+
+START = 1_800_000_000  # 분/시간/일 경계에 맞춘 epoch 초 (UTC 기준)
+
+
+class FakeClock:
+    """테스트에서 조작하는 epoch 초 시계"""
+
+    def __init__(self, now=START):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def counts(point):
+    return point['scheduled'], point['in_progress'], point['completed']
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestStatsHistory:
+    """상태별 개수 시계열 테스트"""
+
+    @pytest.mark.parametrize('backend', [TodoRepository, ListTodoRepository])
+    def test_tracks_mutations_per_bucket(self, backend, clock):
+        """버킷마다 그 구간의 마지막 값을 기록하고, 변경이 없던 버킷은 직전 값으로 채움"""
+        repo = backend()
+        first = repo.create("기존", datetime(2026, 1, 1))
+        history = StatsHistory({'minute': (60, 10)}, clock=clock)
+        history.attach(repo)
+
+        clock.now += 60
+        second = repo.create("새 항목", datetime(2026, 1, 2))
+        repo.update(second.id, status=TodoStatus.IN_PROGRESS)
+        clock.now += 180
+        repo.update(first.id, status=TodoStatus.COMPLETED)
+        repo.update(first.id, content="내용만 수정")
+        clock.now += 60
+        repo.delete(second.id)
+
+        points = history.history('minute')['points']
+
+        assert [counts(point) for point in points] == [
+            (1, 0, 0), (1, 1, 0), (1, 1, 0), (1, 1, 0), (0, 1, 1), (0, 0, 1),
+        ]
+        assert points[-1]['total'] == 1
+        assert points[1]['time'] == datetime.fromtimestamp(START + 60).isoformat()
+
+    def test_downsampling_and_constant_memory(self, clock):
+        """가는 해상도에서 밀려난 구간은 굵은 해상도에 남고, 버퍼 크기는 실행 시간과 무관"""
+        repo = TodoRepository()
+        history = StatsHistory({'minute': (60, 5), 'hour': (3600, 4)}, clock=clock)
+        history.attach(repo)
+        sizes = []
+
+        for minute in range(180):
+            clock.now = START + minute * 60
+            repo.create(f"항목 {minute}", datetime(2026, 1, 1))
+            sizes.append(history.memory_usage(ObjectSizer()))
+
+        minutes = history.history('minute')['points']
+        hours = history.history('hour')['points']
+        assert [point['scheduled'] for point in minutes] == [176, 177, 178, 179, 180]
+        assert [point['scheduled'] for point in hours] == [60, 120, 180]
+        assert hours[0]['time'] == datetime.fromtimestamp(START).isoformat()
+        assert sizes[0] == sizes[-1]
+
+        clock.now += 10 * 3600  # 오래 변경이 없어도 마지막 값으로 채움
+        assert [point['scheduled'] for point in history.history('hour')['points']] == [180] * 4
+        assert len(history.history('minute', limit=2)['points']) == 2
+
+    def test_clear_and_invalid_arguments(self, clock):
+        """전체 삭제는 0으로 기록하고, 없는 해상도나 잘못된 limit은 ValueError"""
+        repo = TodoRepository()
+        repo.create("항목", datetime(2026, 1, 1))
+        history = StatsHistory(clock=clock)
+        history.attach(repo)
+        clock.now += 3600
+        repo.clear_all()
+
+        assert [counts(point) for point in history.history('hour')['points']] == [(1, 0, 0), (0, 0, 0)]
+        with pytest.raises(ValueError):
+            history.history('second')
+        with pytest.raises(ValueError):
+            history.history('minute', limit=0)
+
+
+class TestStatsHistoryRoute:
+    """시계열 API 테스트"""
+
+    def test_history_endpoint(self):
+        """샘플 데이터의 현재 개수가 /api/stats와 같음"""
+        todo_app = TodoApp()
+        todo_app.initialize_sample_data()
+        client = todo_app.app.test_client()
+        stats = client.get('/api/stats').get_json()
+
+        body = client.get('/api/stats/history?resolution=minute&limit=5').get_json()
+
+        assert body['resolution'] == 'minute' and body['seconds'] == 60
+        assert {key: body['points'][-1][key] for key in stats} == stats
+        assert client.get('/api/stats/history').get_json()['resolution'] == 'hour'
+        assert client.get('/api/stats/history?resolution=week').status_code == 400
+        assert client.get('/api/stats/history?limit=abc').status_code == 400
+
+    def test_includes_archived_items(self, tmp_path):
+        """보관한 완료 항목도 완료 개수에 포함"""
+        todo_app = TodoApp(config={'ARCHIVE_DIR': str(tmp_path), 'ARCHIVE_AFTER': 0})
+        for i in range(3):
+            todo_app.service.create_todo(f"완료 {i}", datetime(2026, 1, 1), TodoStatus.COMPLETED)
+        todo_app.service.create_todo("예정", datetime(2026, 1, 2))
+        assert todo_app.archiver.run_once() == 3
+
+        client = todo_app.app.test_client()
+        point = client.get('/api/stats/history?resolution=day').get_json()['points'][-1]
+
+        assert counts(point) == (1, 0, 3)
+        todo_app.service.clear_all_todos()
+        assert counts(client.get('/api/stats/history?resolution=day').get_json()['points'][-1]) == (0, 0, 0)
@@ -0,0 +1,154 @@
+import pytest
+from datetime import datetime
+from app import TodoApp
+from repositories import TodoRepository, ListTodoRepository, TombstoneCompactor
+from repositories.order_index import OrderIndex
+
+
+class FakeClock:
+    """테스트에서 움직일 수 있는 초 단위 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSoftDelete:
+    """삭제 표시(tombstone)와 복구 테스트"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def repo(self, clock, monkeypatch):
+        """항목 5개가 여러 청크에 나뉜 저장소"""
+        monkeypatch.setattr(OrderIndex, '_LOAD', 2)
+        repo = TodoRepository(undo_window=30, clock=clock)
+        for i in range(5):
+            repo.create(f"항목 {i}", datetime(2026, 1, 10 - i))
+        return repo
+
+    def test_deleted_item_is_hidden(self, repo):
+        """삭제 표시된 항목은 조회/수정/이동 대상이 아님"""
+        a, b, c, d, e = repo.get_all()
+
+        assert repo.delete(c.id) is True
+        assert repo.delete(c.id) is False
+        assert repo.get_by_id(c.id) is None
+        assert repo.update(c.id, content="수정") is None
+        assert repo.move_to(c.id, 0) is None
+        assert repo.move_before(a.id, c.id) is None
+        assert repo.get_order() == [a.id, b.id, d.id, e.id]
+        assert repo.count() == 4
+        assert repo.tombstone_count() == 1
+
+        repo.set_order([c.id, e.id])
+        assert repo.get_order() == [e.id, a.id, b.id, d.id]
+
+    def test_restore_to_original_position(self, repo):
+        """복구하면 원래 위치로 돌아옴"""
+        ids = repo.get_order()
+        repo.delete(ids[2])
+        repo.move_to(ids[4], 0)
+
+        restored = repo.restore(ids[2])
+
+        assert restored.id == ids[2]
+        assert repo.get_order() == [ids[4], ids[0], ids[1], ids[2], ids[3]]
+        assert repo.tombstone_count() == 0
+        assert repo.restore(ids[2]) is None
+
+    def test_restore_when_rank_was_reused(self, repo):
+        """삭제된 자리에 다른 항목이 들어와도 그 바로 뒤로 복구"""
+        a, b, c, d, e = repo.get_order()
+        repo.delete(c)
+        repo.move_after(e, b)  # c의 순위 키 자리를 차지할 수 있음
+
+        repo.restore(c)
+
+        assert repo.get_order() == [a, b, e, c, d]
+
+    def test_restore_after_full_reorder(self, repo):
+        """전체 순서가 재구성되었으면 삭제 직전 앞 항목 뒤로 복구"""
+        a, b, c, d, e = repo.get_order()
+        repo.delete(c)
+        repo.sort_by_date()  # 날짜 역순으로 만들었으므로 e, d, b, a
+
+        repo.restore(c)
+
+        assert repo.get_order() == [e, d, b, c, a]
+
+    def test_undo_window_expires(self, repo, clock):
+        """복구 가능 시간이 지나면 복구 불가, 정리 후 sid 재사용"""
+        first, second = repo.get_order()[:2]
+        repo.delete(first)
+        clock.now += 10
+        repo.delete(second)
+
+        clock.now += 25  # first만 만료
+        assert repo.restore(first) is None
+        assert repo.compact() == 1
+        assert repo.tombstone_count() == 1
+        assert repo.restore(second) is not None
+
+        created = repo.create("새 항목", datetime.now())
+        assert repo._ids.get(created.id) == 0  # 정리된 first의 sid 재사용
+
+    def test_compactor_purges_in_batches(self, repo, clock):
+        """정리 작업은 배치 단위로 반복하여 모두 정리"""
+        for todo_id in repo.get_order():
+            repo.delete(todo_id)
+        clock.now += 60
+
+        compactor = TombstoneCompactor(repo, batch_size=2)
+        assert repo.compact(2) == 2
+        assert compactor.run_once() == 3
+        assert repo.tombstone_count() == 0
+
+    def test_listeners_see_delete_and_restore(self, repo):
+        """삭제/복구는 DELETE/CREATE 이벤트로 전달"""
+        events = []
+        repo.add_listener(events.append)
+        todo_id = repo.get_order()[0]
+
+        repo.delete(todo_id)
+        repo.restore(todo_id)
+
+        assert [event.op for event in events] == ['delete', 'create']
+
+    def test_list_repository_drops_sids_of_removed_items(self, clock):
+        """리스트 저장소는 항목이 완전히 빠지면(정리/이동/전체 삭제) 순번도 지움"""
+        repo = ListTodoRepository(undo_window=30, clock=clock)
+        todos = [repo.create(f"항목 {i}", datetime(2026, 1, 10 + i)) for i in range(4)]
+
+        repo.delete(todos[0].id)
+        repo.delete(todos[1].id)
+        repo.restore(todos[1].id)
+        assert len(repo._sids) == 4
+        clock.now += 60
+        assert repo.compact() == 1
+        assert todos[0].id not in repo._sids
+
+        repo.evict([todos[2]])
+        assert set(repo._sids) == {todos[1].id, todos[3].id}
+        repo.clear_all()
+        assert repo._sids == {}
+
+    def test_restore_endpoint(self):
+        """POST /api/todos/<id>/restore"""
+        todo_app = TodoApp()
+        todo_app.initialize_sample_data()
+        client = todo_app.app.test_client()
+        todo_id = client.get('/api/todos').get_json()[1]['id']
+
+        assert client.delete(f'/api/todos/{todo_id}').status_code == 200
+        assert len(client.get('/api/todos').get_json()) == 2
+
+        response = client.post(f'/api/todos/{todo_id}/restore')
+        assert response.status_code == 200
+        assert response.get_json()['id'] == todo_id
+        assert client.get('/api/todos').get_json()[1]['id'] == todo_id
+        assert client.post(f'/api/todos/{todo_id}/restore').status_code == 404
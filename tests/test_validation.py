@@ -0,0 +1,158 @@
+import pytest
+from datetime import datetime
+from pydantic import ValidationError
+from app import TodoApp
+from models import TodoItem, TodoStatus
+from utils.dtos import (
+    CreateTodoRequest, UpdateTodoRequest, ReorderRequest, MoveTodoRequest, CREATE_TODO_BATCH, MAX_BATCH_SIZE
+)
+
+
+class TestRequestModels:
+    """요청 DTO 검증 테스트"""
+
+    def test_create_request_matches_todo_rules(self):
+        """TodoItem과 같은 규칙으로 검증하고 to_todo()는 같은 값의 항목을 만듦"""
+        body = CreateTodoRequest.model_validate_json(
+            '{"content": "  보고서  ", "target_date": "2026-02-15T10:00:00", "status": "진행중"}'
+        )
+        todo = body.to_todo()
+        expected = TodoItem(content="  보고서  ", target_date=datetime(2026, 2, 15, 10), status=TodoStatus.IN_PROGRESS)
+
+        assert todo.model_dump(exclude={'id', 'created_at', 'updated_at'}) == \
+            expected.model_dump(exclude={'id', 'created_at', 'updated_at'})
+        assert todo.id and todo.created_at <= todo.updated_at
+        assert CreateTodoRequest.model_validate_json('{"content": "x", "target_date": "2026-02-15"}') \
+            .to_todo().status == TodoStatus.SCHEDULED
+
+    @pytest.mark.parametrize('payload', [
+        '{"content": "   ", "target_date": "2026-02-15T10:00:00"}',
+        '{"content": "x", "target_date": 1700000000}',
+        '{"content": "x", "target_date": "어제"}',
+        '{"content": "x", "target_date": "2026-02-15", "status": "없음"}',
+        '{"target_date": "2026-02-15"}',
+        '{"content": "x"',
+    ])
+    def test_create_request_rejects(self, payload):
+        """빈 내용, 숫자/잘못된 날짜, 없는 상태, 누락 필드, 깨진 JSON"""
+        with pytest.raises(ValidationError):
+            CreateTodoRequest.model_validate_json(payload)
+
+    def test_batch_adapter_bounds(self):
+        """배열은 1개 이상 MAX_BATCH_SIZE개 이하"""
+        item = '{"content": "x", "target_date": "2026-02-15"}'
+
+        assert len(CREATE_TODO_BATCH.validate_json(f'[{item}, {item}]')) == 2
+        with pytest.raises(ValidationError):
+            CREATE_TODO_BATCH.validate_json('[]')
+        with pytest.raises(ValidationError):
+            CREATE_TODO_BATCH.validate_json('[' + ','.join([item] * (MAX_BATCH_SIZE + 1)) + ']')
+
+    def test_update_request_matches_todo_rules(self):
+        """수정 요청은 지정한 필드만 TodoItem과 같은 규칙으로 검증하고 changes()에 담음"""
+        body = UpdateTodoRequest.model_validate_json('{"status": "완료", "target_date": "2026-03-01T09:00"}')
+
+        assert body.changes() == {'target_date': datetime(2026, 3, 1, 9), 'status': TodoStatus.COMPLETED.value}
+        assert UpdateTodoRequest.model_validate_json('{"content": "  보고서 "}').changes() == {'content': "보고서"}
+        assert UpdateTodoRequest.model_validate_json('{}').changes() == {}
+        with pytest.raises(ValidationError):
+            UpdateTodoRequest.model_validate_json('{"status": "끝"}')
+        with pytest.raises(ValidationError):
+            UpdateTodoRequest.model_validate_json('{"content": "   "}')
+
+
+    def test_order_requests(self):
+        """순서 변경은 문자열 배열만, 이동은 대상 하나만 받음"""
+        assert ReorderRequest.model_validate_json('{"order": ["a", "b"]}').order == ['a', 'b']
+        for body in ('{"order": "abc"}', '{"order": [1]}', '{}', '[]'):
+            with pytest.raises(ValidationError):
+                ReorderRequest.model_validate_json(body)
+
+        assert MoveTodoRequest.model_validate_json('{"position": 0}').position == 0
+        for body in ('{}', '{"before": "a", "after": "b"}', '{"position": "1"}', '{"position": true}'):
+            with pytest.raises(ValidationError):
+                MoveTodoRequest.model_validate_json(body)
+
+
+class TestValidatedRoutes:
+    """요청 본문을 DTO로 검증하는 라우트 테스트"""
+
+    @pytest.fixture
+    def todo_app(self):
+        return TodoApp()
+
+    def test_create_errors(self, todo_app):
+        """검증 실패는 모두 400이고 어떤 필드가 잘못됐는지 알려 줌"""
+        client = todo_app.app.test_client()
+
+        response = client.post('/api/todos', json={'target_date': '2026-02-15T10:00:00'})
+        assert response.status_code == 400
+        assert response.get_json()['error'] == '입력 오류: content: 필수 필드가 없습니다'
+        response = client.post('/api/todos', json={'content': ' ', 'target_date': '2026-02-15T10:00:00'})
+        assert 'TODO 내용은 비울 수 없습니다' in response.get_json()['error']
+        assert client.post('/api/todos', data='{"content"', content_type='application/json').status_code == 400
+        assert todo_app.service.get_todo_count() == 0
+
+        response = client.post('/api/todos', json={'content': '보고서', 'target_date': '2026-02-15T10:00:00'})
+        assert response.status_code == 201
+        assert response.get_json()['status'] == TodoStatus.SCHEDULED.value
+
+    def test_batch_create(self, todo_app):
+        """일괄 생성은 순서대로 만들고, 하나라도 잘못되면 아무것도 만들지 않음"""
+        client = todo_app.app.test_client()
+        payload = [
+            {'content': f'항목 {i}', 'target_date': f'2026-02-{i + 1:02d}T09:00:00', 'status': '진행중'}
+            for i in range(3)
+        ]
+
+        response = client.post('/api/todos/batch', json=payload + [{'content': 'x', 'target_date': '어제'}])
+        assert response.status_code == 400
+        assert response.get_json()['error'].startswith('입력 오류: 3.target_date:')
+        assert todo_app.service.get_todo_count() == 0
+
+        response = client.post('/api/todos/batch', json=payload)
+        assert response.status_code == 201
+        assert [todo['content'] for todo in response.get_json()] == ['항목 0', '항목 1', '항목 2']
+        assert [todo.id for todo in todo_app.service.get_all_todos()] == \
+            [todo['id'] for todo in response.get_json()]
+        assert client.get('/api/stats').get_json()['in_progress'] == 3
+        assert client.post('/api/todos/batch', json={'content': 'x'}).status_code == 400
+
+    def test_update(self, todo_app, monkeypatch):
+        """수정 요청은 DTO에서 한 번만 검증하고 형식 오류와 내용 규칙 위반 모두 400"""
+        client = todo_app.app.test_client()
+        todo = todo_app.service.create_todo("보고서", datetime(2026, 2, 15))
+
+        def revise(self, **changes):
+            raise AssertionError("검증한 변경을 다시 검증함")
+        monkeypatch.setattr(TodoItem, 'revise', revise)
+
+        assert client.put(f'/api/todos/{todo.id}', json={'status': '끝'}).status_code == 400
+        response = client.put(f'/api/todos/{todo.id}', json={'content': ' '})
+        assert response.status_code == 400
+        assert response.get_json()['error'] == '입력 오류: content: TODO 내용은 비울 수 없습니다.'
+        assert client.put(f'/api/todos/{todo.id}', json={'target_date': 5}).status_code == 400
+        assert client.put('/api/todos/없는-id', json={'status': '완료'}).status_code == 404
+
+        response = client.put(f'/api/todos/{todo.id}', json={'status': '완료', 'target_date': '2026-02-20T00:00:00'})
+        assert response.status_code == 200
+        updated = todo_app.service.get_todo_by_id(todo.id)
+        assert updated.status == TodoStatus.COMPLETED and updated.target_date == datetime(2026, 2, 20)
+        assert updated.content == "보고서" and updated.updated_at > todo.updated_at
+
+    def test_order_routes(self, todo_app):
+        """순서 변경/이동 본문 오류는 500이 아닌 400이고 순서를 바꾸지 않음"""
+        client = todo_app.app.test_client()
+        ids = [todo_app.service.create_todo(f"항목 {i}", datetime(2026, 2, 15)).id for i in range(3)]
+
+        for body in ({'order': ids[0]}, {'order': None}, [ids]):
+            assert client.put('/api/todos/reorder', json=body).status_code == 400
+        assert client.put('/api/todos/reorder', data='{"order"', content_type='application/json').status_code == 400
+        response = client.post(f'/api/todos/{ids[0]}/move', json={'position': '2'})
+        assert response.status_code == 400 and response.get_json()['error'].startswith('입력 오류: position:')
+        assert client.post(f'/api/todos/{ids[0]}/move', data='nope').status_code == 400
+        assert [todo.id for todo in todo_app.service.get_all_todos()] == ids
+
+        assert client.put('/api/todos/reorder', json={'order': ids[::-1]}).status_code == 200
+        assert client.post(f'/api/todos/{ids[0]}/move', json={'position': 0}).get_json()['index'] == 0
+        assert [todo.id for todo in todo_app.service.get_all_todos()] == [ids[0], ids[2], ids[1]]
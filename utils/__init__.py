@@ -1,7 +1,47 @@
-"""유틸리티 패키지"""
+"""유틸리티 패키지
+
+예외 클래스를 제외한 나머지는 처음 사용할 때 불러온다. 저장소만 필요한
+도구가 `from utils import TodoNotFoundError` 를 해도 Flask나 DTO 모델 생성
+비용을 치르지 않도록 하기 위함이다.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
 from .exceptions import TodoException, TodoNotFoundError, InvalidTodoError, TodoValidationError
-from .dtos import CreateTodoRequest, UpdateTodoRequest, TodoResponse, TodoListResponse, StatsResponse
-from .serializer import TodoSerializer
+
+if TYPE_CHECKING:
+    from .dtos import (
+        CreateTodoRequest, UpdateTodoRequest, ReorderRequest, MoveTodoRequest, TodoResponse, TodoListResponse,
+        StatsResponse
+    )
+    from .serializer import TodoSerializer
+    from .profiler import ProfileStore, ProfilingMiddleware
+    from .compression import ResponseCompressor
+    from .json_provider import TodoJSONProvider
+    from .idempotency import IdempotencyCache
+    from .admission import AdmissionController
+    from .assets import AssetManifest
+    from .memory import MemoryDiagnostics, ObjectSizer
+
+# 지연 로딩 대상: 이름 -> 하위 모듈
+_LAZY_ATTRS = {
+    'CreateTodoRequest': '.dtos',
+    'UpdateTodoRequest': '.dtos',
+    'ReorderRequest': '.dtos',
+    'MoveTodoRequest': '.dtos',
+    'TodoResponse': '.dtos',
+    'TodoListResponse': '.dtos',
+    'StatsResponse': '.dtos',
+    'TodoSerializer': '.serializer',
+    'ProfileStore': '.profiler',
+    'ProfilingMiddleware': '.profiler',
+    'ResponseCompressor': '.compression',
+    'TodoJSONProvider': '.json_provider',
+    'IdempotencyCache': '.idempotency',
+    'AdmissionController': '.admission',
+    'AssetManifest': '.assets',
+    'MemoryDiagnostics': '.memory',
+    'ObjectSizer': '.memory',
+}
 
 __all__ = [
     'TodoException',
@@ -10,8 +50,33 @@ __all__ = [
     'TodoValidationError',
     'CreateTodoRequest',
     'UpdateTodoRequest',
+    'ReorderRequest',
+    'MoveTodoRequest',
     'TodoResponse',
     'TodoListResponse',
     'StatsResponse',
     'TodoSerializer',
+    'ProfileStore',
+    'ProfilingMiddleware',
+    'ResponseCompressor',
+    'TodoJSONProvider',
+    'IdempotencyCache',
+    'AdmissionController',
+    'AssetManifest',
+    'MemoryDiagnostics',
+    'ObjectSizer',
 ]
+
+
+def __getattr__(name):
+    """지연 로딩 대상 속성을 처음 접근할 때 하위 모듈에서 불러옴"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,23 @@
+"""관리자 인증 유틸리티"""
+import hmac
+from typing import Optional
+
+ADMIN_TOKEN_HEADER = 'X-Admin-Token'
+
+
+def is_valid_admin_token(expected: Optional[str], provided: Optional[str]) -> bool:
+    """
+    관리자 토큰 검증
+
+    토큰이 설정되지 않은 경우 관리자 기능은 항상 비활성화된다.
+
+    Args:
+        expected: 설정된 관리자 토큰
+        provided: 요청에 포함된 토큰
+
+    Returns:
+        일치 여부
+    """
+    if not expected or not provided:
+        return False
+    return hmac.compare_digest(expected.encode('utf-8'), provided.encode('utf-8'))
@@ -0,0 +1,215 @@
+"""비용이 큰 요청의 속도 제한과 동시 실행 제한"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+ADMITTED = 0
+TOO_MANY_REQUESTS = 429
+SERVICE_UNAVAILABLE = 503
+
+
+class RateLimiter:
+    """
+    클라이언트별 토큰 버킷
+
+    버킷은 요청이 올 때만 경과 시간만큼 채우므로 타이머가 필요 없고,
+    최근에 쓰지 않은 클라이언트부터 제거하여 최대 max_clients개만 유지한다.
+    """
+
+    def __init__(self, rate: float, burst: int, max_clients: int = 10000,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate: 초당 채워지는 토큰 수
+            burst: 버킷 크기 (연속으로 허용할 최대 요청 수)
+            max_clients: 보관할 최대 클라이언트 수
+            clock: 시계 (초 단위)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: 'OrderedDict[str, Tuple[float, float]]' = OrderedDict()  # 클라이언트 -> (토큰, 갱신 시각)
+
+    def acquire(self, client: str) -> float:
+        """
+        토큰 하나 사용
+
+        Returns:
+            0이면 허용, 아니면 다음 토큰까지 기다려야 할 시간(초)
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                tokens = float(self.burst)
+                if len(self._buckets) >= self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                tokens = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+                self._buckets.move_to_end(client)
+            if tokens >= 1:
+                self._buckets[client] = (tokens - 1, now)
+                return 0.0
+            self._buckets[client] = (tokens, now)
+            return (1 - tokens) / self.rate
+
+
+class ConcurrencyLimiter:
+    """
+    동시 실행 수 제한
+
+    실행 중인 요청이 limit개면 최대 max_queue개까지 queue_timeout초 동안
+    대기시키고, 대기열이 가득 찼거나 시간 안에 자리가 나지 않으면 거절한다.
+    """
+
+    def __init__(self, limit: int, max_queue: int = 0, queue_timeout: float = 0.0):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = 0
+
+    def acquire(self) -> Tuple[bool, float]:
+        """
+        실행 자리 얻기
+
+        Returns:
+            (허용 여부, 대기한 시간(초))
+        """
+        with self._cond:
+            if self._active < self.limit:
+                self._active += 1
+                return True, 0.0
+            if self._waiting >= self.max_queue:
+                return False, 0.0
+            self._waiting += 1
+            start = time.monotonic()
+            deadline = start + self.queue_timeout
+            try:
+                while self._active >= self.limit:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False, time.monotonic() - start
+                    self._cond.wait(remaining)
+                self._active += 1
+                return True, time.monotonic() - start
+            finally:
+                self._waiting -= 1
+
+    def release(self) -> None:
+        """실행 자리 반납"""
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+
+class AdmissionMetrics:
+    """요청 분류별 허용/거절 횟수와 대기 시간"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.admitted = 0
+        self.rate_limited = 0
+        self.queue_full = 0
+        self.queue_timeout = 0
+        self.queued = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, outcome: str, wait: float = 0.0) -> None:
+        """결과 기록 (outcome: admitted, rate_limited, queue_full, queue_timeout)"""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            if wait > 0:
+                self.queued += 1
+                self.wait_total += wait
+                self.wait_max = max(self.wait_max, wait)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                'admitted': self.admitted,
+                'rejected': {
+                    'rate_limited': self.rate_limited,
+                    'queue_full': self.queue_full,
+                    'queue_timeout': self.queue_timeout,
+                },
+                'queue_wait': {
+                    'count': self.queued,
+                    'mean_ms': round(self.wait_total / self.queued * 1000, 3) if self.queued else 0.0,
+                    'max_ms': round(self.wait_max * 1000, 3),
+                },
+            }
+
+
+class EndpointClass:
+    """같은 제한을 공유하는 엔드포인트 묶음"""
+
+    def __init__(self, name: str, rate: Optional[float] = None, burst: int = 1,
+                 concurrency: Optional[int] = None, queue: int = 0, queue_timeout: float = 0.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            name: 분류 이름
+            rate, burst: 클라이언트별 토큰 버킷 설정 (rate가 없으면 속도 제한 없음)
+            concurrency: 동시 실행 수 (없으면 동시 실행 제한 없음)
+            queue, queue_timeout: 동시 실행 자리를 기다릴 최대 요청 수와 시간(초)
+        """
+        self.name = name
+        self.rate_limiter = RateLimiter(rate, burst, clock=clock) if rate else None
+        self.slots = ConcurrencyLimiter(concurrency, queue, queue_timeout) if concurrency else None
+        self.metrics = AdmissionMetrics()
+
+    def admit(self, client: str) -> Tuple[int, float]:
+        """
+        요청 허용 여부 판단 (허용되면 끝난 뒤 release() 호출 필요)
+
+        Returns:
+            (ADMITTED 또는 거절 상태 코드, Retry-After 초)
+        """
+        if self.rate_limiter is not None:
+            retry_after = self.rate_limiter.acquire(client)
+            if retry_after:
+                self.metrics.record('rate_limited')
+                return TOO_MANY_REQUESTS, retry_after
+        if self.slots is not None:
+            admitted, waited = self.slots.acquire()
+            if not admitted:
+                self.metrics.record('queue_timeout' if waited else 'queue_full', waited)
+                return SERVICE_UNAVAILABLE, 1.0
+            self.metrics.record('admitted', waited)
+        else:
+            self.metrics.record('admitted')
+        return ADMITTED, 0.0
+
+    def release(self) -> None:
+        """admit()으로 얻은 실행 자리 반납"""
+        if self.slots is not None:
+            self.slots.release()
+
+
+class AdmissionController:
+    """엔드포인트 이름으로 제한 분류를 찾는 진입 제어기"""
+
+    def __init__(self, classes: Dict[str, dict], endpoints: Dict[str, str],
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            classes: 분류 이름 -> EndpointClass 설정
+            endpoints: Flask 엔드포인트 이름 -> 분류 이름
+            clock: 토큰 버킷 시계
+        """
+        self.classes = {name: EndpointClass(name, clock=clock, **options) for name, options in classes.items()}
+        self._by_endpoint = {endpoint: self.classes[name] for endpoint, name in endpoints.items()}
+
+    def get(self, endpoint: Optional[str]) -> Optional[EndpointClass]:
+        """엔드포인트의 제한 분류 (제한 없으면 None)"""
+        return self._by_endpoint.get(endpoint)
+
+    def metrics(self) -> dict:
+        """분류별 지표"""
+        return {name: endpoint_class.metrics.to_dict() for name, endpoint_class in self.classes.items()}
@@ -0,0 +1,99 @@
+"""콘텐츠 해시 이름과 미리 압축한 본문을 가진 정적 파일 목록"""
+import gzip
+import hashlib
+import mimetypes
+import os
+from typing import Dict, Optional, Tuple
+from .compression import COMPRESSIBLE_MIMETYPES, brotli, parse_accept_encoding
+
+HASH_LENGTH = 12  # 파일 이름에 넣을 sha256 접두사 길이
+
+
+class Asset:
+    """해시 이름 하나에 해당하는 정적 파일 (원본과 인코딩별 압축 본문)"""
+
+    __slots__ = ('filename', 'hashed_name', 'etag', 'mimetype', 'bodies')
+
+    def __init__(self, filename: str, hashed_name: str, etag: str, mimetype: str, bodies: Dict[str, bytes]):
+        self.filename = filename
+        self.hashed_name = hashed_name
+        self.etag = etag
+        self.mimetype = mimetype
+        self.bodies = bodies  # 인코딩('identity', 'gzip', 'br') -> 본문
+
+    def choose(self, accept_encoding: Optional[str]) -> Tuple[str, bytes]:
+        """Accept-Encoding에 맞는 (인코딩, 본문) 선택 (br > gzip > 원본)"""
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get('*', 0.0)
+        for encoding in ('br', 'gzip'):
+            if encoding in self.bodies and accepted.get(encoding, wildcard) > 0:
+                return encoding, self.bodies[encoding]
+        return 'identity', self.bodies['identity']
+
+
+class AssetManifest:
+    """
+    정적 파일의 해시 이름 목록
+
+    생성할 때 static 폴더를 한 번 읽어 파일마다 내용의 sha256으로
+    'js/script.<해시>.js' 같은 이름을 만들고, 압축할 만한 파일은 gzip(그리고
+    brotli 패키지가 있으면 br) 본문을 미리 만들어 둔다. 내용이 바뀌면 이름도
+    바뀌므로 해시 이름으로 제공하는 응답은 만료 없이 캐시할 수 있다.
+    파일을 수정했으면 앱을 다시 시작하거나 build()를 다시 호출해야 한다.
+    """
+
+    def __init__(self, static_folder: str, level: int = 9):
+        """
+        목록 생성
+
+        Args:
+            static_folder: 정적 파일 폴더
+            level: 미리 압축할 때의 압축 레벨 (한 번만 하므로 최대 압축)
+        """
+        self.static_folder = static_folder
+        self.level = level
+        self._by_filename: Dict[str, Asset] = {}
+        self._by_hashed: Dict[str, Asset] = {}
+        self.build()
+
+    def build(self) -> None:
+        """static 폴더의 모든 파일을 다시 읽어 목록 구성"""
+        by_filename, by_hashed = {}, {}
+        for root, _, files in os.walk(self.static_folder):
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, self.static_folder).replace(os.sep, '/')
+                with open(path, 'rb') as f:
+                    asset = self._load(filename, f.read())
+                by_filename[filename] = by_hashed[asset.hashed_name] = asset
+        self._by_filename, self._by_hashed = by_filename, by_hashed
+
+    def _load(self, filename: str, data: bytes) -> Asset:
+        """파일 하나의 해시 이름과 압축 본문 생성"""
+        digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        stem, ext = os.path.splitext(filename)
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        bodies = {'identity': data}
+        if mimetype in COMPRESSIBLE_MIMETYPES:
+            compressed = {'gzip': gzip.compress(data, compresslevel=self.level, mtime=0)}
+            if brotli is not None:
+                compressed['br'] = brotli.compress(data, quality=11)
+            # 압축해도 작아지지 않으면 원본만 제공
+            bodies.update((encoding, body) for encoding, body in compressed.items() if len(body) < len(data))
+        return Asset(filename, f"{stem}.{digest}{ext}", digest, mimetype, bodies)
+
+    def __len__(self) -> int:
+        return len(self._by_filename)
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 깊은 크기 (원본과 미리 압축한 본문)"""
+        return {'assets': sizer.size((self._by_filename, self._by_hashed))}
+
+    def hashed_name(self, filename: str) -> Optional[str]:
+        """원래 파일 이름의 해시 이름 (목록에 없으면 None)"""
+        asset = self._by_filename.get(filename)
+        return None if asset is None else asset.hashed_name
+
+    def get(self, hashed_name: str) -> Optional[Asset]:
+        """해시 이름으로 파일 조회"""
+        return self._by_hashed.get(hashed_name)
@@ -0,0 +1,108 @@
+"""응답 압축 유틸리티"""
+import gzip
+from typing import Optional
+
+try:
+    import brotli  # 선택적 의존성
+except ImportError:  # pragma: no cover - 설치 여부에 따라 다름
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = frozenset({
+    'application/json',
+    'text/html',
+    'text/plain',
+    'text/css',
+    'application/javascript',
+    'text/javascript',
+})
+
+
+def parse_accept_encoding(header: Optional[str]) -> dict:
+    """
+    Accept-Encoding 헤더를 {인코딩: q값} 딕셔너리로 변환
+
+    Args:
+        header: Accept-Encoding 헤더 값
+
+    Returns:
+        인코딩별 q값
+    """
+    encodings = {}
+    if not header:
+        return encodings
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[name] = quality
+    return encodings
+
+
+class ResponseCompressor:
+    """크기 임계값 이상인 응답을 클라이언트가 지원하는 방식으로 압축하는 클래스"""
+
+    def __init__(self, min_size: int = 1024, level: int = 6):
+        """
+        압축기 초기화
+
+        Args:
+            min_size: 압축을 시작할 최소 본문 크기 (바이트)
+            level: gzip 압축 레벨 (1-9)
+        """
+        self.min_size = min_size
+        self.level = level
+
+    def choose_encoding(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """클라이언트가 허용하는 인코딩 중 가장 효율적인 것을 선택"""
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get('*', 0.0)
+        candidates = ['br', 'gzip'] if brotli is not None else ['gzip']
+        for encoding in candidates:
+            if accepted.get(encoding, wildcard) > 0:
+                return encoding
+        return None
+
+    def compress(self, data: bytes, encoding: str) -> bytes:
+        """지정한 방식으로 데이터 압축"""
+        if encoding == 'br':
+            return brotli.compress(data, quality=min(self.level, 11))
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def process(self, response, accept_encoding: Optional[str]):
+        """
+        Flask 응답 압축 (after_request 훅에서 사용)
+
+        Args:
+            response: Flask 응답 객체
+            accept_encoding: 요청의 Accept-Encoding 헤더
+
+        Returns:
+            (필요 시 압축된) 응답 객체
+        """
+        if response.direct_passthrough or response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return response
+        if response.status_code < 200 or response.status_code >= 300 or 'Content-Encoding' in response.headers:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        if response.calculate_content_length() is None:
+            return response
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+
+        encoding = self.choose_encoding(accept_encoding)
+        if encoding is None:
+            return response
+
+        response.set_data(self.compress(data, encoding))
+        response.headers['Content-Encoding'] = encoding
+        return response
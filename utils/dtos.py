@@ -1,22 +1,100 @@
-"""데이터 전송 객체 (DTO) 클래스"""
+"""데이터 전송 객체 (DTO) 클래스
+
+요청 DTO는 요청 본문(JSON 바이트)을 한 번에 검증한다. 검증기는 모듈을
+불러올 때 한 번만 만들어 두고(CreateTodoRequest.model_validate_json,
+CREATE_TODO_BATCH 등) 요청마다 재사용한다. 생성/수정 요청은 TodoItem과 같은
+규칙으로 검증하므로 to_todo()와 저장소의 apply_update()는 검증을 다시 거치지
+않는다.
+"""
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
-from models import TodoStatus
+from typing import Annotated, Any, Dict, List, Optional
+from pydantic import (
+    BaseModel, BeforeValidator, ConfigDict, Field, StrictInt, TypeAdapter, ValidationError, field_validator,
+    model_validator
+)
+from models import TodoItem, TodoStatus, to_local_naive
+
+# 일괄 생성 요청 한 번에 받을 수 있는 최대 항목 수
+MAX_BATCH_SIZE = 1000
+
+
+def _parse_iso_datetime(value: Any) -> datetime:
+    """
+    ISO 형식 문자열만 날짜로 받음 (datetime.fromisoformat과 같은 규칙, 숫자 타임스탬프는 거절)
+
+    시간대가 있으면 TodoItem과 같이 지역 시각으로 변환한다.
+    """
+    if isinstance(value, datetime):
+        return to_local_naive(value)
+    if not isinstance(value, str):
+        raise ValueError("ISO 형식 날짜 문자열이어야 합니다")
+    return to_local_naive(datetime.fromisoformat(value))
+
+
+# 요청 본문의 날짜 필드 (형식 검사 후 시간대 없는 datetime으로 변환)
+IsoDatetime = Annotated[datetime, BeforeValidator(_parse_iso_datetime)]
 
 
 class CreateTodoRequest(BaseModel):
     """TODO 생성 요청 DTO"""
     content: str = Field(..., min_length=1, description="TODO 내용")
-    target_date: str = Field(..., description="목표 날짜 (ISO 형식)")
-    status: Optional[str] = Field(default=None, description="상태")
+    target_date: IsoDatetime = Field(..., description="목표 날짜 (ISO 형식)")
+    status: TodoStatus = Field(default=TodoStatus.SCHEDULED, description="상태")
+
+    model_config = ConfigDict(use_enum_values=True, validate_default=True)
+
+    @field_validator("content")
+    @classmethod
+    def validate_content(cls, v: str) -> str:
+        """TodoItem과 같은 내용 규칙 (공백 제거 후 비어 있으면 오류)"""
+        return TodoItem.validate_content(v)
+
+    def to_todo(self) -> TodoItem:
+        """검증한 값으로 새 TodoItem 생성 (ID와 시각은 기본값, 재검증 없음)"""
+        return TodoItem.trusted(self.content, self.target_date, self.status)
 
 
 class UpdateTodoRequest(BaseModel):
-    """TODO 수정 요청 DTO"""
-    content: Optional[str] = Field(None, min_length=1, description="TODO 내용")
-    target_date: Optional[str] = Field(None, description="목표 날짜 (ISO 형식)")
-    status: Optional[str] = Field(None, description="상태")
+    """
+    TODO 수정 요청 DTO
+
+    지정한 필드만 TodoItem과 같은 규칙으로 검증하며, 저장소는 changes()를
+    다시 검증하지 않고 적용한다.
+    """
+    content: Optional[str] = Field(None, description="TODO 내용")
+    target_date: Optional[IsoDatetime] = Field(None, description="목표 날짜 (ISO 형식)")
+    status: Optional[TodoStatus] = Field(None, description="상태")
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    @field_validator("content")
+    @classmethod
+    def validate_content(cls, v: Optional[str]) -> Optional[str]:
+        """지정한 경우 TodoItem과 같은 내용 규칙 (공백 제거 후 비어 있으면 오류)"""
+        return v if v is None else TodoItem.validate_content(v)
+
+    def changes(self) -> Dict[str, Any]:
+        """지정한 필드만 담은 변경 내용 (필드 이름 -> 검증한 값)"""
+        return {name: value for name, value in self.__dict__.items() if value is not None}
+
+
+class ReorderRequest(BaseModel):
+    """전체 순서 변경 요청 DTO (문자열 하나를 글자별 ID로 받지 않도록 배열만 허용)"""
+    order: List[str] = Field(..., description="새 순서 (TODO ID 배열)")
+
+
+class MoveTodoRequest(BaseModel):
+    """TODO 하나의 이동 요청 DTO (before, after, position 중 정확히 하나)"""
+    before: Optional[str] = Field(None, description="이 ID 바로 앞으로 이동")
+    after: Optional[str] = Field(None, description="이 ID 바로 뒤로 이동")
+    position: Optional[StrictInt] = Field(None, description="이 위치(0부터 시작)로 이동")
+
+    @model_validator(mode="after")
+    def validate_target(self) -> "MoveTodoRequest":
+        """이동 대상은 하나만 지정"""
+        if sum(value is not None for value in (self.before, self.after, self.position)) != 1:
+            raise ValueError("before, after, position 중 하나만 지정해야 합니다")
+        return self
 
 
 class TodoResponse(BaseModel):
@@ -41,3 +119,24 @@ class StatsResponse(BaseModel):
     scheduled: int = Field(..., description="예정된 개수")
     in_progress: int = Field(..., description="진행중인 개수")
     completed: int = Field(..., description="완료된 개수")
+
+
+# 일괄 생성 요청 본문 (JSON 배열) 검증기
+CREATE_TODO_BATCH = TypeAdapter(
+    Annotated[List[CreateTodoRequest], Field(min_length=1, max_length=MAX_BATCH_SIZE)]
+)
+
+
+def describe_validation_error(error: ValidationError) -> str:
+    """검증 오류를 '위치: 메시지' 목록 문자열로 변환 (API 오류 응답용)"""
+    messages = []
+    for detail in error.errors(include_url=False):
+        location = '.'.join(str(part) for part in detail['loc'])
+        message = detail['msg']
+        if detail['type'] == 'missing':
+            message = '필수 필드가 없습니다'
+        elif detail['type'] == 'value_error':
+            message = str(detail['ctx']['error']) if 'ctx' in detail else message
+        messages.append(f'{location}: {message}' if location else message)
+    return '; '.join(messages)
+
@@ -0,0 +1,110 @@
+"""Idempotency-Key 기반 중복 쓰기 요청 처리"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+MAX_KEY_LENGTH = 255
+
+# 저장된 응답: (상태 코드, 헤더 목록, 본문)
+StoredResponse = Tuple[int, List[Tuple[str, str]], bytes]
+
+
+def request_fingerprint(method: str, path: str, body: bytes) -> str:
+    """같은 키로 다른 요청을 보냈는지 확인하기 위한 요청 지문"""
+    digest = hashlib.sha256()
+    for part in (method.encode(), b'\0', path.encode(), b'\0', body):
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class IdempotencyEntry:
+    """키 하나에 대한 처리 상태 (처리 중이면 response가 None)"""
+
+    __slots__ = ('fingerprint', 'expires_at', 'response', '_done')
+
+    def __init__(self, fingerprint: str, expires_at: float):
+        self.fingerprint = fingerprint
+        self.expires_at = expires_at
+        self.response: Optional[StoredResponse] = None
+        self._done = threading.Event()
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """처리가 끝날 때까지 대기 (timeout 안에 끝나면 True)"""
+        return self._done.wait(timeout)
+
+
+class IdempotencyCache:
+    """
+    Idempotency-Key별 첫 응답을 보관하는 크기 제한/만료 캐시
+
+    같은 키의 요청이 동시에 들어오면 begin()에서 하나만 처리 권한을 얻고,
+    나머지는 그 요청이 끝날 때까지 기다렸다가 같은 응답을 돌려받는다.
+    처리 중 서버 오류로 끝난 요청은 abandon()으로 지워 재시도가 다시
+    처리되도록 한다. 항목은 생성 순서로 저장되어 앞에서부터 만료/제거된다.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 24 * 3600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        캐시 초기화
+
+        Args:
+            max_entries: 보관할 최대 키 개수
+            ttl: 키 보관 시간(초)
+            clock: 만료 계산용 시계
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, IdempotencyEntry]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 깊은 크기 (보관한 응답 본문 포함)"""
+        with self._lock:
+            entries = self._entries
+        return {'entries': sizer.size(entries)}
+
+    def begin(self, key: str, fingerprint: str) -> Tuple[IdempotencyEntry, bool]:
+        """
+        키 처리 시작
+
+        Returns:
+            (항목, 처리 권한 여부). 권한이 없으면 이미 처리되었거나 처리 중인 항목
+        """
+        with self._lock:
+            now = self._clock()
+            self._evict(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry, False
+            entry = self._entries[key] = IdempotencyEntry(fingerprint, now + self.ttl)
+            return entry, True
+
+    def complete(self, entry: IdempotencyEntry, response: StoredResponse) -> None:
+        """처리 결과 저장 후 대기 중인 중복 요청을 깨움"""
+        entry.response = response
+        entry._done.set()
+
+    def abandon(self, key: str, entry: IdempotencyEntry) -> None:
+        """처리 실패로 결과를 남기지 않음 (같은 키로 다시 처리 가능)"""
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+        entry._done.set()
+
+    def _evict(self, now: float) -> None:
+        """만료되었거나 크기를 넘은 오래된 항목 제거 (잠금 안에서 호출)"""
+        entries = self._entries
+        while entries:
+            key, entry = next(iter(entries.items()))
+            if entry.expires_at > now and len(entries) < self.max_entries:
+                break
+            del entries[key]
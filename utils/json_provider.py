@@ -0,0 +1,78 @@
+"""Flask JSON 프로바이더"""
+import json
+from datetime import date, datetime
+from enum import Enum
+from flask.json.provider import DefaultJSONProvider
+from pydantic import BaseModel
+from models import TodoItem
+from .serializer import TodoSerializer
+
+try:
+    import orjson  # 선택적 의존성: 설치되어 있으면 더 빠른 인코더 사용
+except ImportError:  # pragma: no cover - 설치 여부에 따라 다름
+    orjson = None
+
+
+def json_default(obj):
+    """표준 JSON으로 표현할 수 없는 객체 변환"""
+    if isinstance(obj, TodoItem):
+        return TodoSerializer.to_dict(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode='json')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class TodoJSONProvider(DefaultJSONProvider):
+    """
+    TODO 앱 전용 JSON 프로바이더
+
+    - TodoItem, datetime, Enum을 직접 처리
+    - 한글을 이스케이프하지 않고 UTF-8로 출력
+    - orjson이 설치되어 있으면 orjson, 아니면 표준 json 모듈 사용
+    """
+
+    ensure_ascii = False
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs) -> str:
+        """객체를 JSON 문자열로 변환"""
+        if orjson is not None and not kwargs:
+            try:
+                return self._orjson_dumps(obj).decode('utf-8')
+            except TypeError:
+                pass  # orjson이 처리하지 못하는 값은 표준 모듈로 처리
+        kwargs.setdefault('default', json_default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def dumps_bytes(self, obj) -> bytes:
+        """객체를 UTF-8 JSON 바이트로 변환"""
+        if orjson is not None:
+            try:
+                return self._orjson_dumps(obj)
+            except TypeError:
+                pass
+        return json.dumps(
+            obj, default=json_default, ensure_ascii=self.ensure_ascii, sort_keys=self.sort_keys
+        ).encode('utf-8')
+
+    def response(self, *args, **kwargs):
+        """jsonify 응답 생성 (문자열을 거치지 않고 바이트로 인코딩)"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self.raw_response(self.dumps_bytes(obj))
+
+    def raw_response(self, body: bytes, status: int = 200):
+        """이미 인코딩된 JSON 바이트로 응답 생성"""
+        return self._app.response_class(body, status=status, mimetype=self.mimetype)
+
+    def _orjson_dumps(self, obj) -> bytes:
+        """orjson 인코딩"""
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=json_default, option=option)
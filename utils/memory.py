@@ -0,0 +1,270 @@
+"""메모리 진단 유틸리티 (tracemalloc 스냅샷, 구조별 크기, GC 통계)"""
+import gc
+import sys
+import threading
+import tracemalloc
+import types
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional
+from uuid import uuid4
+
+# 크기를 셀 때 따라가지 않는 객체 (공유되는 코드/타입, 다른 구성 요소로 이어지는 메서드)
+_OPAQUE_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+    types.CodeType,
+    types.FrameType,
+)
+
+# tracemalloc 통계 묶음 기준
+GROUP_BY = ('lineno', 'filename', 'traceback')
+
+# 진단 도구 자체의 할당은 통계에서 제외
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+class ObjectSizer:
+    """
+    객체 그래프의 깊은 크기(sys.getsizeof 합계) 계산기
+
+    gc.get_referents로 참조하는 객체를 따라가며, 한 계산기로 이미 센 객체는
+    다시 세지 않는다. 여러 구조를 같은 계산기로 재면 공유 객체(예: 저장소와
+    인덱스가 함께 참조하는 TodoItem)는 먼저 잰 구조에 한 번만 포함된다.
+    타입, 모듈, 함수와 메서드는 따라가지 않는다.
+    """
+
+    def __init__(self):
+        self._seen = set()
+        self.objects = 0  # 지금까지 센 객체 수
+
+    def size(self, obj) -> int:
+        """obj와 obj에서 닿는 (아직 세지 않은) 객체의 크기 합계(바이트)"""
+        total = 0
+        pending = [obj]
+        while pending:
+            current = pending.pop()
+            if id(current) in self._seen or isinstance(current, _OPAQUE_TYPES):
+                continue
+            self._seen.add(id(current))
+            self.objects += 1
+            total += sys.getsizeof(current)
+            pending.extend(gc.get_referents(current))
+        return total
+
+
+class MemorySnapshot:
+    """tracemalloc 스냅샷 하나와 찍은 시점의 추적 메모리"""
+
+    def __init__(self, snapshot: tracemalloc.Snapshot, current: int, peak: int):
+        self.id = uuid4().hex
+        self.created_at = datetime.now()
+        self.snapshot = snapshot
+        self.current = current
+        self.peak = peak
+
+    def to_summary(self) -> dict:
+        """목록 응답용 요약 정보"""
+        return {
+            'id': self.id,
+            'created_at': self.created_at.isoformat(),
+            'traced_current': self.current,
+            'traced_peak': self.peak,
+            'frames': self.snapshot.traceback_limit,
+        }
+
+
+class MemoryDiagnostics:
+    """
+    관리자용 메모리 진단
+
+    - tracemalloc 추적 시작/중지와 스냅샷 보관 (최근 max_snapshots개)
+    - 스냅샷의 위치별 상위 할당과 두 스냅샷의 차이
+    - register()로 등록한 구성 요소의 구조별 크기 (각 구성 요소의
+      memory_usage(sizer)가 {부분 이름: 바이트}를 반환, 잠금 안에서는 구조
+      참조만 모으고 크기는 잠금을 푼 뒤 재므로 측정 중에도 쓰기를 막지 않음)
+    - GC 세대별 통계
+
+    tracemalloc은 추적을 시작한 뒤의 할당만 보므로, 시작 직후의 스냅샷을
+    기준으로 두고 나중 스냅샷과 비교해 늘어난 위치를 찾는다. 추적 중에는
+    모든 할당이 느려지므로 진단할 때만 켠다.
+    """
+
+    def __init__(self, max_snapshots: int = 10):
+        self._max_snapshots = max_snapshots
+        self._snapshots: 'OrderedDict[str, MemorySnapshot]' = OrderedDict()
+        self._components: 'OrderedDict[str, object]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ---- 구조별 크기 ----
+
+    def register(self, name: str, component) -> None:
+        """memory_usage(sizer)를 가진 구성 요소 등록 (등록 순서대로 측정)"""
+        self._components[name] = component
+
+    def structures(self) -> dict:
+        """
+        등록한 구성 요소의 구조별 깊은 크기
+
+        한 ObjectSizer로 등록 순서대로 재므로 공유 객체는 먼저 등록한 구성
+        요소에 포함되고, 합계는 겹치지 않는다.
+
+        Returns:
+            {'components': {이름: {'total': 바이트, 'parts': {부분: 바이트}}}, 'total': 바이트, 'objects': 객체 수}
+        """
+        sizer = ObjectSizer()
+        components = {}
+        for name, component in list(self._components.items()):
+            parts = component.memory_usage(sizer)
+            components[name] = {'total': sum(parts.values()), 'parts': parts}
+        return {
+            'components': components,
+            'total': sum(component['total'] for component in components.values()),
+            'objects': sizer.objects,
+        }
+
+    # ---- GC ----
+
+    @staticmethod
+    def gc_stats() -> dict:
+        """GC 설정과 세대별 수집 통계"""
+        return {
+            'enabled': gc.isenabled(),
+            'thresholds': list(gc.get_threshold()),
+            'counts': list(gc.get_count()),
+            'generations': gc.get_stats(),
+            'tracked_objects': len(gc.get_objects()),
+            'uncollectable': len(gc.garbage),
+        }
+
+    @staticmethod
+    def collect() -> int:
+        """전체 GC를 한 번 실행하고 찾은 도달 불가능 객체 수 반환"""
+        return gc.collect()
+
+    # ---- tracemalloc ----
+
+    @staticmethod
+    def tracing() -> dict:
+        """추적 상태와 추적 중인 메모리(바이트)"""
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            'tracing': tracemalloc.is_tracing(),
+            'frames': tracemalloc.get_traceback_limit(),
+            'traced_current': current,
+            'traced_peak': peak,
+            'overhead': tracemalloc.get_tracemalloc_memory(),
+        }
+
+    @staticmethod
+    def start(frames: int = 1) -> None:
+        """
+        추적 시작 (이미 추적 중이면 프레임 수만 유지)
+
+        Raises:
+            ValueError: frames가 1 미만
+        """
+        if frames < 1:
+            raise ValueError("frames는 1 이상이어야 합니다")
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    @staticmethod
+    def stop() -> None:
+        """추적 중지 (보관한 스냅샷은 남음)"""
+        tracemalloc.stop()
+
+    def take_snapshot(self) -> MemorySnapshot:
+        """
+        스냅샷을 찍어 보관
+
+        Raises:
+            RuntimeError: 추적 중이 아님
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc 추적 중이 아닙니다")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        record = MemorySnapshot(snapshot, *tracemalloc.get_traced_memory())
+        with self._lock:
+            self._snapshots[record.id] = record
+            while len(self._snapshots) > self._max_snapshots:
+                self._snapshots.popitem(last=False)
+        return record
+
+    def get(self, snapshot_id: str) -> Optional[MemorySnapshot]:
+        """ID로 스냅샷 조회"""
+        with self._lock:
+            return self._snapshots.get(snapshot_id)
+
+    def list(self) -> List[MemorySnapshot]:
+        """보관한 스냅샷 목록 (최신순)"""
+        with self._lock:
+            return list(reversed(self._snapshots.values()))
+
+    def clear(self) -> None:
+        """보관한 스냅샷 삭제"""
+        with self._lock:
+            self._snapshots.clear()
+
+    @staticmethod
+    def top(record: MemorySnapshot, group_by: str = 'lineno', limit: int = 20) -> dict:
+        """
+        스냅샷에서 크기가 큰 할당 위치
+
+        Raises:
+            ValueError: 지원하지 않는 group_by
+        """
+        stats = record.snapshot.statistics(_check_group(group_by))
+        return {
+            'snapshot': record.to_summary(),
+            'total': sum(stat.size for stat in stats),
+            'stats': [
+                {'location': _location(stat.traceback), 'size': stat.size, 'count': stat.count}
+                for stat in stats[:limit]
+            ],
+        }
+
+    @staticmethod
+    def diff(record: MemorySnapshot, base: MemorySnapshot, group_by: str = 'lineno', limit: int = 20) -> dict:
+        """
+        base 이후 record까지 크기 변화가 큰 할당 위치
+
+        Raises:
+            ValueError: 지원하지 않는 group_by
+        """
+        stats = record.snapshot.compare_to(base.snapshot, _check_group(group_by))
+        return {
+            'snapshot': record.to_summary(),
+            'base': base.to_summary(),
+            'size_diff': sum(stat.size_diff for stat in stats),
+            'stats': [
+                {
+                    'location': _location(stat.traceback),
+                    'size': stat.size,
+                    'size_diff': stat.size_diff,
+                    'count': stat.count,
+                    'count_diff': stat.count_diff,
+                }
+                for stat in stats[:limit]
+            ],
+        }
+
+
+def _check_group(group_by: str) -> str:
+    if group_by not in GROUP_BY:
+        raise ValueError(f"지원하지 않는 묶음 기준: {group_by} (가능한 값: {', '.join(GROUP_BY)})")
+    return group_by
+
+
+def _location(traceback: tracemalloc.Traceback) -> List[str]:
+    """할당 위치 (가장 최근 프레임부터 'file:line')"""
+    return [f'{frame.filename}:{frame.lineno}' for frame in traceback]
+
@@ -0,0 +1,162 @@
+"""요청 단위 프로파일링 유틸리티"""
+import cProfile
+import io
+import marshal
+import pstats
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs
+from uuid import uuid4
+
+from .admin import is_valid_admin_token
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+PROFILE_QUERY_PARAM = '_profile'
+
+
+class ProfileRecord:
+    """한 요청의 프로파일 결과"""
+
+    def __init__(self, method: str, path: str, duration_ms: float, stats: dict,
+                 profile_id: Optional[str] = None):
+        self.id = profile_id or uuid4().hex
+        self.method = method
+        self.path = path
+        self.duration_ms = duration_ms
+        self.created_at = datetime.now()
+        self._stats = stats
+
+    def to_summary(self) -> dict:
+        """목록 응답용 요약 정보"""
+        return {
+            'id': self.id,
+            'method': self.method,
+            'path': self.path,
+            'duration_ms': round(self.duration_ms, 3),
+            'created_at': self.created_at.isoformat(),
+        }
+
+    def to_pstats_bytes(self) -> bytes:
+        """pstats 파일 형식 (python -m pstats, snakeviz 등에서 열 수 있음)"""
+        return marshal.dumps(self._stats)
+
+    def to_text(self, sort_by: str = 'cumulative', limit: int = 40) -> str:
+        """사람이 읽을 수 있는 pstats 리포트"""
+        stream = io.StringIO()
+        stats = pstats.Stats(_StatsSource(self._stats), stream=stream)
+        stats.sort_stats(sort_by).print_stats(limit)
+        return stream.getvalue()
+
+
+class _StatsSource:
+    """pstats.Stats가 읽을 수 있도록 raw stats를 감싸는 객체"""
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class ProfileStore:
+    """최근 프로파일을 고정 개수만큼 보관하는 저장소"""
+
+    def __init__(self, max_profiles: int = 20):
+        self._max_profiles = max_profiles
+        self._records: 'OrderedDict[str, ProfileRecord]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, record: ProfileRecord) -> None:
+        """프로파일 추가 (오래된 항목부터 제거)"""
+        with self._lock:
+            self._records[record.id] = record
+            while len(self._records) > self._max_profiles:
+                self._records.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[ProfileRecord]:
+        """ID로 프로파일 조회"""
+        with self._lock:
+            return self._records.get(profile_id)
+
+    def list(self) -> List[ProfileRecord]:
+        """최근 프로파일 목록 (최신순)"""
+        with self._lock:
+            return list(reversed(self._records.values()))
+
+    def clear(self) -> None:
+        """모든 프로파일 삭제"""
+        with self._lock:
+            self._records.clear()
+
+    def memory_usage(self, sizer) -> Dict[str, int]:
+        """메모리 진단용 깊은 크기"""
+        with self._lock:
+            records = self._records
+        return {'profiles': sizer.size(records)}
+
+
+class ProfilingMiddleware:
+    """
+    관리자가 요청한 경우에만 요청을 cProfile로 감싸는 WSGI 미들웨어
+
+    `X-Profile: 1` 헤더 또는 `?_profile=1` 쿼리와 유효한 `X-Admin-Token` 헤더가
+    함께 있을 때만 프로파일링한다. 그 외의 요청은 헤더/쿼리 문자열 확인만 하고
+    원래 앱으로 그대로 전달된다.
+    """
+
+    def __init__(self, wsgi_app, store: ProfileStore, admin_token_getter: Callable[[], Optional[str]]):
+        self.wsgi_app = wsgi_app
+        self.store = store
+        self._admin_token_getter = admin_token_getter
+
+    def __call__(self, environ, start_response):
+        if 'HTTP_X_PROFILE' not in environ and PROFILE_QUERY_PARAM not in environ.get('QUERY_STRING', ''):
+            return self.wsgi_app(environ, start_response)
+        if not self._is_profiling_requested(environ):
+            return self.wsgi_app(environ, start_response)
+        return self._profile(environ, start_response)
+
+    def _is_profiling_requested(self, environ) -> bool:
+        """프로파일 플래그와 관리자 토큰 확인"""
+        flag = environ.get('HTTP_X_PROFILE')
+        if flag is None:
+            values = parse_qs(environ.get('QUERY_STRING', '')).get(PROFILE_QUERY_PARAM)
+            flag = values[0] if values else None
+        if flag not in ('1', 'true', 'yes'):
+            return False
+        return is_valid_admin_token(self._admin_token_getter(), environ.get('HTTP_X_ADMIN_TOKEN'))
+
+    def _profile(self, environ, start_response):
+        """요청을 프로파일링하고 결과를 저장"""
+        profile_id = uuid4().hex
+
+        def profiled_start_response(status, headers, exc_info=None):
+            headers.append((PROFILE_ID_HEADER, profile_id))
+            return start_response(status, headers, exc_info)
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        app_iter = None
+        try:
+            # 응답 본문까지 만들어야 직렬화 비용이 포함된다
+            app_iter = self.wsgi_app(environ, profiled_start_response)
+            body = list(app_iter)
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+            profiler.disable()
+            duration_ms = (time.perf_counter() - started) * 1000
+            profiler.create_stats()
+            self.store.add(ProfileRecord(
+                method=environ.get('REQUEST_METHOD', ''),
+                path=environ.get('PATH_INFO', ''),
+                duration_ms=duration_ms,
+                stats=profiler.stats,
+                profile_id=profile_id,
+            ))
+        return body
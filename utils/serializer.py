@@ -1,8 +1,25 @@
 """TodoItem 직렬화 클래스"""
 from datetime import datetime
-from models import TodoItem
+from json.encoder import encode_basestring
+from typing import Iterable, Optional
+from models import TodoItem, TodoStatus, STATUS_CODES
 from .dtos import TodoResponse
 
+try:
+    import orjson  # 선택적 의존성: 설치되어 있으면 목록 인코딩에 사용
+except ImportError:  # pragma: no cover - 설치 여부에 따라 다름
+    orjson = None
+
+TODO_FIELDS = ('id', 'content', 'target_date', 'status', 'created_at', 'updated_at')
+DATETIME_FIELDS = frozenset({'target_date', 'created_at', 'updated_at'})
+
+# 상태 문자열은 종류가 적으므로 미리 인코딩해 둔다
+_STATUS_JSON = {status.value: encode_basestring(status.value) for status in TodoStatus}
+_TODO_JSON_TEMPLATE = (
+    '{"id":"%s","content":%s,"target_date":"%s","status":%s,'
+    '"created_at":"%s","updated_at":"%s"}'
+)
+
 
 class TodoSerializer:
     """TodoItem을 다양한 형식으로 변환하는 직렬화 클래스"""
@@ -35,3 +52,79 @@ class TodoSerializer:
     def to_list(todos: list[TodoItem]) -> list[dict]:
         """TodoItem 리스트를 딕셔너리 리스트로 변환"""
         return [TodoSerializer.to_dict(todo) for todo in todos]
+
+    @staticmethod
+    def to_json(todo: TodoItem) -> str:
+        """TodoItem을 중간 딕셔너리 없이 JSON 문자열로 변환 (to_dict와 같은 구조)"""
+        return _TODO_JSON_TEMPLATE % (
+            todo.id,
+            encode_basestring(todo.content),
+            todo.target_date.isoformat(),
+            _STATUS_JSON[todo.status],
+            todo.created_at.isoformat(),
+            todo.updated_at.isoformat(),
+        )
+
+    @staticmethod
+    def encode_list(todos: Iterable[TodoItem]) -> bytes:
+        """
+        TodoItem 리스트를 UTF-8 JSON 배열 바이트로 직접 인코딩 (to_list와 같은 구조)
+
+        orjson이 있으면 모델의 필드 저장소(__dict__)를 그대로 넘겨 datetime까지
+        C 수준에서 인코딩하고, 없으면 문자열 템플릿으로 인코딩한다.
+        """
+        if orjson is not None:
+            return orjson.dumps([todo.__dict__ for todo in todos])
+        to_json = TodoSerializer.to_json
+        return ('[' + ','.join([to_json(todo) for todo in todos]) + ']').encode('utf-8')
+
+    @staticmethod
+    def parse_fields(fields: Optional[str]) -> Optional[tuple]:
+        """
+        ?fields= 쿼리 값을 필드 튜플로 변환
+
+        Args:
+            fields: 쉼표로 구분된 필드 이름
+
+        Returns:
+            필드 튜플 (지정하지 않으면 None)
+
+        Raises:
+            ValueError: 알 수 없는 필드
+        """
+        if not fields:
+            return None
+        names = tuple(dict.fromkeys(name.strip() for name in fields.split(',') if name.strip()))
+        unknown = [name for name in names if name not in TODO_FIELDS]
+        if unknown or not names:
+            raise ValueError(f"알 수 없는 필드: {', '.join(unknown)}")
+        return names
+
+    @staticmethod
+    def to_sparse_list(todos: Iterable[TodoItem], fields: Optional[tuple] = None,
+                       compact: bool = False) -> list[dict]:
+        """
+        TodoItem 리스트를 필요한 필드만 담은 딕셔너리 리스트로 변환
+
+        Args:
+            todos: TodoItem 목록
+            fields: 포함할 필드 (None이면 전체)
+            compact: True이면 상태는 숫자 코드, 날짜는 epoch 초로 변환
+
+        Returns:
+            딕셔너리 리스트
+        """
+        fields = fields or TODO_FIELDS
+        getters = [(name, TodoSerializer._field_getter(name, compact)) for name in fields]
+        return [{name: getter(todo) for name, getter in getters} for todo in todos]
+
+    @staticmethod
+    def _field_getter(name: str, compact: bool):
+        """필드별 값 추출 함수"""
+        if name in DATETIME_FIELDS:
+            if compact:
+                return lambda todo: int(getattr(todo, name).timestamp())
+            return lambda todo: getattr(todo, name).isoformat()
+        if name == 'status' and compact:
+            return lambda todo: STATUS_CODES[todo.status]
+        return lambda todo: getattr(todo, name)